@@ -22,9 +22,10 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, desc, func
 from sqlalchemy.orm import Session
 
+from backend.db.attribution_graph import AttributionGraphRepository, attribution_graph_cache
 from backend.db.connection import get_session
 from backend.db.models import AttributionORM, CardORM, UserORM
 from backend.tokens.extropy import ExtropyTokenSystem
@@ -246,6 +247,9 @@ async def create_attribution(request: CreateAttributionRequest, db: Session = De
         db.commit()
         db.refresh(attribution)
 
+        # Graphs that include either card now have a new edge
+        attribution_graph_cache.invalidate_cards(str(source_card_id), str(target_card_id))
+
         return AttributionResponse(
             attribution_id=str(attribution.id),
             source_card_id=str(attribution.source_card_id),
@@ -488,6 +492,9 @@ async def get_attribution_graph(
     - All cards this card cited (outgoing)
     - Recursive relationships up to specified depth
 
+    The graph is built with a single recursive query and cached per
+    (card, depth) until an attribution touching it is created.
+
     **Depth Levels:**
     - `depth=1`: Direct attributions only
     - `depth=2`: Attributions + their attributions (default)
@@ -520,71 +527,16 @@ async def get_attribution_graph(
     try:
         card_uuid = UUID(card_id)
 
-        # Verify card exists
-        card = db.query(CardORM).filter(CardORM.id == card_uuid).first()
-        if not card:
-            raise HTTPException(status_code=404, detail="Card not found")
+        graph = attribution_graph_cache.get(str(card_uuid), depth)
+        if graph is None:
+            # One recursive query for the whole neighbourhood, one for card details
+            graph = AttributionGraphRepository(db).get_graph(card_uuid, depth)
+            if graph is None:
+                raise HTTPException(status_code=404, detail="Card not found")
+            attribution_graph_cache.set(str(card_uuid), depth, graph)
 
-        # Collect all relevant card IDs and edges
-        visited_cards = set()
-        edges = []
-        cards_to_process = [(card_uuid, 0)]  # (card_id, current_depth)
-
-        while cards_to_process:
-            current_card_id, current_depth = cards_to_process.pop(0)
-
-            if current_card_id in visited_cards or current_depth >= depth:
-                continue
-
-            visited_cards.add(current_card_id)
-
-            # Get all attributions involving this card
-            attributions = (
-                db.query(AttributionORM)
-                .filter(
-                    or_(
-                        AttributionORM.source_card_id == current_card_id,
-                        AttributionORM.target_card_id == current_card_id,
-                    )
-                )
-                .all()
-            )
-
-            for attr in attributions:
-                edges.append(
-                    {
-                        "source_card_id": str(attr.source_card_id),
-                        "target_card_id": str(attr.target_card_id),
-                        "attribution_type": attr.attribution_type,
-                        "created_at": attr.created_at.isoformat(),
-                    }
-                )
-
-                # Add related cards to processing queue
-                if attr.source_card_id != current_card_id:
-                    cards_to_process.append((attr.source_card_id, current_depth + 1))
-                if attr.target_card_id != current_card_id:
-                    cards_to_process.append((attr.target_card_id, current_depth + 1))
-
-        # Get card details for all nodes
-        cards = db.query(CardORM).filter(CardORM.id.in_(visited_cards)).all()
-
-        # Count attributions per card
-        attribution_counts = {}
-        for edge in edges:
-            source_id = edge["source_card_id"]
-            attribution_counts[source_id] = attribution_counts.get(source_id, 0) + 1
-
-        # Format nodes
-        nodes = [
-            {
-                "card_id": str(c.id),
-                "title": c.title,
-                "user_id": str(c.user_id),
-                "attribution_count": attribution_counts.get(str(c.id), 0),
-            }
-            for c in cards
-        ]
+        nodes = graph["nodes"]
+        edges = graph["edges"]
 
         return AttributionGraphResponse(
             center_card_id=card_id, nodes=nodes, edges=edges, depth=depth
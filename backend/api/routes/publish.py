@@ -13,15 +13,23 @@ from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from backend.auth.api_keys import require_api_key
 from backend.db.connection import get_session
 from backend.db.models import CardORM
-from backend.tokens.extropy import ExtropyTokenSystem
+from backend.tokens.extropy import ExtropyTokenSystem, TokenAward
 
 router = APIRouter(prefix="/publish", tags=["publish"])
 
+PUBLISHED_URL_PREFIX = "https://extrophi.ai/cards/"
+
+TOKENS_PER_PUBLISH = Decimal("1.00000000")
+
+# Attempts at regenerating colliding slugs before giving up
+MAX_SLUG_ATTEMPTS = 5
+
 
 # ============================================================================
 # Request/Response Models
@@ -134,6 +142,56 @@ def generate_slug(text: str, max_length: int = 60) -> str:
     return slug
 
 
+def generate_unique_slugs(
+    db: Session, titles: List[str], max_attempts: int = MAX_SLUG_ATTEMPTS
+) -> List[str]:
+    """
+    Generate slugs for a batch of titles, checking collisions in bulk.
+
+    Each round checks every candidate URL against the database in a single
+    query (and against the rest of the batch), then regenerates only the
+    colliding slugs.
+
+    Args:
+        db: Database session
+        titles: Card titles, in publish order
+        max_attempts: Collision-check rounds before giving up
+
+    Returns:
+        Unique slugs, one per title
+
+    Raises:
+        HTTPException: If unique slugs could not be generated
+    """
+    if not titles:
+        return []
+
+    slugs = [generate_slug(title) for title in titles]
+
+    for _ in range(max_attempts):
+        urls = [f"{PUBLISHED_URL_PREFIX}{slug}" for slug in slugs]
+        taken = set(
+            db.execute(select(CardORM.published_url).where(CardORM.published_url.in_(urls)))
+            .scalars()
+            .all()
+        )
+
+        seen = set()
+        collisions = []
+        for index, url in enumerate(urls):
+            if url in taken or url in seen:
+                collisions.append(index)
+            seen.add(url)
+
+        if not collisions:
+            return slugs
+
+        for index in collisions:
+            slugs[index] = generate_slug(titles[index])
+
+    raise HTTPException(status_code=500, detail="Failed to generate unique card URLs")
+
+
 def is_publishable(card: CardInput) -> bool:
     """
     Check if card meets privacy requirements for publishing.
@@ -171,6 +229,10 @@ async def publish_cards(
     4. Stores in PostgreSQL database
     5. Awards $EXTROPY tokens (1 token per published card)
 
+    The whole batch is written in a single transaction with a fixed number of
+    statements (one card insert, one ledger insert, one balance update), so
+    either every card is published and rewarded or none are.
+
     **Privacy Filtering:**
     - ✅ BUSINESS - Publicly publishable
     - ✅ IDEAS - Publicly publishable
@@ -218,66 +280,60 @@ async def publish_cards(
         # Convert user_id string to UUID
         user_uuid = UUID(user_id)
 
-        # Initialize tracking variables
-        published_urls = []
-        cards_filtered = 0
-        cards_published = 0
-        total_extropy_earned = Decimal("0.00000000")
+        # Check privacy level
+        publishable = [card for card in request.cards if is_publishable(card)]
+        cards_filtered = len(request.cards) - len(publishable)
 
-        # Initialize token system
+        # Generate URL slugs from titles (collisions checked in one query per round)
+        slugs = generate_unique_slugs(db, [card.title for card in publishable])
+        published_urls = [f"{PUBLISHED_URL_PREFIX}{slug}" for slug in slugs]
+
+        # Insert all cards in one multi-row statement (IDs generated client-side)
+        now = datetime.utcnow()
+        card_rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_uuid,
+                "title": card.title,
+                "body": card.body,
+                "tags": card.tags,
+                "privacy_level": card.privacy_level,
+                "category": card.category,
+                "is_published": True,
+                "published_url": published_url,
+                "published_at": now,
+                "extra_metadata": card.metadata or {},
+                "created_at": now,
+                "updated_at": now,
+            }
+            for card, published_url in zip(publishable, published_urls)
+        ]
+        if card_rows:
+            db.execute(insert(CardORM), card_rows)
+
+        # Award $EXTROPY tokens (1 token per publish) in one ledger batch
         token_system = ExtropyTokenSystem(db)
+        await token_system.award_tokens_batch(
+            [
+                TokenAward(
+                    user_id=user_uuid,
+                    amount=TOKENS_PER_PUBLISH,
+                    reason=f"Published card: {card.title}",
+                    card_id=row["id"],
+                    metadata={
+                        "card_title": card.title,
+                        "card_category": card.category,
+                        "published_url": row["published_url"],
+                    },
+                )
+                for card, row in zip(publishable, card_rows)
+            ]
+        )
+
+        cards_published = len(card_rows)
+        total_extropy_earned = TOKENS_PER_PUBLISH * cards_published
 
-        # Process each card
-        for card in request.cards:
-            # Check privacy level
-            if not is_publishable(card):
-                cards_filtered += 1
-                continue
-
-            # Convert to markdown
-            markdown_content = convert_to_markdown(card)
-
-            # Generate URL slug from title
-            slug = generate_slug(card.title)
-            published_url = f"https://extrophi.ai/cards/{slug}"
-
-            # Create card in database
-            card_orm = CardORM(
-                user_id=user_uuid,
-                title=card.title,
-                body=card.body,
-                tags=card.tags,
-                privacy_level=card.privacy_level,
-                category=card.category,
-                is_published=True,
-                published_url=published_url,
-                published_at=datetime.utcnow(),
-                metadata=card.metadata or {},
-            )
-
-            db.add(card_orm)
-            db.flush()  # Flush to get the card ID before awarding tokens
-
-            # Award $EXTROPY tokens (1 token per publish)
-            tokens_per_publish = Decimal("1.00000000")
-            await token_system.award_tokens(
-                user_id=user_uuid,
-                amount=tokens_per_publish,
-                reason=f"Published card: {card.title}",
-                card_id=card_orm.id,
-                metadata={
-                    "card_title": card.title,
-                    "card_category": card.category,
-                    "published_url": published_url,
-                },
-            )
-
-            # Track results
-            published_urls.append(published_url)
-            total_extropy_earned += tokens_per_publish
-            cards_published += 1
-
-        # Commit all changes
+        # Commit cards, ledger entries and balance together (all-or-nothing)
         db.commit()
 
         return PublishResponse(
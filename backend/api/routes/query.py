@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from backend.vector.chromadb_client import ChromaDBClient
+from backend.vector.embedding_cache import get_embedding_cache
 from backend.vector.embeddings import EmbeddingGenerator
 
 router = APIRouter(prefix="/query", tags=["rag"])
@@ -88,6 +89,12 @@ async def rag_query(request: RAGQueryRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/embedding-cache")
+async def embedding_cache_stats():
+    """Embedding cache hit rates (in-process LRU and embedding_cache table)."""
+    return get_embedding_cache().get_stats()
+
+
 @router.get("/health")
 async def vector_health():
     """Check vector store health."""
@@ -1,11 +1,16 @@
 """Scraping API endpoints."""
 
+import json
+
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from backend.db.connection import get_session
 from backend.scrapers import get_scraper
+from backend.scrapers.batch import ScrapeTarget, scrape_many
+from backend.scrapers.http_clients import get_http_clients
 
 router = APIRouter(prefix="/scrape", tags=["scraping"])
 
@@ -15,6 +20,17 @@ class ScrapeRequest(BaseModel):
     limit: int = 20
 
 
+class BatchScrapeTarget(BaseModel):
+    platform: str
+    target: str
+    limit: int = 20
+
+
+class BatchScrapeRequest(BaseModel):
+    targets: list[BatchScrapeTarget] = Field(..., min_length=1, max_length=100)
+    concurrency: int = Field(default=8, ge=1, le=32)
+
+
 class ScrapeResponse(BaseModel):
     status: str
     platform: str
@@ -23,6 +39,47 @@ class ScrapeResponse(BaseModel):
     content_ids: list[str]
 
 
+VALID_PLATFORMS = ["twitter", "youtube", "reddit", "web"]
+
+
+@router.post("/batch")
+async def scrape_batch(request: BatchScrapeRequest):
+    """
+    Scrape many targets across platforms concurrently.
+
+    Streams newline-delimited JSON as results complete: one
+    ``{"type": "item", ..., "content": {...}}`` line per normalized item,
+    an ``"error"`` line for each failed target and a ``"done"`` line (with
+    ``count``) when each target finishes.
+
+    Args:
+        request: Targets and overall concurrency
+
+    Returns:
+        application/x-ndjson stream
+    """
+    invalid = sorted({t.platform for t in request.targets} - set(VALID_PLATFORMS))
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid platform(s) {invalid}. Must be one of: {VALID_PLATFORMS}",
+        )
+
+    targets = [ScrapeTarget(t.platform, t.target, t.limit) for t in request.targets]
+
+    async def stream():
+        async for event in scrape_many(targets, concurrency=request.concurrency):
+            yield json.dumps(event.to_dict()) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.get("/connections")
+async def connection_stats():
+    """Per-host HTTP connection pool utilisation (e.g. Jina, ScraperAPI)."""
+    return get_http_clients().get_stats()
+
+
 @router.post("/{platform}", response_model=ScrapeResponse)
 async def scrape_platform(
     platform: str, request: ScrapeRequest, db: Session = Depends(get_session)
@@ -37,11 +94,10 @@ async def scrape_platform(
     Returns:
         Scraping results with content IDs
     """
-    valid_platforms = ["twitter", "youtube", "reddit", "web"]
-    if platform not in valid_platforms:
+    if platform not in VALID_PLATFORMS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid platform. Must be one of: {valid_platforms}",
+            detail=f"Invalid platform. Must be one of: {VALID_PLATFORMS}",
         )
 
     try:
@@ -4,6 +4,7 @@ API Routes for $EXTROPY Token Operations
 Endpoints:
 - POST /tokens/award - Award tokens to user
 - POST /tokens/transfer - Transfer tokens between users
+- POST /tokens/transfer/batch - Apply many transfers atomically (attribution payouts)
 - GET /tokens/balance/{user_id} - Get user balance
 - GET /tokens/ledger/{user_id} - Get transaction history
 - GET /tokens/stats/{user_id} - Get token statistics
@@ -13,12 +14,12 @@ from decimal import Decimal
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from backend.db.connection import get_session
-from backend.tokens.extropy import ExtropyTokenSystem
+from backend.tokens.extropy import ExtropyTokenSystem, TokenTransfer
 
 router = APIRouter(prefix="/tokens", tags=["tokens"])
 
@@ -49,6 +50,14 @@ class TransferTokensRequest(BaseModel):
     metadata: Optional[Dict] = Field(None, description="Optional additional metadata")
 
 
+class BatchTransferRequest(BaseModel):
+    """Request model for a batch of transfers"""
+
+    transfers: List[TransferTokensRequest] = Field(
+        ..., min_length=1, max_length=1000, description="Transfers to apply, in order"
+    )
+
+
 class BalanceResponse(BaseModel):
     """Response model for balance query"""
 
@@ -183,6 +192,61 @@ async def transfer_tokens(request: TransferTokensRequest, db: Session = Depends(
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+@router.post("/transfer/batch", response_model=List[TransferTokensResponse])
+async def transfer_tokens_batch(request: BatchTransferRequest, db: Session = Depends(get_session)):
+    """
+    Apply many transfers in one transaction.
+
+    All transfers succeed or none do: if any sender has insufficient balance
+    (after the earlier transfers in the batch), nothing is written. Used for
+    paying out attribution rewards in bulk.
+
+    **Example:**
+    ```json
+    {
+        "transfers": [
+            {
+                "from_user_id": "550e8400-e29b-41d4-a716-446655440000",
+                "to_user_id": "660e8400-e29b-41d4-a716-446655440001",
+                "amount": "5.00000000",
+                "reason": "Citation reward",
+                "attribution_id": "880e8400-e29b-41d4-a716-446655440003"
+            }
+        ]
+    }
+    ```
+    """
+    try:
+        token_system = ExtropyTokenSystem(db)
+
+        transfers = [
+            TokenTransfer(
+                from_user_id=UUID(item.from_user_id),
+                to_user_id=UUID(item.to_user_id),
+                amount=Decimal(item.amount),
+                reason=item.reason,
+                attribution_id=UUID(item.attribution_id) if item.attribution_id else None,
+                metadata=item.metadata,
+            )
+            for item in request.transfers
+        ]
+
+        results = await token_system.transfer_tokens_batch(transfers)
+        db.commit()
+
+        return [TransferTokensResponse(**result) for result in results]
+
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
 @router.get("/balance/{user_id}", response_model=BalanceResponse)
 async def get_balance(user_id: str, db: Session = Depends(get_session)):
     """
@@ -217,9 +281,11 @@ async def get_balance(user_id: str, db: Session = Depends(get_session)):
 @router.get("/ledger/{user_id}")
 async def get_ledger(
     user_id: str,
+    response: Response,
     limit: int = 100,
     offset: int = 0,
     transaction_type: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_session),
 ):
     """
@@ -232,6 +298,9 @@ async def get_ledger(
     - `limit`: Maximum number of entries (default: 100)
     - `offset`: Number of entries to skip (default: 0)
     - `transaction_type`: Filter by type (earn, transfer, attribution)
+    - `cursor`: Keyset cursor; pass an empty value for the first page, then the
+      `X-Next-Cursor` response header (or the last entry's `next_cursor`).
+      Deep pages cost the same as the first; `offset` is ignored.
 
     **Example Response:**
     ```json
@@ -243,7 +312,8 @@ async def get_ledger(
             "amount": "10.00000000",
             "transaction_type": "earn",
             "description": "Published a card",
-            "created_at": "2025-11-18T10:30:00"
+            "created_at": "2025-11-18T10:30:00",
+            "next_cursor": "2025-11-18T10:30:00_770e8400-e29b-41d4-a716-446655440002"
         }
     ]
     ```
@@ -253,9 +323,16 @@ async def get_ledger(
         user_uuid = UUID(user_id)
 
         ledger = await token_system.get_ledger(
-            user_id=user_uuid, limit=limit, offset=offset, transaction_type=transaction_type
+            user_id=user_uuid,
+            limit=limit,
+            offset=offset,
+            transaction_type=transaction_type,
+            cursor=cursor,
         )
 
+        if cursor is not None and ledger and len(ledger) == limit:
+            response.headers["X-Next-Cursor"] = ledger[-1]["next_cursor"]
+
         return ledger
 
     except ValueError as e:
@@ -271,7 +348,8 @@ async def get_token_stats(user_id: str, db: Session = Depends(get_session)):
     """
     Get comprehensive token statistics for a user.
 
-    Returns balance, total earned, total spent, and transaction counts.
+    Returns balance, total earned, total spent, and transaction counts,
+    read from the user's materialized ledger summary.
 
     **Example Response:**
     ```json
@@ -286,7 +364,8 @@ async def get_token_stats(user_id: str, db: Session = Depends(get_session)):
             "transfer": 2,
             "attribution": 3,
             "total": 10
-        }
+        },
+        "last_activity_at": "2025-11-18T10:30:00"
     }
     ```
     """
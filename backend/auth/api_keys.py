@@ -8,6 +8,7 @@ Features:
 - SHA-256 hashed storage (never stores plaintext keys)
 - Authorization middleware (FastAPI dependency injection)
 - Rate limiting (1000 requests/hour per key by default)
+- Verified-key cache and batched usage writes (no database write per request)
 - Key management (create, list, revoke)
 - User association (keys tied to user accounts)
 
@@ -29,6 +30,7 @@ from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from backend.auth.key_cache import VerifiedAPIKey, usage_tracker, verified_key_cache
 from backend.db.connection import get_session
 from backend.db.models import (
     APIKeyCreateRequest,
@@ -174,17 +176,21 @@ class APIKeyAuth:
         db: Session,
         api_key: str,
         check_rate_limit: bool = True,
-    ) -> tuple[str, APIKeyORM]:
+    ) -> tuple[str, VerifiedAPIKey]:
         """
         Validate an API key and check rate limiting.
 
+        Keys are looked up in the verified-key cache first, so the database is
+        only queried on a miss. Usage is counted in memory by ``usage_tracker``
+        and written to the database in periodic batches.
+
         Args:
             db: Database session
             api_key: The API key to validate
             check_rate_limit: Whether to enforce rate limiting (default: True)
 
         Returns:
-            tuple: (user_id, api_key_orm)
+            tuple: (user_id, verified_key)
 
         Raises:
             HTTPException: If key is invalid, revoked, expired, or rate limited
@@ -192,21 +198,26 @@ class APIKeyAuth:
         # Hash the provided key
         key_hash = cls.hash_key(api_key)
 
-        # Query database for key
-        stmt = select(APIKeyORM).where(APIKeyORM.key_hash == key_hash)
-        result = db.execute(stmt)
-        api_key_orm = result.scalar_one_or_none()
+        verified_key = verified_key_cache.get(key_hash)
+        if verified_key is None:
+            # Query database for key
+            stmt = select(APIKeyORM).where(APIKeyORM.key_hash == key_hash)
+            result = db.execute(stmt)
+            api_key_orm = result.scalar_one_or_none()
 
-        # Check if key exists
-        if not api_key_orm:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid API key",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            # Check if key exists
+            if not api_key_orm:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid API key",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+
+            verified_key = VerifiedAPIKey.from_orm(api_key_orm)
+            verified_key_cache.set(key_hash, verified_key)
 
         # Check if key is revoked
-        if api_key_orm.is_revoked:
+        if verified_key.is_revoked:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="API key has been revoked",
@@ -214,7 +225,7 @@ class APIKeyAuth:
             )
 
         # Check if key is active
-        if not api_key_orm.is_active:
+        if not verified_key.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="API key is not active",
@@ -222,81 +233,46 @@ class APIKeyAuth:
             )
 
         # Check expiration
-        if api_key_orm.expires_at and api_key_orm.expires_at < datetime.utcnow():
+        if verified_key.expires_at and verified_key.expires_at < datetime.utcnow():
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="API key has expired",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Rate limiting check
-        if check_rate_limit:
-            cls._check_rate_limit(db, api_key_orm)
-
-        # Update usage statistics
-        api_key_orm.last_used_at = datetime.utcnow()
-        api_key_orm.request_count += 1
-
-        # Increment current window usage count
-        api_key_orm.current_usage_count += 1
-
-        db.commit()
-        db.refresh(api_key_orm)
+        # Rate limiting check and usage accounting (in memory, flushed in batches)
+        decision = usage_tracker.record(verified_key, check_rate_limit=check_rate_limit)
+        if not decision.allowed:
+            cls._raise_rate_limited(decision.limit, decision.reset_at)
 
-        return str(api_key_orm.user_id), api_key_orm
+        return str(verified_key.user_id), verified_key
 
     @classmethod
-    def _check_rate_limit(cls, db: Session, api_key_orm: APIKeyORM) -> None:
+    def _raise_rate_limited(cls, limit: int, window_end: datetime) -> None:
         """
-        Check if the API key has exceeded its rate limit.
-
-        Implements a sliding window rate limiter:
-        - Resets window if expired
-        - Checks if current usage is within limit
-        - Raises 429 if limit exceeded
+        Raise 429 Too Many Requests for a key over its limit.
 
         Args:
-            db: Database session
-            api_key_orm: The API key ORM object
+            limit: Requests allowed per window
+            window_end: When the current window resets
 
         Raises:
-            HTTPException: 429 Too Many Requests if limit exceeded
+            HTTPException: 429 Too Many Requests
         """
-        now = datetime.utcnow()
-
-        # Initialize window if not set
-        if not api_key_orm.rate_limit_window_start:
-            api_key_orm.rate_limit_window_start = now
-            api_key_orm.current_usage_count = 0
-            return
+        # Calculate time until window resets
+        time_until_reset = (window_end - datetime.utcnow()).total_seconds()
 
-        # Calculate window end
-        window_end = api_key_orm.rate_limit_window_start + timedelta(
-            seconds=api_key_orm.rate_limit_window_seconds
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded. Try again in {int(time_until_reset)} seconds.",
+            headers={
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(window_end.timestamp())),
+                "Retry-After": str(int(time_until_reset)),
+            },
         )
 
-        # Reset window if expired
-        if now > window_end:
-            api_key_orm.rate_limit_window_start = now
-            api_key_orm.current_usage_count = 0
-            return
-
-        # Check if limit exceeded
-        if api_key_orm.current_usage_count >= api_key_orm.rate_limit_requests:
-            # Calculate time until window resets
-            time_until_reset = (window_end - now).total_seconds()
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Try again in {int(time_until_reset)} seconds.",
-                headers={
-                    "X-RateLimit-Limit": str(api_key_orm.rate_limit_requests),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(window_end.timestamp())),
-                    "Retry-After": str(int(time_until_reset)),
-                },
-            )
-
     @classmethod
     def list_keys(
         cls,
@@ -354,6 +330,10 @@ class APIKeyAuth:
         """
         Revoke an API key.
 
+        The key is evicted from this process's verified-key cache at once;
+        other workers accept it until their cached entry expires (at most
+        ``verified_key_cache.ttl`` seconds).
+
         Args:
             db: Database session
             user_id: User ID that owns the key
@@ -384,6 +364,7 @@ class APIKeyAuth:
         api_key_orm.is_revoked = True
 
         db.commit()
+        verified_key_cache.invalidate(key_id)
         return True
 
     @classmethod
@@ -420,6 +401,8 @@ class APIKeyAuth:
         # Delete the key
         db.delete(api_key_orm)
         db.commit()
+        verified_key_cache.invalidate(key_id)
+        usage_tracker.forget(key_id)
         return True
 
 
@@ -480,7 +463,7 @@ async def require_api_key(
         )
 
     # Validate key and get user_id
-    user_id, _ = await APIKeyAuth.validate_key(db, api_key, check_rate_limit=True)
+    user_id, _ = APIKeyAuth.validate_key(db, api_key, check_rate_limit=True)
 
     return user_id
 
@@ -517,7 +500,7 @@ async def optional_api_key(
         return None
 
     try:
-        user_id, _ = await APIKeyAuth.validate_key(db, api_key, check_rate_limit=True)
+        user_id, _ = APIKeyAuth.validate_key(db, api_key, check_rate_limit=True)
         return user_id
     except HTTPException:
         return None
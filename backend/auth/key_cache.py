@@ -0,0 +1,437 @@
+"""
+Verified API key cache and in-memory usage accounting
+
+Keeps API key authentication off the database write path:
+- VerifiedKeyCache remembers key lookups (by key hash) for a short TTL, so
+  repeat requests skip the SELECT. Revoking or deleting a key evicts it
+  immediately in this process only: other workers keep accepting the key
+  until their cached entry expires (at most ``ttl``, 30 seconds by default).
+- UsageTracker enforces each key's request window in memory and accumulates
+  usage, which is written to PostgreSQL in one batched UPDATE per flush
+  interval instead of a commit per request.
+
+Rate limits are enforced per process: with N workers a key can make up to
+N x ``rate_limit_requests`` per window. Flushes add each worker's requests
+to the stored counter (windows are aligned to fixed boundaries so all
+workers count into the same one), and a worker continues the stored count
+when it first sees a key, so limits carry over across restarts up to the
+last flush.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, case, or_, update
+from sqlalchemy.orm import Session
+
+from backend.db.models import APIKeyORM
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _window_start(now: datetime, window: timedelta) -> datetime:
+    """Start of the fixed window containing ``now`` (the same in every worker)."""
+    return _EPOCH + (now - _EPOCH) // window * window
+
+
+@dataclass
+class VerifiedAPIKey:
+    """Snapshot of the API key fields needed to authenticate a request"""
+
+    id: UUID
+    user_id: UUID
+    key_name: str
+    key_prefix: str
+    is_active: bool
+    is_revoked: bool
+    expires_at: Optional[datetime]
+    rate_limit_requests: int
+    rate_limit_window_seconds: int
+    current_usage_count: int
+    rate_limit_window_start: Optional[datetime]
+
+    @classmethod
+    def from_orm(cls, api_key_orm: APIKeyORM) -> "VerifiedAPIKey":
+        """Build a snapshot from a loaded APIKeyORM row."""
+        return cls(
+            id=api_key_orm.id,
+            user_id=api_key_orm.user_id,
+            key_name=api_key_orm.key_name,
+            key_prefix=api_key_orm.key_prefix,
+            is_active=api_key_orm.is_active,
+            is_revoked=api_key_orm.is_revoked,
+            expires_at=api_key_orm.expires_at,
+            rate_limit_requests=api_key_orm.rate_limit_requests,
+            rate_limit_window_seconds=api_key_orm.rate_limit_window_seconds,
+            current_usage_count=api_key_orm.current_usage_count or 0,
+            rate_limit_window_start=api_key_orm.rate_limit_window_start,
+        )
+
+
+class VerifiedKeyCache:
+    """
+    LRU + TTL cache of API key snapshots keyed by key hash.
+
+    Only hashes are stored, never plaintext keys.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 30.0):
+        """
+        Initialize key cache.
+
+        Args:
+            max_entries: Maximum cached keys
+            ttl: Seconds a cached key stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[str, Tuple[float, VerifiedAPIKey]]" = OrderedDict()
+        self._hash_by_id: Dict[UUID, str] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key_hash: str) -> Optional[VerifiedAPIKey]:
+        """
+        Get a cached key.
+
+        Args:
+            key_hash: SHA-256 hash of the API key
+
+        Returns:
+            Cached snapshot, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key_hash)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key_hash)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key_hash: str, api_key: VerifiedAPIKey) -> None:
+        """
+        Cache a key loaded from the database.
+
+        Args:
+            key_hash: SHA-256 hash of the API key
+            api_key: Snapshot of the key row
+        """
+        with self._lock:
+            self._remove(key_hash)
+            self._entries[key_hash] = (time.monotonic() + self.ttl, api_key)
+            self._hash_by_id[api_key.id] = key_hash
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, key_id: UUID) -> bool:
+        """
+        Drop a key after it is revoked, deleted or changed.
+
+        Args:
+            key_id: API key ID
+
+        Returns:
+            True if the key was cached
+        """
+        with self._lock:
+            key_hash = self._hash_by_id.get(key_id)
+            if key_hash is None:
+                return False
+            self._remove(key_hash)
+            self.invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        """Drop all cached keys."""
+        with self._lock:
+            self._entries.clear()
+            self._hash_by_id.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key_hash: str) -> None:
+        """Remove an entry and its ID index reference (lock held)."""
+        entry = self._entries.pop(key_hash, None)
+        if entry is not None and self._hash_by_id.get(entry[1].id) == key_hash:
+            del self._hash_by_id[entry[1].id]
+
+
+class UsageDecision(NamedTuple):
+    """Outcome of recording one request against a key's rate limit"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_at: datetime
+
+
+@dataclass
+class _KeyUsage:
+    """In-memory usage state for one key"""
+
+    window_start: Optional[datetime]
+    window_count: int
+    pending_requests: int = 0
+    pending_window_requests: int = 0  # Unflushed requests in the current window
+    last_used_at: Optional[datetime] = None
+
+
+class UsageTracker:
+    """
+    Per-key rate-limit windows and usage counters, flushed in batches.
+
+    ``record`` never touches the database. ``flush`` adds every key's
+    pending usage to the stored counters in a single executemany UPDATE;
+    ``start`` runs it periodically on the event loop.
+    """
+
+    def __init__(self, flush_interval: float = 5.0):
+        """
+        Initialize usage tracker.
+
+        Args:
+            flush_interval: Seconds between background flushes
+        """
+        self.flush_interval = flush_interval
+
+        self._usage: Dict[UUID, _KeyUsage] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._session_factory: Optional[Callable[[], Session]] = None
+
+        self.flushes = 0
+        self.flushed_requests = 0
+        self.flush_errors = 0
+
+    def record(
+        self,
+        api_key: VerifiedAPIKey,
+        check_rate_limit: bool = True,
+        now: Optional[datetime] = None,
+    ) -> UsageDecision:
+        """
+        Count a request against a key (fixed window of ``rate_limit_window_seconds``).
+
+        Args:
+            api_key: Key making the request
+            check_rate_limit: Whether to refuse requests over the limit
+            now: Current time (defaults to utcnow)
+
+        Returns:
+            UsageDecision; when ``allowed`` is False nothing was counted
+        """
+        now = now or datetime.utcnow()
+        window = timedelta(seconds=api_key.rate_limit_window_seconds)
+        limit = api_key.rate_limit_requests
+
+        with self._lock:
+            usage = self._usage.get(api_key.id)
+            if usage is None:
+                # First request seen by this process: continue the stored window
+                usage = _KeyUsage(api_key.rate_limit_window_start, api_key.current_usage_count)
+                self._usage[api_key.id] = usage
+
+            if usage.window_start is None or now >= usage.window_start + window:
+                usage.window_start = _window_start(now, window)
+                usage.window_count = 0
+                usage.pending_window_requests = 0
+
+            reset_at = usage.window_start + window
+            if check_rate_limit and usage.window_count >= limit:
+                return UsageDecision(False, limit, 0, reset_at)
+
+            usage.window_count += 1
+            usage.pending_requests += 1
+            usage.pending_window_requests += 1
+            usage.last_used_at = now
+            return UsageDecision(True, limit, max(0, limit - usage.window_count), reset_at)
+
+    def forget(self, key_id: UUID) -> None:
+        """Drop all state for a deleted key."""
+        with self._lock:
+            self._usage.pop(key_id, None)
+
+    def pending(self) -> int:
+        """Number of requests not yet written to the database."""
+        with self._lock:
+            return sum(usage.pending_requests for usage in self._usage.values())
+
+    def flush(self, db: Session) -> int:
+        """
+        Add pending usage for every key to the stored counters in one UPDATE and commit.
+
+        Counts are incremented rather than overwritten, so flushes from
+        several workers add up. A flush for an older window than the stored
+        one leaves the stored window alone. On failure the pending counts are
+        restored so the next flush retries.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of requests written
+        """
+        with self._lock:
+            rows = [
+                {
+                    "key_id": key_id,
+                    "requests": usage.pending_requests,
+                    "window_requests": usage.pending_window_requests,
+                    "window_start": usage.window_start,
+                    "used_at": usage.last_used_at,
+                }
+                for key_id, usage in self._usage.items()
+                if usage.pending_requests
+            ]
+            for row in rows:
+                self._usage[row["key_id"]].pending_requests = 0
+                self._usage[row["key_id"]].pending_window_requests = 0
+
+        if not rows:
+            return 0
+
+        table = APIKeyORM.__table__
+        stored_start = table.c.rate_limit_window_start
+        window_start = bindparam("window_start")
+        newer_window = or_(stored_start.is_(None), stored_start < window_start)
+        used_at = bindparam("used_at")
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("key_id"))
+            .values(
+                request_count=table.c.request_count + bindparam("requests"),
+                current_usage_count=case(
+                    (
+                        stored_start == window_start,
+                        table.c.current_usage_count + bindparam("window_requests"),
+                    ),
+                    (newer_window, bindparam("window_requests")),
+                    else_=table.c.current_usage_count,
+                ),
+                rate_limit_window_start=case((newer_window, window_start), else_=stored_start),
+                last_used_at=case(
+                    (or_(table.c.last_used_at.is_(None), table.c.last_used_at < used_at), used_at),
+                    else_=table.c.last_used_at,
+                ),
+            )
+        )
+        try:
+            db.execute(statement, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            self.flush_errors += 1
+            with self._lock:
+                for row in rows:
+                    usage = self._usage.get(row["key_id"])
+                    if usage is not None:
+                        usage.pending_requests += row["requests"]
+                        if usage.window_start == row["window_start"]:
+                            usage.pending_window_requests += row["window_requests"]
+            raise
+
+        written = sum(row["requests"] for row in rows)
+        self.flushes += 1
+        self.flushed_requests += written
+        self._prune()
+        return written
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Start periodic background flushing on the running event loop.
+
+        Args:
+            session_factory: Callable returning a new database session
+        """
+        self._session_factory = session_factory
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background flushing and write any remaining usage."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session_factory is not None:
+            try:
+                await asyncio.to_thread(self._flush_with_new_session)
+            except Exception as e:
+                logger.warning(f"Final API key usage flush failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all usage state without flushing."""
+        with self._lock:
+            self._usage.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker counters."""
+        return {
+            "tracked_keys": len(self._usage),
+            "pending_requests": self.pending(),
+            "flushes": self.flushes,
+            "flushed_requests": self.flushed_requests,
+            "flush_errors": self.flush_errors,
+        }
+
+    async def _run(self) -> None:
+        """Flush every ``flush_interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self._flush_with_new_session)
+            except Exception as e:
+                logger.warning(f"API key usage flush failed: {e}")
+
+    def _flush_with_new_session(self) -> int:
+        db = self._session_factory()
+        try:
+            return self.flush(db)
+        finally:
+            db.close()
+
+    def _prune(self) -> None:
+        """Forget keys idle for an hour (their state has already been written)."""
+        now = datetime.utcnow()
+        with self._lock:
+            idle = [
+                key_id
+                for key_id, usage in self._usage.items()
+                if not usage.pending_requests
+                and usage.last_used_at is not None
+                and usage.last_used_at < now - timedelta(hours=1)
+            ]
+            for key_id in idle:
+                del self._usage[key_id]
+
+
+# Process-wide instances shared by APIKeyAuth
+verified_key_cache = VerifiedKeyCache()
+usage_tracker = UsageTracker()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Benchmark attribution graph construction.
+
+Builds synthetic attribution graphs in an in-memory SQLite database and
+compares the legacy per-card BFS (one query per visited card, ``list.pop(0)``,
+duplicate enqueues) against the single recursive-CTE query used by
+``AttributionGraphRepository``, plus a warm ``AttributionGraphCache`` lookup.
+
+Edges follow a power-law so a few "popular" cards have very high degree,
+which is the case that made the legacy BFS slow.
+
+Usage:
+    python backend/benchmarks/bench_attribution_graph.py
+    python backend/benchmarks/bench_attribution_graph.py --edges 10000 100000 --depth 3
+    python backend/benchmarks/bench_attribution_graph.py --centers 20 --rtt-ms 1.0
+
+SQLite runs in-process, so a query costs microseconds rather than a network
+round-trip. The "+RTT" columns add ``--rtt-ms`` per query to model a database
+on another host.
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.db.attribution_graph import (  # noqa: E402
+    ATTRIBUTION_GRAPH_SQL,
+    AttributionGraphCache,
+    reachable_cards,
+)
+
+SCHEMA = """
+CREATE TABLE cards (id TEXT PRIMARY KEY, title TEXT, user_id TEXT);
+CREATE TABLE attributions (
+    id TEXT PRIMARY KEY,
+    source_card_id TEXT NOT NULL,
+    target_card_id TEXT NOT NULL,
+    attribution_type TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+INDEXES = """
+CREATE INDEX idx_attributions_source_card_id ON attributions(source_card_id);
+CREATE INDEX idx_attributions_target_card_id ON attributions(target_card_id);
+"""
+
+TYPES = ("citation", "remix", "reply")
+
+
+def card_id(n: int) -> str:
+    """Deterministic UUID string for card number ``n``."""
+    return str(UUID(int=n + 1))
+
+
+def build_database(edges: int, avg_degree: int, seed: int) -> Tuple[sqlite3.Connection, int]:
+    """Create a database with ``edges`` power-law distributed attributions."""
+    rng = random.Random(seed)
+    n_cards = max(10, edges * 2 // avg_degree)
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO cards VALUES (?, ?, ?)",
+        ((card_id(i), f"Card {i}", card_id(i % 1000)) for i in range(n_cards)),
+    )
+
+    def pick() -> int:
+        # Zipf-like (log-uniform) card choice: low numbers are the popular cards
+        return int(n_cards ** rng.random()) - 1
+
+    seen: Set[Tuple[int, int, str]] = set()
+    rows = []
+    while len(rows) < edges:
+        source, target = pick(), rng.randrange(n_cards)
+        kind = TYPES[len(rows) % 3]
+        if source == target or (source, target, kind) in seen:
+            continue
+        seen.add((source, target, kind))
+        rows.append(
+            (
+                str(UUID(int=len(rows) + 1)),
+                card_id(source),
+                card_id(target),
+                kind,
+                f"2025-01-01T00:00:{len(rows) % 60:02d}",
+            )
+        )
+    conn.executemany("INSERT INTO attributions VALUES (?, ?, ?, ?, ?)", rows)
+    conn.executescript(INDEXES)
+    conn.execute("ANALYZE")
+    return conn, n_cards
+
+
+def legacy_graph(conn: sqlite3.Connection, center: str, depth: int) -> Tuple[int, int]:
+    """Original route algorithm. Returns (queries, edges)."""
+    visited: Set[str] = set()
+    edges: List[Dict] = []
+    queue = [(center, 0)]
+    queries = 0
+
+    while queue:
+        current, current_depth = queue.pop(0)
+        if current in visited or current_depth >= depth:
+            continue
+        visited.add(current)
+
+        queries += 1
+        rows = conn.execute(
+            "SELECT id, source_card_id, target_card_id, attribution_type, created_at "
+            "FROM attributions WHERE source_card_id = ? OR target_card_id = ?",
+            (current, current),
+        ).fetchall()
+        for _, source, target, kind, created_at in rows:
+            edges.append({"source_card_id": source, "target_card_id": target})
+            if source != current:
+                queue.append((source, current_depth + 1))
+            if target != current:
+                queue.append((target, current_depth + 1))
+
+    conn.execute(
+        f"SELECT id FROM cards WHERE id IN ({','.join('?' * len(visited))})", list(visited)
+    ).fetchall()
+    return queries + 1, len(edges)
+
+
+def cte_graph(conn: sqlite3.Connection, center: str, depth: int) -> Tuple[int, int, Set[str]]:
+    """Recursive-CTE algorithm. Returns (queries, edges, visited)."""
+    rows = conn.execute(ATTRIBUTION_GRAPH_SQL, {"card_id": center, "depth": depth}).fetchall()
+    edges = [{"source_card_id": r[1], "target_card_id": r[2]} for r in rows]
+    visited = reachable_cards(center, edges, depth)
+    conn.execute(
+        f"SELECT id FROM cards WHERE id IN ({','.join('?' * len(visited))})", list(visited)
+    ).fetchall()
+    return 2, len(edges), visited
+
+
+def timed(fn, *args) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark attribution graph construction")
+    parser.add_argument(
+        "--edges",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Graph sizes to benchmark (default: 10000 100000 1000000)",
+    )
+    parser.add_argument("--depth", type=int, default=2, help="Graph depth 1-3 (default: 2)")
+    parser.add_argument(
+        "--centers", type=int, default=10, help="Centre cards per size (default: 10)"
+    )
+    parser.add_argument("--avg-degree", type=int, default=10, help="Mean card degree")
+    parser.add_argument(
+        "--rtt-ms",
+        type=float,
+        default=0.5,
+        help="Modelled database round-trip per query in ms (default: 0.5)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"depth={args.depth}, centres per size={args.centers} (card 0 is the most popular)\n")
+    print(
+        f"{'edges':>10} {'graph edges':>12} {'legacy q':>9} {'legacy ms':>10} "
+        f"{'+RTT ms':>9} {'cte q':>6} {'cte ms':>8} {'+RTT ms':>9} {'cached ms':>10} "
+        f"{'speedup':>8}"
+    )
+
+    for n_edges in args.edges:
+        start = time.perf_counter()
+        conn, n_cards = build_database(n_edges, args.avg_degree, args.seed)
+        build_s = time.perf_counter() - start
+
+        rng = random.Random(args.seed)
+        centers = [card_id(0)] + [card_id(rng.randrange(n_cards)) for _ in range(args.centers - 1)]
+        cache = AttributionGraphCache(max_entries=len(centers))
+
+        legacy_ms, cte_ms, cached_ms, legacy_q, graph_edges = [], [], [], [], []
+        for center in centers:
+            ms, (queries, _) = timed(legacy_graph, conn, center, args.depth)
+            legacy_ms.append(ms)
+            legacy_q.append(queries)
+
+            ms, (_, n_graph_edges, visited) = timed(cte_graph, conn, center, args.depth)
+            cte_ms.append(ms)
+            graph_edges.append(n_graph_edges)
+
+            cache.set(center, args.depth, {"visited": visited})
+            ms, _ = timed(cache.get, center, args.depth)
+            cached_ms.append(ms)
+
+        legacy = statistics.mean(legacy_ms)
+        legacy_rtt = legacy + statistics.mean(legacy_q) * args.rtt_ms
+        cte = statistics.mean(cte_ms)
+        cte_rtt = cte + 2 * args.rtt_ms
+        print(
+            f"{n_edges:>10,} {statistics.mean(graph_edges):>12,.0f} "
+            f"{statistics.mean(legacy_q):>9,.0f} {legacy:>10.2f} {legacy_rtt:>9.2f} "
+            f"{2:>6} {cte:>8.2f} {cte_rtt:>9.2f} {statistics.mean(cached_ms):>10.4f} "
+            f"{legacy_rtt / cte_rtt:>7.1f}x   (built in {build_s:.1f}s)"
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
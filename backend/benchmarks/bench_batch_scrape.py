@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch scraping throughput.
+
+Scrapes ``--targets`` targets with a stub scraper that simulates upstream
+latency (``--latency-ms`` per extract, ``--items`` results per target), and
+reports normalized items/sec for:
+
+- legacy: the previous Celery task pattern, one ``asyncio.run`` for
+  ``extract`` plus one per item for ``normalize``, target after target
+- batch: ``scrape_many`` on one event loop at each ``--concurrency`` level
+
+No network access is needed; the stub isolates scheduling overhead and
+concurrency from real upstream behaviour, so absolute numbers are only
+indicative.
+
+Usage:
+    python backend/benchmarks/bench_batch_scrape.py
+    python backend/benchmarks/bench_batch_scrape.py --targets 256 --latency-ms 100
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.scrapers.base import (  # noqa: E402
+    AuthorModel,
+    BaseScraper,
+    ContentModel,
+    UnifiedContent,
+)
+from backend.scrapers.batch import ScrapeTarget, scrape_many  # noqa: E402
+
+
+class StubScraper(BaseScraper):
+    """Returns ``items`` results per target after ``latency`` seconds."""
+
+    def __init__(self, latency: float, items: int):
+        self.latency = latency
+        self.items = items
+
+    async def health_check(self) -> dict:
+        return {"status": "ok", "message": "stub"}
+
+    async def extract(self, target: str, limit: int = 20) -> list[dict]:
+        await asyncio.sleep(self.latency)
+        return [
+            {"id": f"{target}-{i}", "text": f"Item {i} from {target}"} for i in range(self.items)
+        ]
+
+    async def normalize(self, raw_data: dict) -> UnifiedContent:
+        return UnifiedContent(
+            platform="web",
+            source_url=f"https://example.com/{raw_data['id']}",
+            author=AuthorModel(id="stub", platform="web", username="stub"),
+            content=ContentModel(body=raw_data["text"], word_count=len(raw_data["text"].split())),
+        )
+
+
+def run_legacy(scraper: StubScraper, targets: list[ScrapeTarget]) -> int:
+    """One event loop for extract and one per normalize, target after target."""
+    items = 0
+    for target in targets:
+        raw_data = asyncio.run(scraper.extract(target.target, target.limit))
+        for item in raw_data:
+            asyncio.run(scraper.normalize(item))
+            items += 1
+    return items
+
+
+async def run_batch(scraper: StubScraper, targets: list[ScrapeTarget], concurrency: int) -> int:
+    items = 0
+    async for event in scrape_many(
+        targets,
+        concurrency=concurrency,
+        platform_limits={"web": concurrency},
+        scraper_factory=lambda platform: scraper,
+    ):
+        if event.type == "item":
+            items += 1
+        elif event.type == "error":
+            raise RuntimeError(event.error)
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch scraping throughput")
+    parser.add_argument("--targets", type=int, default=128, help="Targets (default: 128)")
+    parser.add_argument("--items", type=int, default=20, help="Items per target (default: 20)")
+    parser.add_argument(
+        "--latency-ms", type=float, default=50, help="Simulated extract latency (default: 50)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32],
+        help="Concurrency levels (default: 1 8 32)",
+    )
+    args = parser.parse_args()
+
+    scraper = StubScraper(args.latency_ms / 1000, args.items)
+    targets = [ScrapeTarget("web", f"https://example.com/page{i}") for i in range(args.targets)]
+    expected = args.targets * args.items
+
+    print(
+        f"{args.targets} targets x {args.items} items, "
+        f"{args.latency_ms:.0f} ms simulated latency per target\n"
+    )
+    print(f"{'mode':>14} {'items':>7} {'seconds':>8} {'items/s':>10} {'speedup':>8}")
+
+    start = time.perf_counter()
+    items = run_legacy(scraper, targets)
+    legacy_elapsed = time.perf_counter() - start
+    assert items == expected, items
+    legacy_rate = items / legacy_elapsed
+    print(f"{'legacy':>14} {items:>7,} {legacy_elapsed:>8.2f} {legacy_rate:>10,.0f} {1:>7.1f}x")
+
+    for concurrency in args.concurrency:
+        start = time.perf_counter()
+        items = asyncio.run(run_batch(scraper, targets, concurrency))
+        elapsed = time.perf_counter() - start
+        assert items == expected, items
+        rate = items / elapsed
+        print(
+            f"{f'batch x{concurrency}':>14} {items:>7,} {elapsed:>8.2f} {rate:>10,.0f} "
+            f"{rate / legacy_rate:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
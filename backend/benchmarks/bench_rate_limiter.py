@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark AdaptiveRateLimiter per-check latency and memory.
+
+Drives ``--ips`` distinct client IPs (100k by default) through the limiter,
+plus a set of "hot" IPs that exceed the limit and get blocked, and compares
+the previous list-of-datetimes implementation (reproduced below as
+``LegacyRateLimiter``) against the current sliding-window counter.
+
+Each implementation runs in its own subprocess so the reported resident set
+size (RSS) growth is not polluted by the other run.
+
+Usage:
+    python backend/benchmarks/bench_rate_limiter.py
+    python backend/benchmarks/bench_rate_limiter.py --ips 100000 --requests-per-ip 20
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+MAX_REQUESTS = 100
+WINDOW_SECONDS = 60
+BLOCK_SECONDS = 900
+
+
+class LegacyRateLimiter:
+    """The original algorithm: one datetime per request, one task per block."""
+
+    def __init__(self, max_requests: int, window_seconds: int, block_duration_seconds: int):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.block_duration_seconds = block_duration_seconds
+        self.requests: Dict[str, List[datetime]] = {}
+        self.block_list: set = set()
+        self._unblock_tasks: Dict[str, asyncio.Task] = {}
+
+    async def check_rate_limit(self, client_ip: str, endpoint: str = None, cost: int = 1) -> bool:
+        key = f"{client_ip}:{endpoint}" if endpoint else client_ip
+        now = datetime.now()
+        if key in self.block_list:
+            return False
+        if key not in self.requests:
+            self.requests[key] = []
+        cutoff_time = now - timedelta(seconds=self.window_seconds)
+        self.requests[key] = [t for t in self.requests[key] if t > cutoff_time]
+        if len(self.requests[key]) + cost > self.max_requests:
+            self.block_list.add(key)
+            if key not in self._unblock_tasks or self._unblock_tasks[key].done():
+                self._unblock_tasks[key] = asyncio.create_task(self._unblock_after_delay(key))
+            return False
+        for _ in range(cost):
+            self.requests[key].append(now)
+        return True
+
+    async def _unblock_after_delay(self, key: str) -> None:
+        await asyncio.sleep(self.block_duration_seconds)
+        self.block_list.discard(key)
+        self.requests.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def make_limiter(impl: str):
+    if impl == "legacy":
+        return LegacyRateLimiter(MAX_REQUESTS, WINDOW_SECONDS, BLOCK_SECONDS)
+
+    from backend.security.rate_limiting import AdaptiveRateLimiter
+
+    return AdaptiveRateLimiter(MAX_REQUESTS, WINDOW_SECONDS, BLOCK_SECONDS)
+
+
+async def run_impl(args: argparse.Namespace) -> Dict:
+    """Run the workload against one implementation and collect measurements."""
+    limiter = make_limiter(args.impl)
+    ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.ips)]
+    hot = ips[: args.hot_ips]
+
+    # Preallocate latency samples so they do not count towards RSS growth
+    total = args.ips * args.requests_per_ip + len(hot) * (MAX_REQUESTS + 50)
+    samples = array("q", bytes(8 * total))
+    checks = blocked = 0
+
+    gc.collect()
+    rss_before = rss_bytes()
+
+    start = time.perf_counter()
+    for _ in range(args.requests_per_ip):
+        for ip in ips:
+            t0 = time.perf_counter_ns()
+            allowed = await limiter.check_rate_limit(ip, "/api/v1/scrape")
+            samples[checks] = time.perf_counter_ns() - t0
+            checks += 1
+            blocked += not allowed
+    # Hot clients blow through the limit and get blocked
+    for _ in range(MAX_REQUESTS + 50):
+        for ip in hot:
+            t0 = time.perf_counter_ns()
+            allowed = await limiter.check_rate_limit(ip, "/api/v1/search")
+            samples[checks] = time.perf_counter_ns() - t0
+            checks += 1
+            blocked += not allowed
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    rss_after = rss_bytes()
+    samples = sorted(samples)
+    return {
+        "impl": args.impl,
+        "checks": checks,
+        "blocked": blocked,
+        "keys": len(limiter),
+        "tasks": len(asyncio.all_tasks()) - 1,
+        "checks_per_s": checks / elapsed,
+        "mean_ns": statistics.mean(samples),
+        "p99_ns": samples[int(len(samples) * 0.99)],
+        "rss_mb": (rss_after - rss_before) / 1024 / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AdaptiveRateLimiter")
+    parser.add_argument("--ips", type=int, default=100_000, help="Distinct client IPs")
+    parser.add_argument(
+        "--requests-per-ip", type=int, default=10, help="Requests per IP (default: 10)"
+    )
+    parser.add_argument(
+        "--hot-ips", type=int, default=1000, help="IPs that exceed the limit (default: 1000)"
+    )
+    parser.add_argument("--impl", choices=["legacy", "current"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.impl:
+        print(json.dumps(asyncio.run(run_impl(args))))
+        return
+
+    print(
+        f"{args.ips:,} IPs x {args.requests_per_ip} requests, {args.hot_ips:,} hot IPs "
+        f"(limit {MAX_REQUESTS}/{WINDOW_SECONDS}s)\n"
+    )
+    print(
+        f"{'impl':>8} {'checks':>10} {'blocked':>8} {'keys':>8} {'tasks':>6} "
+        f"{'checks/s':>10} {'mean ns':>8} {'p99 ns':>8} {'RSS MB':>7}"
+    )
+    for impl in ("legacy", "current"):
+        output = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--impl", impl],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{r['impl']:>8} {r['checks']:>10,} {r['blocked']:>8,} {r['keys']:>8,} "
+            f"{r['tasks']:>6,} {r['checks_per_s']:>10,.0f} {r['mean_ns']:>8,.0f} "
+            f"{r['p99_ns']:>8,} {r['rss_mb']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
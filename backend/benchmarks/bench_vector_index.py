@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark ANN recall and latency of pgvector indexes.
+
+Loads synthetic clustered vectors (1536-d by default) into a scratch table,
+computes exact top-k neighbours with index scans disabled, then builds each
+index type with ``VectorIndexManager`` (parameters derived from the row
+count) and sweeps its search knob:
+
+- hnsw: ``hnsw.ef_search`` (``--ef-search``)
+- ivfflat: ``ivfflat.probes`` (``--probes``)
+
+For every setting it reports recall@k against the exact results and the
+per-query latency, i.e. the recall-vs-latency curve to pick
+``similarity_search(ef_search=..., probes=...)`` from.
+
+Needs PostgreSQL with pgvector at ``DATABASE_URL`` (or ``--database-url``).
+The scratch table is dropped afterwards unless ``--keep`` is given.
+
+Usage:
+    python backend/benchmarks/bench_vector_index.py
+    python backend/benchmarks/bench_vector_index.py --methods hnsw --ef-search 20 80 320
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.db.vector_index import (  # noqa: E402
+    INDEX_METHODS,
+    VectorIndexManager,
+    apply_search_params,
+)
+from pgvector.sqlalchemy import Vector  # noqa: E402
+from sqlalchemy import bindparam, create_engine, text  # noqa: E402
+
+TABLE = "bench_vector_index"
+INSERT_BATCH = 1000
+
+
+def make_vectors(count: int, dim: int, centers: List[List[float]], rng: random.Random):
+    """Points scattered around random cluster centres (embeddings are clustered too)."""
+    for _ in range(count):
+        center = rng.choice(centers)
+        yield [value + rng.random() - 0.5 for value in center]
+
+
+def load(engine, rows: int, dim: int, clusters: int, rng: random.Random) -> List[List[float]]:
+    """Create and fill the scratch table; return the cluster centres."""
+    centers = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(clusters)]
+    insert = text(f"INSERT INTO {TABLE} (id, embedding) VALUES (:id, :embedding)").bindparams(
+        bindparam("embedding", type_=Vector(dim))
+    )
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        conn.execute(
+            text(f"CREATE TABLE {TABLE} (id INTEGER PRIMARY KEY, embedding vector({dim}))")
+        )
+
+    start = time.perf_counter()
+    batch = []
+    for i, vector in enumerate(make_vectors(rows, dim, centers, rng)):
+        batch.append({"id": i, "embedding": vector})
+        if len(batch) == INSERT_BATCH or i == rows - 1:
+            with engine.begin() as conn:
+                conn.execute(insert, batch)
+            batch = []
+            print(f"  loaded {i + 1:,}/{rows:,} rows", end="\r", flush=True)
+    print(f"Loaded {rows:,} rows in {time.perf_counter() - start:.1f}s{' ' * 20}")
+    return centers
+
+
+def search(
+    engine,
+    queries: List[List[float]],
+    k: int,
+    dim: int,
+    ef_search: Optional[int] = None,
+    probes: Optional[int] = None,
+    exact: bool = False,
+):
+    """Run every query; return result IDs and per-query seconds."""
+    query = text(f"SELECT id FROM {TABLE} ORDER BY embedding <=> :query LIMIT :k").bindparams(
+        bindparam("query", type_=Vector(dim))
+    )
+    results, latencies = [], []
+    with engine.connect() as conn:
+        for vector in queries:
+            start = time.perf_counter()
+            with conn.begin():
+                apply_search_params(conn, ef_search=ef_search, probes=probes, exact=exact)
+                ids = [row.id for row in conn.execute(query, {"query": vector, "k": k})]
+            latencies.append(time.perf_counter() - start)
+            results.append(ids)
+    return results, latencies
+
+
+def recall(results: List[List[int]], truth: List[List[int]], k: int) -> float:
+    """Mean fraction of the exact top-k found per query."""
+    return statistics.mean(len(set(found) & set(exact)) / k for found, exact in zip(results, truth))
+
+
+def report(label: str, knob: str, results, latencies, truth, k: int) -> None:
+    latencies_ms = sorted(seconds * 1000 for seconds in latencies)
+    p95 = latencies_ms[min(len(latencies_ms) - 1, int(len(latencies_ms) * 0.95))]
+    print(
+        f"{label:>8} {knob:>14} {recall(results, truth, k):>9.3f} "
+        f"{statistics.median(latencies_ms):>8.2f} {p95:>8.2f} "
+        f"{len(latencies) / sum(latencies):>8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pgvector ANN recall vs latency")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="PostgreSQL URL")
+    parser.add_argument("--rows", type=int, default=20_000, help="Vectors (default: 20000)")
+    parser.add_argument("--dim", type=int, default=1536, help="Dimensions (default: 1536)")
+    parser.add_argument("--clusters", type=int, default=50, help="Clusters (default: 50)")
+    parser.add_argument("--queries", type=int, default=100, help="Queries (default: 100)")
+    parser.add_argument("-k", type=int, default=10, help="Neighbours per query (default: 10)")
+    parser.add_argument("--methods", nargs="+", choices=INDEX_METHODS, default=list(INDEX_METHODS))
+    parser.add_argument(
+        "--ef-search",
+        type=int,
+        nargs="+",
+        default=[10, 20, 40, 80, 160],
+        help="hnsw.ef_search values (default: 10 20 40 80 160)",
+    )
+    parser.add_argument(
+        "--probes",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="ivfflat.probes values (default: 1 2 4 8 16)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch table")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("set DATABASE_URL or pass --database-url")
+
+    engine = create_engine(args.database_url)
+    rng = random.Random(args.seed)
+    manager = VectorIndexManager(engine=engine, table=TABLE)
+
+    try:
+        centers = load(engine, args.rows, args.dim, args.clusters, rng)
+        queries = list(make_vectors(args.queries, args.dim, centers, rng))
+        truth, exact_latencies = search(engine, queries, args.k, args.dim, exact=True)
+
+        print(
+            f"\n{args.rows:,} x {args.dim}-d vectors, {args.clusters} clusters, "
+            f"{args.queries} queries, recall@{args.k}\n"
+        )
+        print(f"{'index':>8} {'setting':>14} {'recall':>9} {'p50 ms':>8} {'p95 ms':>8} {'q/s':>8}")
+        report("exact", "seq scan", truth, exact_latencies, truth, args.k)
+
+        for method in args.methods:
+            built = manager.build(method, concurrently=False)
+            params = built["params"]
+            print(
+                f"-- {method} built in {built['build_seconds']}s with "
+                + ", ".join(
+                    f"{key}={value}"
+                    for key, value in params.items()
+                    if value is not None and key != "method"
+                )
+            )
+            if method == "hnsw":
+                for ef_search in args.ef_search:
+                    results, latencies = search(
+                        engine, queries, args.k, args.dim, ef_search=ef_search
+                    )
+                    report(method, f"ef_search={ef_search}", results, latencies, truth, args.k)
+            else:
+                for probes in args.probes:
+                    results, latencies = search(engine, queries, args.k, args.dim, probes=probes)
+                    report(method, f"probes={probes}", results, latencies, truth, args.k)
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
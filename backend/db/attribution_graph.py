@@ -0,0 +1,265 @@
+"""Attribution graph traversal and caching
+
+Builds the "who cited who" neighbourhood of a card with a single recursive
+CTE instead of one query per visited card, and caches the result per
+(card, depth) until an attribution touching the graph is created.
+
+The SQL sticks to portable recursive-CTE syntax so the same statement runs on
+PostgreSQL and SQLite (used by the benchmark).
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.db.models import CardORM
+
+# Cards within ``depth - 1`` hops of the centre (edges are followed in both
+# directions), then every attribution touching one of those cards. The anchor
+# selects from ``cards`` so the parameter is compared against a typed column.
+ATTRIBUTION_GRAPH_SQL = """
+WITH RECURSIVE reachable(card_id, distance) AS (
+    SELECT id, 0 FROM cards WHERE id = :card_id
+    UNION
+    SELECT CASE
+               WHEN a.source_card_id = r.card_id THEN a.target_card_id
+               ELSE a.source_card_id
+           END,
+           r.distance + 1
+    FROM reachable r
+    JOIN attributions a
+      ON a.source_card_id = r.card_id OR a.target_card_id = r.card_id
+    WHERE r.distance + 1 < :depth
+),
+visited AS (
+    SELECT DISTINCT card_id FROM reachable
+)
+SELECT a.id, a.source_card_id, a.target_card_id, a.attribution_type, a.created_at
+FROM attributions a
+WHERE a.source_card_id IN (SELECT card_id FROM visited)
+   OR a.target_card_id IN (SELECT card_id FROM visited)
+ORDER BY a.created_at, a.id
+"""
+
+
+def reachable_cards(center: str, edges: Iterable[Dict[str, Any]], depth: int) -> Set[str]:
+    """Find cards fewer than ``depth`` hops from the centre card.
+
+    Args:
+        center: Centre card ID
+        edges: Graph edges with ``source_card_id`` and ``target_card_id``
+        depth: Graph depth (1 = centre card only)
+
+    Returns:
+        Set of visited card IDs (always includes the centre)
+    """
+    adjacency: Dict[str, List[str]] = {}
+    for edge in edges:
+        source, target = edge["source_card_id"], edge["target_card_id"]
+        adjacency.setdefault(source, []).append(target)
+        adjacency.setdefault(target, []).append(source)
+
+    visited = {center}
+    frontier = deque([(center, 0)])
+    while frontier:
+        card_id, distance = frontier.popleft()
+        if distance + 1 >= depth:
+            continue
+        for neighbour in adjacency.get(card_id, ()):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                frontier.append((neighbour, distance + 1))
+    return visited
+
+
+def _format_timestamp(value: Any) -> str:
+    """Render a timestamp column (datetime or driver string) as ISO 8601."""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+class AttributionGraphRepository:
+    """Repository for attribution graph queries"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_graph(self, card_id: UUID, depth: int) -> Optional[Dict[str, Any]]:
+        """
+        Build the attribution graph around a card in two queries.
+
+        Args:
+            card_id: Centre card ID
+            depth: Graph depth (1-3)
+
+        Returns:
+            Dictionary with ``nodes``, ``edges`` and ``visited`` card IDs,
+            or None if the card does not exist
+        """
+        rows = self.session.execute(
+            text(ATTRIBUTION_GRAPH_SQL), {"card_id": str(card_id), "depth": depth}
+        ).fetchall()
+
+        edges = [
+            {
+                "source_card_id": str(row.source_card_id),
+                "target_card_id": str(row.target_card_id),
+                "attribution_type": row.attribution_type,
+                "created_at": _format_timestamp(row.created_at),
+            }
+            for row in rows
+        ]
+
+        center = str(card_id)
+        visited = reachable_cards(center, edges, depth)
+
+        cards = (
+            self.session.query(CardORM.id, CardORM.title, CardORM.user_id)
+            .filter(CardORM.id.in_([UUID(c) for c in visited]))
+            .all()
+        )
+        if not any(str(c.id) == center for c in cards):
+            return None
+
+        attribution_counts: Dict[str, int] = {}
+        for edge in edges:
+            source_id = edge["source_card_id"]
+            attribution_counts[source_id] = attribution_counts.get(source_id, 0) + 1
+
+        nodes = [
+            {
+                "card_id": str(c.id),
+                "title": c.title,
+                "user_id": str(c.user_id),
+                "attribution_count": attribution_counts.get(str(c.id), 0),
+            }
+            for c in cards
+        ]
+
+        return {"nodes": nodes, "edges": edges, "visited": visited}
+
+
+class AttributionGraphCache:
+    """
+    LRU cache of attribution graphs keyed by (card, depth).
+
+    Entries are indexed by every card they visited, so creating an attribution
+    only invalidates the graphs that include one of its endpoints. A TTL bounds
+    staleness when several workers each hold their own cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        """
+        Initialize graph cache.
+
+        Args:
+            max_entries: Maximum cached graphs
+            ttl: Seconds a cached graph stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._by_card: Dict[str, Set[Tuple[str, int]]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, card_id: str, depth: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached graph.
+
+        Args:
+            card_id: Centre card ID
+            depth: Graph depth
+
+        Returns:
+            Cached graph, or None if missing or expired
+        """
+        key = (card_id, depth)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, card_id: str, depth: int, graph: Dict[str, Any]) -> None:
+        """
+        Cache a graph built by ``AttributionGraphRepository.get_graph``.
+
+        Args:
+            card_id: Centre card ID
+            depth: Graph depth
+            graph: Graph including its ``visited`` card IDs
+        """
+        key = (card_id, depth)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, graph)
+            for visited_id in graph["visited"]:
+                self._by_card.setdefault(visited_id, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_cards(self, *card_ids: str) -> int:
+        """
+        Drop every cached graph that visited any of the given cards.
+
+        Args:
+            *card_ids: Card IDs touched by a change
+
+        Returns:
+            Number of graphs invalidated
+        """
+        with self._lock:
+            keys = set()
+            for card_id in card_ids:
+                keys |= self._by_card.get(str(card_id), set())
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached graphs."""
+        with self._lock:
+            self._entries.clear()
+            self._by_card.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: Tuple[str, int]) -> None:
+        """Remove an entry and its reverse-index references (lock held)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for visited_id in entry[1]["visited"]:
+            keys = self._by_card.get(visited_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_card[visited_id]
+
+
+# Process-wide cache shared by the attribution routes
+attribution_graph_cache = AttributionGraphCache()
@@ -0,0 +1,5 @@
+-- Migration: Index cards.published_url
+-- Date: 2026-10-16
+-- Description: Support bulk slug collision checks when publishing batches of cards
+
+CREATE INDEX IF NOT EXISTS idx_cards_published_url ON cards(published_url);
@@ -0,0 +1,4 @@
+-- Rollback Migration: Remove cards.published_url index
+-- Date: 2026-10-16
+
+DROP INDEX IF EXISTS idx_cards_published_url;
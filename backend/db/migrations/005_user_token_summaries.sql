@@ -0,0 +1,41 @@
+-- Migration: Add user_token_summaries table
+-- Date: 2026-10-16
+-- Description: Per-user $EXTROPY ledger aggregates so totals and counts no longer scan the ledger
+
+CREATE TABLE IF NOT EXISTS user_token_summaries (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+
+    -- Running totals
+    total_earned DECIMAL(20, 8) NOT NULL DEFAULT 0.00000000 CHECK (total_earned >= 0),
+    total_spent DECIMAL(20, 8) NOT NULL DEFAULT 0.00000000 CHECK (total_spent >= 0),
+
+    -- Transaction counts
+    earn_count INTEGER NOT NULL DEFAULT 0,
+    transfer_count INTEGER NOT NULL DEFAULT 0,
+    attribution_count INTEGER NOT NULL DEFAULT 0,
+    tx_count INTEGER NOT NULL DEFAULT 0,
+
+    -- Most recent ledger entry involving the user
+    last_activity_at TIMESTAMP
+);
+
+COMMENT ON TABLE user_token_summaries IS 'Per-user $EXTROPY ledger aggregates (maintained with each ledger write)';
+
+-- Backfill from existing ledger history
+INSERT INTO user_token_summaries (
+    user_id, total_earned, total_spent,
+    earn_count, transfer_count, attribution_count, tx_count, last_activity_at
+)
+SELECT
+    u.id,
+    COALESCE(SUM(l.amount) FILTER (WHERE l.to_user_id = u.id), 0),
+    COALESCE(SUM(l.amount) FILTER (WHERE l.from_user_id = u.id), 0),
+    COUNT(*) FILTER (WHERE l.to_user_id = u.id AND l.transaction_type = 'earn'),
+    COUNT(*) FILTER (WHERE l.transaction_type = 'transfer'),
+    COUNT(*) FILTER (WHERE l.transaction_type = 'attribution'),
+    COUNT(*),
+    MAX(l.created_at)
+FROM users u
+JOIN extropy_ledger l ON l.to_user_id = u.id OR l.from_user_id = u.id
+GROUP BY u.id
+ON CONFLICT (user_id) DO NOTHING;
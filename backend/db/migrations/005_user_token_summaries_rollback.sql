@@ -0,0 +1,4 @@
+-- Rollback Migration: Remove user_token_summaries table
+-- Date: 2026-10-16
+
+DROP TABLE IF EXISTS user_token_summaries CASCADE;
@@ -0,0 +1,13 @@
+-- Migration: Add change-detection fingerprints to contents
+-- Date: 2026-10-16
+-- Description: HTTP validators and a normalized content hash per source so re-scrapes can skip unchanged documents
+
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS etag TEXT;
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS last_modified TEXT;
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS last_checked_at TIMESTAMP;
+
+COMMENT ON COLUMN contents.content_hash IS 'SHA-256 of the whitespace/Unicode-normalized body';
+COMMENT ON COLUMN contents.etag IS 'ETag from the last fetch (sent as If-None-Match)';
+COMMENT ON COLUMN contents.last_modified IS 'Last-Modified from the last fetch (sent as If-Modified-Since)';
+COMMENT ON COLUMN contents.last_checked_at IS 'Last re-scrape, whether or not the content changed';
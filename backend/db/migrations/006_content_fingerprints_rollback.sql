@@ -0,0 +1,7 @@
+-- Rollback Migration: Remove change-detection fingerprints from contents
+-- Date: 2026-10-16
+
+ALTER TABLE contents DROP COLUMN IF EXISTS last_checked_at;
+ALTER TABLE contents DROP COLUMN IF EXISTS last_modified;
+ALTER TABLE contents DROP COLUMN IF EXISTS etag;
+ALTER TABLE contents DROP COLUMN IF EXISTS content_hash;
@@ -0,0 +1,15 @@
+-- Migration: Add embedding_cache table
+-- Date: 2026-10-16
+-- Description: Persistent (model, normalized text hash) -> embedding cache so identical text is never embedded twice
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model VARCHAR(100) NOT NULL,
+    text_hash CHAR(64) NOT NULL,
+    dimensions INTEGER NOT NULL,
+    embedding vector NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (model, text_hash)
+);
+
+COMMENT ON TABLE embedding_cache IS 'Embeddings keyed by model and SHA-256 of the normalized input text';
+COMMENT ON COLUMN embedding_cache.text_hash IS 'SHA-256 of the whitespace/Unicode-normalized text that was embedded';
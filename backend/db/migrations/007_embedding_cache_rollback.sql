@@ -0,0 +1,4 @@
+-- Rollback Migration: Remove embedding_cache table
+-- Date: 2026-10-16
+
+DROP TABLE IF EXISTS embedding_cache;
@@ -27,7 +27,9 @@ class ContentORM(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     platform = Column(String(50), nullable=False)  # twitter, youtube, reddit, amazon, web
     source_url = Column(Text, unique=True, nullable=False, index=True)
-    author_id = Column(String(255), nullable=False, index=True)
+    author_id = Column(
+        String(255), ForeignKey("authors.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     content_title = Column(Text, nullable=True)
     content_body = Column(Text, nullable=False)
     published_at = Column(DateTime, nullable=True, index=True)
@@ -44,9 +46,15 @@ class ContentORM(Base):
     # Metadata for platform-specific data
     extra_metadata = Column(JSONB, nullable=True, default={})
 
+    # Change detection for re-scrapes
+    content_hash = Column(String(64), nullable=True)  # SHA-256 of the normalized body
+    etag = Column(Text, nullable=True)
+    last_modified = Column(Text, nullable=True)
+
     # Timestamps
     scraped_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     analyzed_at = Column(DateTime, nullable=True)
+    last_checked_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Foreign key to author
@@ -56,11 +64,14 @@ class ContentORM(Base):
     __table_args__ = (
         Index("idx_platform_author", "platform", "author_id"),
         Index("idx_platform_published", "platform", "published_at"),
+        # Initial ANN index; rebuild with parameters sized to the table via
+        # backend.db.vector_index.VectorIndexManager
         Index(
-            "idx_embedding_ivfflat",
+            "idx_contents_embedding_ivfflat",
             "embedding",
             postgresql_using="ivfflat",
-            postgresql_with={"op_class": "vector_cosine_ops"},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with={"lists": 100},
         ),
     )
 
@@ -114,7 +125,9 @@ class PatternORM(Base):
     __tablename__ = "patterns"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    author_id = Column(String(255), nullable=False, index=True)
+    author_id = Column(
+        String(255), ForeignKey("authors.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     pattern_type = Column(String(50), nullable=False)  # elaboration, theme, hook, framework
     description = Column(Text, nullable=False)
 
@@ -172,6 +185,22 @@ class ResearchSessionORM(Base):
         return f"<ResearchSessionORM(id={self.id}, name={self.session_name})>"
 
 
+class EmbeddingCacheORM(Base):
+    """ORM model for cached embeddings keyed by model and normalized text hash"""
+
+    __tablename__ = "embedding_cache"
+
+    model = Column(String(100), primary_key=True)
+    text_hash = Column(String(64), primary_key=True)  # SHA-256 of normalized text
+    dimensions = Column(Integer, nullable=False)
+    embedding = Column(Vector(), nullable=False)  # Any dimension; models differ
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<EmbeddingCacheORM(model={self.model}, text_hash={self.text_hash[:12]})>"
+
+
 class APIKeyORM(Base):
     """ORM model for API keys with rate limiting"""
 
@@ -329,6 +358,7 @@ class CardORM(Base):
         Index("idx_cards_created_at", "created_at"),
         Index("idx_cards_published_at", "published_at"),
         Index("idx_cards_user_published", "user_id", "is_published"),
+        Index("idx_cards_published_url", "published_url"),
     )
 
     def __repr__(self):
@@ -389,6 +419,36 @@ class ExtropyLedgerORM(Base):
         return f"<ExtropyLedgerORM(id={self.id}, type={self.transaction_type}, amount={self.amount})>"
 
 
+class UserTokenSummaryORM(Base):
+    """ORM model for per-user $EXTROPY ledger aggregates
+
+    Maintained by ExtropyTokenSystem in the same transaction as each ledger
+    write, so totals and counts never require scanning the ledger.
+    """
+
+    __tablename__ = "user_token_summaries"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Running totals
+    total_earned = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0.00000000"))
+    total_spent = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0.00000000"))
+
+    # Transaction counts
+    earn_count = Column(Integer, nullable=False, default=0)
+    transfer_count = Column(Integer, nullable=False, default=0)
+    attribution_count = Column(Integer, nullable=False, default=0)
+    tx_count = Column(Integer, nullable=False, default=0)
+
+    # Most recent ledger entry involving the user
+    last_activity_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<UserTokenSummaryORM(user_id={self.user_id}, earned={self.total_earned})>"
+
+
 class AttributionORM(Base):
     """ORM model for citations, remixes, and replies between cards"""
 
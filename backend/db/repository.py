@@ -14,6 +14,7 @@ from backend.db.models import (
     PatternORM,
     ResearchSessionORM,
 )
+from backend.db.vector_index import apply_search_params, restore_search_params
 
 
 class ContentRepository:
@@ -34,6 +35,9 @@ class ContentRepository:
         analysis: Optional[Dict[str, Any]] = None,
         embedding: Optional[List[float]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
     ) -> ContentORM:
         """
         Create new content entry.
@@ -49,6 +53,9 @@ class ContentRepository:
             analysis: LLM analysis results dict
             embedding: Vector embedding (1536 dims)
             metadata: Platform-specific metadata
+            content_hash: Normalized body hash for change detection
+            etag: ETag from the fetch
+            last_modified: Last-Modified from the fetch
 
         Returns:
             Created ContentORM instance
@@ -67,6 +74,10 @@ class ContentRepository:
             analysis=analysis or {},
             embedding=embedding,
             extra_metadata=metadata or {},
+            content_hash=content_hash,
+            etag=etag,
+            last_modified=last_modified,
+            last_checked_at=datetime.utcnow(),
         )
         self.session.add(content)
         self.session.commit()
@@ -81,6 +92,125 @@ class ContentRepository:
         """Get content by source URL"""
         return self.session.query(ContentORM).filter_by(source_url=source_url).first()
 
+    def get_fingerprint(self, source_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the change-detection fields for a source without loading its body.
+
+        Args:
+            source_url: Content URL
+
+        Returns:
+            Dict with id, content_hash, etag, last_modified and body_bytes,
+            or None if the URL has not been stored
+        """
+        row = (
+            self.session.query(
+                ContentORM.id,
+                ContentORM.content_hash,
+                ContentORM.etag,
+                ContentORM.last_modified,
+                func.octet_length(ContentORM.content_body),
+            )
+            .filter_by(source_url=source_url)
+            .first()
+        )
+        if row is None:
+            return None
+        return {
+            "id": row[0],
+            "content_hash": row[1],
+            "etag": row[2],
+            "last_modified": row[3],
+            "body_bytes": row[4] or 0,
+        }
+
+    def mark_checked(
+        self,
+        content_id: UUID,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> bool:
+        """
+        Record a re-scrape that found the content unchanged.
+
+        Only the validators, ``last_checked_at`` and a missing content hash
+        are written; the body and embedding are left alone.
+
+        Args:
+            content_id: Content UUID
+            etag: New ETag (kept if None)
+            last_modified: New Last-Modified (kept if None)
+            content_hash: Backfilled hash for rows stored without one (kept if None)
+
+        Returns:
+            True if updated, False if not found
+        """
+        values: Dict[str, Any] = {"last_checked_at": datetime.utcnow()}
+        if etag is not None:
+            values["etag"] = etag
+        if last_modified is not None:
+            values["last_modified"] = last_modified
+        if content_hash is not None:
+            values["content_hash"] = content_hash
+
+        updated = (
+            self.session.query(ContentORM)
+            .filter_by(id=content_id)
+            .update(values, synchronize_session=False)
+        )
+        self.session.commit()
+        return updated > 0
+
+    def update_content(
+        self,
+        content_id: UUID,
+        content_body: str,
+        content_hash: str,
+        content_title: Optional[str] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> bool:
+        """
+        Replace the body of content that changed since it was stored.
+
+        The previous embedding is kept unless a new one is given, so content
+        stays searchable until it is re-embedded.
+
+        Args:
+            content_id: Content UUID
+            content_body: New content text
+            content_hash: Normalized hash of the new body
+            content_title: New title
+            metrics: New engagement metrics
+            metadata: New platform-specific metadata
+            etag: ETag from the fetch
+            last_modified: Last-Modified from the fetch
+            embedding: Embedding of the new body (previous one kept if None)
+
+        Returns:
+            True if updated, False if not found
+        """
+        content = self.get_by_id(content_id)
+        if not content:
+            return False
+
+        content.content_body = content_body
+        content.content_hash = content_hash
+        content.content_title = content_title
+        content.metrics = metrics or {}
+        content.extra_metadata = metadata or {}
+        content.etag = etag
+        content.last_modified = last_modified
+        if embedding is not None:
+            content.embedding = embedding
+        content.last_checked_at = datetime.utcnow()
+        self.session.commit()
+        return True
+
     def list_by_platform(
         self, platform: str, limit: int = 100, offset: int = 0
     ) -> List[ContentORM]:
@@ -152,15 +282,26 @@ class ContentRepository:
         limit: int = 10,
         platform: Optional[str] = None,
         min_similarity: float = 0.7,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact: bool = False,
     ) -> List[Tuple[ContentORM, float]]:
         """
         Semantic similarity search using cosine distance.
 
+        The nearest ``limit`` rows come from a plain ``ORDER BY distance
+        LIMIT`` so the ANN index serves them; the similarity threshold is
+        applied afterwards. Because results are sorted, this returns the same
+        rows as filtering first.
+
         Args:
             query_embedding: Query vector (1536 dims)
             limit: Number of results to return
             platform: Optional platform filter
             min_similarity: Minimum cosine similarity (0.0-1.0)
+            ef_search: HNSW search breadth; higher = better recall, slower
+            probes: IVFFlat lists to search; higher = better recall, slower
+            exact: Bypass the ANN index (exact, sequential search)
 
         Returns:
             List of (ContentORM, similarity_score) tuples, sorted by similarity
@@ -168,22 +309,30 @@ class ContentRepository:
         # Convert similarity threshold to distance (cosine distance = 1 - similarity)
         max_distance = 1.0 - min_similarity
 
-        query = select(
-            ContentORM,
-            (1 - ContentORM.embedding.cosine_distance(query_embedding)).label("similarity"),
-        ).where(ContentORM.embedding.is_not(None))
+        previous = apply_search_params(
+            self.session, ef_search=ef_search, probes=probes, exact=exact
+        )
+
+        # Compute the distance once; ORDER BY reuses the output column
+        distance = ContentORM.embedding.cosine_distance(query_embedding).label("distance")
+        nearest = select(ContentORM.id, distance).where(ContentORM.embedding.is_not(None))
 
         if platform:
-            query = query.where(ContentORM.platform == platform)
+            nearest = nearest.where(ContentORM.platform == platform)
+
+        nearest = nearest.order_by(distance).limit(limit).subquery()
 
-        # Filter by distance and order by similarity
         query = (
-            query.where(ContentORM.embedding.cosine_distance(query_embedding) <= max_distance)
-            .order_by(ContentORM.embedding.cosine_distance(query_embedding))
-            .limit(limit)
+            select(ContentORM, (1 - nearest.c.distance).label("similarity"))
+            .join(nearest, ContentORM.id == nearest.c.id)
+            .where(nearest.c.distance <= max_distance)
+            .order_by(nearest.c.distance)
         )
 
         results = self.session.execute(query).all()
+        # Keep later queries in this transaction on the default plan (a failed
+        # query aborts the transaction, and its rollback drops the settings)
+        restore_search_params(self.session, previous)
         return [(row[0], float(row[1])) for row in results]
 
     def count_by_platform(self, platform: str) -> int:
@@ -41,8 +41,12 @@ CREATE TABLE IF NOT EXISTS contents (
     analysis JSONB DEFAULT '{}',
     embedding vector(1536),
     metadata JSONB DEFAULT '{}',
+    content_hash VARCHAR(64),
+    etag TEXT,
+    last_modified TEXT,
     scraped_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     analyzed_at TIMESTAMP,
+    last_checked_at TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -165,6 +169,16 @@ CREATE INDEX IF NOT EXISTS idx_scraper_usage_status ON scraper_usage(status);
 CREATE INDEX IF NOT EXISTS idx_scraper_usage_scraped_at ON scraper_usage(scraped_at);
 CREATE INDEX IF NOT EXISTS idx_scraper_usage_type_status ON scraper_usage(scraper_type, status);
 
+-- Embedding cache: (model, normalized text hash) -> vector, shared by all embedding call sites
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model VARCHAR(100) NOT NULL,
+    text_hash CHAR(64) NOT NULL,
+    dimensions INTEGER NOT NULL,
+    embedding vector NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (model, text_hash)
+);
+
 -- Create or update function for updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -191,6 +205,7 @@ COMMENT ON TABLE research_sessions IS 'Tracks research sessions, queries, and ge
 COMMENT ON TABLE content_analysis IS 'Detailed LLM analysis results for each piece of content';
 COMMENT ON TABLE scrape_jobs IS 'Monitoring and tracking of scraping jobs across platforms';
 COMMENT ON TABLE scraper_usage IS 'Tracks ScraperAPI and other service usage with credit consumption and performance metrics';
+COMMENT ON TABLE embedding_cache IS 'Embeddings keyed by model and SHA-256 of the normalized input text';
 
 COMMENT ON COLUMN contents.embedding IS 'OpenAI embedding (1536 dimensions) for semantic search via pgvector';
 COMMENT ON COLUMN contents.metrics IS 'Platform-specific metrics: likes, views, retweets, engagement_rate, etc.';
@@ -280,6 +295,7 @@ CREATE INDEX IF NOT EXISTS idx_cards_parent_card_id ON cards(parent_card_id);
 CREATE INDEX IF NOT EXISTS idx_cards_created_at ON cards(created_at);
 CREATE INDEX IF NOT EXISTS idx_cards_published_at ON cards(published_at);
 CREATE INDEX IF NOT EXISTS idx_cards_user_published ON cards(user_id, is_published);
+CREATE INDEX IF NOT EXISTS idx_cards_published_url ON cards(published_url);
 CREATE INDEX IF NOT EXISTS idx_cards_tags ON cards USING GIN (tags);
 
 -- Attributions table: Track citations, remixes, and replies between cards
@@ -364,6 +380,24 @@ CREATE INDEX IF NOT EXISTS idx_extropy_ledger_created_at ON extropy_ledger(creat
 CREATE INDEX IF NOT EXISTS idx_extropy_ledger_from_user_created ON extropy_ledger(from_user_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_extropy_ledger_to_user_created ON extropy_ledger(to_user_id, created_at);
 
+-- Token summaries: Per-user ledger aggregates, maintained in the same transaction as each ledger write
+CREATE TABLE IF NOT EXISTS user_token_summaries (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+
+    -- Running totals
+    total_earned DECIMAL(20, 8) NOT NULL DEFAULT 0.00000000 CHECK (total_earned >= 0),
+    total_spent DECIMAL(20, 8) NOT NULL DEFAULT 0.00000000 CHECK (total_spent >= 0),
+
+    -- Transaction counts
+    earn_count INTEGER NOT NULL DEFAULT 0,
+    transfer_count INTEGER NOT NULL DEFAULT 0,
+    attribution_count INTEGER NOT NULL DEFAULT 0,
+    tx_count INTEGER NOT NULL DEFAULT 0,
+
+    -- Most recent ledger entry involving the user
+    last_activity_at TIMESTAMP
+);
+
 -- Sync state table: Track synchronization status for published cards
 CREATE TABLE IF NOT EXISTS sync_state (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -472,5 +506,6 @@ COMMENT ON COLUMN extropy_ledger.amount IS 'Transaction amount (DECIMAL, always
 COMMENT ON COLUMN extropy_ledger.transaction_type IS 'Transaction type: earn, transfer, reward, attribution';
 COMMENT ON COLUMN extropy_ledger.from_user_balance_after IS 'Sender balance after transaction (audit trail)';
 COMMENT ON COLUMN extropy_ledger.to_user_balance_after IS 'Receiver balance after transaction (audit trail)';
+COMMENT ON TABLE user_token_summaries IS 'Per-user $EXTROPY ledger aggregates (maintained with each ledger write)';
 COMMENT ON COLUMN sync_state.sync_status IS 'Sync status: pending, in_progress, synced, failed';
 COMMENT ON COLUMN sync_state.git_commit_hash IS 'Git commit hash from selective publish';
@@ -0,0 +1,301 @@
+"""pgvector ANN index management for content embeddings
+
+Builds an HNSW or IVFFlat index on ``contents.embedding`` with parameters
+derived from the number of embedded rows, refreshes planner statistics, and
+sets the per-query search breadth (``hnsw.ef_search`` / ``ivfflat.probes``)
+that trades recall for latency.
+
+Usage:
+    python -m backend.db.vector_index status
+    python -m backend.db.vector_index build --method hnsw
+"""
+
+import argparse
+import json
+import math
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from backend.db.connection import get_engine
+
+INDEX_METHODS = ("hnsw", "ivfflat")
+
+# pgvector defaults (hnsw.ef_search = 40, ivfflat.probes = 1)
+DEFAULT_EF_SEARCH = 40
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+_MEMORY = re.compile(r"^\d+\s*(kB|MB|GB)$")
+
+
+@dataclass(frozen=True)
+class IndexParams:
+    """Build and default search parameters for one ANN index."""
+
+    method: str
+    lists: Optional[int] = None  # IVFFlat: number of clusters
+    probes: Optional[int] = None  # IVFFlat: clusters searched per query
+    m: Optional[int] = None  # HNSW: links per node
+    ef_construction: Optional[int] = None  # HNSW: candidate list while building
+    ef_search: Optional[int] = None  # HNSW: candidate list per query
+
+    def with_clause(self) -> str:
+        """Storage parameters for ``CREATE INDEX ... WITH (...)``."""
+        if self.method == "ivfflat":
+            return f"lists = {int(self.lists)}"
+        return f"m = {int(self.m)}, ef_construction = {int(self.ef_construction)}"
+
+
+def recommend_params(method: str, row_count: int) -> IndexParams:
+    """
+    Derive index parameters from the number of embedded rows.
+
+    Follows the pgvector guidance: IVFFlat uses ``rows / 1000`` lists up to
+    1M rows and ``sqrt(rows)`` beyond, probing ``sqrt(lists)`` of them. HNSW
+    keeps the defaults (m=16, ef_construction=64) and doubles the build
+    effort past 1M rows, where the graph needs more links to keep recall.
+
+    Args:
+        method: "hnsw" or "ivfflat"
+        row_count: Rows with an embedding
+
+    Returns:
+        IndexParams for the method
+    """
+    if method not in INDEX_METHODS:
+        raise ValueError(f"Unknown index method: {method} (use one of {INDEX_METHODS})")
+
+    if method == "ivfflat":
+        if row_count <= 1_000_000:
+            lists = max(1, row_count // 1000)
+        else:
+            lists = int(math.sqrt(row_count))
+        return IndexParams(method, lists=lists, probes=max(1, round(math.sqrt(lists))))
+
+    if row_count <= 1_000_000:
+        return IndexParams(method, m=16, ef_construction=64, ef_search=DEFAULT_EF_SEARCH)
+    return IndexParams(method, m=24, ef_construction=128, ef_search=2 * DEFAULT_EF_SEARCH)
+
+
+def apply_search_params(
+    connection: Any,
+    ef_search: Optional[int] = None,
+    probes: Optional[int] = None,
+    exact: bool = False,
+) -> Dict[str, Optional[str]]:
+    """
+    Set ANN search breadth for the current transaction.
+
+    Higher ``ef_search`` (HNSW) or ``probes`` (IVFFlat) raises recall at the
+    cost of latency; each only affects its own index type, so both may be
+    given. ``exact`` disables index scans for an exact (sequential) search.
+    Settings are transaction-local (``set_config(..., true)``) and last until
+    the transaction ends; on a shared session pass the returned values to
+    ``restore_search_params`` once the search has run.
+
+    Args:
+        connection: SQLAlchemy Session or Connection inside a transaction
+        ef_search: HNSW candidate list size (should be >= the LIMIT)
+        probes: IVFFlat lists to search
+        exact: Skip the ANN index entirely
+
+    Returns:
+        Previous value of each changed setting (None if it was undefined)
+    """
+    settings = {}
+    if ef_search is not None:
+        settings["hnsw.ef_search"] = int(ef_search)
+    if probes is not None:
+        settings["ivfflat.probes"] = int(probes)
+    if exact:
+        settings["enable_indexscan"] = "off"
+
+    previous = {}
+    for name, value in settings.items():
+        # The select list is evaluated in order: read the old value, then set
+        previous[name] = connection.execute(
+            text("SELECT current_setting(:name, true), set_config(:name, :value, true)"),
+            {"name": name, "value": str(value)},
+        ).scalar()
+    return previous
+
+
+def restore_search_params(connection: Any, previous: Dict[str, Optional[str]]) -> None:
+    """
+    Undo ``apply_search_params`` within the same transaction.
+
+    Args:
+        connection: The Session or Connection the settings were applied to
+        previous: Values returned by ``apply_search_params``
+    """
+    for name, value in previous.items():
+        # A NULL value resets the setting to its default
+        connection.execute(
+            text("SELECT set_config(:name, :value, true)"),
+            {"name": name, "value": value},
+        )
+
+
+class VectorIndexManager:
+    """
+    Build and inspect the ANN index on a vector column.
+
+    Rebuilds create the new index under a temporary name, drop the old ANN
+    indexes on the column and rename the new one, so queries keep an index
+    throughout when ``concurrently`` is set.
+    """
+
+    def __init__(
+        self, engine: Optional[Any] = None, table: str = "contents", column: str = "embedding"
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            engine: SQLAlchemy engine (defaults to ``get_engine()``)
+            table: Table holding the vectors
+            column: Vector column (cosine distance)
+        """
+        for identifier in (table, column):
+            if not _IDENTIFIER.match(identifier):
+                raise ValueError(f"Invalid SQL identifier: {identifier}")
+
+        self.engine = engine or get_engine()
+        self.table = table
+        self.column = column
+
+    def index_name(self, method: str) -> str:
+        return f"idx_{self.table}_{self.column}_{method}"
+
+    def row_count(self) -> int:
+        """Rows with a non-NULL vector."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text(f"SELECT count(*) FROM {self.table} WHERE {self.column} IS NOT NULL")
+            ).scalar()
+
+    def existing_indexes(self) -> List[Dict[str, Any]]:
+        """ANN indexes on the column, with their method, definition and size."""
+        query = text(
+            "SELECT i.indexname AS name, i.indexdef AS definition, "
+            "pg_relation_size(format('%I.%I', i.schemaname, i.indexname)::regclass) AS size_bytes "
+            "FROM pg_indexes i "
+            "WHERE i.tablename = :table "
+            "AND (i.indexdef ILIKE '%USING hnsw%' OR i.indexdef ILIKE '%USING ivfflat%') "
+            "AND i.indexdef LIKE :column"
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(query, {"table": self.table, "column": f"%({self.column} %"})
+            indexes = [dict(row._mapping) for row in rows]
+
+        for index in indexes:
+            index["method"] = "hnsw" if "USING hnsw" in index["definition"] else "ivfflat"
+        return indexes
+
+    def build(
+        self,
+        method: str = "hnsw",
+        params: Optional[IndexParams] = None,
+        concurrently: bool = True,
+        maintenance_work_mem: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build (or rebuild) the ANN index, then ANALYZE the table.
+
+        Args:
+            method: "hnsw" or "ivfflat"
+            params: Index parameters (derived from the row count if None)
+            concurrently: Build without blocking writes (slower)
+            maintenance_work_mem: Build memory, e.g. "2GB" (HNSW builds much
+                faster when the graph fits)
+
+        Returns:
+            Index name, method, parameters, row count and build seconds
+        """
+        rows = self.row_count()
+        params = params or recommend_params(method, rows)
+        if params.method != method:
+            raise ValueError(f"Parameters are for {params.method}, not {method}")
+        if maintenance_work_mem is not None and not _MEMORY.match(maintenance_work_mem):
+            raise ValueError(f"Invalid maintenance_work_mem: {maintenance_work_mem}")
+
+        name = self.index_name(method)
+        building = f"{name}_new"
+        option = "CONCURRENTLY " if concurrently else ""
+        old = [index["name"] for index in self.existing_indexes() if index["name"] != building]
+
+        start = time.perf_counter()
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            if maintenance_work_mem is not None:
+                conn.execute(text(f"SET maintenance_work_mem = '{maintenance_work_mem}'"))
+            # Left behind (invalid) if an earlier concurrent build failed
+            conn.execute(text(f"DROP INDEX {option}IF EXISTS {building}"))
+            conn.execute(
+                text(
+                    f"CREATE INDEX {option}{building} ON {self.table} "
+                    f"USING {method} ({self.column} vector_cosine_ops) "
+                    f"WITH ({params.with_clause()})"
+                )
+            )
+            for index in old:
+                conn.execute(text(f"DROP INDEX {option}IF EXISTS {index}"))
+            conn.execute(text(f"ALTER INDEX {building} RENAME TO {name}"))
+            conn.execute(text(f"ANALYZE {self.table}"))
+        seconds = time.perf_counter() - start
+
+        return {
+            "index": name,
+            "method": method,
+            "params": asdict(params),
+            "rows": rows,
+            "replaced": [index for index in old if index != name],
+            "build_seconds": round(seconds, 2),
+        }
+
+    def analyze(self) -> None:
+        """Refresh planner statistics for the table."""
+        with self.engine.begin() as conn:
+            conn.execute(text(f"ANALYZE {self.table}"))
+
+    def status(self) -> Dict[str, Any]:
+        """Current ANN indexes next to the parameters the row count calls for."""
+        rows = self.row_count()
+        return {
+            "table": self.table,
+            "column": self.column,
+            "rows": rows,
+            "indexes": self.existing_indexes(),
+            "recommended": {
+                method: asdict(recommend_params(method, rows)) for method in INDEX_METHODS
+            },
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the pgvector index on contents.embedding")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="Show ANN indexes and recommended parameters")
+    build = subparsers.add_parser("build", help="Build or rebuild the ANN index")
+    build.add_argument("--method", choices=INDEX_METHODS, default="hnsw")
+    build.add_argument("--blocking", action="store_true", help="Build without CONCURRENTLY")
+    build.add_argument("--maintenance-work-mem", help='Build memory, e.g. "2GB"')
+    args = parser.parse_args()
+
+    manager = VectorIndexManager()
+    if args.command == "status":
+        result = manager.status()
+    else:
+        result = manager.build(
+            args.method,
+            concurrently=not args.blocking,
+            maintenance_work_mem=args.maintenance_work_mem,
+        )
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from sqlalchemy.orm import sessionmaker
 
 from backend.api.middleware.cors import setup_cors
 from backend.api.middleware.security_headers import setup_security_headers
@@ -16,6 +17,10 @@ from backend.api.routes import (
     tokens_router,
     ultra_learning_router,
 )
+from backend.auth.key_cache import usage_tracker
+from backend.db.connection import get_engine
+from backend.scrapers.adapters.twitter import close_browser_pool
+from backend.scrapers.http_clients import close_http_clients
 from backend.security.audit_log import AuditLogger
 from backend.security.rate_limiting import get_rate_limiter
 
@@ -74,11 +79,19 @@ async def startup_event():
     """Initialize services on startup."""
     # TODO: Initialize database connection pool
     # TODO: Verify all services are healthy
-    pass
+
+    # Write API key usage counters in periodic batches
+    usage_tracker.start(sessionmaker(autocommit=False, autoflush=False, bind=get_engine()))
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     # TODO: Close database connections
-    pass
+
+    # Persist API key usage recorded since the last flush
+    await usage_tracker.stop()
+
+    # Close pooled Twitter browser contexts and scraper HTTP connections
+    await close_browser_pool()
+    await close_http_clients()
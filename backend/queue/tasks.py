@@ -7,6 +7,26 @@ from typing import Any
 from backend.queue.celery_app import celery_app
 
 
+def _run(coro: Any) -> Any:
+    """
+    Run a scraping coroutine on a fresh event loop.
+
+    Shared browser contexts and HTTP connections are bound to the loop, so
+    they are closed before the loop ends.
+    """
+    from backend.scrapers.adapters.twitter import close_browser_pool
+    from backend.scrapers.http_clients import close_http_clients
+
+    async def run() -> Any:
+        try:
+            return await coro
+        finally:
+            await close_browser_pool()
+            await close_http_clients()
+
+    return asyncio.run(run())
+
+
 @celery_app.task(bind=True, max_retries=3)
 def scrape_content(self, platform: str, target: str, limit: int = 20) -> dict[str, Any]:
     """
@@ -26,13 +46,13 @@ def scrape_content(self, platform: str, target: str, limit: int = 20) -> dict[st
         from backend.scrapers import get_scraper
 
         scraper = get_scraper(platform)
-        # Note: This is sync wrapper for async scraper
-        raw_data = asyncio.run(scraper.extract(target, limit))
 
-        normalized = []
-        for item in raw_data:
-            content = asyncio.run(scraper.normalize(item))
-            normalized.append(content.model_dump())
+        async def scrape() -> list[dict[str, Any]]:
+            # Extract and normalize on one event loop
+            raw_data = await scraper.extract(target, limit)
+            return [(await scraper.normalize(item)).model_dump() for item in raw_data]
+
+        normalized = _run(scrape())
 
         return {
             "status": "success",
@@ -46,6 +66,83 @@ def scrape_content(self, platform: str, target: str, limit: int = 20) -> dict[st
         self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
 
 
+@celery_app.task(bind=True, max_retries=3)
+def scrape_batch(self, targets: list[dict[str, Any]], concurrency: int = 8) -> dict[str, Any]:
+    """
+    Async task to scrape many targets concurrently on one event loop.
+
+    Args:
+        self: Celery task instance (bound task)
+        targets: Dicts with platform, target and optional limit
+        concurrency: Maximum targets scraped at once
+
+    Returns:
+        Task result with normalized content and per-target errors
+    """
+    try:
+        from backend.scrapers.batch import ScrapeTarget, scrape_many_to_list
+
+        events = _run(
+            scrape_many_to_list(
+                [ScrapeTarget(**target) for target in targets], concurrency=concurrency
+            )
+        )
+
+        content = [e.content.model_dump() for e in events if e.type == "item"]
+        errors = [
+            {"platform": e.platform, "target": e.target, "error": e.error}
+            for e in events
+            if e.type == "error"
+        ]
+        return {
+            "status": "success",
+            "targets": len(targets),
+            "count": len(content),
+            "content": content,
+            "errors": errors,
+            "scraped_at": datetime.utcnow().isoformat(),
+        }
+    except Exception as exc:
+        self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+
+
+@celery_app.task(bind=True, max_retries=3)
+def recrawl_sources(self, urls: list[str]) -> dict[str, Any]:
+    """
+    Async task to re-scrape stored web sources, skipping unchanged ones.
+
+    No embedding function is wired in, so changed content keeps its previous
+    embedding until it is re-embedded.
+
+    Args:
+        self: Celery task instance (bound task)
+        urls: Source URLs to check
+
+    Returns:
+        Crawl cycle report: new/changed/unchanged counts, bytes downloaded
+        and saved, and embedding calls made and saved
+    """
+    try:
+        from backend.db.connection import get_session
+        from backend.db.repository import ContentRepository
+        from backend.scrapers.recrawl import recrawl_web
+
+        session_gen = get_session()
+        session = next(session_gen)
+        try:
+            stats = _run(recrawl_web(urls, ContentRepository(session)))
+        finally:
+            session_gen.close()
+
+        return {
+            "status": "success",
+            **stats.to_dict(),
+            "recrawled_at": datetime.utcnow().isoformat(),
+        }
+    except Exception as exc:
+        self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+
+
 @celery_app.task(bind=True, max_retries=3)
 def analyze_content(self, content_id: str) -> dict[str, Any]:
     """
@@ -10,6 +10,7 @@ from backend.scrapers.adapters.twitter import TwitterScraper
 from backend.scrapers.adapters.web import WebScraper
 from backend.scrapers.adapters.youtube import YouTubeScraper
 from backend.scrapers.base import BaseScraper, UnifiedContent
+from backend.scrapers.rate_limiter import Priority, scrape_priority
 
 
 class DanKoeScraper(BaseScraper):
@@ -292,8 +293,9 @@ class DanKoeScraper(BaseScraper):
         print(f"Max credits: {self.max_credits}")
         print(f"{'='*60}\n")
 
-        # Extract raw content
-        raw_content = await self.extract(target)
+        # Extract raw content (bulk lane: interactive scrapes are served first)
+        with scrape_priority(Priority.BULK):
+            raw_content = await self.extract(target)
 
         print(f"\n{'='*60}")
         print(f"📊 Saving to database...")
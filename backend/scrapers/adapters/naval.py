@@ -13,6 +13,7 @@ from backend.scrapers.base import (
 )
 from backend.scrapers.adapters.twitter import TwitterScraper
 from backend.scrapers.adapters.youtube import YouTubeScraper
+from backend.scrapers.rate_limiter import Priority, scrape_priority
 
 
 class NavalScraper(BaseScraper):
@@ -238,9 +239,10 @@ class NavalScraper(BaseScraper):
             "errors": [],
         }
 
-        # Scrape Twitter
+        # Scrape Twitter (bulk lane: interactive scrapes are served first)
         try:
-            twitter_data = await self._extract_twitter(twitter_limit)
+            with scrape_priority(Priority.BULK):
+                twitter_data = await self._extract_twitter(twitter_limit)
             results["twitter"] = twitter_data
             results["total_items"] += len(twitter_data)
             # Estimate credits: ~0.01 per tweet
@@ -252,7 +254,8 @@ class NavalScraper(BaseScraper):
 
         # Scrape YouTube
         try:
-            youtube_data = await self._extract_youtube(youtube_limit)
+            with scrape_priority(Priority.BULK):
+                youtube_data = await self._extract_youtube(youtube_limit)
             results["youtube"] = youtube_data
             results["total_items"] += len(youtube_data)
             # Estimate credits: ~1.0 per video (transcript extraction)
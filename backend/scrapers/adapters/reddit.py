@@ -2,7 +2,7 @@
 
 import os
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 from backend.scrapers.base import (
     AuthorModel,
@@ -11,6 +11,41 @@ from backend.scrapers.base import (
     MetricsModel,
     UnifiedContent,
 )
+from backend.scrapers.rate_limiter import get_rate_limiter
+
+_REDDIT: Optional[Any] = None
+
+
+def get_reddit_client() -> Any:
+    """
+    Get the PRAW client shared by all Reddit scrapers.
+
+    PRAW is synchronous and talks HTTP through ``requests``, so it cannot
+    borrow from the async ``HTTPClientRegistry``. Sharing one client gives
+    all scrapers one OAuth token and one keep-alive session, instead of a
+    new client per scraper instance.
+
+    Returns:
+        praw.Reddit instance
+    """
+    global _REDDIT
+
+    if _REDDIT is None:
+        # Lazy import to avoid circular import issues with 'queue' module
+        import praw
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=10))
+        _REDDIT = praw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID", ""),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET", ""),
+            user_agent=os.getenv("REDDIT_USER_AGENT", "IAC-032-unified-scraper/1.0"),
+            requestor_kwargs={"session": session},
+        )
+
+    return _REDDIT
 
 
 class RedditScraper(BaseScraper):
@@ -25,14 +60,7 @@ class RedditScraper(BaseScraper):
     """
 
     def __init__(self) -> None:
-        # Lazy import to avoid circular import issues with 'queue' module
-        import praw
-
-        self.reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID", ""),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET", ""),
-            user_agent=os.getenv("REDDIT_USER_AGENT", "IAC-032-unified-scraper/1.0"),
-        )
+        self.reddit = get_reddit_client()
 
     async def health_check(self) -> dict[str, Any]:
         """Verify Reddit API access."""
@@ -66,6 +94,8 @@ class RedditScraper(BaseScraper):
         """
         posts: list[dict[str, Any]] = []
 
+        await get_rate_limiter().wait_if_needed("reddit")
+
         if target.startswith("r/"):
             subreddit_name = target[2:]
             subreddit = self.reddit.subreddit(subreddit_name)
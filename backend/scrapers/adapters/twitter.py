@@ -1,9 +1,11 @@
 """Twitter/X scraper implementing BaseScraper interface."""
 
+import os
 import random
 from datetime import datetime
+from typing import Optional
 
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import Browser, Page
 
 from backend.scrapers.base import (
     AuthorModel,
@@ -12,6 +14,120 @@ from backend.scrapers.base import (
     MetricsModel,
     UnifiedContent,
 )
+from backend.scrapers.browser_pool import BrowserContextPool
+from backend.scrapers.rate_limiter import get_rate_limiter
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# IAC-024 fingerprint spoofing, installed once per pooled browser context
+FINGERPRINT_SPOOFING_SCRIPT = """
+// Canvas fingerprint spoofing
+const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+HTMLCanvasElement.prototype.toDataURL = function() {
+    const context = this.getContext('2d');
+    if (context) {
+        const imageData = context.getImageData(0, 0, this.width, this.height);
+        // Add slight noise to canvas
+        for (let i = 0; i < imageData.data.length; i += 4) {
+            imageData.data[i] += Math.random() * 2 - 1;
+        }
+        context.putImageData(imageData, 0, 0);
+    }
+    return originalToDataURL.apply(this, arguments);
+};
+
+// WebGL fingerprint spoofing
+const getParameter = WebGLRenderingContext.prototype.getParameter;
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) {
+        return 'Intel Inc.';
+    }
+    if (parameter === 37446) {
+        return 'Intel Iris OpenGL Engine';
+    }
+    return getParameter.apply(this, arguments);
+};
+
+// Audio context fingerprint spoofing
+const AudioContext = window.AudioContext || window.webkitAudioContext;
+if (AudioContext) {
+    const originalCreateOscillator = AudioContext.prototype.createOscillator;
+    AudioContext.prototype.createOscillator = function() {
+        const oscillator = originalCreateOscillator.apply(this, arguments);
+        const originalStart = oscillator.start;
+        oscillator.start = function() {
+            // Add slight frequency variation
+            this.frequency.value += Math.random() * 0.001;
+            return originalStart.apply(this, arguments);
+        };
+        return oscillator;
+    };
+}
+"""
+
+# Reads every visible tweet in one round-trip, then scrolls by the given distance
+COLLECT_TWEETS_SCRIPT = """
+(scrollDistance) => {
+    const read = (root, selector, fn) => {
+        const el = root.querySelector(selector);
+        return el ? fn(el) : null;
+    };
+    const tweets = Array.from(document.querySelectorAll('article[data-testid="tweet"]')).map(
+        (article) => ({
+            href: read(article, 'a[href*="/status/"]', (el) => el.getAttribute('href')),
+            text: read(article, '[data-testid="tweetText"]', (el) => el.innerText),
+            created_at: read(article, 'time', (el) => el.getAttribute('datetime')),
+            likes: read(article, '[data-testid="like"]', (el) => el.innerText),
+            retweets: read(article, '[data-testid="retweet"]', (el) => el.innerText),
+            replies: read(article, '[data-testid="reply"]', (el) => el.innerText),
+        })
+    );
+    if (scrollDistance) {
+        window.scrollBy({top: scrollDistance, behavior: 'smooth'});
+    }
+    return tweets;
+}
+"""
+
+_BROWSER_POOL: Optional[BrowserContextPool] = None
+
+
+def get_browser_pool() -> BrowserContextPool:
+    """
+    Get the browser context pool shared by all Twitter scrapers.
+
+    Sized by ``TWITTER_BROWSER_POOL_SIZE`` (default 2) and recycled every
+    ``TWITTER_CONTEXT_MAX_PAGES`` pages (default 50).
+
+    Returns:
+        BrowserContextPool instance
+    """
+    global _BROWSER_POOL
+
+    if _BROWSER_POOL is None:
+        _BROWSER_POOL = BrowserContextPool(
+            size=int(os.getenv("TWITTER_BROWSER_POOL_SIZE", "2")),
+            max_pages_per_context=int(os.getenv("TWITTER_CONTEXT_MAX_PAGES", "50")),
+            context_options={
+                "viewport": {"width": 1920, "height": 1080},
+                "user_agent": USER_AGENT,
+            },
+            init_script=FINGERPRINT_SPOOFING_SCRIPT,
+        )
+
+    return _BROWSER_POOL
+
+
+async def close_browser_pool() -> None:
+    """Close the shared pool's contexts and browser (called on shutdown)."""
+    global _BROWSER_POOL
+
+    if _BROWSER_POOL is not None:
+        pool, _BROWSER_POOL = _BROWSER_POOL, None
+        await pool.close()
 
 
 class TwitterScraper(BaseScraper):
@@ -21,14 +137,26 @@ class TwitterScraper(BaseScraper):
     Features:
     - Fingerprint spoofing (canvas, WebGL, audio)
     - Human-like behavior simulation
-    - Session persistence
+    - Session persistence via a pool of warm browser contexts
     - Adaptive rate limiting
     - Better metric extraction
     """
 
-    def __init__(self):
+    def __init__(self, pool: Optional[BrowserContextPool] = None):
+        """
+        Initialize Twitter scraper.
+
+        Args:
+            pool: Browser context pool (defaults to the shared ``get_browser_pool()``)
+        """
         self.browser: Browser | None = None
         self.page: Page | None = None
+        self._pool = pool
+
+    @property
+    def pool(self) -> BrowserContextPool:
+        """Browser context pool used for scrapes."""
+        return self._pool or get_browser_pool()
 
     async def health_check(self) -> dict:
         """Verify Twitter access."""
@@ -37,6 +165,7 @@ class TwitterScraper(BaseScraper):
             "message": "Twitter scraper initialized",
             "timestamp": datetime.utcnow().isoformat(),
             "platform": "twitter",
+            "browser_pool": await self.pool.health_check(),
         }
 
     async def extract(self, target: str, limit: int = 20) -> list[dict]:
@@ -54,18 +183,9 @@ class TwitterScraper(BaseScraper):
         tweets = []
         seen_ids = set()
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            )
-
-            # Apply fingerprint spoofing (IAC-024 pattern)
-            await self._apply_fingerprint_spoofing(context)
-
-            page = await context.new_page()
+        await get_rate_limiter().wait_if_needed("twitter")
 
+        async with self.pool.page() as page:
             # Navigate to profile
             await page.goto(f"https://twitter.com/{username}", wait_until="networkidle")
             await page.wait_for_timeout(2000)
@@ -75,161 +195,65 @@ class TwitterScraper(BaseScraper):
             max_scrolls = 20
 
             while len(tweets) < limit and scroll_attempts < max_scrolls:
-                # Extract current visible tweets
-                tweet_elements = await page.query_selector_all('article[data-testid="tweet"]')
+                # Read the visible tweets and scroll on in a single round-trip
+                records = await self._human_scroll(page)
 
-                for element in tweet_elements:
+                for record in records:
                     if len(tweets) >= limit:
                         break
 
-                    try:
-                        tweet_data = await self._extract_tweet_data(element, username)
-                        if tweet_data and tweet_data["id"] not in seen_ids:
-                            tweets.append(tweet_data)
-                            seen_ids.add(tweet_data["id"])
-                    except Exception:
-                        continue
+                    tweet_data = self._extract_tweet_data(record, username)
+                    if tweet_data and tweet_data["id"] not in seen_ids:
+                        tweets.append(tweet_data)
+                        seen_ids.add(tweet_data["id"])
 
                 if len(tweets) >= limit:
                     break
 
-                # Human-like scrolling (IAC-024 pattern)
-                await self._human_scroll(page)
                 await page.wait_for_timeout(1000 + self._random_delay())
                 scroll_attempts += 1
 
-            await browser.close()
-
         return tweets[:limit]
 
-    async def _apply_fingerprint_spoofing(self, context):
-        """Apply IAC-024 fingerprint spoofing techniques."""
-        await context.add_init_script("""
-            // Canvas fingerprint spoofing
-            const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-            HTMLCanvasElement.prototype.toDataURL = function() {
-                const context = this.getContext('2d');
-                if (context) {
-                    const imageData = context.getImageData(0, 0, this.width, this.height);
-                    // Add slight noise to canvas
-                    for (let i = 0; i < imageData.data.length; i += 4) {
-                        imageData.data[i] += Math.random() * 2 - 1;
-                    }
-                    context.putImageData(imageData, 0, 0);
-                }
-                return originalToDataURL.apply(this, arguments);
-            };
-
-            // WebGL fingerprint spoofing
-            const getParameter = WebGLRenderingContext.prototype.getParameter;
-            WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                if (parameter === 37445) {
-                    return 'Intel Inc.';
-                }
-                if (parameter === 37446) {
-                    return 'Intel Iris OpenGL Engine';
-                }
-                return getParameter.apply(this, arguments);
-            };
-
-            // Audio context fingerprint spoofing
-            const AudioContext = window.AudioContext || window.webkitAudioContext;
-            if (AudioContext) {
-                const originalCreateOscillator = AudioContext.prototype.createOscillator;
-                AudioContext.prototype.createOscillator = function() {
-                    const oscillator = originalCreateOscillator.apply(this, arguments);
-                    const originalStart = oscillator.start;
-                    oscillator.start = function() {
-                        // Add slight frequency variation
-                        this.frequency.value += Math.random() * 0.001;
-                        return originalStart.apply(this, arguments);
-                    };
-                    return oscillator;
-                };
-            }
-        """)
-
-    async def _human_scroll(self, page):
-        """Simulate human-like scrolling (IAC-024 pattern)."""
+    async def _human_scroll(self, page) -> list[dict]:
+        """
+        Collect visible tweets, then scroll like a human (IAC-024 pattern).
+
+        Returns:
+            Raw DOM records for every tweet article currently rendered
+        """
         # Random scroll distance
         scroll_distance = 300 + int(self._random_delay() / 2)
-
-        # Smooth scroll with easing
-        await page.evaluate(f"""
-            window.scrollBy({{
-                top: {scroll_distance},
-                behavior: 'smooth'
-            }});
-        """)
+        return await page.evaluate(COLLECT_TWEETS_SCRIPT, scroll_distance)
 
     def _random_delay(self) -> int:
         """Generate random delay (IAC-024 pattern)."""
         return random.randint(500, 1500)
 
-    async def _extract_tweet_data(self, element, username: str) -> dict | None:
-        """Extract tweet data from element with better selectors."""
-        try:
-            # Get tweet ID from article element
-            tweet_link = await element.query_selector('a[href*="/status/"]')
-            if not tweet_link:
-                return None
-
-            href = await tweet_link.get_attribute("href")
-            tweet_id = href.split("/status/")[-1].split("?")[0] if href else str(random.randint(1000000, 9999999))
-
-            # Extract text
-            text_element = await element.query_selector('[data-testid="tweetText"]')
-            text = await text_element.inner_text() if text_element else ""
-
-            # Extract timestamp
-            time_element = await element.query_selector("time")
-            timestamp = await time_element.get_attribute("datetime") if time_element else datetime.utcnow().isoformat()
-
-            # Extract metrics
-            metrics = await self._extract_metrics(element)
-
-            return {
-                "id": tweet_id,
-                "text": text,
-                "author_id": username,
-                "created_at": timestamp,
-                "public_metrics": metrics,
-            }
-        except Exception:
+    def _extract_tweet_data(self, record: dict, username: str) -> dict | None:
+        """Build tweet data from a DOM record collected by ``_human_scroll``."""
+        href = record.get("href")
+        if not href:
             return None
 
-    async def _extract_metrics(self, element) -> dict:
-        """Extract engagement metrics from tweet element."""
-        metrics = {
-            "like_count": 0,
-            "retweet_count": 0,
-            "reply_count": 0,
-            "view_count": 0,
-        }
+        tweet_id = href.split("/status/")[-1].split("?")[0]
 
-        try:
-            # Like count
-            like_button = await element.query_selector('[data-testid="like"]')
-            if like_button:
-                like_text = await like_button.inner_text()
-                metrics["like_count"] = self._parse_count(like_text)
-
-            # Retweet count
-            retweet_button = await element.query_selector('[data-testid="retweet"]')
-            if retweet_button:
-                retweet_text = await retweet_button.inner_text()
-                metrics["retweet_count"] = self._parse_count(retweet_text)
-
-            # Reply count
-            reply_button = await element.query_selector('[data-testid="reply"]')
-            if reply_button:
-                reply_text = await reply_button.inner_text()
-                metrics["reply_count"] = self._parse_count(reply_text)
-
-        except Exception:
-            pass
+        return {
+            "id": tweet_id,
+            "text": record.get("text") or "",
+            "author_id": username,
+            "created_at": record.get("created_at") or datetime.utcnow().isoformat(),
+            "public_metrics": self._extract_metrics(record),
+        }
 
-        return metrics
+    def _extract_metrics(self, record: dict) -> dict:
+        """Parse engagement metrics from a DOM record."""
+        return {
+            "like_count": self._parse_count(record.get("likes") or ""),
+            "retweet_count": self._parse_count(record.get("retweets") or ""),
+            "reply_count": self._parse_count(record.get("replies") or ""),
+            "view_count": 0,
+        }
 
     def _parse_count(self, count_str: str) -> int:
         """Parse count strings like '1.2K' to integers."""
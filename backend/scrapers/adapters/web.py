@@ -1,10 +1,9 @@
 """Web/Blog scraper using Jina.ai Reader API implementing BaseScraper interface."""
 
 from datetime import datetime
+from typing import Optional
 from urllib.parse import urlparse
 
-import httpx
-
 from backend.scrapers.base import (
     AuthorModel,
     BaseScraper,
@@ -12,6 +11,9 @@ from backend.scrapers.base import (
     MetricsModel,
     UnifiedContent,
 )
+from backend.scrapers.fingerprint import content_hash
+from backend.scrapers.http_clients import HTTPClientRegistry, get_http_clients
+from backend.scrapers.rate_limiter import get_rate_limiter
 
 
 class WebScraper(BaseScraper):
@@ -23,24 +25,37 @@ class WebScraper(BaseScraper):
     - Automatic markdown conversion
     - Clean content extraction
     - No JavaScript rendering needed for static sites
+    - Pooled keep-alive connections shared by all scrapes
+    - Conditional re-fetches (ETag/Last-Modified) and normalized content hashes
     """
 
-    def __init__(self) -> None:
+    def __init__(self, http: Optional[HTTPClientRegistry] = None) -> None:
+        """
+        Initialize web scraper.
+
+        Args:
+            http: HTTP client registry (defaults to the shared ``get_http_clients()``)
+        """
         self.jina_base_url = "https://r.jina.ai/"
         self.timeout = 30
+        self._http = http
+
+    @property
+    def client(self):
+        """Shared pooled client for the Jina Reader host."""
+        return (self._http or get_http_clients()).client(self.jina_base_url)
 
     async def health_check(self) -> dict:
         """Verify Jina.ai API access."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.jina_base_url}https://example.com", timeout=10)
-                if response.status_code == 200:
-                    return {
-                        "status": "ok",
-                        "message": "Jina.ai Reader API accessible",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "platform": "web",
-                    }
+            response = await self.client.get(f"{self.jina_base_url}https://example.com", timeout=10)
+            if response.status_code == 200:
+                return {
+                    "status": "ok",
+                    "message": "Jina.ai Reader API accessible",
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "platform": "web",
+                }
         except Exception:
             pass
 
@@ -62,52 +77,94 @@ class WebScraper(BaseScraper):
         Returns:
             Raw web content as list of dicts
         """
+        return [await self.fetch(target)]
+
+    async def fetch(
+        self,
+        target: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> dict:
+        """
+        Fetch one URL, conditionally if validators from an earlier fetch are given.
+
+        Args:
+            target: Full URL to scrape
+            etag: ETag from the previous fetch (sent as If-None-Match)
+            last_modified: Last-Modified from the previous fetch (sent as If-Modified-Since)
+
+        Returns:
+            Raw web content dict. ``not_modified`` is True (and ``content``
+            empty) when the upstream answered 304. Successful fetches include
+            ``etag``, ``last_modified``, ``content_hash`` and ``bytes``.
+        """
         if not target.startswith("http"):
             target = f"https://{target}"
 
+        await get_rate_limiter().wait_if_needed("web")
+
+        headers = {
+            "Accept": "text/markdown",
+            "X-Return-Format": "markdown",
+        }
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.jina_base_url}{target}",
-                    timeout=self.timeout,
-                    headers={
-                        "Accept": "text/markdown",
-                        "X-Return-Format": "markdown",
-                    },
-                )
-                response.raise_for_status()
-
-                content = response.text
-
-                # Extract title from markdown (first # heading)
-                title = None
-                lines = content.split("\n")
-                for line in lines:
-                    if line.startswith("# "):
-                        title = line[2:].strip()
-                        break
-
-                return [
-                    {
-                        "url": target,
-                        "title": title,
-                        "content": content,
-                        "content_type": "markdown",
-                        "status_code": response.status_code,
-                        "extracted_at": datetime.utcnow().isoformat(),
-                    }
-                ]
-        except Exception as e:
-            return [
-                {
+            response = await self.client.get(
+                f"{self.jina_base_url}{target}",
+                timeout=self.timeout,
+                headers=headers,
+            )
+            if response.status_code == 304:
+                return {
                     "url": target,
                     "title": None,
                     "content": "",
                     "content_type": "markdown",
-                    "error": str(e),
+                    "status_code": 304,
+                    "not_modified": True,
+                    "etag": response.headers.get("etag", etag),
+                    "last_modified": response.headers.get("last-modified", last_modified),
+                    "bytes": 0,
                     "extracted_at": datetime.utcnow().isoformat(),
                 }
-            ]
+            response.raise_for_status()
+
+            content = response.text
+
+            # Extract title from markdown (first # heading)
+            title = None
+            lines = content.split("\n")
+            for line in lines:
+                if line.startswith("# "):
+                    title = line[2:].strip()
+                    break
+
+            return {
+                "url": target,
+                "title": title,
+                "content": content,
+                "content_type": "markdown",
+                "status_code": response.status_code,
+                "not_modified": False,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "content_hash": content_hash(content),
+                "bytes": len(response.content),
+                "extracted_at": datetime.utcnow().isoformat(),
+            }
+        except Exception as e:
+            return {
+                "url": target,
+                "title": None,
+                "content": "",
+                "content_type": "markdown",
+                "error": str(e),
+                "extracted_at": datetime.utcnow().isoformat(),
+            }
 
     async def normalize(self, raw_data: dict) -> UnifiedContent:
         """Convert raw web data to UnifiedContent."""
@@ -142,6 +199,7 @@ class WebScraper(BaseScraper):
             metadata={
                 "domain": domain,
                 "content_type": raw_data.get("content_type", "markdown"),
+                "content_hash": raw_data.get("content_hash") or content_hash(content),
                 "has_error": "error" in raw_data,
             },
         )
@@ -1,8 +1,11 @@
 """YouTube scraper implementing BaseScraper interface."""
 
 import asyncio
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import AsyncIterator, Callable, Optional, TypeVar
 
 from backend.scrapers.base import (
     AuthorModel,
@@ -11,6 +14,38 @@ from backend.scrapers.base import (
     MetricsModel,
     UnifiedContent,
 )
+from backend.scrapers.checkpoint import ScrapeCheckpoint
+from backend.scrapers.rate_limiter import get_rate_limiter
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_VIDEO_TIMEOUT = 60.0
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def get_youtube_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool shared by all YouTube scrapers for blocking calls.
+
+    yt-dlp and youtube-transcript-api are synchronous. Running them on a
+    dedicated, bounded pool keeps them off the event loop and stops them
+    from starving the default executor used by the rest of the app.
+    Sized by ``YOUTUBE_MAX_WORKERS`` (default 8).
+
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    global _EXECUTOR
+
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=int(os.getenv("YOUTUBE_MAX_WORKERS", "8")),
+            thread_name_prefix="youtube",
+        )
+
+    return _EXECUTOR
 
 
 class YouTubeScraper(BaseScraper):
@@ -23,13 +58,31 @@ class YouTubeScraper(BaseScraper):
     - Channel information
     - Multi-language support
     - Channel video listing
+    - Concurrent channel/playlist ingestion on a bounded thread pool, with
+      per-video timeouts and resumable checkpoints
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Optional[ThreadPoolExecutor] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        video_timeout: float = DEFAULT_VIDEO_TIMEOUT,
+    ):
+        """
+        Initialize YouTube scraper.
+
+        Args:
+            executor: Thread pool for blocking calls (defaults to ``get_youtube_executor()``)
+            max_concurrency: Videos fetched at once during channel ingestion
+            video_timeout: Seconds allowed per video for metadata and transcript
+        """
         # Lazy import youtube_transcript_api to avoid import issues
         from youtube_transcript_api import YouTubeTranscriptApi
 
         self.api = YouTubeTranscriptApi()
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.video_timeout = video_timeout
 
     async def health_check(self) -> dict:
         """Verify YouTube transcript API access."""
@@ -60,10 +113,70 @@ class YouTubeScraper(BaseScraper):
             video_data = await self._extract_single_video(video_id)
             return [video_data] if video_data else []
 
+    async def iter_channel_videos(
+        self,
+        target: str,
+        limit: int = 20,
+        checkpoint: Optional[ScrapeCheckpoint] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Fetch a channel's or playlist's videos concurrently, yielding each as it completes.
+
+        At most ``max_concurrency`` videos are fetched at once. Videos the
+        checkpoint already has are skipped, and each successfully fetched
+        video is marked done once the consumer asks for the next one, so an
+        interrupted ingestion resumes without losing the video that was
+        being processed. Videos that failed or timed out are yielded with an
+        ``error`` key and retried on the next run. Closing the generator
+        early cancels the remaining fetches.
+
+        Args:
+            target: Channel or playlist ID/URL
+            limit: Maximum videos to list
+            checkpoint: Optional checkpoint of completed video IDs
+
+        Yields:
+            Raw video data dicts, in completion order
+        """
+        video_ids = await self._list_channel_video_ids(target, limit)
+        async for video_data in self._iter_videos(video_ids, checkpoint):
+            yield video_data
+
+    async def _iter_videos(
+        self, video_ids: list[str], checkpoint: Optional[ScrapeCheckpoint] = None
+    ) -> AsyncIterator[dict]:
+        """Fetch videos on the bounded pool, yielding each as it completes."""
+        if checkpoint is not None:
+            video_ids = [video_id for video_id in video_ids if not checkpoint.is_done(video_id)]
+        if not video_ids:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(video_id: str) -> dict | None:
+            async with semaphore:
+                return await self._extract_single_video(video_id)
+
+        tasks = [asyncio.create_task(fetch(video_id)) for video_id in video_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                video_data = await next_done
+                if not video_data:
+                    continue
+                yield video_data
+                # Resumed only once the consumer has handled the video
+                if checkpoint is not None and "error" not in video_data:
+                    checkpoint.mark_done(video_data["video_id"])
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if checkpoint is not None:
+                checkpoint.save()
+
     async def _extract_single_video(self, video_id: str) -> dict | None:
         """Extract single video with transcript and metadata."""
-        # Lazy import to avoid circular import issues
-        from youtube_transcript_api import YouTubeTranscriptApi
+        await get_rate_limiter().wait_if_needed("youtube")
 
         try:
             # Get metadata using yt-dlp
@@ -73,20 +186,19 @@ class YouTubeScraper(BaseScraper):
                 'extract_flat': False,
             }
 
-            loop = asyncio.get_event_loop()
-            video_info = await loop.run_in_executor(
-                None,
-                lambda: self._get_video_info(video_id, ydl_opts)
+            # Metadata and transcript are independent; fetch both at once
+            info_call = self._run_blocking(lambda: self._get_video_info(video_id, ydl_opts))
+            transcript_call = self._run_blocking(lambda: self._get_transcript(video_id))
+            video_info, transcript_list = await asyncio.wait_for(
+                asyncio.gather(info_call, transcript_call), timeout=self.video_timeout
             )
 
             if not video_info:
                 return None
 
-            # Get transcript
-            try:
-                transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+            if transcript_list:
                 full_text = " ".join([segment["text"] for segment in transcript_list])
-            except Exception:
+            else:
                 # Transcript not available
                 transcript_list = []
                 full_text = video_info.get('description', '')
@@ -106,9 +218,13 @@ class YouTubeScraper(BaseScraper):
                 "extracted_at": datetime.utcnow().isoformat(),
             }
         except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                error = f"Timed out after {self.video_timeout:.0f}s"
+            else:
+                error = str(e)
             return {
                 "video_id": video_id,
-                "error": str(e),
+                "error": error,
                 "title": "",
                 "transcript": "",
                 "segments": [],
@@ -116,42 +232,53 @@ class YouTubeScraper(BaseScraper):
             }
 
     async def _extract_channel_videos(self, target: str, limit: int) -> list[dict]:
-        """Extract videos from a channel or playlist."""
-        videos = []
+        """Extract videos from a channel or playlist, in listing order."""
+        video_ids = await self._list_channel_video_ids(target, limit)
+        videos = [video async for video in self._iter_videos(video_ids)]
+        order = {video_id: i for i, video_id in enumerate(video_ids)}
+        videos.sort(key=lambda video: order[video["video_id"]])
+        return videos
 
-        try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-                'playlist_items': f'1-{limit}',
-            }
+    async def _list_channel_video_ids(self, target: str, limit: int) -> list[str]:
+        """List up to ``limit`` video IDs of a channel or playlist."""
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': True,
+            'playlist_items': f'1-{limit}',
+        }
 
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None,
-                lambda: self._get_playlist_info(target, ydl_opts)
-            )
+        await get_rate_limiter().wait_if_needed("youtube")
+        try:
+            info = await self._run_blocking(lambda: self._get_playlist_info(target, ydl_opts))
+        except Exception:
+            return []
 
-            if not info:
-                return []
+        if not info:
+            return []
 
-            # Extract video IDs
-            if 'entries' in info:
-                video_ids = [entry['id'] for entry in info['entries'] if entry][:limit]
-            else:
-                video_ids = [info['id']]
+        # Extract video IDs
+        if 'entries' in info:
+            video_ids = [entry['id'] for entry in info['entries'] if entry][:limit]
+        else:
+            video_ids = [info['id']]
 
-            # Get transcript and metadata for each video
-            for video_id in video_ids:
-                video_data = await self._extract_single_video(video_id)
-                if video_data:
-                    videos.append(video_data)
+        return video_ids
 
-        except Exception as e:
-            pass
+    async def _run_blocking(self, func: Callable[[], T]) -> T:
+        """Run a blocking call on the YouTube thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor or get_youtube_executor(), func)
 
-        return videos
+    def _get_transcript(self, video_id: str) -> list[dict]:
+        """Synchronous helper to fetch transcript segments (empty if unavailable)."""
+        try:
+            if hasattr(self.api, "fetch"):
+                # youtube-transcript-api >= 1.0
+                return self.api.fetch(video_id).to_raw_data()
+            return self.api.get_transcript(video_id)
+        except Exception:
+            return []
 
     def _get_video_info(self, video_id: str, opts: dict) -> dict | None:
         """Synchronous helper to get video info with yt-dlp."""
@@ -0,0 +1,166 @@
+"""Concurrent multi-target scraping on a single event loop."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
+
+from backend.scrapers.base import BaseScraper, UnifiedContent
+from backend.scrapers.rate_limiter import PLATFORM_RATE_LIMITS
+from backend.scrapers.registry import get_scraper
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PLATFORM_CONCURRENCY = 4
+
+
+@dataclass
+class ScrapeTarget:
+    """One target in a batch scrape."""
+
+    platform: str
+    target: str
+    limit: int = 20
+
+
+@dataclass
+class BatchScrapeEvent:
+    """
+    A streamed batch scrape result.
+
+    ``type`` is "item" (one normalized ``content``), "error" (the target
+    failed; ``error`` holds the message) or "done" (the target finished;
+    ``count`` items were produced).
+    """
+
+    type: str
+    platform: str
+    target: str
+    content: Optional[UnifiedContent] = None
+    error: Optional[str] = None
+    count: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (used for NDJSON streaming)."""
+        data: dict[str, Any] = {"type": self.type, "platform": self.platform, "target": self.target}
+        if self.content is not None:
+            data["content"] = self.content.model_dump(mode="json")
+        if self.error is not None:
+            data["error"] = self.error
+        if self.type == "done":
+            data["count"] = self.count
+        return data
+
+
+def platform_concurrency(platform: str) -> int:
+    """
+    Concurrent targets allowed per platform.
+
+    Matches the platform's rate-limit burst size, so in-flight targets never
+    queue for more tokens than the bucket can hold at once.
+    """
+    config = PLATFORM_RATE_LIMITS.get(platform)
+    return config.burst_size if config else DEFAULT_PLATFORM_CONCURRENCY
+
+
+@dataclass
+class _PlatformState:
+    scraper: Optional[BaseScraper]
+    semaphore: asyncio.Semaphore
+    health_error: Optional[str] = None
+    health_checked: bool = False
+    health_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+async def scrape_many(
+    targets: list[ScrapeTarget],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    platform_limits: Optional[dict[str, int]] = None,
+    scraper_factory: Callable[[str], BaseScraper] = get_scraper,
+    check_health: bool = True,
+) -> AsyncIterator[BatchScrapeEvent]:
+    """
+    Scrape many targets concurrently, yielding normalized items as they complete.
+
+    Targets run on the current event loop, at most ``concurrency`` at once
+    and at most ``platform_concurrency(platform)`` per platform. Requests
+    inside each adapter still go through the shared scraper rate limiter.
+    One scraper instance (and one health check) is used per platform.
+    Closing the generator early cancels the remaining targets.
+
+    Args:
+        targets: Targets to scrape
+        concurrency: Maximum targets in flight overall
+        platform_limits: Per-platform concurrency overrides
+        scraper_factory: Returns the scraper for a platform
+        check_health: Run each platform's health check before its first target
+
+    Yields:
+        BatchScrapeEvent for every item, failed target and finished target
+    """
+    platform_limits = platform_limits or {}
+    overall = asyncio.Semaphore(concurrency)
+    events: asyncio.Queue = asyncio.Queue()
+    platforms: dict[str, _PlatformState] = {}
+
+    for item in targets:
+        if item.platform not in platforms:
+            try:
+                scraper = scraper_factory(item.platform)
+                error = None
+            except Exception as e:
+                scraper, error = None, str(e)
+            limit = platform_limits.get(item.platform) or platform_concurrency(item.platform)
+            state = _PlatformState(scraper, asyncio.Semaphore(limit), health_error=error)
+            state.health_checked = bool(error) or not check_health
+            platforms[item.platform] = state
+
+    async def run(item: ScrapeTarget) -> None:
+        state = platforms[item.platform]
+        count = 0
+        try:
+            async with state.semaphore, overall:
+                await _ensure_healthy(state, item.platform)
+                if state.health_error:
+                    raise RuntimeError(state.health_error)
+
+                raw_items = await state.scraper.extract(item.target, item.limit)
+                for raw in raw_items:
+                    content = await state.scraper.normalize(raw)
+                    count += 1
+                    events.put_nowait(
+                        BatchScrapeEvent("item", item.platform, item.target, content=content)
+                    )
+        except Exception as e:
+            events.put_nowait(BatchScrapeEvent("error", item.platform, item.target, error=str(e)))
+        events.put_nowait(BatchScrapeEvent("done", item.platform, item.target, count=count))
+
+    tasks = [asyncio.create_task(run(item)) for item in targets]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            event = await events.get()
+            if event.type == "done":
+                remaining -= 1
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def scrape_many_to_list(targets: list[ScrapeTarget], **kwargs: Any) -> list[BatchScrapeEvent]:
+    """Run ``scrape_many`` to completion and collect its events."""
+    return [event async for event in scrape_many(targets, **kwargs)]
+
+
+async def _ensure_healthy(state: _PlatformState, platform: str) -> None:
+    """Run a platform's health check once; concurrent targets wait for it."""
+    async with state.health_lock:
+        if state.health_checked:
+            return
+        try:
+            health = await state.scraper.health_check()
+            if health.get("status") != "ok":
+                state.health_error = f"Scraper not healthy: {health.get('message')}"
+        except Exception as e:
+            state.health_error = f"Health check failed for {platform}: {e}"
+        state.health_checked = True
@@ -0,0 +1,298 @@
+"""Pool of warm Playwright browser contexts shared by browser-based scrapers."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Optional
+
+from playwright.async_api import async_playwright
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES_PER_CONTEXT = 50
+
+
+@dataclass
+class _PooledContext:
+    """A browser context and how many pages it has served."""
+
+    context: Any
+    browser: Any
+    created_at: float
+    pages_served: int = 0
+    healthy: bool = True
+
+
+class BrowserContextPool:
+    """
+    Bounded pool of browser contexts on one shared, lazily launched browser.
+
+    Features:
+    - At most ``size`` contexts checked out at once; extra callers wait
+    - Contexts are created on demand, configured once (options and init
+      script) and reused across scrapes
+    - Contexts are recycled after ``max_pages_per_context`` pages to bound
+      memory growth and cookie/session drift
+    - Health checks on checkout: contexts from a disconnected browser are
+      dropped, and a crashed browser is relaunched on the next checkout
+    - A page that raises discards its context instead of returning it
+
+    Example:
+        pool = BrowserContextPool(size=4, context_options={"viewport": {...}})
+        async with pool.page() as page:
+            await page.goto("https://example.com")
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_pages_per_context: int = DEFAULT_MAX_PAGES_PER_CONTEXT,
+        launch_options: Optional[dict] = None,
+        context_options: Optional[dict] = None,
+        init_script: Optional[str] = None,
+        playwright_factory: Callable[[], Any] = async_playwright,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the pool (no browser is launched until first use).
+
+        Args:
+            size: Maximum concurrently checked-out contexts
+            max_pages_per_context: Pages served before a context is recycled
+            launch_options: Keyword arguments for ``chromium.launch``
+            context_options: Keyword arguments for ``browser.new_context``
+            init_script: Script added to every new context
+            playwright_factory: Returns a Playwright context manager
+            clock: Monotonic time source in seconds
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if max_pages_per_context < 1:
+            raise ValueError("max_pages_per_context must be at least 1")
+
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self.launch_options = launch_options or {"headless": True}
+        self.context_options = context_options or {}
+        self.init_script = init_script
+        self._playwright_factory = playwright_factory
+        self._clock = clock
+
+        self._playwright = None
+        self._browser = None
+        self._idle: list[_PooledContext] = []
+        self._in_use = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+        self.browser_launches = 0
+        self.contexts_created = 0
+        self.contexts_recycled = 0
+        self.contexts_discarded = 0
+        self.pages_served = 0
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """
+        Check out a warm context and yield a fresh page in it.
+
+        The page is closed afterwards. The context goes back to the pool
+        unless it reached its page budget or the block raised.
+
+        Yields:
+            Playwright Page
+        """
+        pooled = await self.acquire()
+        failed = False
+        page = None
+        try:
+            page = await pooled.context.new_page()
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    failed = True
+            await self.release(pooled, healthy=not failed)
+
+    async def acquire(self) -> _PooledContext:
+        """
+        Check out a healthy context, waiting while all ``size`` are in use.
+
+        Returns:
+            The pooled context (pass it back to ``release``)
+
+        Raises:
+            RuntimeError: If the pool has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Browser context pool is closed")
+        self._check_loop()
+        slots = self._get_slots()
+        await slots.acquire()
+        try:
+            browser = await self._ensure_browser()
+            while self._idle:
+                pooled = self._idle.pop()  # Most recently used is the warmest
+                if pooled.browser is browser and pooled.healthy:
+                    self._in_use += 1
+                    return pooled
+                await self._close_context(pooled)
+                self.contexts_discarded += 1
+
+            pooled = await self._new_context(browser)
+            self._in_use += 1
+            return pooled
+        except BaseException:
+            slots.release()
+            raise
+
+    async def release(self, pooled: _PooledContext, healthy: bool = True) -> None:
+        """
+        Return a context to the pool, recycling it if spent or unhealthy.
+
+        Args:
+            pooled: Context from ``acquire``
+            healthy: False if the caller saw it fail (it is then discarded)
+        """
+        self._in_use -= 1
+        pooled.pages_served += 1
+        self.pages_served += 1
+        try:
+            if not healthy or not self._is_connected(pooled.browser):
+                await self._close_context(pooled)
+                self.contexts_discarded += 1
+            elif pooled.pages_served >= self.max_pages_per_context or self._closed:
+                await self._close_context(pooled)
+                self.contexts_recycled += 1
+            else:
+                self._idle.append(pooled)
+        finally:
+            self._get_slots().release()
+
+    async def health_check(self) -> dict:
+        """
+        Report pool health without launching a browser.
+
+        Returns:
+            Dict with status ("ok", "idle" before first use, or "error"
+            if the browser has disconnected) and ``get_stats`` fields
+        """
+        if self._browser is None:
+            status = "idle"
+        elif self._is_connected(self._browser):
+            status = "ok"
+        else:
+            status = "error"
+        return {"status": status, **self.get_stats()}
+
+    def get_stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict with pool size, idle/in-use contexts and lifetime counters
+        """
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "max_pages_per_context": self.max_pages_per_context,
+            "browser_launches": self.browser_launches,
+            "contexts_created": self.contexts_created,
+            "contexts_recycled": self.contexts_recycled,
+            "contexts_discarded": self.contexts_discarded,
+            "pages_served": self.pages_served,
+        }
+
+    async def close(self) -> None:
+        """
+        Close idle contexts, the browser and Playwright.
+
+        Contexts still checked out are closed when they are released.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_context(pooled)
+        await self._shutdown_browser()
+
+    def _check_loop(self) -> None:
+        """Forget state owned by a previous event loop (it cannot be used here)."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._loop is not None:
+            self._playwright = self._browser = None
+            self._idle = []
+            self._in_use = 0
+            self._slots = self._launch_lock = None
+        self._loop = loop
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Created lazily so the pool can be built outside a running loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        return self._slots
+
+    async def _ensure_browser(self) -> Any:
+        """Launch the browser on first use, or relaunch it after a crash."""
+        if self._browser is not None and self._is_connected(self._browser):
+            return self._browser
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._browser is not None and self._is_connected(self._browser):
+                return self._browser
+            await self._shutdown_browser()
+            self._playwright = await self._playwright_factory().start()
+            self._browser = await self._playwright.chromium.launch(**self.launch_options)
+            self.browser_launches += 1
+            return self._browser
+
+    async def _new_context(self, browser: Any) -> _PooledContext:
+        context = await browser.new_context(**self.context_options)
+        try:
+            if self.init_script:
+                await context.add_init_script(self.init_script)
+        except BaseException:
+            await self._close_quietly(context)
+            raise
+        self.contexts_created += 1
+        return _PooledContext(context=context, browser=browser, created_at=self._clock())
+
+    async def _shutdown_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            await self._close_quietly(browser)
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    async def _close_context(self, pooled: _PooledContext) -> None:
+        pooled.healthy = False
+        await self._close_quietly(pooled.context)
+
+    @staticmethod
+    async def _close_quietly(resource: Any) -> None:
+        # Closing after a crash raises; there is nothing left to clean up
+        try:
+            await resource.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_connected(browser: Any) -> bool:
+        try:
+            return bool(browser.is_connected())
+        except Exception:
+            return False
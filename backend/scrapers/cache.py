@@ -1,28 +1,78 @@
 """Caching layer for scraper results to reduce API calls and improve performance."""
 
+import asyncio
 import hashlib
+import heapq
+import itertools
 import json
+import logging
 import time
-from typing import Any, Optional
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping per entry: key string, CacheEntry, index and heap references
+ENTRY_OVERHEAD_BYTES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Redis payload headers (see serialize)
+_PLAIN = b"j"
+_ZLIB = b"z"
+COMPRESS_THRESHOLD_BYTES = 4096
 
 
 class CacheEntry:
-    """Single cache entry with expiration."""
+    """Single cache entry with expiration and estimated size."""
 
-    def __init__(self, value: Any, ttl: int):
+    __slots__ = ("key", "platform", "value", "expires_at", "size")
+
+    def __init__(
+        self,
+        value: Any,
+        ttl: int,
+        key: str = "",
+        platform: str = "",
+        size: int = 0,
+        now: Optional[float] = None,
+    ):
         """
         Initialize cache entry.
 
         Args:
             value: Cached value
             ttl: Time to live in seconds
+            key: Cache key
+            platform: Platform the entry belongs to
+            size: Estimated size in bytes
+            now: Current time (defaults to time.time())
         """
+        self.key = key
+        self.platform = platform
         self.value = value
-        self.expires_at = time.time() + ttl
+        self.expires_at = (time.time() if now is None else now) + ttl
+        self.size = size
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if cache entry has expired."""
-        return time.time() > self.expires_at
+        return (time.time() if now is None else now) > self.expires_at
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory used by a cached value.
+
+    Uses the length of its JSON encoding plus a fixed per-entry overhead;
+    scraper results are lists of JSON-like dicts, for which this tracks the
+    real footprint closely enough for budgeting.
+    """
+    return len(json.dumps(value, default=str, separators=(",", ":"))) + ENTRY_OVERHEAD_BYTES
 
 
 class ScraperCache:
@@ -30,21 +80,44 @@ class ScraperCache:
     In-memory cache for scraper results with TTL support.
 
     Features:
-    - TTL-based expiration
-    - Platform-specific cache keys
-    - Automatic cleanup of expired entries
-    - Memory-efficient storage
+    - TTL-based expiration, driven by a min-heap of expiry times so expired
+      entries are removed in O(log n) each, on writes and in the background
+    - Byte-bounded LRU: least recently used entries are evicted once the
+      estimated size exceeds ``max_bytes``
+    - Per-platform index, so platform invalidation only touches that
+      platform's entries
+    - Hit ratio, eviction and memory statistics
     """
 
-    def __init__(self, default_ttl: int = 3600):
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Initialize cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default 1 hour)
+            max_bytes: Memory budget for cached values (estimated)
+            clock: Time source in seconds
         """
         self.default_ttl = default_ttl
-        self._cache: dict[str, CacheEntry] = {}
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._by_platform: dict[str, set[str]] = {}
+        self._expiry_heap: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._bytes = 0
+        self._task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def _make_key(self, platform: str, target: str, **kwargs) -> str:
         """
@@ -85,16 +158,20 @@ class ScraperCache:
             Cached data or None if not found/expired
         """
         key = self._make_key(platform, target, **kwargs)
+        entry = self._cache.get(key)
 
-        if key not in self._cache:
+        if entry is None:
+            self.misses += 1
             return None
 
-        entry = self._cache[key]
-
-        if entry.is_expired():
-            del self._cache[key]
+        if entry.is_expired(self._clock()):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
             return None
 
+        self._cache.move_to_end(key)
+        self.hits += 1
         return entry.value
 
     def set(
@@ -108,6 +185,8 @@ class ScraperCache:
         """
         Store data in cache.
 
+        Values larger than the whole memory budget are not cached.
+
         Args:
             platform: Platform name
             target: Target identifier
@@ -117,8 +196,28 @@ class ScraperCache:
         """
         key = self._make_key(platform, target, **kwargs)
         ttl = ttl or self.default_ttl
+        now = self._clock()
+
+        self._remove(key)
+        self.cleanup_expired(now)
+
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
 
-        self._cache[key] = CacheEntry(value, ttl)
+        entry = CacheEntry(value, ttl, key=key, platform=platform, size=size, now=now)
+        self._cache[key] = entry
+        self._by_platform.setdefault(platform, set()).add(key)
+        self._bytes += size
+        heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._sequence), key))
+
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
+
+        # Drop heap references to replaced or removed entries
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._compact_heap()
 
     def invalidate(self, platform: str, target: str, **kwargs) -> bool:
         """
@@ -133,12 +232,7 @@ class ScraperCache:
             True if entry was removed, False if not found
         """
         key = self._make_key(platform, target, **kwargs)
-
-        if key in self._cache:
-            del self._cache[key]
-            return True
-
-        return False
+        return self._remove(key)
 
     def invalidate_platform(self, platform: str) -> int:
         """
@@ -150,30 +244,65 @@ class ScraperCache:
         Returns:
             Number of entries removed
         """
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{platform}:")]
+        keys_to_remove = self._by_platform.pop(platform, set())
 
         for key in keys_to_remove:
-            del self._cache[key]
+            self._bytes -= self._cache.pop(key).size
 
         return len(keys_to_remove)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._by_platform.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
 
-    def cleanup_expired(self) -> int:
+    def cleanup_expired(self, now: Optional[float] = None) -> int:
         """
         Remove expired entries from cache.
 
+        Only entries whose expiry time has passed are visited.
+
+        Args:
+            now: Current time (defaults to the cache clock)
+
         Returns:
             Number of entries removed
         """
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
+        now = self._clock() if now is None else now
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and heap[0][0] < now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+
+        self.expirations += removed
+        return removed
 
-        for key in expired_keys:
-            del self._cache[key]
+    def start(self, interval: float = 60.0) -> None:
+        """
+        Start removing expired entries periodically on the running event loop.
 
-        return len(expired_keys)
+        Args:
+            interval: Seconds between sweeps
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        """Stop background expiry."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
 
     def get_stats(self) -> dict:
         """
@@ -182,32 +311,369 @@ class ScraperCache:
         Returns:
             Dictionary with cache metrics
         """
+        now = self._clock()
         total_entries = len(self._cache)
-        expired_count = sum(1 for v in self._cache.values() if v.is_expired())
-
-        platform_counts: dict[str, int] = {}
-        for key in self._cache.keys():
-            platform = key.split(":")[0]
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
+        expired_count = sum(1 for v in self._cache.values() if v.is_expired(now))
+        lookups = self.hits + self.misses
 
         return {
             "total_entries": total_entries,
             "expired_entries": expired_count,
             "active_entries": total_entries - expired_count,
-            "by_platform": platform_counts,
+            "by_platform": {platform: len(keys) for platform, keys in self._by_platform.items()},
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "memory_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
         }
 
+    async def _run(self, interval: float) -> None:
+        """Sweep expired entries every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            self.cleanup_expired()
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and its platform index reference."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+
+        self._bytes -= entry.size
+        keys = self._by_platform.get(entry.platform)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_platform[entry.platform]
+        return True
+
+    def _compact_heap(self) -> None:
+        """Rebuild the expiry heap from live entries."""
+        self._expiry_heap = [
+            (entry.expires_at, next(self._sequence), key) for key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
+
+def serialize(value: Any, compress_threshold: int = COMPRESS_THRESHOLD_BYTES) -> bytes:
+    """
+    Encode a cached value for Redis.
+
+    JSON via orjson (stdlib json if orjson is unavailable), zlib-compressed
+    above ``compress_threshold`` bytes. A one-byte header records the format.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(value, default=str)
+    else:
+        payload = json.dumps(value, default=str, separators=(",", ":")).encode()
+
+    if len(payload) > compress_threshold:
+        return _ZLIB + zlib.compress(payload, 1)
+    return _PLAIN + payload
+
+
+def deserialize(data: bytes) -> Any:
+    """Decode a value produced by ``serialize``."""
+    header, payload = data[:1], data[1:]
+    if header == _ZLIB:
+        payload = zlib.decompress(payload)
+    elif header != _PLAIN:
+        raise ValueError(f"Unknown cache payload format {header!r}")
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+class TieredScraperCache:
+    """
+    Two-tier scraper cache: in-process L1 (``ScraperCache``) over shared Redis L2.
+
+    - Reads check L1, then L2; L2 hits are promoted to L1 for ``l1_ttl``
+      seconds (kept short so invalidations in other workers are picked up)
+    - Values are stored in Redis as compact binary (see ``serialize``)
+    - ``get_or_scrape`` is single-flight: concurrent calls for the same
+      (platform, target, params) in this process share one scrape, and a
+      short Redis lock makes other workers wait for that result instead of
+      scraping too
+    - Redis errors are logged and the cache degrades to L1 only
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        redis_url: Optional[str] = None,
+        default_ttl: int = 3600,
+        l1: Optional[ScraperCache] = None,
+        l1_ttl: int = 60,
+        platform_ttls: Optional[dict[str, int]] = None,
+        key_prefix: str = "scraper",
+        lock_timeout: float = 30.0,
+        lock_poll_interval: float = 0.1,
+        compress_threshold: int = COMPRESS_THRESHOLD_BYTES,
+    ):
+        """
+        Initialize tiered cache.
+
+        Args:
+            redis_client: Async Redis client (takes precedence over redis_url)
+            redis_url: Redis URL for L2 (no L2 if neither is given)
+            default_ttl: TTL in seconds for platforms without an entry in
+                ``platform_ttls``
+            l1: In-process cache to use as L1
+            l1_ttl: Maximum L1 lifetime in seconds
+            platform_ttls: Per-platform TTLs (defaults to ``PLATFORM_CACHE_TTL``)
+            key_prefix: Redis key prefix
+            lock_timeout: Seconds another worker's scrape is waited for
+            lock_poll_interval: Seconds between checks while waiting
+            compress_threshold: Compress serialized values larger than this
+        """
+        if redis_client is None and redis_url:
+            import redis.asyncio as redis_async
+
+            redis_client = redis_async.from_url(redis_url)
+
+        self.redis = redis_client
+        self.default_ttl = default_ttl
+        self.l1 = l1 or ScraperCache(default_ttl=l1_ttl)
+        self.l1_ttl = l1_ttl
+        self.platform_ttls = PLATFORM_CACHE_TTL if platform_ttls is None else platform_ttls
+        self.key_prefix = key_prefix
+        self.lock_timeout = lock_timeout
+        self.lock_poll_interval = lock_poll_interval
+        self.compress_threshold = compress_threshold
+
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.l2_errors = 0
+        self.scrapes = 0
+        self.coalesced = 0
+
+    async def get(self, platform: str, target: str, **params: Any) -> Optional[Any]:
+        """
+        Retrieve cached results from L1, then L2.
+
+        Args:
+            platform: Platform name
+            target: Target identifier
+            **params: Additional cache key parameters
+
+        Returns:
+            Cached results or None
+        """
+        value = self.l1.get(platform, target, **params)
+        if value is not None:
+            return value
+
+        if self.redis is None:
+            return None
+
+        key = self._redis_key(platform, target, params)
+        try:
+            data = await self.redis.get(key)
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Cache get error: {e}")
+            return None
+
+        if data is None:
+            self.l2_misses += 1
+            return None
+
+        self.l2_hits += 1
+        value = deserialize(data)
+        self.l1.set(platform, target, value, ttl=self.l1_ttl, **params)
+        return value
+
+    async def set(
+        self, platform: str, target: str, value: Any, ttl: Optional[int] = None, **params: Any
+    ) -> None:
+        """
+        Store results in both tiers.
+
+        Args:
+            platform: Platform name
+            target: Target identifier
+            value: Results to cache
+            ttl: TTL in seconds (defaults to the platform TTL)
+            **params: Additional cache key parameters
+        """
+        ttl = ttl or self.platform_ttls.get(platform, self.default_ttl)
+        self.l1.set(platform, target, value, ttl=min(ttl, self.l1_ttl), **params)
+
+        if self.redis is None:
+            return
+
+        key = self._redis_key(platform, target, params)
+        try:
+            await self.redis.set(key, serialize(value, self.compress_threshold), ex=ttl)
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Cache set error: {e}")
+
+    async def invalidate(self, platform: str, target: str, **params: Any) -> None:
+        """Invalidate cached results in both tiers."""
+        self.l1.invalidate(platform, target, **params)
+
+        if self.redis is None:
+            return
+
+        try:
+            await self.redis.delete(self._redis_key(platform, target, params))
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Cache invalidate error: {e}")
+
+    async def get_or_scrape(
+        self,
+        platform: str,
+        target: str,
+        scrape: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        **params: Any,
+    ) -> Any:
+        """
+        Return cached results, or scrape once and cache them.
+
+        Empty results are returned but not cached.
+
+        Args:
+            platform: Platform name
+            target: Target identifier
+            scrape: Coroutine function performing the upstream scrape
+            ttl: TTL in seconds (defaults to the platform TTL)
+            **params: Additional cache key parameters
+
+        Returns:
+            Cached or freshly scraped results
+        """
+        value = await self.get(platform, target, **params)
+        if value is not None:
+            return value
+
+        key = self._redis_key(platform, target, params)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        # A scrape may have finished while L2 was being checked
+        value = self.l1.get(platform, target, **params)
+        if value is not None:
+            return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._scrape_once(platform, target, scrape, ttl, params)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody is waiting
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics for both tiers.
+
+        Returns:
+            Dictionary with L1 metrics and L2/single-flight counters
+        """
+        return {
+            "l1": self.l1.get_stats(),
+            "l2_enabled": self.redis is not None,
+            "l2_hits": self.l2_hits,
+            "l2_misses": self.l2_misses,
+            "l2_errors": self.l2_errors,
+            "scrapes": self.scrapes,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+    async def _scrape_once(
+        self,
+        platform: str,
+        target: str,
+        scrape: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        params: dict[str, Any],
+    ) -> Any:
+        """Scrape under a Redis lock, or wait for the worker that holds it."""
+        lock_key = f"{self._redis_key(platform, target, params)}:lock"
+        locked = await self._acquire_lock(lock_key)
+
+        if not locked:
+            # Another worker is scraping this target; wait for its result
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.lock_poll_interval)
+                value = await self.get(platform, target, **params)
+                if value is not None:
+                    return value
+                if not await self._lock_held(lock_key):
+                    break
+
+        try:
+            self.scrapes += 1
+            value = await scrape()
+            if value:
+                await self.set(platform, target, value, ttl=ttl, **params)
+            return value
+        finally:
+            if locked:
+                await self._release_lock(lock_key)
+
+    async def _acquire_lock(self, lock_key: str) -> bool:
+        """Take the cross-worker scrape lock (always succeeds without L2)."""
+        if self.redis is None:
+            return True
+        try:
+            return bool(
+                await self.redis.set(lock_key, b"1", nx=True, px=int(self.lock_timeout * 1000))
+            )
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Cache lock error: {e}")
+            return True
+
+    async def _lock_held(self, lock_key: str) -> bool:
+        try:
+            return bool(await self.redis.exists(lock_key))
+        except Exception:
+            return False
+
+    async def _release_lock(self, lock_key: str) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"Cache unlock error: {e}")
+
+    def _redis_key(self, platform: str, target: str, params: dict[str, Any]) -> str:
+        return f"{self.key_prefix}:{self.l1._make_key(platform, target, **params)}"
+
 
 # Global cache instance
 _GLOBAL_CACHE: Optional[ScraperCache] = None
 
 
-def get_cache(default_ttl: int = 3600) -> ScraperCache:
+def get_cache(default_ttl: int = 3600, max_bytes: int = DEFAULT_MAX_BYTES) -> ScraperCache:
     """
     Get global cache instance.
 
     Args:
         default_ttl: Default TTL in seconds (only used on first call)
+        max_bytes: Memory budget in bytes (only used on first call)
 
     Returns:
         ScraperCache instance
@@ -215,7 +681,7 @@ def get_cache(default_ttl: int = 3600) -> ScraperCache:
     global _GLOBAL_CACHE
 
     if _GLOBAL_CACHE is None:
-        _GLOBAL_CACHE = ScraperCache(default_ttl=default_ttl)
+        _GLOBAL_CACHE = ScraperCache(default_ttl=default_ttl, max_bytes=max_bytes)
 
     return _GLOBAL_CACHE
 
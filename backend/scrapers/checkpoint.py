@@ -0,0 +1,71 @@
+"""Resumable progress checkpoints for long-running ingestion jobs."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Union
+
+
+class ScrapeCheckpoint:
+    """
+    Set of completed item IDs persisted to a JSON file.
+
+    Lets a large channel or corpus be ingested across several runs: items
+    marked done are skipped next time. Writes are atomic (temp file and
+    rename), so an interrupted run never leaves a corrupt checkpoint.
+
+    Example:
+        checkpoint = ScrapeCheckpoint("data/checkpoints/naval.json")
+        for video_id in video_ids:
+            if not checkpoint.is_done(video_id):
+                ...
+                checkpoint.mark_done(video_id)
+    """
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 1):
+        """
+        Load the checkpoint at ``path`` (missing or unreadable files start empty).
+
+        Args:
+            path: JSON file to read and write
+            flush_every: Write to disk after this many ``mark_done`` calls
+        """
+        self.path = Path(path)
+        self.flush_every = max(1, flush_every)
+        self.completed: set[str] = set()
+        self._pending = 0
+
+        try:
+            data = json.loads(self.path.read_text())
+            self.completed = set(data.get("completed", []))
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def __len__(self) -> int:
+        return len(self.completed)
+
+    def is_done(self, item_id: str) -> bool:
+        """Whether ``item_id`` was completed in this or an earlier run."""
+        return item_id in self.completed
+
+    def mark_done(self, item_id: str) -> None:
+        """Record ``item_id`` as completed, flushing every ``flush_every`` calls."""
+        if item_id in self.completed:
+            return
+        self.completed.add(item_id)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.save()
+
+    def save(self) -> None:
+        """Atomically write the checkpoint to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "completed": sorted(self.completed),
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.path)
+        self._pending = 0
@@ -0,0 +1,36 @@
+"""Normalized content fingerprints for change detection on re-scrapes."""
+
+import hashlib
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_for_hash(text: str) -> str:
+    """
+    Normalize text so cosmetic differences do not count as changes.
+
+    Applies Unicode NFKC normalization and collapses runs of whitespace
+    (including line-ending and trailing-space differences) to one space.
+
+    Args:
+        text: Scraped content body
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def content_hash(text: str) -> str:
+    """
+    SHA-256 hex digest of the normalized text.
+
+    Args:
+        text: Scraped content body
+
+    Returns:
+        64-character hex digest
+    """
+    return hashlib.sha256(normalize_for_hash(text).encode("utf-8")).hexdigest()
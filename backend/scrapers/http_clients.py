@@ -0,0 +1,352 @@
+"""Process-wide pooled HTTP clients for scrapers, keyed by upstream host."""
+
+import asyncio
+import importlib.util
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+import httpcore
+import httpx
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_DNS_TTL = 300.0
+
+
+@dataclass
+class HostLimits:
+    """Connection pool limits for one upstream host."""
+
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+
+# Sized to the matching rate limiter burst, so bursts never wait for a socket
+HOST_LIMITS = {
+    "r.jina.ai": HostLimits(max_connections=20, max_keepalive_connections=20),
+    "api.scraperapi.com": HostLimits(max_connections=10, max_keepalive_connections=10),
+}
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that caches DNS lookups for ``ttl`` seconds.
+
+    Connections are opened to the cached address; TLS still verifies and
+    sends SNI for the original host name.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[httpcore.AsyncNetworkBackend] = None,
+        ttl: float = DEFAULT_DNS_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._backend = backend or httpcore.AnyIOBackend()
+        self.ttl = ttl
+        self._clock = clock
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        """
+        Resolve ``host`` to IP addresses, using the cache when fresh.
+
+        Args:
+            host: Host name (IP literals are returned as is)
+            port: Port, part of the cache key
+
+        Returns:
+            Addresses in resolver order
+        """
+        key = (host, port)
+        cached = self._cache.get(key)
+        now = self._clock()
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[1]
+
+        self.lookups += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[key] = (now + self.ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self.resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+
+        # Every cached address failed; the host may have moved
+        self._cache.pop((host, port), None)
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport with a DNS-caching backend and in-flight request counts."""
+
+    def __init__(
+        self,
+        limits: HostLimits,
+        http2: bool,
+        network_backend: httpcore.AsyncNetworkBackend,
+    ):
+        super().__init__(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+        )
+        # httpx does not expose httpcore's network_backend, so rebuild its
+        # pool with the same settings plus the caching backend
+        pool = self._pool
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=pool._ssl_context,
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=network_backend,
+        )
+        self.max_connections = limits.max_connections
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        # The connection stays busy until the body has been read and closed
+        response.stream = _TrackedStream(response.stream, self._request_done)
+        return response
+
+    def _request_done(self) -> None:
+        self.in_flight -= 1
+
+    def pool_stats(self) -> dict:
+        connections = self._pool.connections
+        active = sum(1 for connection in connections if not connection.is_idle())
+        return {
+            "max_connections": self.max_connections,
+            "connections": len(connections),
+            "active": active,
+            "idle": len(connections) - active,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - active),
+            "peak_in_flight": self.peak_in_flight,
+            "utilization": self.in_flight / self.max_connections,
+            "requests": self.requests,
+        }
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response stream that reports when it is closed (once)."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class HTTPClientRegistry:
+    """
+    Shared ``httpx.AsyncClient`` per upstream host.
+
+    Features:
+    - One connection pool per host with its own limits (``HOST_LIMITS``)
+    - Keep-alive connections reused across scrapes
+    - HTTP/2 when the ``h2`` package is installed
+    - DNS results cached per host (``dns_ttl`` seconds)
+    - Per-host pool utilisation in ``get_stats``
+
+    Clients are created on first use, bound to the running event loop, and
+    closed by ``aclose`` (app shutdown). Callers must not close borrowed
+    clients.
+
+    Example:
+        client = get_http_clients().client("https://r.jina.ai/")
+        response = await client.get("https://r.jina.ai/https://example.com")
+    """
+
+    def __init__(
+        self,
+        default_limits: Optional[HostLimits] = None,
+        host_limits: Optional[dict[str, HostLimits]] = None,
+        http2: Optional[bool] = None,
+        dns_ttl: float = DEFAULT_DNS_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        network_backend: Optional[httpcore.AsyncNetworkBackend] = None,
+    ):
+        """
+        Initialize the registry (no clients are created until first use).
+
+        Args:
+            default_limits: Limits for hosts without an entry in ``host_limits``
+            host_limits: Per-host limit overrides (defaults to ``HOST_LIMITS``)
+            http2: Enable HTTP/2 (default: when ``h2`` is installed)
+            dns_ttl: Seconds to cache DNS lookups
+            timeout: Default request timeout in seconds
+            network_backend: Backend wrapped by the DNS cache (for tests)
+        """
+        self.default_limits = default_limits or HostLimits()
+        self.host_limits = HOST_LIMITS if host_limits is None else host_limits
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.http2 = http2
+        self.timeout = timeout
+        self.dns = CachingNetworkBackend(network_backend, ttl=dns_ttl)
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, _PooledTransport] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def client(self, url_or_host: str) -> httpx.AsyncClient:
+        """
+        Borrow the shared client for a URL's host.
+
+        Args:
+            url_or_host: Full URL or bare host name
+
+        Returns:
+            httpx.AsyncClient (do not close it)
+        """
+        loop = _running_loop()
+        if loop is not self._loop:
+            # Connections belong to the loop that opened them; start afresh on
+            # a new loop (e.g. one ``asyncio.run`` per Celery task)
+            self._clients, self._transports = {}, {}
+            self._loop = loop
+
+        host = _host_of(url_or_host)
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            limits = self.host_limits.get(host, self.default_limits)
+            transport = _PooledTransport(limits, self.http2, self.dns)
+            client = httpx.AsyncClient(
+                transport=transport, timeout=self.timeout, follow_redirects=True
+            )
+            self._clients[host] = client
+            self._transports[host] = transport
+        return client
+
+    def get_stats(self) -> dict:
+        """
+        Get per-host pool utilisation.
+
+        Returns:
+            Dict with ``hosts`` (connections, active/idle, in-flight and
+            queued requests, utilisation against ``max_connections``) and
+            DNS cache counters
+        """
+        return {
+            "http2": self.http2,
+            "hosts": {host: transport.pool_stats() for host, transport in self._transports.items()},
+            "dns": {"lookups": self.dns.lookups, "hits": self.dns.hits},
+        }
+
+    async def aclose(self) -> None:
+        """Close every client and its connections."""
+        clients, self._clients = self._clients, {}
+        self._transports = {}
+        for client in clients.values():
+            await client.aclose()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _host_of(url_or_host: str) -> str:
+    if "://" not in url_or_host:
+        url_or_host = f"https://{url_or_host}"
+    parts = urlsplit(url_or_host)
+    host = (parts.hostname or "").lower()
+    return f"{host}:{parts.port}" if parts.port else host
+
+
+# Global registry instance
+_REGISTRY: Optional[HTTPClientRegistry] = None
+
+
+def get_http_clients() -> HTTPClientRegistry:
+    """
+    Get the global HTTP client registry.
+
+    Returns:
+        HTTPClientRegistry instance
+    """
+    global _REGISTRY
+
+    if _REGISTRY is None:
+        _REGISTRY = HTTPClientRegistry()
+
+    return _REGISTRY
+
+
+async def close_http_clients() -> None:
+    """Close the global registry's clients (called on shutdown)."""
+    global _REGISTRY
+
+    if _REGISTRY is not None:
+        registry, _REGISTRY = _REGISTRY, None
+        await registry.aclose()
@@ -1,54 +1,129 @@
 """Rate limiting for scrapers to prevent API abuse and rate limit violations."""
 
 import asyncio
+import contextvars
 import time
-from collections import defaultdict
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from enum import IntEnum
+from typing import Callable, Deque, Iterator, Optional
 
 
 @dataclass
 class RateLimitConfig:
     """Configuration for rate limiting."""
 
-    requests_per_minute: int = 60
-    requests_per_hour: int = 1000
+    requests_per_minute: float = 60
+    requests_per_hour: Optional[int] = 1000  # None disables the hourly cap
     burst_size: int = 10
 
 
+class Priority(IntEnum):
+    """Waiter lanes, served in ascending order."""
+
+    INTERACTIVE = 0  # API requests a user is waiting on
+    BULK = 1  # Corpus jobs and other background scraping
+
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "scrape_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def scrape_priority(priority: Priority) -> Iterator[None]:
+    """
+    Set the default lane for rate-limited scraping in this context.
+
+    Applies to everything awaited inside the block, including tasks it starts.
+
+    Example:
+        with scrape_priority(Priority.BULK):
+            await scraper.scrape_naval_corpus()
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class _Waiter:
+    """A queued request for ``cost`` tokens"""
+
+    __slots__ = ("future", "cost", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, cost: int, enqueued_at: float):
+        self.future = future
+        self.cost = cost
+        self.enqueued_at = enqueued_at
+
+
+class _Bucket:
+    """Token bucket, hourly window and waiter lanes for one platform"""
+
+    def __init__(self, config: RateLimitConfig, now: float, wait_samples: int):
+        self.config = config
+        self.tokens = float(config.burst_size)
+        self.last_refill = now
+        self.request_times: Deque[float] = deque()
+        self.lanes: list[Deque[_Waiter]] = [deque() for _ in Priority]
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.wait_times: Deque[float] = deque(maxlen=wait_samples)
+
+    def queue_depth(self) -> int:
+        return sum(len(lane) for lane in self.lanes)
+
+    def head(self) -> Optional[_Waiter]:
+        """First live waiter in the highest-priority non-empty lane."""
+        for lane in self.lanes:
+            while lane and lane[0].future.done():
+                lane.popleft()  # Cancelled while queued
+            if lane:
+                return lane[0]
+        return None
+
+
 class RateLimiter:
     """
     In-memory rate limiter using token bucket algorithm.
 
     Features:
-    - Per-platform rate limiting
+    - Per-platform rate limiting (optionally with per-platform configs)
     - Burst allowance for sudden spikes
     - Automatic token regeneration
-    - Thread-safe with asyncio locks
+    - Waiters queue FIFO per platform and are woken exactly when their tokens
+      are available (one timer per platform, no polling)
+    - Priority lanes: interactive requests are served before bulk jobs
+    - Queue depth and wait-time percentiles in ``get_stats``
     """
 
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        platform_configs: Optional[dict[str, RateLimitConfig]] = None,
+        wait_samples: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             config: Rate limit configuration (uses defaults if not provided)
+            platform_configs: Optional overrides keyed by platform
+            wait_samples: Recent wait times kept per platform for percentiles
+            clock: Monotonic time source in seconds
         """
         self.config = config or RateLimitConfig()
-
-        # Per-platform token buckets
-        self._tokens: dict[str, float] = defaultdict(lambda: self.config.burst_size)
-        self._last_refill: dict[str, float] = defaultdict(time.time)
-
-        # Track request history for hourly limits
-        self._request_times: dict[str, list[float]] = defaultdict(list)
-
-        # Locks for thread safety
-        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.platform_configs = platform_configs or {}
+        self._wait_samples = wait_samples
+        self._clock = clock
+        self._buckets: dict[str, _Bucket] = {}
 
     async def acquire(self, platform: str, cost: int = 1) -> bool:
         """
-        Acquire tokens for a request.
+        Acquire tokens for a request without waiting.
 
         Args:
             platform: Platform identifier (twitter, youtube, reddit, web)
@@ -58,75 +133,75 @@ class RateLimiter:
             True if request allowed, raises exception if rate limited
 
         Raises:
-            RateLimitExceeded: If rate limit exceeded
+            RateLimitExceeded: If rate limit exceeded or other requests are queued
         """
-        async with self._locks[platform]:
-            # Refill tokens based on time elapsed
-            self._refill_tokens(platform)
-
-            # Check hourly limit
-            self._clean_old_requests(platform)
-            if len(self._request_times[platform]) >= self.config.requests_per_hour:
-                wait_time = 3600 - (time.time() - self._request_times[platform][0])
-                raise RateLimitExceeded(
-                    f"Hourly limit reached for {platform}. Retry in {wait_time:.0f}s"
-                )
-
-            # Check if enough tokens available
-            if self._tokens[platform] < cost:
-                wait_time = self._time_until_refill(platform, cost)
-                raise RateLimitExceeded(
-                    f"Rate limit exceeded for {platform}. Retry in {wait_time:.1f}s"
-                )
-
-            # Consume tokens
-            self._tokens[platform] -= cost
-            self._request_times[platform].append(time.time())
-
-            return True
-
-    def _refill_tokens(self, platform: str) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.time()
-        elapsed = now - self._last_refill[platform]
-
-        # Refill rate: requests_per_minute / 60 seconds
-        refill_rate = self.config.requests_per_minute / 60.0
-        tokens_to_add = elapsed * refill_rate
-
-        self._tokens[platform] = min(
-            self._tokens[platform] + tokens_to_add, self.config.burst_size
-        )
-        self._last_refill[platform] = now
-
-    def _clean_old_requests(self, platform: str) -> None:
-        """Remove request timestamps older than 1 hour."""
-        cutoff = time.time() - 3600
-        self._request_times[platform] = [
-            t for t in self._request_times[platform] if t > cutoff
-        ]
-
-    def _time_until_refill(self, platform: str, required_tokens: int) -> float:
-        """Calculate time until enough tokens available."""
-        tokens_needed = required_tokens - self._tokens[platform]
-        refill_rate = self.config.requests_per_minute / 60.0
-        return tokens_needed / refill_rate
-
-    async def wait_if_needed(self, platform: str, cost: int = 1) -> None:
+        bucket = self._bucket(platform)
+        now = self._clock()
+        self._refill(bucket, now)
+
+        config = bucket.config
+        if config.requests_per_hour is not None and (
+            len(bucket.request_times) >= config.requests_per_hour
+        ):
+            wait_time = 3600 - (now - bucket.request_times[0])
+            raise RateLimitExceeded(
+                f"Hourly limit reached for {platform}. Retry in {wait_time:.0f}s"
+            )
+
+        if bucket.head() is not None:
+            raise RateLimitExceeded(
+                f"Rate limit exceeded for {platform}: {bucket.queue_depth()} requests queued"
+            )
+
+        if bucket.tokens < cost:
+            wait_time = self._time_until_available(bucket, cost, now)
+            raise RateLimitExceeded(
+                f"Rate limit exceeded for {platform}. Retry in {wait_time:.1f}s"
+            )
+
+        self._consume(bucket, cost, now)
+        return True
+
+    async def wait_if_needed(
+        self, platform: str, cost: int = 1, priority: Optional[Priority] = None
+    ) -> None:
         """
-        Wait if rate limited, then acquire tokens.
+        Wait in the platform's queue until tokens are available, then take them.
 
         Args:
             platform: Platform identifier
             cost: Number of tokens required
+            priority: Lane to queue in (defaults to the ``scrape_priority`` context)
+
+        Raises:
+            ValueError: If cost exceeds the platform's burst size
         """
-        while True:
-            try:
-                await self.acquire(platform, cost)
-                return
-            except RateLimitExceeded as e:
-                wait_time = float(str(e).split("Retry in ")[1].rstrip("s"))
-                await asyncio.sleep(wait_time)
+        bucket = self._bucket(platform)
+        if cost > bucket.config.burst_size:
+            raise ValueError(
+                f"Cost {cost} exceeds burst size {bucket.config.burst_size} for {platform}"
+            )
+
+        now = self._clock()
+        self._refill(bucket, now)
+        if bucket.head() is None and self._time_until_available(bucket, cost, now) <= 0:
+            self._consume(bucket, cost, now)
+            bucket.wait_times.append(0.0)
+            return
+
+        if priority is None:
+            priority = _current_priority.get()
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), cost, now)
+        bucket.lanes[priority].append(waiter)
+        self._schedule(platform, bucket)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.cancelled():
+                # Let the next waiter take this one's place
+                self._schedule(platform, bucket)
+            raise
 
     def get_stats(self, platform: str) -> dict:
         """
@@ -136,20 +211,110 @@ class RateLimiter:
             platform: Platform identifier
 
         Returns:
-            Statistics dict with tokens, requests, etc.
+            Statistics dict with tokens, requests, queue depth and wait times
         """
-        self._refill_tokens(platform)
-        self._clean_old_requests(platform)
+        bucket = self._bucket(platform)
+        self._refill(bucket, self._clock())
+        config = bucket.config
 
+        waits = sorted(bucket.wait_times)
         return {
             "platform": platform,
-            "tokens_available": self._tokens[platform],
-            "max_tokens": self.config.burst_size,
-            "requests_last_hour": len(self._request_times[platform]),
-            "hourly_limit": self.config.requests_per_hour,
-            "requests_per_minute": self.config.requests_per_minute,
+            "tokens_available": bucket.tokens,
+            "max_tokens": config.burst_size,
+            "requests_last_hour": len(bucket.request_times),
+            "hourly_limit": config.requests_per_hour,
+            "requests_per_minute": config.requests_per_minute,
+            "queue_depth": bucket.queue_depth(),
+            "queue_depth_by_priority": {
+                priority.name.lower(): len(bucket.lanes[priority]) for priority in Priority
+            },
+            "wait_seconds": {
+                "p50": _percentile(waits, 0.50),
+                "p90": _percentile(waits, 0.90),
+                "p99": _percentile(waits, 0.99),
+                "max": waits[-1] if waits else 0.0,
+            },
         }
 
+    def _bucket(self, platform: str) -> _Bucket:
+        bucket = self._buckets.get(platform)
+        if bucket is None:
+            config = self.platform_configs.get(platform, self.config)
+            bucket = _Bucket(config, self._clock(), self._wait_samples)
+            self._buckets[platform] = bucket
+        return bucket
+
+    def _refill(self, bucket: _Bucket, now: float) -> None:
+        """Refill tokens and drop request timestamps older than 1 hour."""
+        refill_rate = bucket.config.requests_per_minute / 60.0
+        elapsed = now - bucket.last_refill
+        bucket.tokens = min(bucket.tokens + elapsed * refill_rate, bucket.config.burst_size)
+        bucket.last_refill = now
+
+        cutoff = now - 3600
+        while bucket.request_times and bucket.request_times[0] <= cutoff:
+            bucket.request_times.popleft()
+
+    def _time_until_available(self, bucket: _Bucket, cost: int, now: float) -> float:
+        """Seconds until ``cost`` tokens are available and the hourly cap allows a request."""
+        refill_rate = bucket.config.requests_per_minute / 60.0
+        wait = max(0.0, (cost - bucket.tokens) / refill_rate)
+
+        hourly_limit = bucket.config.requests_per_hour
+        if hourly_limit is not None and len(bucket.request_times) >= hourly_limit:
+            # Wait for enough old requests to leave the hour window
+            oldest = bucket.request_times[len(bucket.request_times) - hourly_limit]
+            wait = max(wait, oldest + 3600 - now)
+        return wait
+
+    def _consume(self, bucket: _Bucket, cost: int, now: float) -> None:
+        bucket.tokens -= cost
+        bucket.request_times.append(now)
+
+    def _schedule(self, platform: str, bucket: _Bucket) -> None:
+        """Wake the queue head when its tokens are due (one timer per platform)."""
+        if bucket.timer is not None:
+            bucket.timer.cancel()
+            bucket.timer = None
+
+        waiter = bucket.head()
+        if waiter is None:
+            return
+        now = self._clock()
+        self._refill(bucket, now)
+        delay = self._time_until_available(bucket, waiter.cost, now)
+        loop = asyncio.get_running_loop()
+        bucket.timer = loop.call_later(delay, self._dispatch, platform, bucket)
+
+    def _dispatch(self, platform: str, bucket: _Bucket) -> None:
+        """Grant tokens to queued waiters in order, then reschedule."""
+        bucket.timer = None
+        now = self._clock()
+        self._refill(bucket, now)
+
+        while True:
+            waiter = bucket.head()
+            if waiter is None or self._time_until_available(bucket, waiter.cost, now) > 0:
+                break
+            for lane in bucket.lanes:
+                if lane and lane[0] is waiter:
+                    lane.popleft()
+                    break
+            self._consume(bucket, waiter.cost, now)
+            bucket.wait_times.append(now - waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+        self._schedule(platform, bucket)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
 
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded."""
@@ -161,14 +326,13 @@ class RateLimitExceeded(Exception):
 _GLOBAL_LIMITER: Optional[RateLimiter] = None
 
 
-def get_rate_limiter(
-    platform_configs: Optional[dict[str, RateLimitConfig]] = None
-) -> RateLimiter:
+def get_rate_limiter(platform_configs: Optional[dict[str, RateLimitConfig]] = None) -> RateLimiter:
     """
     Get global rate limiter instance.
 
     Args:
         platform_configs: Optional platform-specific configurations
+            (defaults to ``PLATFORM_RATE_LIMITS``; only used on first call)
 
     Returns:
         RateLimiter instance
@@ -176,8 +340,7 @@ def get_rate_limiter(
     global _GLOBAL_LIMITER
 
     if _GLOBAL_LIMITER is None:
-        # Default config if none provided
-        _GLOBAL_LIMITER = RateLimiter()
+        _GLOBAL_LIMITER = RateLimiter(platform_configs=platform_configs or PLATFORM_RATE_LIMITS)
 
     return _GLOBAL_LIMITER
 
@@ -0,0 +1,177 @@
+"""Tests for concurrent multi-target scraping."""
+
+import asyncio
+
+import pytest
+
+from backend.scrapers.base import AuthorModel, BaseScraper, ContentModel, UnifiedContent
+from backend.scrapers.batch import ScrapeTarget, platform_concurrency, scrape_many
+
+
+class Concurrency:
+    """Tracks concurrent extract calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+
+class FakeScraper(BaseScraper):
+    """Scraper returning ``items`` results per target after ``delay`` seconds."""
+
+    def __init__(self, platform="web", delay=0.0, items=2, healthy=True, fail_on=(), overall=None):
+        self.platform = platform
+        self.overall = overall or Concurrency()
+        self.delay = delay
+        self.items = items
+        self.healthy = healthy
+        self.fail_on = set(fail_on)
+        self.health_checks = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def health_check(self) -> dict:
+        self.health_checks += 1
+        await asyncio.sleep(0)
+        return {"status": "ok" if self.healthy else "error", "message": "down"}
+
+    async def extract(self, target: str, limit: int = 20) -> list[dict]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.overall.active += 1
+        self.overall.max_active = max(self.overall.max_active, self.overall.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if target in self.fail_on:
+                raise RuntimeError(f"cannot scrape {target}")
+            return [{"id": f"{target}-{i}", "text": target} for i in range(min(self.items, limit))]
+        finally:
+            self.active -= 1
+            self.overall.active -= 1
+
+    async def normalize(self, raw_data: dict) -> UnifiedContent:
+        return UnifiedContent(
+            platform=self.platform,
+            source_url=f"https://example.com/{raw_data['id']}",
+            author=AuthorModel(id="a", platform=self.platform, username="a"),
+            content=ContentModel(body=raw_data["text"]),
+        )
+
+
+def factory(scrapers):
+    def get(platform):
+        if platform not in scrapers:
+            raise ValueError(f"No scraper registered for platform '{platform}'")
+        return scrapers[platform]
+
+    return get
+
+
+async def collect(targets, **kwargs):
+    return [event async for event in scrape_many(targets, **kwargs)]
+
+
+class TestBatchScrape:
+    """Test scrape_many."""
+
+    @pytest.mark.asyncio
+    async def test_streams_items_as_targets_complete(self):
+        """Fast targets are yielded before slow ones finish."""
+        scrapers = {"web": FakeScraper("web", delay=0.01), "youtube": FakeScraper("youtube", 0.1)}
+        targets = [ScrapeTarget("youtube", "slow"), ScrapeTarget("web", "fast")]
+
+        events = await collect(targets, scraper_factory=factory(scrapers))
+
+        assert [(e.type, e.target) for e in events] == [
+            ("item", "fast"),
+            ("item", "fast"),
+            ("done", "fast"),
+            ("item", "slow"),
+            ("item", "slow"),
+            ("done", "slow"),
+        ]
+        assert events[0].content.platform == "web"
+        assert events[2].count == 2
+
+    @pytest.mark.asyncio
+    async def test_per_platform_concurrency(self):
+        """No platform runs more targets at once than its limit."""
+        web = FakeScraper("web", delay=0.02)
+        targets = [ScrapeTarget("web", f"page{i}") for i in range(10)]
+
+        await collect(
+            targets,
+            concurrency=8,
+            platform_limits={"web": 3},
+            scraper_factory=factory({"web": web}),
+        )
+
+        assert web.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_overall_concurrency(self):
+        """The overall limit applies across platforms."""
+        overall = Concurrency()
+        scrapers = {p: FakeScraper(p, delay=0.02, overall=overall) for p in ("web", "reddit")}
+        targets = [ScrapeTarget(p, f"t{i}") for p in scrapers for i in range(5)]
+
+        await collect(targets, concurrency=4, scraper_factory=factory(scrapers))
+
+        assert overall.max_active == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_targets_reported(self):
+        """A failing target yields an error event; the others still complete."""
+        web = FakeScraper("web", fail_on={"bad"})
+        targets = [ScrapeTarget("web", "bad"), ScrapeTarget("web", "good")]
+
+        events = await collect(targets, scraper_factory=factory({"web": web}))
+
+        errors = [e for e in events if e.type == "error"]
+        assert len(errors) == 1 and "cannot scrape bad" in errors[0].error
+        assert sum(e.type == "item" for e in events) == 2
+        assert sum(e.type == "done" for e in events) == 2
+
+    @pytest.mark.asyncio
+    async def test_health_checked_once_per_platform(self):
+        """Unhealthy platforms fail their targets after a single health check."""
+        web = FakeScraper("web", healthy=False)
+        targets = [ScrapeTarget("web", f"page{i}") for i in range(5)]
+
+        events = await collect(targets, scraper_factory=factory({"web": web}))
+
+        assert web.health_checks == 1
+        assert all("not healthy" in e.error for e in events if e.type == "error")
+        assert sum(e.type == "error" for e in events) == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_platform(self):
+        """Targets on unregistered platforms fail without affecting others."""
+        targets = [ScrapeTarget("myspace", "tom"), ScrapeTarget("web", "page")]
+
+        events = await collect(targets, scraper_factory=factory({"web": FakeScraper()}))
+
+        assert [e.type for e in events if e.target == "tom"] == ["error", "done"]
+        assert sum(e.type == "item" for e in events) == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_remaining_targets(self):
+        """Stopping consumption cancels in-flight scrapes."""
+        web = FakeScraper("web", delay=10)
+        fast = FakeScraper("reddit", delay=0)
+        targets = [ScrapeTarget("reddit", "r/python")] + [
+            ScrapeTarget("web", f"page{i}") for i in range(3)
+        ]
+
+        stream = scrape_many(targets, scraper_factory=factory({"web": web, "reddit": fast}))
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.target == "r/python"
+        assert web.active == 0
+
+    def test_platform_concurrency_follows_burst_size(self):
+        """Platform limits default to the rate limiter burst size."""
+        assert platform_concurrency("twitter") == 5
+        assert platform_concurrency("web") == 20
+        assert platform_concurrency("unknown") == 4
@@ -0,0 +1,248 @@
+"""Tests for the pooled Playwright browser contexts and Twitter extraction."""
+
+import asyncio
+
+import pytest
+
+from backend.scrapers.adapters.twitter import TwitterScraper
+from backend.scrapers.browser_pool import BrowserContextPool
+
+
+class FakePage:
+    """Page whose ``evaluate`` returns queued tweet records."""
+
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.batches = []
+        self.evaluate_calls = 0
+
+    async def goto(self, url, wait_until=None):
+        self.url = url
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        self.evaluate_calls += 1
+        return self.batches.pop(0) if self.batches else []
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+        self.init_scripts = []
+        self.pages = []
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def new_page(self):
+        page = FakePage(self)
+        page.batches = list(self.browser.playwright.batches)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, playwright):
+        self.playwright = playwright
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    """Stands in for ``async_playwright()`` and counts browser launches."""
+
+    def __init__(self):
+        self.chromium = self
+        self.browsers = []
+        self.batches = []
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+    async def launch(self, **options):
+        browser = FakeBrowser(self)
+        self.browsers.append(browser)
+        return browser
+
+
+@pytest.fixture
+def playwright():
+    return FakePlaywright()
+
+
+def make_pool(playwright, **kwargs):
+    return BrowserContextPool(playwright_factory=playwright, init_script="spoof()", **kwargs)
+
+
+class TestBrowserContextPool:
+    """Test BrowserContextPool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_warm_context(self, playwright):
+        """Sequential scrapes share one browser and one configured context."""
+        pool = make_pool(playwright)
+
+        for _ in range(3):
+            async with pool.page() as page:
+                assert not page.closed
+
+        assert len(playwright.browsers) == 1
+        assert len(playwright.browsers[0].contexts) == 1
+        context = playwright.browsers[0].contexts[0]
+        assert context.init_scripts == ["spoof()"]
+        assert all(page.closed for page in context.pages)
+        assert pool.get_stats()["pages_served"] == 3
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_contexts(self, playwright):
+        """No more than ``size`` contexts are checked out at once."""
+        pool = make_pool(playwright, size=2)
+        active = 0
+        max_active = 0
+
+        async def scrape():
+            nonlocal active, max_active
+            async with pool.page():
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(scrape() for _ in range(6)))
+
+        assert max_active == 2
+        assert len(playwright.browsers[0].contexts) == 2
+        assert pool.get_stats()["idle"] == 2
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_pages(self, playwright):
+        pool = make_pool(playwright, max_pages_per_context=2)
+
+        for _ in range(5):
+            async with pool.page():
+                pass
+
+        contexts = playwright.browsers[0].contexts
+        assert len(contexts) == 3
+        assert [c.closed for c in contexts] == [True, True, False]
+        assert pool.get_stats()["contexts_recycled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_page_discards_context(self, playwright):
+        pool = make_pool(playwright)
+
+        with pytest.raises(RuntimeError):
+            async with pool.page():
+                raise RuntimeError("Target crashed")
+
+        assert playwright.browsers[0].contexts[0].closed
+        async with pool.page():
+            pass
+        assert len(playwright.browsers[0].contexts) == 2
+        assert pool.get_stats()["contexts_discarded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_relaunches_crashed_browser(self, playwright):
+        pool = make_pool(playwright)
+        async with pool.page():
+            pass
+
+        playwright.browsers[0].connected = False
+        assert (await pool.health_check())["status"] == "error"
+
+        async with pool.page() as page:
+            assert page.context.browser is playwright.browsers[1]
+        assert len(playwright.browsers) == 2
+        assert (await pool.health_check())["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_close(self, playwright):
+        pool = make_pool(playwright)
+        assert (await pool.health_check())["status"] == "idle"
+        async with pool.page():
+            pass
+
+        await pool.close()
+
+        assert playwright.browsers[0].contexts[0].closed
+        assert not playwright.browsers[0].connected
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+
+class TestTwitterExtract:
+    """Test TwitterScraper.extract against a pooled fake browser."""
+
+    @pytest.mark.asyncio
+    async def test_reads_each_scroll_in_one_evaluate(self, playwright):
+        def record(i, likes="1.2K"):
+            return {
+                "href": f"/naval/status/{i}?s=20",
+                "text": f"tweet {i}",
+                "created_at": "2024-01-01T00:00:00.000Z",
+                "likes": likes,
+                "retweets": "3",
+                "replies": None,
+            }
+
+        playwright.batches = [
+            [record(1), record(2), {"href": None, "text": "promoted"}],
+            [record(2), record(3, likes="")],
+        ]
+        scraper = TwitterScraper(pool=make_pool(playwright))
+
+        tweets = await scraper.extract("@naval", limit=3)
+
+        page = playwright.browsers[0].contexts[0].pages[0]
+        assert page.evaluate_calls == 2
+        assert page.url == "https://twitter.com/naval"
+        assert [t["id"] for t in tweets] == ["1", "2", "3"]
+        assert tweets[0]["public_metrics"] == {
+            "like_count": 1200,
+            "retweet_count": 3,
+            "reply_count": 0,
+            "view_count": 0,
+        }
+        assert tweets[2]["public_metrics"]["like_count"] == 0
+        assert tweets[0]["author_id"] == "naval"
+
+
+def test_new_event_loop_starts_a_fresh_browser(playwright):
+    """State from a finished loop is not reused (one asyncio.run per Celery task)."""
+    pool = make_pool(playwright)
+
+    async def scrape():
+        async with pool.page():
+            pass
+
+    asyncio.run(scrape())
+    asyncio.run(scrape())
+
+    assert len(playwright.browsers) == 2
@@ -1,10 +1,29 @@
 """Tests for caching functionality."""
 
+import asyncio
 import time
 
 import pytest
 
-from backend.scrapers.cache import ScraperCache
+from backend.scrapers.cache import (
+    ScraperCache,
+    TieredScraperCache,
+    deserialize,
+    estimate_size,
+    serialize,
+)
+from backend.scrapers.utils import ScraperCache as RedisScraperCache
+from backend.scrapers.utils import cached
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
 
 
 class TestScraperCache:
@@ -166,3 +185,248 @@ class TestScraperCache:
         assert stats["active_entries"] == 2
         assert stats["by_platform"]["twitter"] == 2
         assert stats["by_platform"]["youtube"] == 1
+
+    def test_lru_eviction_by_size(self):
+        """Least recently used entries are evicted when over the byte budget."""
+        entry_size = estimate_size([{"id": "1"}])
+        cache = ScraperCache(max_bytes=entry_size * 3)
+
+        for i in range(3):
+            cache.set("twitter", f"@user{i}", [{"id": str(i)}])
+        # Touch user0 so user1 becomes least recently used
+        cache.get("twitter", "@user0")
+        cache.set("twitter", "@user3", [{"id": "3"}])
+
+        assert cache.get("twitter", "@user1") is None
+        assert cache.get("twitter", "@user0") is not None
+        assert cache.get("twitter", "@user3") is not None
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["memory_bytes"] == entry_size * 3
+
+    def test_oversized_value_not_cached(self):
+        """Values larger than the whole budget are skipped."""
+        cache = ScraperCache(max_bytes=100)
+
+        cache.set("web", "https://example.com", [{"body": "x" * 1000}])
+
+        assert cache.get("web", "https://example.com") is None
+        assert cache.get_stats()["memory_bytes"] == 0
+
+    def test_expired_entries_removed_on_write(self):
+        """Writes drop expired entries without a full scan."""
+        clock = FakeClock()
+        cache = ScraperCache(clock=clock)
+
+        cache.set("twitter", "@user1", [{"id": "1"}], ttl=1)
+        cache.set("twitter", "@user2", [{"id": "2"}], ttl=60)
+        clock.now += 2
+        cache.set("youtube", "video123", [{"id": "3"}])
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["expirations"] == 1
+        assert stats["by_platform"] == {"twitter": 1, "youtube": 1}
+
+    def test_overwrite_keeps_new_expiry(self):
+        """Re-setting a key is not expired by its old heap entry."""
+        clock = FakeClock()
+        cache = ScraperCache(clock=clock)
+
+        cache.set("twitter", "@user", [{"id": "1"}], ttl=1)
+        cache.set("twitter", "@user", [{"id": "2"}], ttl=60)
+        clock.now += 2
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get("twitter", "@user") == [{"id": "2"}]
+
+    def test_hit_ratio(self):
+        """Stats report hits, misses and hit ratio."""
+        cache = ScraperCache()
+        cache.set("twitter", "@user", [{"id": "1"}])
+
+        cache.get("twitter", "@user")
+        cache.get("twitter", "@user")
+        cache.get("twitter", "@missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_background_expiry(self):
+        """The background task removes expired entries."""
+        clock = FakeClock()
+        cache = ScraperCache(clock=clock)
+        cache.set("twitter", "@user", [{"id": "1"}], ttl=1)
+        clock.now += 2
+
+        cache.start(interval=0.01)
+        await asyncio.sleep(0.05)
+        await cache.stop()
+
+        assert cache.get_stats()["total_entries"] == 0
+
+
+class BrokenRedis:
+    """Async Redis stand-in whose commands always fail."""
+
+    async def get(self, *args, **kwargs):
+        raise ConnectionError("connection refused")
+
+    set = delete = exists = get
+
+
+class TestTieredScraperCache:
+    """Test the L1 + Redis L2 cache."""
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeAsyncRedis()
+
+    def test_serialize_round_trip(self):
+        """Small values are stored plain, large ones compressed."""
+        small = [{"id": "1", "text": "hi"}]
+        large = [{"id": str(i), "text": "repeated text " * 20} for i in range(50)]
+
+        assert serialize(small)[:1] == b"j"
+        assert serialize(large)[:1] == b"z"
+        assert len(serialize(large)) < len(str(large))
+        assert deserialize(serialize(small)) == small
+        assert deserialize(serialize(large)) == large
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_promoted_to_l1(self, redis_client):
+        """Another worker's results are served from Redis, then from L1."""
+        writer = TieredScraperCache(redis_client=redis_client)
+        reader = TieredScraperCache(redis_client=redis_client)
+
+        await writer.set("youtube", "video123", [{"id": "3"}], limit=5)
+
+        assert await reader.get("youtube", "video123", limit=5) == [{"id": "3"}]
+        assert reader.l2_hits == 1
+        assert await reader.get("youtube", "video123", limit=5) == [{"id": "3"}]
+        assert reader.l2_hits == 1
+        assert reader.l1.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_platform_ttl_applied(self, redis_client):
+        """Redis TTLs follow PLATFORM_CACHE_TTL."""
+        cache = TieredScraperCache(redis_client=redis_client)
+
+        await cache.set("twitter", "@user", [{"id": "1"}])
+
+        ttl = await redis_client.ttl(cache._redis_key("twitter", "@user", {}))
+        assert 0 < ttl <= 300
+
+    @pytest.mark.asyncio
+    async def test_invalidate_both_tiers(self, redis_client):
+        """Invalidation removes the L1 and L2 copies."""
+        cache = TieredScraperCache(redis_client=redis_client)
+        await cache.set("web", "https://example.com", [{"id": "1"}])
+
+        await cache.invalidate("web", "https://example.com")
+
+        assert await cache.get("web", "https://example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self, redis_client):
+        """Concurrent requests for one target trigger a single scrape."""
+        cache = TieredScraperCache(redis_client=redis_client)
+        calls = 0
+
+        async def scrape():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [{"id": "1"}]
+
+        results = await asyncio.gather(
+            *(cache.get_or_scrape("twitter", "@user", scrape, limit=10) for _ in range(20))
+        )
+
+        assert calls == 1
+        assert all(r == [{"id": "1"}] for r in results)
+        assert cache.get_stats()["coalesced"] == 19
+
+    @pytest.mark.asyncio
+    async def test_single_flight_across_workers(self, redis_client):
+        """Workers sharing Redis wait for the worker holding the scrape lock."""
+        workers = [
+            TieredScraperCache(redis_client=redis_client, lock_poll_interval=0.01) for _ in range(3)
+        ]
+        calls = 0
+
+        async def scrape():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [{"id": "1"}]
+
+        results = await asyncio.gather(
+            *(worker.get_or_scrape("reddit", "r/python", scrape) for worker in workers)
+        )
+
+        assert calls == 1
+        assert all(r == [{"id": "1"}] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_single_flight_propagates_errors(self):
+        """Waiters see the leader's exception, and the next call retries."""
+        cache = TieredScraperCache()
+        calls = 0
+
+        async def scrape():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_scrape("web", "https://example.com", scrape) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_scrape("web", "https://example.com", scrape)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_degrade_to_l1(self):
+        """An unreachable Redis leaves L1 caching working."""
+        cache = TieredScraperCache(redis_client=BrokenRedis())
+
+        await cache.set("twitter", "@user", [{"id": "1"}])
+
+        assert await cache.get("twitter", "@user") == [{"id": "1"}]
+        assert await cache.get_or_scrape("twitter", "@other", _scrape_one) == [{"id": "1"}]
+        assert cache.get_stats()["l2_errors"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator(self, redis_client):
+        """The cached decorator scrapes once per target and params."""
+        cache = RedisScraperCache(ttl=60)
+        cache.redis = redis_client
+        calls = 0
+
+        class Scraper:
+            @cached(cache, "twitter")
+            async def extract(self, target, limit=20):
+                nonlocal calls
+                calls += 1
+                return [{"target": target}]
+
+        scraper = Scraper()
+        await asyncio.gather(*(scraper.extract("@user") for _ in range(5)))
+        await scraper.extract("@user")
+
+        assert calls == 1
+
+
+async def _scrape_one():
+    return [{"id": "1"}]
@@ -0,0 +1,126 @@
+"""Tests for the shared per-host HTTP client registry."""
+
+import asyncio
+
+import pytest
+
+from backend.scrapers.http_clients import CachingNetworkBackend, HostLimits, HTTPClientRegistry
+
+
+class LocalServer:
+    """Keep-alive HTTP/1.1 server counting connections and requests."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                self.requests += 1
+                await asyncio.sleep(self.delay)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+async def test_reuses_keep_alive_connections():
+    async with LocalServer() as server:
+        registry = HTTPClientRegistry(http2=False)
+        url = f"http://localhost:{server.port}/page"
+
+        for _ in range(5):
+            response = await registry.client(url).get(url)
+            assert response.text == "ok"
+
+        assert server.connections == 1
+        assert server.requests == 5
+        assert registry.client(url) is registry.client(f"http://localhost:{server.port}/other")
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_host_limits_and_utilization_stats():
+    async with LocalServer(delay=0.05) as server:
+        host = f"localhost:{server.port}"
+        registry = HTTPClientRegistry(
+            http2=False, host_limits={host: HostLimits(max_connections=2)}
+        )
+        url = f"http://{host}/"
+        client = registry.client(url)
+
+        tasks = [asyncio.create_task(client.get(url)) for _ in range(6)]
+        await asyncio.sleep(0.02)
+        busy = registry.get_stats()["hosts"][host]
+        await asyncio.gather(*tasks)
+        idle = registry.get_stats()["hosts"][host]
+
+        assert busy["max_connections"] == 2
+        assert busy["in_flight"] == 6
+        assert busy["active"] == 2
+        assert busy["queued"] == 4
+        assert busy["utilization"] == 3.0
+        assert server.connections == 2
+        assert idle["in_flight"] == 0 and idle["idle"] == 2
+        assert idle["peak_in_flight"] == 6 and idle["requests"] == 6
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_dns_lookups_are_cached():
+    async with LocalServer() as server:
+        registry = HTTPClientRegistry(http2=False, default_limits=HostLimits(keepalive_expiry=0))
+        url = f"http://localhost:{server.port}/"
+
+        for _ in range(3):
+            await registry.client(url).get(url)
+
+        assert server.connections == 3  # No keep-alive, so every request connects
+        assert registry.get_stats()["dns"] == {"lookups": 1, "hits": 2}
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_expires():
+    now = [0.0]
+    backend = CachingNetworkBackend(ttl=10, clock=lambda: now[0])
+
+    assert await backend.resolve("localhost", 80)
+    await backend.resolve("localhost", 80)
+    now[0] = 11
+    await backend.resolve("localhost", 80)
+
+    assert (backend.lookups, backend.hits) == (2, 1)
+
+
+def test_clients_are_rebuilt_on_a_new_event_loop():
+    """Clients from a finished loop are not reused (one asyncio.run per Celery task)."""
+    registry = HTTPClientRegistry(http2=False)
+
+    async def borrow():
+        return registry.client("https://r.jina.ai/")
+
+    first = asyncio.run(borrow())
+    second = asyncio.run(borrow())
+
+    assert first is not second
@@ -5,10 +5,13 @@ import asyncio
 import pytest
 
 from backend.scrapers.rate_limiter import (
+    Priority,
     RateLimitConfig,
     RateLimitExceeded,
     RateLimiter,
+    scrape_priority,
 )
+from backend.scrapers.utils import RateLimiter as CallRateLimiter
 
 
 class TestRateLimiter:
@@ -140,3 +143,125 @@ class TestRateLimiter:
         # Allow floating point precision errors
         assert abs(stats["tokens_available"] - 10) < 0.01
         assert stats["requests_last_hour"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_fifo(self):
+        """Queued waiters are woken in arrival order, one token interval apart."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=1200, requests_per_hour=None, burst_size=1)
+        )
+        await limiter.acquire("test_platform")
+
+        order = []
+
+        async def worker(i):
+            await limiter.wait_if_needed("test_platform")
+            order.append(i)
+
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        await asyncio.gather(*(worker(i) for i in range(5)))
+        elapsed = loop.time() - start
+
+        assert order == [0, 1, 2, 3, 4]
+        # 5 tokens at 20/s: ~0.25s, with no polling overshoot
+        assert 0.2 <= elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_interactive_lane_served_before_bulk(self):
+        """Interactive waiters jump ahead of bulk waiters queued earlier."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=1200, requests_per_hour=None, burst_size=1)
+        )
+        await limiter.acquire("test_platform")
+
+        order = []
+
+        async def worker(name, priority):
+            await limiter.wait_if_needed("test_platform", priority=priority)
+            order.append(name)
+
+        async def bulk_job():
+            with scrape_priority(Priority.BULK):
+                await asyncio.gather(worker("bulk-1", None), worker("bulk-2", None))
+
+        bulk = asyncio.create_task(bulk_job())
+        await asyncio.sleep(0.01)
+        assert limiter.get_stats("test_platform")["queue_depth_by_priority"]["bulk"] == 2
+
+        await worker("interactive", Priority.INTERACTIVE)
+        await bulk
+
+        assert order == ["interactive", "bulk-1", "bulk-2"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_turn(self):
+        """Cancelling a queued waiter lets the next one proceed."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=600, requests_per_hour=None, burst_size=1)
+        )
+        await limiter.acquire("test_platform")
+
+        first = asyncio.create_task(limiter.wait_if_needed("test_platform"))
+        second = asyncio.create_task(limiter.wait_if_needed("test_platform"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_jump_queue(self):
+        """Non-blocking acquire fails while others are waiting."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=600, requests_per_hour=None, burst_size=1)
+        )
+        await limiter.acquire("test_platform")
+        waiter = asyncio.create_task(limiter.wait_if_needed("test_platform"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimitExceeded, match="queued"):
+            await limiter.acquire("test_platform")
+        await waiter
+
+    @pytest.mark.asyncio
+    async def test_wait_stats(self):
+        """Stats report queue depth and wait-time percentiles."""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=1200, requests_per_hour=None, burst_size=2)
+        )
+        await asyncio.gather(*(limiter.wait_if_needed("test_platform") for _ in range(4)))
+
+        stats = limiter.get_stats("test_platform")
+        waits = stats["wait_seconds"]
+        assert stats["queue_depth"] == 0
+        assert waits["p50"] > 0
+        assert 0.08 <= waits["max"] < 0.3
+        assert waits["p50"] <= waits["p90"] <= waits["p99"] <= waits["max"]
+
+    @pytest.mark.asyncio
+    async def test_wait_if_needed_rejects_cost_above_burst(self):
+        """A cost larger than the bucket could never be served."""
+        limiter = RateLimiter(RateLimitConfig(burst_size=2))
+
+        with pytest.raises(ValueError):
+            await limiter.wait_if_needed("test_platform", cost=3)
+
+    def test_platform_configs(self):
+        """Platform-specific configs override the default."""
+        limiter = RateLimiter(platform_configs={"twitter": RateLimitConfig(burst_size=5)})
+
+        assert limiter.get_stats("twitter")["max_tokens"] == 5
+        assert limiter.get_stats("web")["max_tokens"] == 10
+
+    @pytest.mark.asyncio
+    async def test_call_rate_limiter_queues(self):
+        """The decorator limiter shares the queued implementation."""
+        limiter = CallRateLimiter(calls=2, period=0.1)
+
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        # 2 burst tokens, then 2 more at 20/s
+        assert 0.08 <= loop.time() - start < 0.3
@@ -0,0 +1,212 @@
+"""Tests for conditional re-scraping and content-hash change detection."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from backend.scrapers.adapters.web import WebScraper
+from backend.scrapers.fingerprint import content_hash
+from backend.scrapers.rate_limiter import RateLimitConfig, RateLimiter
+from backend.scrapers.recrawl import recrawl_web
+
+
+class FakeUpstream:
+    """Jina stand-in serving mutable pages, honouring If-None-Match when ``etags`` is on."""
+
+    def __init__(self, pages, etags=True):
+        self.pages = pages
+        self.etags = etags
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        url = str(request.url).split("r.jina.ai/", 1)[1]
+        body = self.pages[url]
+        headers = {}
+        if self.etags:
+            etag = f'"{content_hash(body)[:12]}"'
+            headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers=headers)
+        return httpx.Response(200, text=body, headers=headers)
+
+
+class FakeRegistry:
+    def __init__(self, upstream):
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream.handler))
+
+    def client(self, url):
+        return self._client
+
+
+class FakeContentRepository:
+    """In-memory stand-in for ContentRepository's change-detection methods."""
+
+    def __init__(self):
+        self.rows = {}
+        self.writes = 0
+
+    def _by_id(self, content_id):
+        return next(row for row in self.rows.values() if row["id"] == content_id)
+
+    def get_by_id(self, content_id):
+        return SimpleNamespace(**self._by_id(content_id))
+
+    def get_fingerprint(self, source_url):
+        row = self.rows.get(source_url)
+        if row is None:
+            return None
+        fields = ("id", "content_hash", "etag", "last_modified")
+        return {
+            **{k: row.get(k) for k in fields},
+            "body_bytes": len(row["content_body"].encode()),
+        }
+
+    def create(self, platform, source_url, author_id, **fields):
+        self.writes += 1
+        row = {"id": uuid4(), "source_url": source_url, "checks": 0, **fields}
+        self.rows[source_url] = row
+        return type("Content", (), row)
+
+    def update_content(self, content_id, embedding=None, **fields):
+        self.writes += 1
+        row = self._by_id(content_id)
+        row.update(fields)
+        if embedding is not None:
+            row["embedding"] = embedding
+        return True
+
+    def mark_checked(self, content_id, etag=None, last_modified=None, content_hash=None):
+        row = self._by_id(content_id)
+        row["checks"] += 1
+        row["etag"] = etag or row.get("etag")
+        row["content_hash"] = content_hash or row.get("content_hash")
+        return True
+
+    def update_embedding(self, content_id, embedding):
+        self._by_id(content_id)["embedding"] = embedding
+        return True
+
+
+class FakeAuthorRepository:
+    def create(self, author_id, **kwargs):
+        return author_id
+
+
+class Embedder:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, text):
+        self.calls += 1
+        return [0.0] * 4
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter(monkeypatch):
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=6000, burst_size=100))
+    monkeypatch.setattr("backend.scrapers.adapters.web.get_rate_limiter", lambda: limiter)
+
+
+async def crawl(upstream, repo, embedder, urls):
+    scraper = WebScraper(http=FakeRegistry(upstream))
+    return await recrawl_web(
+        urls, repo, scraper=scraper, embed=embedder, authors=FakeAuthorRepository()
+    )
+
+
+def test_content_hash_ignores_whitespace_and_unicode_forms():
+    assert content_hash("# Title\r\n\r\nBody  text ") == content_hash("# Title\n\nBody text")
+    assert content_hash("café") == content_hash("café")
+    assert content_hash("Body text") != content_hash("Body text!")
+
+
+@pytest.mark.asyncio
+async def test_not_modified_skips_download_write_and_embedding():
+    url = "https://example.com/post"
+    upstream = FakeUpstream({url: "# Post\n\nHello world"})
+    repo, embedder = FakeContentRepository(), Embedder()
+
+    first = await crawl(upstream, repo, embedder, [url])
+    second = await crawl(upstream, repo, embedder, [url])
+
+    assert (first.new, first.embedding_calls) == (1, 1)
+    assert second.not_modified == 1
+    assert second.bytes_downloaded == 0
+    assert second.bytes_not_downloaded == len("# Post\n\nHello world")
+    assert second.embedding_calls_saved == 1
+    assert upstream.requests[-1].headers["If-None-Match"] == repo.rows[url]["etag"]
+    assert (repo.writes, embedder.calls, repo.rows[url]["checks"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_hash_skips_write_and_embedding():
+    """Without validators, an identical normalized body is still detected."""
+    url = "https://example.com/post"
+    upstream = FakeUpstream({url: "# Post\n\nHello world"}, etags=False)
+    repo, embedder = FakeContentRepository(), Embedder()
+    await crawl(upstream, repo, embedder, [url])
+
+    upstream.pages[url] = "# Post\r\n\r\nHello   world\n"
+    stats = await crawl(upstream, repo, embedder, [url])
+
+    assert stats.unchanged == 1
+    assert stats.bytes_not_written == len(upstream.pages[url])
+    assert stats.embedding_calls_saved == 1
+    assert (repo.writes, embedder.calls) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_changed_content_is_rewritten_and_reembedded():
+    url = "https://example.com/post"
+    upstream = FakeUpstream({url: "# Post\n\nHello world", "https://example.com/new": "New"})
+    repo, embedder = FakeContentRepository(), Embedder()
+    await crawl(upstream, repo, embedder, [url])
+
+    upstream.pages[url] = "# Post\n\nHello again"
+    stats = await crawl(upstream, repo, embedder, [url, "example.com/new"])
+
+    assert (stats.changed, stats.new, stats.embedding_calls) == (1, 1, 2)
+    assert repo.rows[url]["content_body"] == "# Post\n\nHello again"
+    assert repo.rows[url]["content_hash"] == content_hash("# Post\n\nHello again")
+    assert repo.rows[url]["embedding"] == [0.0] * 4
+    assert embedder.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_row_without_hash_is_compared_by_stored_body():
+    """Rows stored before content hashes existed are not all treated as changed."""
+    url = "https://example.com/post"
+    upstream = FakeUpstream({url: "# Post\n\nHello world"}, etags=False)
+    repo, embedder = FakeContentRepository(), Embedder()
+    repo.rows[url] = {
+        "id": uuid4(),
+        "checks": 0,
+        "content_body": "# Post\n\nHello world\n",
+        "content_hash": None,
+        "embedding": [1.0] * 4,
+    }
+
+    stats = await crawl(upstream, repo, embedder, [url])
+
+    assert (stats.unchanged, stats.changed) == (1, 0)
+    assert (repo.writes, embedder.calls) == (0, 0)
+    assert repo.rows[url]["content_hash"] == content_hash("# Post\n\nHello world")
+    assert repo.rows[url]["embedding"] == [1.0] * 4
+
+
+@pytest.mark.asyncio
+async def test_changed_content_keeps_embedding_without_embedder():
+    url = "https://example.com/post"
+    upstream = FakeUpstream({url: "# Post\n\nHello world"}, etags=False)
+    repo = FakeContentRepository()
+    await crawl(upstream, repo, Embedder(), [url])
+
+    upstream.pages[url] = "# Post\n\nHello again"
+    stats = await crawl(upstream, repo, None, [url])
+
+    assert (stats.changed, stats.embedding_calls) == (1, 0)
+    assert repo.rows[url]["content_body"] == "# Post\n\nHello again"
+    assert repo.rows[url]["embedding"] == [0.0] * 4
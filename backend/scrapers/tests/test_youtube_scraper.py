@@ -0,0 +1,129 @@
+"""Tests for concurrent YouTube channel ingestion."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.scrapers.adapters.youtube import YouTubeScraper
+from backend.scrapers.checkpoint import ScrapeCheckpoint
+from backend.scrapers.rate_limiter import RateLimitConfig, RateLimiter
+
+
+class FakeYouTube:
+    """Blocking stand-ins for yt-dlp and the transcript API."""
+
+    def __init__(self, video_ids, delay=0.02, slow=()):
+        self.video_ids = video_ids
+        self.delay = delay
+        self.slow = set(slow)
+        self.fetched = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def install(self, scraper):
+        scraper._get_playlist_info = self.playlist_info
+        scraper._get_video_info = self.video_info
+        scraper._get_transcript = self.transcript
+        return scraper
+
+    def playlist_info(self, url, opts):
+        return {"entries": [{"id": video_id} for video_id in self.video_ids]}
+
+    def video_info(self, video_id, opts):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(1 if video_id in self.slow else self.delay)
+            self.fetched.append(video_id)
+            return {"title": f"Video {video_id}", "channel": "naval", "description": "desc"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def transcript(self, video_id):
+        time.sleep(self.delay)
+        return [{"text": "hello", "start": 0.0, "duration": 1.0}]
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter(monkeypatch):
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=6000, burst_size=100))
+    monkeypatch.setattr("backend.scrapers.adapters.youtube.get_rate_limiter", lambda: limiter)
+    return limiter
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=8)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def make_scraper(fake, executor, **kwargs):
+    return fake.install(YouTubeScraper(executor=executor, **kwargs))
+
+
+class TestYouTubeChannelIngestion:
+    """Test YouTubeScraper channel/playlist fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_and_keeps_listing_order(self, executor):
+        fake = FakeYouTube([f"vid{i:08d}" for i in range(8)])
+        scraper = make_scraper(fake, executor, max_concurrency=4)
+
+        started = time.perf_counter()
+        videos = await scraper.extract("@naval", limit=8)
+        elapsed = time.perf_counter() - started
+
+        assert [v["video_id"] for v in videos] == fake.video_ids
+        assert fake.max_active == 4
+        assert elapsed < 8 * 2 * fake.delay
+        assert videos[0]["transcript"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_per_video_timeout(self, executor):
+        fake = FakeYouTube(["fast0000001", "slow0000001"], slow={"slow0000001"})
+        scraper = make_scraper(fake, executor, video_timeout=0.2)
+
+        videos = [v async for v in scraper.iter_channel_videos("@naval")]
+
+        assert [v["video_id"] for v in videos] == ["fast0000001", "slow0000001"]
+        assert "Timed out" in videos[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resumes_across_runs(self, executor, tmp_path):
+        path = tmp_path / "checkpoints" / "naval.json"
+        fake = FakeYouTube([f"vid{i:08d}" for i in range(6)])
+        scraper = make_scraper(fake, executor, max_concurrency=1)
+
+        # First run is interrupted after handling two videos
+        stream = scraper.iter_channel_videos("@naval", checkpoint=ScrapeCheckpoint(path))
+        handled = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        assert len(ScrapeCheckpoint(path)) == 1  # The second was never acknowledged
+
+        fake.fetched.clear()
+        rest = [
+            v
+            async for v in scraper.iter_channel_videos("@naval", checkpoint=ScrapeCheckpoint(path))
+        ]
+
+        assert handled[0]["video_id"] not in fake.fetched
+        assert {v["video_id"] for v in rest} == set(fake.video_ids) - {handled[0]["video_id"]}
+        assert len(ScrapeCheckpoint(path)) == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_videos_are_retried(self, executor, tmp_path):
+        path = tmp_path / "naval.json"
+        fake = FakeYouTube(["good0000001", "slow0000001"], slow={"slow0000001"})
+        scraper = make_scraper(fake, executor, video_timeout=0.2)
+
+        [v async for v in scraper.iter_channel_videos("@naval", checkpoint=ScrapeCheckpoint(path))]
+
+        checkpoint = ScrapeCheckpoint(path)
+        assert checkpoint.is_done("good0000001")
+        assert not checkpoint.is_done("slow0000001")
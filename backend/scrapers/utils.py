@@ -2,13 +2,12 @@
 
 import asyncio
 import functools
-import hashlib
-import json
 import logging
-import time
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 
-import redis
+from backend.scrapers.cache import TieredScraperCache
+from backend.scrapers.rate_limiter import Priority, RateLimitConfig
+from backend.scrapers.rate_limiter import RateLimiter as ScraperRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +16,12 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 class RateLimiter:
-    """Token bucket rate limiter for API calls."""
+    """
+    Token bucket rate limiter for API calls.
+
+    A single-bucket view of ``backend.scrapers.rate_limiter.RateLimiter``, so
+    callers queue FIFO (by priority lane) instead of sleep-polling.
+    """
 
     def __init__(self, calls: int, period: float) -> None:
         """
@@ -29,32 +33,32 @@ class RateLimiter:
         """
         self.calls = calls
         self.period = period
-        self.tokens = calls
-        self.last_update = time.time()
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        """Wait until a token is available."""
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_update
-
-            # Refill tokens based on elapsed time
-            self.tokens = min(self.calls, self.tokens + (elapsed * self.calls / self.period))
-            self.last_update = now
+        self._limiter = ScraperRateLimiter(
+            RateLimitConfig(
+                requests_per_minute=calls * 60 / period,
+                requests_per_hour=None,
+                burst_size=calls,
+            )
+        )
+
+    async def acquire(self, priority: Optional[Priority] = None) -> None:
+        """
+        Wait until a token is available.
 
-            if self.tokens < 1:
-                # Wait until next token is available
-                wait_time = (1 - self.tokens) * self.period / self.calls
-                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-                self.tokens = 1
+        Args:
+            priority: Lane to queue in (defaults to the ``scrape_priority`` context)
+        """
+        await self._limiter.wait_if_needed("default", priority=priority)
 
-            self.tokens -= 1
 
+class ScraperCache(TieredScraperCache):
+    """
+    Redis-backed cache for scraper results.
 
-class ScraperCache:
-    """Redis-based cache for scraper results."""
+    A ``TieredScraperCache`` with one TTL for every platform: results are
+    kept in process (L1) and in Redis (L2), and ``cached`` uses its
+    single-flight ``get_or_scrape``.
+    """
 
     def __init__(self, redis_url: str = "redis://localhost:6379/0", ttl: int = 3600) -> None:
         """
@@ -65,76 +69,12 @@ class ScraperCache:
             ttl: Time to live in seconds (default 1 hour)
         """
         try:
-            self.redis_client = redis.from_url(redis_url, decode_responses=True)
-            self.ttl = ttl
-            self.enabled = True
+            super().__init__(redis_url=redis_url, default_ttl=ttl, platform_ttls={})
         except Exception as e:
             logger.warning(f"Redis cache disabled: {e}")
-            self.enabled = False
-
-    def _make_key(self, platform: str, target: str, params: dict[str, Any]) -> str:
-        """Generate cache key from parameters."""
-        params_str = json.dumps(params, sort_keys=True)
-        params_hash = hashlib.md5(params_str.encode()).hexdigest()[:8]
-        return f"scraper:{platform}:{target}:{params_hash}"
-
-    async def get(self, platform: str, target: str, **params: Any) -> list[dict] | None:
-        """
-        Retrieve cached scraper results.
-
-        Args:
-            platform: Platform name (twitter, youtube, etc.)
-            target: Target identifier (username, video_id, etc.)
-            **params: Additional parameters used in the scrape
-
-        Returns:
-            Cached results or None if not found/expired
-        """
-        if not self.enabled:
-            return None
-
-        try:
-            key = self._make_key(platform, target, params)
-            cached = self.redis_client.get(key)
-            if cached:
-                logger.debug(f"Cache hit: {key}")
-                return json.loads(cached)
-        except Exception as e:
-            logger.warning(f"Cache get error: {e}")
-
-        return None
-
-    async def set(self, platform: str, target: str, results: list[dict], **params: Any) -> None:
-        """
-        Store scraper results in cache.
-
-        Args:
-            platform: Platform name
-            target: Target identifier
-            results: Results to cache
-            **params: Additional parameters used in the scrape
-        """
-        if not self.enabled or not results:
-            return
-
-        try:
-            key = self._make_key(platform, target, params)
-            self.redis_client.setex(key, self.ttl, json.dumps(results))
-            logger.debug(f"Cache set: {key} (ttl={self.ttl}s)")
-        except Exception as e:
-            logger.warning(f"Cache set error: {e}")
-
-    def invalidate(self, platform: str, target: str, **params: Any) -> None:
-        """Invalidate cache for specific target."""
-        if not self.enabled:
-            return
-
-        try:
-            key = self._make_key(platform, target, params)
-            self.redis_client.delete(key)
-            logger.debug(f"Cache invalidated: {key}")
-        except Exception as e:
-            logger.warning(f"Cache invalidate error: {e}")
+            super().__init__(default_ttl=ttl, platform_ttls={})
+        self.ttl = ttl
+        self.enabled = self.redis is not None
 
 
 def rate_limit(calls: int = 10, period: float = 60.0) -> Callable[[F], F]:
@@ -239,19 +179,10 @@ def cached(cache: ScraperCache, platform: str) -> Callable[[F], F]:
             # Extract target from arguments
             target = args[1] if len(args) > 1 else kwargs.get("target", "unknown")
 
-            # Try to get from cache
-            cached_result = await cache.get(platform, str(target), **kwargs)
-            if cached_result is not None:
-                return cached_result
-
-            # Execute function
-            result = await func(*args, **kwargs)
-
-            # Cache result
-            if result:
-                await cache.set(platform, str(target), result, **kwargs)
-
-            return result
+            # Concurrent calls for the same target share one scrape
+            return await cache.get_or_scrape(
+                platform, str(target), lambda: func(*args, **kwargs), **kwargs
+            )
 
         return wrapper  # type: ignore
 
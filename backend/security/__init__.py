@@ -17,6 +17,7 @@ Implements OWASP Top 10 2021 security controls:
 from backend.security.audit_log import AuditLogger
 from backend.security.auth import create_access_token, hash_password, verify_password, verify_token
 from backend.security.crypto import SecureStorage, generate_encryption_key
+from backend.security.distributed_rate_limit import DistributedRateLimiter
 from backend.security.integrity import generate_hmac, verify_file_integrity, verify_hmac
 from backend.security.rate_limiting import AdaptiveRateLimiter
 from backend.security.rbac import Permission, Role, has_permission
@@ -35,6 +36,7 @@ __all__ = [
     "InputValidator",
     # Rate Limiting (A04)
     "AdaptiveRateLimiter",
+    "DistributedRateLimiter",
     # Auth (A07)
     "hash_password",
     "verify_password",
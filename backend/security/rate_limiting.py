@@ -3,9 +3,24 @@ A04:2021 - Insecure Design
 Adaptive rate limiting to prevent abuse and DoS attacks
 """
 
-import asyncio
-from datetime import datetime, timedelta
-from typing import Dict
+import math
+import os
+import time
+from typing import Callable, Dict, Optional, Union
+
+from backend.security.distributed_rate_limit import DistributedRateLimiter
+
+
+class _ClientWindow:
+    """Constant-size sliding-window state for one client key"""
+
+    __slots__ = ("window_start", "current", "previous", "blocked_until")
+
+    def __init__(self, window_start: float):
+        self.window_start = window_start
+        self.current = 0
+        self.previous = 0
+        self.blocked_until = 0.0
 
 
 class AdaptiveRateLimiter:
@@ -14,9 +29,15 @@ class AdaptiveRateLimiter:
 
     Features:
     - Per-IP and per-endpoint rate limiting
-    - Sliding window implementation
+    - Sliding window implementation (sliding-window counter, O(1) per check)
     - Automatic blocking after limit exceeded
     - Configurable limits and block durations
+
+    Each client key stores two counters and two timestamps regardless of its
+    request rate. The count for the last ``window_seconds`` is estimated from
+    the current fixed window plus the previous window weighted by how much of
+    it still overlaps. Blocks expire lazily on the client's next request, and
+    idle keys are swept periodically so memory tracks active clients only.
     """
 
     def __init__(
@@ -24,6 +45,8 @@ class AdaptiveRateLimiter:
         max_requests: int = 100,
         window_seconds: int = 60,
         block_duration_seconds: int = 900,
+        sweep_interval_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize rate limiter.
@@ -32,19 +55,18 @@ class AdaptiveRateLimiter:
             max_requests: Maximum requests per window (default: 100)
             window_seconds: Time window in seconds (default: 60)
             block_duration_seconds: Duration to block after limit exceeded (default: 900/15min)
+            sweep_interval_seconds: How often idle keys are evicted (default: window_seconds)
+            clock: Monotonic time source in seconds
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.block_duration_seconds = block_duration_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds or window_seconds
+        self._clock = clock
 
-        # Storage: {client_key: [request_timestamps]}
-        self.requests: Dict[str, list[datetime]] = {}
-
-        # Blocked clients: {client_key}
-        self.block_list: set = set()
-
-        # Active unblock tasks
-        self._unblock_tasks: Dict[str, asyncio.Task] = {}
+        # Storage: {client_key: window state}
+        self._clients: Dict[str, _ClientWindow] = {}
+        self._next_sweep = clock() + self.sweep_interval_seconds
 
     def _get_client_key(self, client_ip: str, endpoint: str = None) -> str:
         """
@@ -61,9 +83,33 @@ class AdaptiveRateLimiter:
             return f"{client_ip}:{endpoint}"
         return client_ip
 
-    async def check_rate_limit(
-        self, client_ip: str, endpoint: str = None, cost: int = 1
-    ) -> bool:
+    def _advance(self, state: _ClientWindow, now: float) -> float:
+        """
+        Roll a client's counters forward to the window containing ``now``.
+
+        Returns:
+            float: Estimated requests in the last ``window_seconds``
+        """
+        window_start = math.floor(now / self.window_seconds) * self.window_seconds
+        if window_start != state.window_start:
+            adjacent = window_start - state.window_start == self.window_seconds
+            state.previous = state.current if adjacent else 0
+            state.current = 0
+            state.window_start = window_start
+
+        overlap = 1.0 - (now - window_start) / self.window_seconds
+        return state.previous * overlap + state.current
+
+    def _get_state(self, key: str, now: float) -> Optional[_ClientWindow]:
+        """Get a client's state, clearing it if its block has expired."""
+        state = self._clients.get(key)
+        if state is not None and state.blocked_until and state.blocked_until <= now:
+            # Block served: start again with a clean slate
+            del self._clients[key]
+            state = None
+        return state
+
+    async def check_rate_limit(self, client_ip: str, endpoint: str = None, cost: int = 1) -> bool:
         """
         Check if request should be rate limited.
 
@@ -76,56 +122,55 @@ class AdaptiveRateLimiter:
             bool: True if request allowed, False if rate limited
         """
         key = self._get_client_key(client_ip, endpoint)
-        now = datetime.now()
+        now = self._clock()
+
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        state = self._get_state(key, now)
 
         # Check if blocked
-        if key in self.block_list:
+        if state is not None and state.blocked_until:
             return False
 
-        # Initialize request history
-        if key not in self.requests:
-            self.requests[key] = []
-
-        # Remove old requests (outside the window)
-        cutoff_time = now - timedelta(seconds=self.window_seconds)
-        self.requests[key] = [
-            req_time for req_time in self.requests[key] if req_time > cutoff_time
-        ]
+        if state is None:
+            state = _ClientWindow(math.floor(now / self.window_seconds) * self.window_seconds)
+            self._clients[key] = state
 
         # Check limit (accounting for cost)
-        current_count = len(self.requests[key])
+        current_count = self._advance(state, now)
         if current_count + cost > self.max_requests:
-            # Block the client
-            self.block_list.add(key)
-
-            # Schedule unblock after delay
-            if key not in self._unblock_tasks or self._unblock_tasks[key].done():
-                self._unblock_tasks[key] = asyncio.create_task(
-                    self._unblock_after_delay(key, self.block_duration_seconds)
-                )
-
+            # Block the client; the block is lifted on its first request after expiry
+            state.blocked_until = now + self.block_duration_seconds
             return False
 
-        # Add current request(s) based on cost
-        for _ in range(cost):
-            self.requests[key].append(now)
-
+        state.current += cost
         return True
 
-    async def _unblock_after_delay(self, key: str, delay: int):
+    def sweep(self, now: Optional[float] = None) -> int:
         """
-        Unblock a client after a delay.
+        Evict idle clients whose counters no longer affect any decision.
 
         Args:
-            key: Client key to unblock
-            delay: Delay in seconds
+            now: Current clock value (default: now)
+
+        Returns:
+            int: Number of keys evicted
         """
-        await asyncio.sleep(delay)
-        self.block_list.discard(key)
+        now = self._clock() if now is None else now
+        idle_before = now - 2 * self.window_seconds
+
+        idle = [
+            key
+            for key, state in self._clients.items()
+            if (state.blocked_until and state.blocked_until <= now)
+            or (not state.blocked_until and state.window_start < idle_before)
+        ]
+        for key in idle:
+            del self._clients[key]
 
-        # Clear request history for clean slate
-        if key in self.requests:
-            del self.requests[key]
+        self._next_sweep = now + self.sweep_interval_seconds
+        return len(idle)
 
     def get_remaining_requests(self, client_ip: str, endpoint: str = None) -> int:
         """
@@ -139,22 +184,17 @@ class AdaptiveRateLimiter:
             int: Number of remaining requests (0 if blocked)
         """
         key = self._get_client_key(client_ip, endpoint)
+        now = self._clock()
+        state = self._get_state(key, now)
 
-        if key in self.block_list:
-            return 0
-
-        if key not in self.requests:
+        if state is None:
             return self.max_requests
 
-        # Clean up old requests
-        now = datetime.now()
-        cutoff_time = now - timedelta(seconds=self.window_seconds)
-        self.requests[key] = [
-            req_time for req_time in self.requests[key] if req_time > cutoff_time
-        ]
+        if state.blocked_until:
+            return 0
 
-        current_count = len(self.requests[key])
-        return max(0, self.max_requests - current_count)
+        current_count = self._advance(state, now)
+        return max(0, self.max_requests - math.ceil(current_count))
 
     def reset_client(self, client_ip: str, endpoint: str = None):
         """
@@ -166,16 +206,8 @@ class AdaptiveRateLimiter:
         """
         key = self._get_client_key(client_ip, endpoint)
 
-        # Remove from block list
-        self.block_list.discard(key)
-
-        # Clear request history
-        if key in self.requests:
-            del self.requests[key]
-
-        # Cancel unblock task if exists
-        if key in self._unblock_tasks and not self._unblock_tasks[key].done():
-            self._unblock_tasks[key].cancel()
+        # Remove from block list and clear request history
+        self._clients.pop(key, None)
 
     def is_blocked(self, client_ip: str, endpoint: str = None) -> bool:
         """
@@ -189,25 +221,45 @@ class AdaptiveRateLimiter:
             bool: True if blocked, False otherwise
         """
         key = self._get_client_key(client_ip, endpoint)
-        return key in self.block_list
+        state = self._get_state(key, self._clock())
+        return state is not None and bool(state.blocked_until)
+
+    def __len__(self) -> int:
+        """Number of client keys currently tracked."""
+        return len(self._clients)
 
 
 # Global rate limiter instance
 _rate_limiter = None
 
 
-def get_rate_limiter() -> AdaptiveRateLimiter:
+def get_rate_limiter() -> Union[AdaptiveRateLimiter, DistributedRateLimiter]:
     """
     Get or create global rate limiter instance.
 
+    When ``RATE_LIMIT_REDIS_URL`` (or ``REDIS_URL``) is set, limits are shared by
+    every worker through Valkey/Redis, with in-process limiting as a fallback
+    while the server is unreachable. Otherwise limits are per process.
+
     Returns:
-        AdaptiveRateLimiter: Global rate limiter
+        Global rate limiter
     """
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = AdaptiveRateLimiter(
-            max_requests=100,  # 100 requests
+        limits = dict(
             window_seconds=60,  # per minute
             block_duration_seconds=900,  # block for 15 minutes
         )
+        url = os.getenv("RATE_LIMIT_REDIS_URL") or os.getenv("REDIS_URL")
+        if url:
+            import redis.asyncio as redis_async
+
+            _rate_limiter = DistributedRateLimiter(
+                redis_async.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5),
+                limit=100,  # 100 requests
+                prefix="backend:rate_limit",
+                **limits,
+            )
+        else:
+            _rate_limiter = AdaptiveRateLimiter(max_requests=100, **limits)  # 100 requests
     return _rate_limiter
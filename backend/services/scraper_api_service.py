@@ -7,10 +7,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from scraperapi_sdk import ScraperAPIClient
+import httpx
 from sqlalchemy import text
 
 from backend.db.connection import get_engine
+from backend.scrapers.http_clients import HTTPClientRegistry, get_http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,62 @@ class ScraperAPIRateLimitExceeded(Exception):
     pass
 
 
+class AsyncScraperAPIClient:
+    """
+    Minimal async ScraperAPI client on the shared, pooled HTTP clients.
+
+    Replaces the synchronous SDK, which opened a new connection per request
+    on a worker thread.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_endpoint: str = "https://api.scraperapi.com",
+        http: Optional[HTTPClientRegistry] = None,
+        timeout: float = 70.0,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            api_key: ScraperAPI key
+            api_endpoint: ScraperAPI endpoint
+            http: HTTP client registry (defaults to the shared ``get_http_clients()``)
+            timeout: Request timeout in seconds (ScraperAPI retries for up to 60s)
+        """
+        self.api_key = api_key
+        self.api_endpoint = api_endpoint
+        self.timeout = timeout
+        self._http = http
+
+    async def get(self, url: str, **params) -> httpx.Response:
+        """
+        Fetch ``url`` through ScraperAPI.
+
+        Args:
+            url: URL to scrape
+            **params: ScraperAPI parameters (render, country_code, premium, ...)
+
+        Returns:
+            httpx.Response
+
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response
+        """
+        query = {key: _param_value(value) for key, value in params.items()}
+        query.update(api_key=self.api_key, url=url)
+        client = (self._http or get_http_clients()).client(self.api_endpoint)
+        response = await client.get(self.api_endpoint, params=query, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+
+def _param_value(value):
+    # ScraperAPI expects lowercase booleans ("render=true")
+    return str(value).lower() if isinstance(value, bool) else value
+
+
 class ScraperAPIService:
     """
     ScraperAPI client wrapper with error handling, retry logic, and usage tracking.
@@ -42,15 +99,16 @@ class ScraperAPIService:
     - Error handling for common failure modes
     """
 
-    def __init__(self, config: ScraperAPIConfig):
+    def __init__(self, config: ScraperAPIConfig, http: Optional[HTTPClientRegistry] = None):
         """
         Initialize ScraperAPI service.
 
         Args:
             config: ScraperAPI configuration
+            http: HTTP client registry (defaults to the shared ``get_http_clients()``)
         """
         self.config = config
-        self.client = ScraperAPIClient(api_key=config.api_key)
+        self.client = AsyncScraperAPIClient(api_key=config.api_key, http=http)
         self._credits_used = 0
 
     async def scrape(self, url: str, **kwargs) -> dict:
@@ -89,10 +147,8 @@ class ScraperAPIService:
                     f"Scraping URL (attempt {attempt + 1}/{self.config.max_retries}): {url}"
                 )
 
-                # Make ScraperAPI request (synchronous)
-                response = await asyncio.to_thread(
-                    self.client.get, url=url, **kwargs
-                )
+                # Make ScraperAPI request on the shared connection pool
+                response = await self.client.get(url=url, **kwargs)
 
                 # Calculate credits used (estimate based on request type)
                 credits_used = self._estimate_credits(url, kwargs)
@@ -31,6 +31,8 @@ from datetime import datetime
 import lancedb
 from sentence_transformers import SentenceTransformer
 
+from backend.vector.embedding_cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +54,7 @@ class LocalVectorDBService:
         table_name: str = "content_vectors",
         model_name: str = "all-MiniLM-L6-v2",
         device: Optional[str] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize local vector database service.
@@ -61,10 +64,14 @@ class LocalVectorDBService:
             table_name: Name of the vector table
             model_name: Sentence transformer model name
             device: Device for model inference ('cpu', 'cuda', or None for auto)
+            embedding_cache: Embedding cache (defaults to the shared ``get_embedding_cache()``)
         """
         self.db_path = Path(db_path)
         self.table_name = table_name
         self.model_name = model_name
+        self.embedding_cache = (
+            embedding_cache if embedding_cache is not None else get_embedding_cache()
+        )
 
         # Create database directory if it doesn't exist
         self.db_path.mkdir(parents=True, exist_ok=True)
@@ -106,8 +113,7 @@ class LocalVectorDBService:
         Returns:
             Embedding vector (384 dimensions)
         """
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self.embedding_cache.get_or_embed(self.model_name, [text], self._encode)[0]
 
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """
@@ -119,10 +125,14 @@ class LocalVectorDBService:
         Returns:
             List of embedding vectors
         """
+        return self.embedding_cache.get_or_embed(self.model_name, texts, self._encode)
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Run the model on texts the embedding cache could not serve."""
         embeddings = self.model.encode(
             texts,
             convert_to_numpy=True,
-            show_progress_bar=True,
+            show_progress_bar=len(texts) > 1,
             batch_size=32,
         )
         return [emb.tolist() for emb in embeddings]
@@ -411,6 +421,7 @@ class LocalVectorDBService:
             "actual_storage_mb": round(db_size_mb, 2),
             "db_path": str(self.db_path),
             "table_name": self.table_name,
+            "embedding_cache": self.embedding_cache.get_stats(),
         }
 
     def health_check(self) -> Dict[str, Any]:
@@ -421,9 +432,9 @@ class LocalVectorDBService:
             Health status dict
         """
         try:
-            # Test embedding generation
+            # Test embedding generation (bypassing the cache)
             start = time.time()
-            test_embedding = self.generate_embedding("test")
+            test_embedding = self._encode(["test"])[0]
             embedding_time_ms = (time.time() - start) * 1000
 
             # Test search if table exists
@@ -0,0 +1,214 @@
+"""
+Tests for the Valkey/Redis-backed distributed rate limiter
+
+Runs the Lua script against fakeredis (requires ``fakeredis[lua]``).
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from backend.security.distributed_rate_limit import DistributedRateLimiter, LocalRateLimiter
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class BrokenClient:
+    """Client whose scripts always fail, like an unreachable server."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def register_script(self, script):
+        async def run(keys, args):
+            self.calls += 1
+            raise ConnectionError("connection refused")
+
+        return run
+
+
+@pytest.fixture
+def clock():
+    # Start at a window boundary so window arithmetic is easy to follow
+    return FakeClock(1_700_000_040.0)
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeAsyncRedis()
+
+
+def make_limiter(client, clock, **kwargs) -> DistributedRateLimiter:
+    kwargs.setdefault("limit", 4)
+    kwargs.setdefault("window_seconds", 10)
+    return DistributedRateLimiter(client, clock=clock, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_blocks_after_limit(client, clock):
+    limiter = make_limiter(client, clock)
+
+    results = [await limiter.hit("1.2.3.4") for _ in range(5)]
+
+    assert [r.allowed for r in results] == [True, True, True, True, False]
+    assert [r.remaining for r in results[:4]] == [3, 2, 1, 0]
+    assert results[4].retry_after == 10
+    assert all(r.source == "server" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_limits_are_shared_between_limiters(client, clock):
+    """Two workers pointing at the same server share one limit."""
+    worker_a = make_limiter(client, clock)
+    worker_b = make_limiter(client, clock)
+
+    for _ in range(2):
+        assert await worker_a.check_rate_limit("1.2.3.4", "/api")
+        assert await worker_b.check_rate_limit("1.2.3.4", "/api")
+
+    assert not await worker_a.check_rate_limit("1.2.3.4", "/api")
+    assert await worker_b.check_rate_limit("1.2.3.4", "/other")
+
+
+@pytest.mark.asyncio
+async def test_cost_weighted_requests(client, clock):
+    limiter = make_limiter(client, clock)
+
+    assert (await limiter.hit("user", cost=3)).allowed
+    assert not (await limiter.hit("user", cost=2)).allowed
+    assert (await limiter.hit("user", cost=1)).allowed
+
+
+@pytest.mark.asyncio
+async def test_sliding_window(client, clock):
+    """Previous window requests count in proportion to their overlap."""
+    limiter = make_limiter(client, clock)
+    for _ in range(4):
+        assert (await limiter.hit("user")).allowed
+
+    # 25% into the next window: 4 * 0.75 = 3 requests still count
+    clock.advance(12.5)
+    assert (await limiter.hit("user")).allowed
+    assert not (await limiter.hit("user")).allowed
+
+    # Two windows later everything has expired
+    clock.advance(20)
+    assert (await limiter.hit("user")).remaining == 3
+
+
+@pytest.mark.asyncio
+async def test_block_duration(client, clock):
+    limiter = make_limiter(client, clock, block_duration_seconds=60)
+    for _ in range(4):
+        await limiter.hit("user")
+
+    denied = await limiter.hit("user")
+    assert not denied.allowed and denied.retry_after == 60
+
+    clock.advance(30)
+    assert (await limiter.hit("user")).retry_after == 30
+
+    # A served block starts a clean slate
+    clock.advance(30)
+    assert (await limiter.hit("user")).remaining == 3
+
+
+@pytest.mark.asyncio
+async def test_key_always_has_ttl(client, clock):
+    limiter = make_limiter(client, clock, block_duration_seconds=60)
+
+    await limiter.hit("user")
+    assert 0 < await client.pttl("rate_limit:user") <= 20_000
+
+    for _ in range(4):
+        await limiter.hit("user")
+    assert 20_000 < await client.pttl("rate_limit:user") <= 60_000
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_limiting(clock):
+    broken = BrokenClient()
+    limiter = make_limiter(broken, clock, retry_interval_seconds=5)
+
+    results = [await limiter.hit("user") for _ in range(5)]
+
+    assert [r.allowed for r in results] == [True, True, True, True, False]
+    assert all(r.source == "local" for r in results)
+    # The server is not retried until the retry interval has passed
+    assert broken.calls == 1
+    assert not limiter.get_stats()["server_available"]
+
+    clock.advance(5)
+    await limiter.hit("user")
+    assert broken.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_recovers_when_server_returns(client, clock):
+    limiter = make_limiter(BrokenClient(), clock, retry_interval_seconds=5)
+    assert (await limiter.hit("user")).source == "local"
+
+    limiter.client = client
+    assert (await limiter.hit("user")).source == "local"
+
+    clock.advance(5)
+    assert (await limiter.hit("user")).source == "server"
+
+
+def test_local_limiter_sweeps_idle_keys():
+    local = LocalRateLimiter(sweep_interval_ms=1000)
+    for i in range(10):
+        local.hit(f"client-{i}", limit=5, window_ms=1000, cost=1, block_ms=0, now_ms=0)
+    assert len(local) == 10
+
+    local.hit("fresh", limit=5, window_ms=1000, cost=1, block_ms=0, now_ms=5000)
+    assert len(local) == 1
+
+
+@pytest.mark.asyncio
+async def test_foreign_key_type_falls_back_locally(client, clock):
+    """A non-hash value under the key is a server error: limit locally, leave the key alone."""
+    await client.set("rate_limit:1.2.3.4", 57)
+    limiter = make_limiter(client, clock)
+
+    results = [await limiter.hit("1.2.3.4") for _ in range(5)]
+
+    assert [r.allowed for r in results] == [True, True, True, True, False]
+    assert all(r.source == "local" for r in results)
+    assert limiter.server_errors == 1
+    assert limiter.cooling_down
+    assert await client.get("rate_limit:1.2.3.4") == b"57"
+    assert await client.ttl("rate_limit:1.2.3.4") == -1
+
+
+def _module_body(path: Path) -> str:
+    """AST dump of a module without its docstring (formatting-independent)."""
+    tree = ast.parse(path.read_text())
+    if ast.get_docstring(tree) is not None:
+        tree.body = tree.body[1:]
+    return ast.dump(tree)
+
+
+def test_writer_copy_in_sync():
+    """The writer's copy must match this module apart from the docstring."""
+    root = Path(__file__).resolve().parents[3]
+    writer_copy = root / "writer" / "src" / "core" / "rate_limit.py"
+    if not writer_copy.exists():
+        pytest.skip("writer sources not available")
+
+    original = root / "backend" / "security" / "distributed_rate_limit.py"
+    assert _module_body(writer_copy) == _module_body(original)
@@ -218,6 +218,16 @@ class TestInjectionPrevention:
 # ============================================================================
 
 
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class TestRateLimiting:
     """Test A04 - Adaptive rate limiting."""
 
@@ -262,6 +272,54 @@ class TestRateLimiting:
         # Client 2 should still work
         assert await limiter.check_rate_limit("192.168.1.2", "/test")
 
+    @pytest.mark.asyncio
+    async def test_rate_limiting_sliding_window(self):
+        """Previous window requests count in proportion to their overlap."""
+        clock = FakeClock(1000.0)
+        limiter = AdaptiveRateLimiter(max_requests=4, window_seconds=10, clock=clock)
+
+        for _ in range(4):
+            assert await limiter.check_rate_limit("10.0.0.1")
+
+        # Halfway into the next window half of the previous 4 still count
+        clock.now = 1015.0
+        assert limiter.get_remaining_requests("10.0.0.1") == 2
+        assert await limiter.check_rate_limit("10.0.0.1")
+        assert await limiter.check_rate_limit("10.0.0.1")
+
+    @pytest.mark.asyncio
+    async def test_rate_limiting_block_expires_lazily(self):
+        """Blocks are lifted on the first request after they expire."""
+        clock = FakeClock(0.0)
+        limiter = AdaptiveRateLimiter(
+            max_requests=1, window_seconds=10, block_duration_seconds=60, clock=clock
+        )
+
+        assert await limiter.check_rate_limit("10.0.0.1")
+        assert not await limiter.check_rate_limit("10.0.0.1")
+        assert limiter.is_blocked("10.0.0.1")
+
+        clock.now = 59.0
+        assert not await limiter.check_rate_limit("10.0.0.1")
+
+        clock.now = 60.0
+        assert not limiter.is_blocked("10.0.0.1")
+        assert await limiter.check_rate_limit("10.0.0.1")
+
+    @pytest.mark.asyncio
+    async def test_rate_limiting_sweeps_idle_clients(self):
+        """Idle clients are evicted so memory tracks active clients only."""
+        clock = FakeClock(0.0)
+        limiter = AdaptiveRateLimiter(max_requests=5, window_seconds=10, clock=clock)
+
+        for i in range(100):
+            await limiter.check_rate_limit(f"10.0.0.{i}")
+        assert len(limiter) == 100
+
+        clock.now = 25.0
+        await limiter.check_rate_limit("10.0.1.1")
+        assert len(limiter) == 1
+
 
 # ============================================================================
 # A07: Authentication Failures
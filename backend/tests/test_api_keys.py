@@ -7,6 +7,7 @@ Tests cover:
 - Authorization middleware
 - Rate limiting (1000 req/hour per key)
 - Key management endpoints (create, list, revoke)
+- Verified-key cache and batched usage writes
 """
 
 import hashlib
@@ -19,6 +20,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.auth.api_keys import APIKeyAuth
+from backend.auth.key_cache import usage_tracker, verified_key_cache
 from backend.db.models import (
     APIKeyCreateRequest,
     APIKeyORM,
@@ -31,6 +33,16 @@ from backend.db.models import (
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_key_cache():
+    """Start every test with an empty key cache and usage tracker."""
+    verified_key_cache.clear()
+    usage_tracker.clear()
+    yield
+    verified_key_cache.clear()
+    usage_tracker.clear()
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a test database session."""
@@ -292,7 +304,10 @@ def test_rate_limiting_window_reset(db_session, test_user_id):
     for _ in range(5):
         APIKeyAuth.validate_key(db_session, created.api_key, check_rate_limit=True)
 
-    # Manually reset the window (simulate time passing)
+    # Persist usage, then simulate a restart after the window has passed
+    usage_tracker.flush(db_session)
+    verified_key_cache.clear()
+    usage_tracker.clear()
     db_key = db_session.query(APIKeyORM).filter_by(id=created.id).first()
     db_key.rate_limit_window_start = datetime.utcnow() - timedelta(hours=2)
     db_session.commit()
@@ -376,6 +391,21 @@ def test_revoke_key_success(db_session, test_user_id):
     assert db_key.revoked_at is not None
 
 
+def test_revoke_key_invalidates_cached_key(db_session, test_user_id):
+    """Test that a revoked key is rejected even after it was cached."""
+    request = APIKeyCreateRequest(key_name="Cached Key")
+    created = APIKeyAuth.create_api_key(db_session, test_user_id, request)
+
+    APIKeyAuth.validate_key(db_session, created.api_key, check_rate_limit=False)
+    APIKeyAuth.revoke_key(db_session, test_user_id, created.id)
+
+    with pytest.raises(HTTPException) as exc:
+        APIKeyAuth.validate_key(db_session, created.api_key, check_rate_limit=False)
+
+    assert exc.value.status_code == 401
+    assert "revoked" in exc.value.detail.lower()
+
+
 def test_revoke_key_not_found(db_session, test_user_id):
     """Test revoking non-existent key."""
     fake_id = uuid4()
@@ -412,6 +442,9 @@ def test_usage_tracking(db_session, test_user_id):
     for _ in range(10):
         APIKeyAuth.validate_key(db_session, created.api_key, check_rate_limit=True)
 
+    # Usage is written in one batch
+    assert usage_tracker.flush(db_session) == 10
+
     # Check usage stats
     db_key = db_session.query(APIKeyORM).filter_by(id=created.id).first()
     assert db_key.request_count == 10
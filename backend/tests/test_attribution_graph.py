@@ -0,0 +1,191 @@
+"""
+Tests for attribution graph traversal and caching
+
+Tests cover:
+- Recursive CTE edges by depth (each edge once)
+- Reachability by depth
+- Repository node/edge formatting
+- Cache hits, targeted invalidation, LRU eviction and TTL expiry
+"""
+
+import sqlite3
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from backend.db.attribution_graph import (
+    ATTRIBUTION_GRAPH_SQL,
+    AttributionGraphCache,
+    AttributionGraphRepository,
+    reachable_cards,
+)
+
+
+def card(n: int) -> str:
+    return str(UUID(int=n))
+
+
+# Chain 1 -> 2 -> 3 -> 4 plus 5 citing 1 and an isolated card 6
+EDGES = [(1, 2), (2, 3), (3, 4), (5, 1)]
+
+
+@pytest.fixture
+def graph_db():
+    """SQLite database with a small attribution graph"""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE cards (id TEXT PRIMARY KEY);
+        CREATE TABLE attributions (
+            id TEXT PRIMARY KEY, source_card_id TEXT, target_card_id TEXT,
+            attribution_type TEXT, created_at TEXT
+        );
+        """)
+    conn.executemany("INSERT INTO cards VALUES (?)", [(card(n),) for n in range(1, 7)])
+    conn.executemany(
+        "INSERT INTO attributions VALUES (?, ?, ?, 'citation', ?)",
+        [
+            (str(uuid4()), card(s), card(t), f"2025-01-01T00:00:0{i}")
+            for i, (s, t) in enumerate(EDGES)
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+def run_cte(conn, center: str, depth: int):
+    rows = conn.execute(ATTRIBUTION_GRAPH_SQL, {"card_id": center, "depth": depth}).fetchall()
+    return [{"source_card_id": r[1], "target_card_id": r[2]} for r in rows]
+
+
+@pytest.mark.parametrize(
+    "depth,expected_edges",
+    [
+        (1, {(1, 2), (5, 1)}),
+        (2, {(1, 2), (5, 1), (2, 3)}),
+        (3, {(1, 2), (5, 1), (2, 3), (3, 4)}),
+    ],
+)
+def test_cte_edges_by_depth(graph_db, depth, expected_edges):
+    """CTE returns each edge touching a visited card exactly once"""
+    edges = run_cte(graph_db, card(1), depth)
+
+    pairs = [(int(UUID(e["source_card_id"])), int(UUID(e["target_card_id"]))) for e in edges]
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected_edges
+
+
+def test_cte_unknown_card_returns_nothing(graph_db):
+    """CTE anchors on the cards table, so unknown IDs yield no edges"""
+    assert run_cte(graph_db, card(99), 3) == []
+
+
+def test_cte_isolated_card(graph_db):
+    """Cards without attributions yield an empty edge list"""
+    assert run_cte(graph_db, card(6), 2) == []
+
+
+def test_reachable_cards_by_depth():
+    """Visited cards are those fewer than depth hops away in either direction"""
+    edges = [{"source_card_id": card(s), "target_card_id": card(t)} for s, t in EDGES]
+
+    assert reachable_cards(card(1), edges, 1) == {card(1)}
+    assert reachable_cards(card(1), edges, 2) == {card(1), card(2), card(5)}
+    assert reachable_cards(card(1), edges, 3) == {card(1), card(2), card(5), card(3)}
+
+
+def test_repository_builds_nodes_and_counts():
+    """Repository formats edges, loads visited cards and counts outgoing edges"""
+    Row = namedtuple("Row", "id source_card_id target_card_id attribution_type created_at")
+    Card = namedtuple("Card", "id title user_id")
+    center, cited, author = UUID(int=1), UUID(int=2), uuid4()
+
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = [
+        Row(uuid4(), center, cited, "remix", datetime(2025, 1, 1)),
+    ]
+    session.query.return_value.filter.return_value.all.return_value = [
+        Card(center, "Centre", author),
+        Card(cited, "Cited", author),
+    ]
+
+    graph = AttributionGraphRepository(session).get_graph(center, depth=2)
+
+    assert graph["visited"] == {str(center), str(cited)}
+    assert graph["edges"] == [
+        {
+            "source_card_id": str(center),
+            "target_card_id": str(cited),
+            "attribution_type": "remix",
+            "created_at": "2025-01-01T00:00:00",
+        }
+    ]
+    counts = {n["card_id"]: n["attribution_count"] for n in graph["nodes"]}
+    assert counts == {str(center): 1, str(cited): 0}
+    assert session.execute.call_count == 1
+
+
+def test_repository_missing_card_returns_none():
+    """Unknown centre cards return None so the route can 404"""
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = []
+    session.query.return_value.filter.return_value.all.return_value = []
+
+    assert AttributionGraphRepository(session).get_graph(uuid4(), depth=2) is None
+
+
+def make_graph(*cards):
+    return {"nodes": [], "edges": [], "visited": {card(n) for n in cards}}
+
+
+def test_cache_hit_and_miss():
+    """Graphs are cached per (card, depth)"""
+    cache = AttributionGraphCache()
+    graph = make_graph(1, 2)
+
+    assert cache.get(card(1), 2) is None
+    cache.set(card(1), 2, graph)
+
+    assert cache.get(card(1), 2) is graph
+    assert cache.get(card(1), 3) is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_cache_invalidates_only_affected_graphs():
+    """New attributions only drop graphs that visited one of their cards"""
+    cache = AttributionGraphCache()
+    cache.set(card(1), 2, make_graph(1, 2))
+    cache.set(card(2), 3, make_graph(2, 3, 4))
+    cache.set(card(6), 2, make_graph(6))
+
+    assert cache.invalidate_cards(card(4), card(7)) == 1
+
+    assert cache.get(card(1), 2) is not None
+    assert cache.get(card(2), 3) is None
+    assert cache.get(card(6), 2) is not None
+
+
+def test_cache_lru_eviction():
+    """Least recently used graphs are evicted first"""
+    cache = AttributionGraphCache(max_entries=2)
+    cache.set(card(1), 1, make_graph(1))
+    cache.set(card(2), 1, make_graph(2))
+    cache.get(card(1), 1)
+    cache.set(card(3), 1, make_graph(3))
+
+    assert cache.get(card(2), 1) is None
+    assert cache.get(card(1), 1) is not None
+    # Evicted entries are removed from the reverse index too
+    assert cache.invalidate_cards(card(2)) == 0
+
+
+def test_cache_ttl_expiry():
+    """Expired graphs are treated as misses"""
+    cache = AttributionGraphCache(ttl=-1)
+    cache.set(card(1), 2, make_graph(1))
+
+    assert cache.get(card(1), 2) is None
+    assert cache.get_stats()["entries"] == 0
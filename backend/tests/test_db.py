@@ -259,6 +259,33 @@ class TestContentRepository:
             assert similarity >= 0.5
             assert content.id in [content1.id, content2.id, content3.id]
 
+    def test_similarity_search_tuning(self, db_session, test_author):
+        """Test ANN search knobs and exact search"""
+        repo = ContentRepository(db_session)
+
+        for i in range(3):
+            repo.create(
+                platform="twitter",
+                source_url=f"https://twitter.com/testuser/status/tune{i}",
+                author_id=test_author.id,
+                content_body=f"Tuned search content {i}",
+                embedding=[0.1 * (i + 1)] * 1536,
+            )
+
+        exact = repo.similarity_search(
+            query_embedding=[0.1] * 1536, limit=3, min_similarity=0.5, exact=True
+        )
+        tuned = repo.similarity_search(
+            query_embedding=[0.1] * 1536, limit=3, min_similarity=0.5, ef_search=100, probes=10
+        )
+
+        assert len(exact) > 0
+        # An approximate search never returns rows the exact search rules out
+        exact_ids = {content.id for content, _ in exact}
+        assert all(content.id in exact_ids for content, _ in tuned)
+        similarities = [similarity for _, similarity in exact]
+        assert similarities == sorted(similarities, reverse=True)
+
     def test_count_by_platform(self, db_session, test_author):
         """Test counting content by platform"""
         repo = ContentRepository(db_session)
@@ -0,0 +1,143 @@
+"""
+Tests for the content-hash embedding cache
+
+Tests cover:
+- Keys ignore whitespace/Unicode differences and include the model
+- L1 hits, store (L2) hits and in-request duplicates skip the embed call
+- LRU eviction
+- Store errors fall back to L1 with a retry backoff
+- Call sites (OpenAI generator) route through the cache
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.vector.embedding_cache import EmbeddingCache
+from backend.vector.embeddings import EmbeddingGenerator
+
+
+class FakeStore:
+    """In-memory stand-in for the embedding_cache table."""
+
+    def __init__(self):
+        self.rows = {}
+        self.lookups = 0
+        self.fail = False
+
+    def get_many(self, model, hashes):
+        self.lookups += 1
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        return {h: self.rows[(model, h)] for h in hashes if (model, h) in self.rows}
+
+    def put_many(self, model, embeddings):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        for key, vector in embeddings.items():
+            self.rows.setdefault((model, key), vector)
+
+
+class Embedder:
+    """Records every batch it is asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+@pytest.fixture
+def store():
+    return FakeStore()
+
+
+@pytest.fixture
+def embed():
+    return Embedder()
+
+
+def test_identical_normalized_text_is_embedded_once(store, embed):
+    cache = EmbeddingCache(store=store)
+
+    first = cache.get_or_embed("m", ["Hello  world", "other"], embed)
+    second = cache.get_or_embed("m", ["Hello world\n", "other", "Hello world"], embed)
+
+    assert embed.calls == [["Hello  world", "other"]]
+    assert second == [first[0], first[1], first[0]]
+    stats = cache.get_stats()
+    assert (stats["requests"], stats["l1_hits"], stats["misses"]) == (5, 2, 2)
+    assert stats["duplicates"] == 1
+    assert stats["hit_rate"] == 0.6
+
+
+def test_model_is_part_of_the_key(store, embed):
+    cache = EmbeddingCache(store=store)
+
+    cache.get_or_embed("ada", ["text"], embed)
+    cache.get_or_embed("minilm", ["text"], embed)
+
+    assert len(embed.calls) == 2
+
+
+def test_store_serves_other_processes_entries(store, embed):
+    EmbeddingCache(store=store).get_or_embed("m", ["a", "b"], embed)
+    cache = EmbeddingCache(store=store)
+
+    vectors = cache.get_or_embed("m", ["a", "b", "c"], embed)
+    cache.get_or_embed("m", ["a"], embed)
+
+    assert embed.calls == [["a", "b"], ["c"]]
+    assert vectors == [[1.0, 1.0]] * 3
+    assert (cache.get_stats()["l2_hits"], cache.get_stats()["l1_hits"]) == (2, 1)
+    assert store.lookups == 2  # The last call was served from L1
+
+
+def test_lru_eviction(embed):
+    cache = EmbeddingCache(max_entries=2)
+
+    cache.get_or_embed("m", ["a", "b"], embed)
+    cache.get_or_embed("m", ["a"], embed)  # Refresh "a"
+    cache.get_or_embed("m", ["c"], embed)  # Evicts "b"
+    cache.get_or_embed("m", ["a", "b"], embed)
+
+    assert embed.calls[-1] == ["b"]
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_store_errors_fall_back_to_l1_with_backoff(store, embed):
+    now = [0.0]
+    cache = EmbeddingCache(store=store, retry_after=30, clock=lambda: now[0])
+    store.fail = True
+
+    assert cache.get_or_embed("m", ["a"], embed) == [[1.0, 1.0]]
+    cache.get_or_embed("m", ["b"], embed)
+    assert store.lookups == 1  # Skipped while backing off
+    assert cache.get_stats()["store"] == "backoff"
+
+    store.fail = False
+    now[0] = 31
+    cache.get_or_embed("m", ["c"], embed)
+
+    assert store.lookups == 2
+    assert len(store.rows) == 1  # Only "c" was written once the store recovered
+    assert cache.get_stats()["store_errors"] == 1
+    assert cache.get_stats()["store"] == "ok"
+
+
+def test_openai_generator_uses_cache(embed):
+    cache = EmbeddingCache()
+    generator = EmbeddingGenerator(cache=cache)
+    generator.client = MagicMock()
+    generator.client.embeddings.create.side_effect = lambda input, model: MagicMock(
+        data=[MagicMock(embedding=v) for v in embed(input)]
+    )
+
+    query = generator.generate("What is leverage?")
+    batch = generator.generate_batch(["What is leverage?", "Specific knowledge"])
+
+    assert batch[0] == query
+    assert embed.calls == [["What is leverage?"], ["Specific knowledge"]]
+    assert cache.get_stats()["l1_hits"] == 1
@@ -8,17 +8,28 @@ Tests cover:
 - Ledger audit trail (immutable log)
 - Negative balance prevention
 - Edge cases and error handling
+- Batched awards and transfers
+- Materialized summaries and keyset ledger cursors
 """
 
 import pytest
+from collections import namedtuple
+from datetime import datetime
 from decimal import Decimal
-from uuid import uuid4
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from backend.db.models import Base, UserORM, ExtropyLedgerORM
-from backend.tokens.extropy import ExtropyTokenSystem
+from backend.tokens.extropy import (
+    ExtropyTokenSystem,
+    TokenAward,
+    TokenTransfer,
+    decode_ledger_cursor,
+    encode_ledger_cursor,
+)
 from fastapi import HTTPException
 
 
@@ -102,7 +113,8 @@ async def test_award_tokens_with_metadata(token_system, test_user, db_session):
         metadata=metadata,
     )
 
-    # Verify ledger entry
+    # Verify ledger entry (reloaded, so the stored column is checked)
+    db_session.expire_all()
     ledger_entry = (
         db_session.query(ExtropyLedgerORM)
         .filter(ExtropyLedgerORM.to_user_id == test_user.id)
@@ -111,7 +123,7 @@ async def test_award_tokens_with_metadata(token_system, test_user, db_session):
 
     assert ledger_entry is not None
     assert ledger_entry.card_id == card_id
-    assert ledger_entry.metadata == metadata
+    assert ledger_entry.extra_metadata == metadata
     assert ledger_entry.transaction_type == "earn"
 
 
@@ -506,3 +518,221 @@ async def test_audit_trail_completeness(token_system, test_user, test_user2, db_
     assert ledger_entry.description == "Audit test"
     assert ledger_entry.metadata == {"test": "data"}
     assert ledger_entry.created_at is not None
+
+
+# ============================================================================
+# Batch Award Tests
+# ============================================================================
+
+
+def mock_batch_session(balances):
+    """Mock session whose locked-balance query returns the given balances"""
+    Row = namedtuple("Row", "id extropy_balance")
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [
+        Row(user_id, balance) for user_id, balance in balances.items()
+    ]
+    return session
+
+
+@pytest.mark.asyncio
+async def test_award_tokens_batch_running_balances():
+    """Test batch awards write one ledger batch with running balances"""
+    user_id = uuid4()
+    session = mock_batch_session({user_id: Decimal("10.00000000")})
+    awards = [
+        TokenAward(user_id=user_id, amount=Decimal("1.00000000"), reason=f"Card {i}")
+        for i in range(3)
+    ]
+
+    balances = await ExtropyTokenSystem(session).award_tokens_batch(awards)
+
+    assert balances == {user_id: Decimal("13.00000000")}
+    # Lock query, one ledger insert, one balance update, one summary upsert
+    assert session.execute.call_count == 4
+    ledger_rows = session.execute.call_args_list[1].args[1]
+    assert [row["to_user_balance_after"] for row in ledger_rows] == [
+        Decimal("11.00000000"),
+        Decimal("12.00000000"),
+        Decimal("13.00000000"),
+    ]
+    assert session.execute.call_args_list[2].args[1][0]["extropy_balance"] == Decimal("13.00000000")
+    session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_award_tokens_batch_invalid_amount():
+    """Test batch awards reject non-positive amounts before touching the database"""
+    session = MagicMock()
+    awards = [TokenAward(user_id=uuid4(), amount=Decimal("0"), reason="Invalid")]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ExtropyTokenSystem(session).award_tokens_batch(awards)
+
+    assert exc_info.value.status_code == 400
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_award_tokens_batch_user_not_found():
+    """Test batch awards fail as a whole if any recipient is missing"""
+    known, unknown = uuid4(), uuid4()
+    session = mock_batch_session({known: Decimal("0.00000000")})
+    awards = [
+        TokenAward(user_id=known, amount=Decimal("1.00000000"), reason="Known"),
+        TokenAward(user_id=unknown, amount=Decimal("1.00000000"), reason="Unknown"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ExtropyTokenSystem(session).award_tokens_batch(awards)
+
+    assert exc_info.value.status_code == 404
+    assert session.execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_award_tokens_batch_empty():
+    """Test empty batches are a no-op"""
+    session = MagicMock()
+    assert await ExtropyTokenSystem(session).award_tokens_batch([]) == {}
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transfer_tokens_batch_applies_in_order():
+    """Test batch transfers use running balances and write each table once"""
+    alice, bob, carol = uuid4(), uuid4(), uuid4()
+    session = mock_batch_session(
+        {alice: Decimal("10.00000000"), bob: Decimal("0.00000000"), carol: Decimal("0.00000000")}
+    )
+    attribution_id = uuid4()
+    transfers = [
+        TokenTransfer(alice, bob, Decimal("6.00000000"), "Citation", attribution_id),
+        # Bob can only pay Carol because the first transfer credited him
+        TokenTransfer(bob, carol, Decimal("4.00000000"), "Remix"),
+    ]
+
+    results = await ExtropyTokenSystem(session).transfer_tokens_batch(transfers)
+
+    assert [(r["from_balance"], r["to_balance"]) for r in results] == [
+        ("4.00000000", "6.00000000"),
+        ("2.00000000", "4.00000000"),
+    ]
+    # Lock query, one ledger insert, one balance update, one summary upsert
+    assert session.execute.call_count == 4
+    ledger_rows = session.execute.call_args_list[1].args[1]
+    assert [row["transaction_type"] for row in ledger_rows] == ["attribution", "transfer"]
+    assert [row["id"] for row in ledger_rows] == [UUID(r["transaction_id"]) for r in results]
+    session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transfer_tokens_batch_insufficient_writes_nothing():
+    """Test a batch that would overdraw any sender is rejected as a whole"""
+    alice, bob = uuid4(), uuid4()
+    session = mock_batch_session({alice: Decimal("5.00000000"), bob: Decimal("0.00000000")})
+    transfers = [
+        TokenTransfer(alice, bob, Decimal("3.00000000"), "First"),
+        TokenTransfer(alice, bob, Decimal("3.00000000"), "Second"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ExtropyTokenSystem(session).transfer_tokens_batch(transfers)
+
+    assert exc_info.value.status_code == 400
+    assert "Insufficient balance" in exc_info.value.detail
+    # Only the lock query ran
+    assert session.execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transfer_tokens_batch_validation():
+    """Test invalid amounts, self-transfers and unknown users are rejected"""
+    alice, bob = uuid4(), uuid4()
+    session = mock_batch_session({alice: Decimal("5.00000000")})
+    token_system = ExtropyTokenSystem(session)
+
+    for transfers, status in [
+        ([TokenTransfer(alice, bob, Decimal("0"), "Zero")], 400),
+        ([TokenTransfer(alice, alice, Decimal("1"), "Self")], 400),
+        ([TokenTransfer(alice, bob, Decimal("1"), "Unknown receiver")], 404),
+    ]:
+        with pytest.raises(HTTPException) as exc_info:
+            await token_system.transfer_tokens_batch(transfers)
+        assert exc_info.value.status_code == status
+
+    assert await token_system.transfer_tokens_batch([]) == []
+
+
+def test_ledger_cursor_round_trip():
+    """Test keyset cursors decode to the entry they were built from"""
+    created_at, entry_id = datetime(2025, 11, 18, 10, 30, 0, 123456), uuid4()
+
+    cursor = encode_ledger_cursor(created_at, entry_id)
+
+    assert decode_ledger_cursor(cursor) == (created_at, entry_id)
+    with pytest.raises(ValueError):
+        decode_ledger_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_ledger_invalid_cursor():
+    """Test malformed cursors are rejected with 400"""
+    session = MagicMock()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ExtropyTokenSystem(session).get_ledger(uuid4(), cursor="garbage")
+
+    assert exc_info.value.status_code == 400
+
+
+def test_record_summaries_combines_deltas():
+    """Test summary deltas are folded per user into a single upsert"""
+    sender, receiver = uuid4(), uuid4()
+    session = MagicMock()
+    at = datetime(2025, 1, 1)
+
+    ExtropyTokenSystem(session)._record_summaries(
+        [
+            (None, receiver, Decimal("5.00000000"), "earn"),
+            (sender, receiver, Decimal("2.00000000"), "transfer"),
+            (sender, receiver, Decimal("1.00000000"), "attribution"),
+        ],
+        at=at,
+    )
+
+    assert session.execute.call_count == 1
+    rows = {row["user_id"]: row for row in session.execute.call_args.args[1]}
+    assert rows[receiver]["total_earned"] == Decimal("8.00000000")
+    assert rows[receiver]["total_spent"] == Decimal("0.00000000")
+    assert rows[receiver]["earn_count"] == 1
+    assert rows[receiver]["tx_count"] == 3
+    assert rows[sender]["total_spent"] == Decimal("3.00000000")
+    assert rows[sender]["transfer_count"] == 1
+    assert rows[sender]["attribution_count"] == 1
+    assert rows[sender]["earn_count"] == 0
+    assert rows[sender]["last_activity_at"] == at
+
+
+@pytest.mark.asyncio
+async def test_get_token_stats_reads_summary():
+    """Test stats come from one balance/summary query without scanning the ledger"""
+    Summary = namedtuple(
+        "Summary",
+        "total_earned total_spent earn_count transfer_count attribution_count last_activity_at",
+    )
+    session = MagicMock()
+    session.execute.return_value.first.return_value = (
+        Decimal("7.00000000"),
+        Summary(Decimal("10"), Decimal("3"), 4, 2, 1, datetime(2025, 1, 1)),
+    )
+
+    stats = await ExtropyTokenSystem(session).get_token_stats(uuid4())
+
+    assert stats["balance"] == "7.00000000"
+    assert stats["total_earned"] == "10.00000000"
+    assert stats["net_change"] == "7.00000000"
+    assert stats["transaction_counts"] == {"earn": 4, "transfer": 2, "attribution": 1, "total": 7}
+    assert stats["last_activity_at"] == "2025-01-01T00:00:00"
+    assert session.execute.call_count == 1
+    session.query.assert_not_called()
@@ -0,0 +1,212 @@
+"""
+Tests for the verified API key cache and usage tracker
+
+Tests cover:
+- Cache hits skip the database lookup
+- Invalidation by key ID, LRU eviction and TTL expiry
+- In-memory rate-limit windows
+- Batched usage flushes (and retry after a failed flush)
+- Flushes from several workers add up
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.auth.api_keys import APIKeyAuth
+from backend.auth.key_cache import (
+    UsageTracker,
+    VerifiedAPIKey,
+    VerifiedKeyCache,
+    usage_tracker,
+    verified_key_cache,
+)
+from backend.db.models import APIKeyORM
+
+
+@pytest.fixture(autouse=True)
+def reset_key_cache():
+    """Start every test with an empty key cache and usage tracker."""
+    verified_key_cache.clear()
+    usage_tracker.clear()
+    yield
+    verified_key_cache.clear()
+    usage_tracker.clear()
+
+
+def make_key(**overrides) -> VerifiedAPIKey:
+    fields = dict(
+        id=uuid4(),
+        user_id=uuid4(),
+        key_name="Test Key",
+        key_prefix="extro_live_abcd",
+        is_active=True,
+        is_revoked=False,
+        expires_at=None,
+        rate_limit_requests=3,
+        rate_limit_window_seconds=3600,
+        current_usage_count=0,
+        rate_limit_window_start=None,
+    )
+    fields.update(overrides)
+    return VerifiedAPIKey(**fields)
+
+
+def test_cache_hit_invalidate_and_eviction():
+    """Keys are cached by hash, dropped by ID and evicted least recently used"""
+    cache = VerifiedKeyCache(max_entries=2)
+    first, second, third = make_key(), make_key(), make_key()
+
+    cache.set("hash-1", first)
+    cache.set("hash-2", second)
+    assert cache.get("hash-1") is first
+
+    cache.set("hash-3", third)
+    assert cache.get("hash-2") is None
+
+    assert cache.invalidate(first.id) is True
+    assert cache.get("hash-1") is None
+    assert cache.invalidate(second.id) is False
+    assert cache.get("hash-3") is third
+
+
+def test_cache_ttl_expiry():
+    """Expired keys are treated as misses"""
+    cache = VerifiedKeyCache(ttl=-1)
+    cache.set("hash", make_key())
+
+    assert cache.get("hash") is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_usage_window_limit_and_reset():
+    """Requests over the limit are refused until the window ends"""
+    tracker = UsageTracker()
+    key = make_key()
+    start = datetime(2025, 1, 1, 12, 0, 0)
+
+    decisions = [tracker.record(key, now=start) for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert decisions[2].remaining == 0
+    assert decisions[3].reset_at == start + timedelta(hours=1)
+    assert tracker.pending() == 3
+
+    assert tracker.record(key, now=start + timedelta(hours=1, seconds=1)).allowed
+    assert tracker.record(key, check_rate_limit=False, now=start).allowed
+
+
+def test_usage_continues_stored_window():
+    """A key's stored window and count are honoured on first sight"""
+    tracker = UsageTracker()
+    now = datetime.utcnow()
+    key = make_key(current_usage_count=3, rate_limit_window_start=now - timedelta(minutes=5))
+
+    assert tracker.record(key, now=now).allowed is False
+
+
+def test_flush_writes_one_batch():
+    """Pending usage for all keys is written in one executemany UPDATE"""
+    tracker = UsageTracker()
+    first, second = make_key(), make_key()
+    for _ in range(2):
+        tracker.record(first)
+    tracker.record(second)
+    db = MagicMock()
+
+    assert tracker.flush(db) == 3
+
+    assert db.execute.call_count == 1
+    rows = {row["key_id"]: row for row in db.execute.call_args.args[1]}
+    assert rows[first.id]["requests"] == 2
+    assert rows[second.id]["requests"] == 1
+    db.commit.assert_called_once()
+
+    # Nothing pending: no database work
+    assert tracker.flush(db) == 0
+    assert db.execute.call_count == 1
+
+
+def test_failed_flush_keeps_pending_usage():
+    """Usage from a failed flush is retried by the next one"""
+    tracker = UsageTracker()
+    tracker.record(make_key())
+    db = MagicMock()
+    db.execute.side_effect = RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        tracker.flush(db)
+
+    db.rollback.assert_called_once()
+    assert tracker.pending() == 1
+
+
+def test_usage_window_is_aligned():
+    """Windows start on fixed boundaries, so every worker uses the same one"""
+    tracker = UsageTracker()
+
+    decision = tracker.record(make_key(), now=datetime(2025, 1, 1, 12, 34, 56))
+
+    assert decision.reset_at == datetime(2025, 1, 1, 13, 0, 0)
+
+
+def test_flushes_from_several_workers_add_up():
+    """Each worker adds its own requests instead of overwriting the counter"""
+    engine = create_engine("sqlite:///:memory:")
+    APIKeyORM.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    key = make_key()
+    db.add(
+        APIKeyORM(
+            id=key.id,
+            user_id=key.user_id,
+            key_name=key.key_name,
+            key_prefix=key.key_prefix,
+            key_hash="hash",
+        )
+    )
+    db.commit()
+    now = datetime(2025, 1, 1, 12, 30, 0)
+    worker_a, worker_b, stale = UsageTracker(), UsageTracker(), UsageTracker()
+
+    for _ in range(2):
+        worker_a.record(key, now=now)
+    worker_b.record(key, now=now + timedelta(minutes=1))
+    stale.record(key, now=now - timedelta(hours=1))
+    for tracker in (worker_a, worker_b, stale):
+        tracker.flush(db)
+
+    row = db.get(APIKeyORM, key.id)
+    db.refresh(row)
+    assert row.request_count == 4
+    # The stale worker's previous window does not reset the current one
+    assert (row.current_usage_count, row.rate_limit_window_start) == (
+        3,
+        datetime(2025, 1, 1, 12, 0, 0),
+    )
+    assert row.last_used_at == now + timedelta(minutes=1)
+
+
+def test_validate_key_uses_cache_without_writes():
+    """Repeat validations hit the cache and never write to the database"""
+    api_key = "extro_live_cached"
+    key = make_key()
+    verified_key_cache.set(APIKeyAuth.hash_key(api_key), key)
+    db = MagicMock()
+
+    for _ in range(3):
+        user_id, verified = APIKeyAuth.validate_key(db, api_key)
+        assert user_id == str(key.user_id)
+
+    with pytest.raises(HTTPException) as exc:
+        APIKeyAuth.validate_key(db, api_key)
+
+    assert exc.value.status_code == 429
+    assert exc.value.headers["X-RateLimit-Remaining"] == "0"
+    db.execute.assert_not_called()
+    db.commit.assert_not_called()
@@ -455,3 +455,118 @@ class TestPrivacyFiltering:
             privacy_level="business",  # lowercase
         )
         assert is_publishable(card) is True
+
+
+class TestBulkPublish:
+    """Test the single-transaction bulk publish path."""
+
+    def test_generate_unique_slugs_regenerates_taken(self):
+        """Test slugs already in the database are regenerated."""
+        from backend.api.routes.publish import PUBLISHED_URL_PREFIX, generate_unique_slugs
+
+        db = MagicMock()
+        taken = []
+
+        def execute(statement):
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = list(taken)
+            taken.clear()
+            return result
+
+        db.execute.side_effect = execute
+
+        with patch(
+            "backend.api.routes.publish.generate_slug",
+            side_effect=["taken-slug", "free-slug", "retry-slug"],
+        ):
+            taken.append(f"{PUBLISHED_URL_PREFIX}taken-slug")
+            slugs = generate_unique_slugs(db, ["A", "B"])
+
+        assert slugs == ["retry-slug", "free-slug"]
+        assert db.execute.call_count == 2  # One collision check per round
+
+    def test_generate_unique_slugs_in_batch_duplicates(self):
+        """Test duplicate slugs within one batch are regenerated."""
+        from backend.api.routes.publish import generate_unique_slugs
+
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+
+        with patch(
+            "backend.api.routes.publish.generate_slug",
+            side_effect=["same", "same", "other"],
+        ):
+            slugs = generate_unique_slugs(db, ["A", "A"])
+
+        assert slugs == ["same", "other"]
+
+    def test_generate_unique_slugs_gives_up(self):
+        """Test slug generation fails after the configured attempts."""
+        from fastapi import HTTPException
+
+        from backend.api.routes.publish import generate_unique_slugs
+
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+
+        with patch("backend.api.routes.publish.generate_slug", return_value="same"):
+            with pytest.raises(HTTPException):
+                generate_unique_slugs(db, ["A", "A"], max_attempts=2)
+
+    @pytest.mark.asyncio
+    @patch("backend.api.routes.publish.ExtropyTokenSystem")
+    async def test_publish_batch_single_transaction(self, mock_token_system: MagicMock):
+        """Test a batch is written with one insert, one award batch and one commit."""
+        from backend.api.routes.publish import CardInput, PublishRequest, publish_cards
+
+        mock_token_instance = AsyncMock()
+        mock_token_system.return_value = mock_token_instance
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+
+        cards = [
+            CardInput(title=f"Card {i}", body="Body", category="IDEAS", privacy_level="IDEAS")
+            for i in range(50)
+        ] + [CardInput(title="Diary", body="Body", category="JOURNAL", privacy_level="PERSONAL")]
+
+        response = await publish_cards(PublishRequest(cards=cards), user_id=str(uuid4()), db=db)
+
+        assert response.cards_published == 50
+        assert response.cards_filtered == 1
+        assert response.extropy_earned == "50.00000000"
+        # Slug collision check + multi-row card insert
+        assert db.execute.call_count == 2
+        card_rows = db.execute.call_args_list[1].args[1]
+        assert len(card_rows) == 50
+
+        awards = mock_token_instance.award_tokens_batch.await_args.args[0]
+        assert [a.card_id for a in awards] == [row["id"] for row in card_rows]
+        mock_token_instance.award_tokens.assert_not_called()
+        db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("backend.api.routes.publish.ExtropyTokenSystem")
+    async def test_publish_batch_all_or_nothing(self, mock_token_system: MagicMock):
+        """Test a failed award rolls back the cards as well."""
+        from fastapi import HTTPException
+
+        from backend.api.routes.publish import CardInput, PublishRequest, publish_cards
+
+        mock_token_instance = AsyncMock()
+        mock_token_instance.award_tokens_batch.side_effect = HTTPException(
+            status_code=404, detail="User not found"
+        )
+        mock_token_system.return_value = mock_token_instance
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+
+        request = PublishRequest(
+            cards=[CardInput(title="Card", body="Body", category="IDEAS", privacy_level="IDEAS")]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await publish_cards(request, user_id=str(uuid4()), db=db)
+
+        assert exc_info.value.status_code == 404
+        db.commit.assert_not_called()
+        db.rollback.assert_called_once()
@@ -0,0 +1,238 @@
+"""
+Tests for pgvector index management and tuned ANN search
+
+Tests cover:
+- Index parameters derived from row count
+- Search breadth (ef_search / probes / exact) set per transaction
+- Index rebuild statements (build new, drop old, rename, ANALYZE)
+- similarity_search computes the distance once and applies the knobs
+- similarity_search restores the knobs for later queries on the session
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.db.repository import ContentRepository
+from backend.db.vector_index import (
+    IndexParams,
+    VectorIndexManager,
+    apply_search_params,
+    recommend_params,
+    restore_search_params,
+)
+
+
+class FakeEngine:
+    """Records executed SQL; answers the row count and pg_indexes queries."""
+
+    def __init__(self, rows, indexes):
+        self.rows = rows
+        self.indexes = indexes
+        self.statements = []
+        self.options = {}
+
+    def connect(self):
+        return self
+
+    def begin(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execution_options(self, **options):
+        self.options = options
+        return self
+
+    def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        if sql.startswith("SELECT count(*)"):
+            return SimpleNamespace(scalar=lambda: self.rows)
+        if "FROM pg_indexes" in sql:
+            return [
+                SimpleNamespace(
+                    _mapping={
+                        "name": name,
+                        "definition": f"CREATE INDEX {name} ON public.contents USING {method} "
+                        "(embedding vector_cosine_ops)",
+                        "size_bytes": 8192,
+                    }
+                )
+                for name, method in self.indexes
+            ]
+        self.statements.append(sql)
+        return MagicMock()
+
+
+@pytest.mark.parametrize(
+    "rows, lists, probes",
+    [(0, 1, 1), (50_000, 50, 7), (1_000_000, 1000, 32), (4_000_000, 2000, 45)],
+)
+def test_ivfflat_params_scale_with_rows(rows, lists, probes):
+    params = recommend_params("ivfflat", rows)
+
+    assert (params.lists, params.probes) == (lists, probes)
+    assert params.with_clause() == f"lists = {lists}"
+
+
+def test_hnsw_params_scale_with_rows():
+    small = recommend_params("hnsw", 100_000)
+    large = recommend_params("hnsw", 2_000_000)
+
+    assert (small.m, small.ef_construction, small.ef_search) == (16, 64, 40)
+    assert (large.m, large.ef_construction, large.ef_search) == (24, 128, 80)
+    assert small.with_clause() == "m = 16, ef_construction = 64"
+
+    with pytest.raises(ValueError):
+        recommend_params("flat", 100)
+
+
+def test_search_params_are_transaction_local():
+    connection = MagicMock()
+    connection.execute.return_value.scalar.side_effect = ["40", "1", "on"]
+
+    previous = apply_search_params(connection, ef_search=100, probes=10, exact=True)
+
+    settings = [call.args[1] for call in connection.execute.call_args_list]
+    assert settings == [
+        {"name": "hnsw.ef_search", "value": "100"},
+        {"name": "ivfflat.probes", "value": "10"},
+        {"name": "enable_indexscan", "value": "off"},
+    ]
+    assert "set_config(:name, :value, true)" in str(connection.execute.call_args.args[0])
+    assert previous == {"hnsw.ef_search": "40", "ivfflat.probes": "1", "enable_indexscan": "on"}
+
+    connection.reset_mock()
+    assert apply_search_params(connection) == {}
+    connection.execute.assert_not_called()
+
+
+def test_restore_search_params_resets_previous_values():
+    connection = MagicMock()
+
+    restore_search_params(connection, {"enable_indexscan": "on", "hnsw.ef_search": None})
+
+    settings = [call.args[1] for call in connection.execute.call_args_list]
+    # None (setting was undefined) resets to the default
+    assert settings == [
+        {"name": "enable_indexscan", "value": "on"},
+        {"name": "hnsw.ef_search", "value": None},
+    ]
+    assert "set_config(:name, :value, true)" in str(connection.execute.call_args.args[0])
+
+
+def test_build_replaces_index_and_analyzes():
+    engine = FakeEngine(
+        rows=250_000,
+        indexes=[
+            ("idx_contents_embedding_ivfflat", "ivfflat"),
+            ("idx_embedding_ivfflat", "ivfflat"),
+        ],
+    )
+    manager = VectorIndexManager(engine=engine)
+
+    result = manager.build("hnsw", maintenance_work_mem="2GB")
+
+    assert engine.options == {"isolation_level": "AUTOCOMMIT"}
+    assert engine.statements == [
+        "SET maintenance_work_mem = '2GB'",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_contents_embedding_hnsw_new",
+        "CREATE INDEX CONCURRENTLY idx_contents_embedding_hnsw_new ON contents "
+        "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_contents_embedding_ivfflat",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_embedding_ivfflat",
+        "ALTER INDEX idx_contents_embedding_hnsw_new RENAME TO idx_contents_embedding_hnsw",
+        "ANALYZE contents",
+    ]
+    assert result["rows"] == 250_000
+    assert result["replaced"] == ["idx_contents_embedding_ivfflat", "idx_embedding_ivfflat"]
+
+
+def test_build_with_explicit_params():
+    engine = FakeEngine(rows=10, indexes=[("idx_contents_embedding_ivfflat", "ivfflat")])
+    manager = VectorIndexManager(engine=engine)
+
+    result = manager.build("ivfflat", params=IndexParams("ivfflat", lists=20), concurrently=False)
+
+    assert (
+        "CREATE INDEX idx_contents_embedding_ivfflat_new ON contents USING ivfflat "
+        "(embedding vector_cosine_ops) WITH (lists = 20)"
+    ) in engine.statements
+    assert result["replaced"] == []  # Same name: dropped, then the new index takes it
+
+    with pytest.raises(ValueError):
+        manager.build("hnsw", params=IndexParams("ivfflat", lists=20))
+    with pytest.raises(ValueError):
+        manager.build("ivfflat", maintenance_work_mem="1GB'; DROP TABLE contents; --")
+
+
+def test_rejects_invalid_identifiers():
+    with pytest.raises(ValueError):
+        VectorIndexManager(engine=FakeEngine(0, []), table="contents; DROP TABLE authors")
+
+
+def test_status_reports_recommendations():
+    manager = VectorIndexManager(engine=FakeEngine(rows=5000, indexes=[("idx_x", "hnsw")]))
+
+    status = manager.status()
+
+    assert status["rows"] == 5000
+    assert [index["method"] for index in status["indexes"]] == ["hnsw"]
+    assert status["recommended"]["ivfflat"]["lists"] == 5
+
+
+def test_similarity_search_computes_distance_once():
+    session = MagicMock()
+    session.execute.return_value.all.return_value = []
+
+    ContentRepository(session).similarity_search([0.1] * 1536, limit=5, ef_search=80)
+
+    knob, query, restore = session.execute.call_args_list
+    assert knob.args[1] == {"name": "hnsw.ef_search", "value": "80"}
+    assert restore.args[1]["name"] == "hnsw.ef_search"
+    sql = str(query.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.count("<=>") == 1
+    # The ANN ordering and LIMIT sit in the inner query; the threshold outside
+    inner, outer = sql.split(") AS anon_1")
+    assert "ORDER BY distance" in inner and "LIMIT" in inner
+    assert "anon_1.distance <=" in outer
+
+
+class SettingsSession:
+    """Session stand-in that keeps GUC values like a Postgres transaction."""
+
+    DEFAULTS = {"hnsw.ef_search": "40", "ivfflat.probes": "1", "enable_indexscan": "on"}
+
+    def __init__(self):
+        self.settings = dict(self.DEFAULTS)
+        self.seen = []
+
+    def execute(self, statement, params=None):
+        result = MagicMock()
+        result.all.return_value = []
+        if "set_config" in str(statement):
+            name, value = params["name"], params["value"]
+            result.scalar.return_value = self.settings[name]
+            self.settings[name] = self.DEFAULTS[name] if value is None else value
+        return result
+
+    def get(self, model, ident):
+        self.seen.append(dict(self.settings))
+        return None
+
+
+def test_similarity_search_does_not_leak_settings():
+    session = SettingsSession()
+    repository = ContentRepository(session)
+
+    repository.similarity_search([0.1] * 1536, ef_search=200, probes=20, exact=True)
+    repository.get_by_id(uuid4())
+
+    assert session.seen == [SettingsSession.DEFAULTS]
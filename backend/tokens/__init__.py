@@ -1,5 +1,5 @@
 """$EXTROPY token system module"""
 
-from backend.tokens.extropy import ExtropyTokenSystem
+from backend.tokens.extropy import ExtropyTokenSystem, TokenAward, TokenTransfer
 
-__all__ = ["ExtropyTokenSystem"]
+__all__ = ["ExtropyTokenSystem", "TokenAward", "TokenTransfer"]
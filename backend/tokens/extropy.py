@@ -7,19 +7,91 @@ Implements cryptocurrency-grade token management with:
 - Balance tracking (DECIMAL precision)
 - Ledger audit trail (immutable log)
 - Negative balance prevention
+- Batched awards (one ledger insert and one balance update per batch)
+- Batched transfers with row locks taken in ID order (no lost updates or deadlocks)
+- Materialized per-user summaries (totals and counts without ledger scans)
+- Keyset-paginated ledger history
 
 CRITICAL: Uses DECIMAL (not float) for money.
 """
 
+from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from backend.db.models import ExtropyLedgerORM, UserORM
+from backend.db.models import ExtropyLedgerORM, UserORM, UserTokenSummaryORM
+
+ZERO = Decimal("0.00000000")
+
+# Summary columns that accumulate (all except user_id and last_activity_at)
+SUMMARY_COUNTERS = (
+    "total_earned",
+    "total_spent",
+    "earn_count",
+    "transfer_count",
+    "attribution_count",
+    "tx_count",
+)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Normalize a SQL aggregate (Decimal, float, int or None) to 8 decimal places."""
+    return Decimal(str(value or 0)).quantize(ZERO)
+
+
+def encode_ledger_cursor(created_at: datetime, entry_id: UUID) -> str:
+    """
+    Build a keyset cursor pointing just after a ledger entry.
+
+    Args:
+        created_at: Entry timestamp
+        entry_id: Entry ID (tie-breaker for identical timestamps)
+
+    Returns:
+        Opaque cursor string for ``get_ledger(cursor=...)``
+    """
+    return f"{created_at.isoformat()}_{entry_id}"
+
+
+def decode_ledger_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a cursor built by ``encode_ledger_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, _, entry_id = cursor.rpartition("_")
+    return datetime.fromisoformat(created_at), UUID(entry_id)
+
+
+@dataclass
+class TokenAward:
+    """A single system award within a batch (see ``award_tokens_batch``)"""
+
+    user_id: UUID
+    amount: Decimal
+    reason: str
+    card_id: Optional[UUID] = None
+    metadata: Optional[Dict] = None
+
+
+@dataclass
+class TokenTransfer:
+    """A single user-to-user transfer within a batch (see ``transfer_tokens_batch``)"""
+
+    from_user_id: UUID
+    to_user_id: UUID
+    amount: Decimal
+    reason: str
+    attribution_id: Optional[UUID] = None
+    metadata: Optional[Dict] = None
 
 
 class ExtropyTokenSystem:
@@ -68,8 +140,8 @@ class ExtropyTokenSystem:
         if amount <= 0:
             raise HTTPException(status_code=400, detail="Amount must be positive")
 
-        # Get user
-        user = self.db.query(UserORM).filter(UserORM.id == user_id).first()
+        # Get user (locked, so concurrent transfers cannot overwrite the new balance)
+        user = self.db.query(UserORM).filter(UserORM.id == user_id).with_for_update().first()
         if not user:
             raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
@@ -87,9 +159,10 @@ class ExtropyTokenSystem:
                 card_id=card_id,
                 to_user_balance_after=new_balance,
                 description=reason,
-                metadata=metadata or {},
+                extra_metadata=metadata or {},
             )
             self.db.add(ledger_entry)
+            self._record_summaries([(None, user_id, amount, "earn")])
 
             # Commit transaction
             self.db.commit()
@@ -101,6 +174,71 @@ class ExtropyTokenSystem:
             self.db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to award tokens: {str(e)}")
 
+    async def award_tokens_batch(self, awards: List[TokenAward]) -> Dict[UUID, Decimal]:
+        """
+        Award tokens for many events with a fixed number of statements.
+
+        Recipients are locked in ID order, every ledger entry is written in one
+        multi-row insert and each recipient's balance is updated once. Unlike
+        ``award_tokens`` this does not commit: the writes join the caller's
+        transaction, so they succeed or fail together with the caller's other
+        changes (e.g. the cards being published).
+
+        Args:
+            awards: Awards to apply, in ledger order
+
+        Returns:
+            New balance per recipient
+
+        Raises:
+            HTTPException: If any amount is invalid or a recipient is not found
+        """
+        if not awards:
+            return {}
+
+        if any(award.amount <= 0 for award in awards):
+            raise HTTPException(status_code=400, detail="Amount must be positive")
+
+        user_ids = sorted({award.user_id for award in awards}, key=str)
+        balances = self._lock_balances(user_ids)
+
+        missing = [user_id for user_id in user_ids if user_id not in balances]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"User {missing[0]} not found")
+
+        now = datetime.utcnow()
+        ledger_rows = []
+        for award in awards:
+            balances[award.user_id] += award.amount
+            ledger_rows.append(
+                {
+                    "id": uuid4(),
+                    "from_user_id": None,  # System award (no sender)
+                    "to_user_id": award.user_id,
+                    "amount": award.amount,
+                    "transaction_type": "earn",
+                    "card_id": award.card_id,
+                    "to_user_balance_after": balances[award.user_id],
+                    "description": award.reason,
+                    "extra_metadata": award.metadata or {},
+                    "created_at": now,
+                }
+            )
+
+        self.db.execute(insert(ExtropyLedgerORM), ledger_rows)
+        self.db.execute(
+            update(UserORM),
+            [
+                {"id": user_id, "extropy_balance": balance, "updated_at": now}
+                for user_id, balance in balances.items()
+            ],
+        )
+        self._record_summaries(
+            [(None, award.user_id, award.amount, "earn") for award in awards], at=now
+        )
+
+        return balances
+
     async def transfer_tokens(
         self,
         from_user_id: UUID,
@@ -136,64 +274,149 @@ class ExtropyTokenSystem:
         if from_user_id == to_user_id:
             raise HTTPException(status_code=400, detail="Cannot transfer to yourself")
 
-        # Get both users
-        sender = self.db.query(UserORM).filter(UserORM.id == from_user_id).first()
-        receiver = self.db.query(UserORM).filter(UserORM.id == to_user_id).first()
-
-        if not sender:
-            raise HTTPException(status_code=404, detail=f"Sender {from_user_id} not found")
-        if not receiver:
-            raise HTTPException(status_code=404, detail=f"Receiver {to_user_id} not found")
-
-        # Check sender balance
-        if sender.extropy_balance < amount:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Insufficient balance. Available: {sender.extropy_balance}, Required: {amount}",
-            )
+        transfer = TokenTransfer(
+            from_user_id=from_user_id,
+            to_user_id=to_user_id,
+            amount=amount,
+            reason=reason,
+            attribution_id=attribution_id,
+            metadata=metadata,
+        )
+        result = (await self.transfer_tokens_batch([transfer]))[0]
 
         try:
-            # Deduct from sender
-            sender.extropy_balance -= amount
-            sender_new_balance = sender.extropy_balance
-
-            # Add to receiver
-            receiver.extropy_balance += amount
-            receiver_new_balance = receiver.extropy_balance
-
-            # Create ledger entry
-            ledger_entry = ExtropyLedgerORM(
-                from_user_id=from_user_id,
-                to_user_id=to_user_id,
-                amount=amount,
-                transaction_type="attribution" if attribution_id else "transfer",
-                attribution_id=attribution_id,
-                from_user_balance_after=sender_new_balance,
-                to_user_balance_after=receiver_new_balance,
-                description=reason,
-                metadata=metadata or {},
-            )
-            self.db.add(ledger_entry)
-
             # Commit transaction
             self.db.commit()
-            self.db.refresh(sender)
-            self.db.refresh(receiver)
-
-            return {
-                "transaction_id": str(ledger_entry.id),
-                "from_user_id": str(from_user_id),
-                "to_user_id": str(to_user_id),
-                "amount": str(amount),
-                "from_balance": str(sender.extropy_balance),
-                "to_balance": str(receiver.extropy_balance),
-                "reason": reason,
-            }
+            return result
 
         except Exception as e:
             self.db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to transfer tokens: {str(e)}")
 
+    async def transfer_tokens_batch(self, transfers: List[TokenTransfer]) -> List[Dict]:
+        """
+        Apply many user-to-user transfers (e.g., attribution payouts) atomically.
+
+        Every sender and receiver is locked with ``SELECT ... FOR UPDATE`` in
+        ID order before any balance is read, so concurrent transfers can
+        neither lose updates nor deadlock on each other. Transfers are then
+        applied in order against the locked balances and written with one
+        ledger insert and one balance update. If any transfer would overdraw
+        its sender, nothing is written.
+
+        Like ``award_tokens_batch`` this does not commit, so the transfers
+        join the caller's transaction.
+
+        Args:
+            transfers: Transfers to apply, in ledger order
+
+        Returns:
+            Transaction details per transfer (same shape as ``transfer_tokens``)
+
+        Raises:
+            HTTPException: If an amount is invalid, a user is not found, or a
+                sender's balance is insufficient
+        """
+        if not transfers:
+            return []
+
+        for transfer in transfers:
+            if transfer.amount <= 0:
+                raise HTTPException(status_code=400, detail="Amount must be positive")
+            if transfer.from_user_id == transfer.to_user_id:
+                raise HTTPException(status_code=400, detail="Cannot transfer to yourself")
+
+        user_ids = {t.from_user_id for t in transfers} | {t.to_user_id for t in transfers}
+        balances = self._lock_balances(sorted(user_ids, key=str))
+
+        for transfer in transfers:
+            if transfer.from_user_id not in balances:
+                raise HTTPException(
+                    status_code=404, detail=f"Sender {transfer.from_user_id} not found"
+                )
+            if transfer.to_user_id not in balances:
+                raise HTTPException(
+                    status_code=404, detail=f"Receiver {transfer.to_user_id} not found"
+                )
+
+        now = datetime.utcnow()
+        ledger_rows = []
+        results = []
+        for transfer in transfers:
+            available = balances[transfer.from_user_id]
+            if available < transfer.amount:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"Insufficient balance. Available: {available}, "
+                        f"Required: {transfer.amount}"
+                    ),
+                )
+
+            balances[transfer.from_user_id] -= transfer.amount
+            balances[transfer.to_user_id] += transfer.amount
+
+            entry_id = uuid4()
+            ledger_rows.append(
+                {
+                    "id": entry_id,
+                    "from_user_id": transfer.from_user_id,
+                    "to_user_id": transfer.to_user_id,
+                    "amount": transfer.amount,
+                    "transaction_type": "attribution" if transfer.attribution_id else "transfer",
+                    "attribution_id": transfer.attribution_id,
+                    "from_user_balance_after": balances[transfer.from_user_id],
+                    "to_user_balance_after": balances[transfer.to_user_id],
+                    "description": transfer.reason,
+                    "extra_metadata": transfer.metadata or {},
+                    "created_at": now,
+                }
+            )
+            results.append(
+                {
+                    "transaction_id": str(entry_id),
+                    "from_user_id": str(transfer.from_user_id),
+                    "to_user_id": str(transfer.to_user_id),
+                    "amount": str(transfer.amount),
+                    "from_balance": str(balances[transfer.from_user_id]),
+                    "to_balance": str(balances[transfer.to_user_id]),
+                    "reason": transfer.reason,
+                }
+            )
+
+        self.db.execute(insert(ExtropyLedgerORM), ledger_rows)
+        self.db.execute(
+            update(UserORM),
+            [
+                {"id": user_id, "extropy_balance": balance, "updated_at": now}
+                for user_id, balance in balances.items()
+            ],
+        )
+        self._record_summaries(
+            [
+                (row["from_user_id"], row["to_user_id"], row["amount"], row["transaction_type"])
+                for row in ledger_rows
+            ],
+            at=now,
+        )
+
+        return results
+
+    def _lock_balances(self, user_ids: List[UUID]) -> Dict[UUID, Decimal]:
+        """
+        Lock users' rows and read their balances (missing users are omitted).
+
+        Rows are locked in ID order so concurrent batches touching overlapping
+        users always acquire locks in the same sequence and cannot deadlock.
+        """
+        rows = self.db.execute(
+            select(UserORM.id, UserORM.extropy_balance)
+            .where(UserORM.id.in_(user_ids))
+            .order_by(UserORM.id)
+            .with_for_update()
+        ).all()
+        return {row.id: row.extropy_balance for row in rows}
+
     async def get_balance(self, user_id: UUID) -> Decimal:
         """
         Get current balance for user.
@@ -219,40 +442,52 @@ class ExtropyTokenSystem:
         limit: int = 100,
         offset: int = 0,
         transaction_type: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict]:
         """
         Get transaction history for user.
 
-        Returns both incoming and outgoing transactions.
+        Returns both incoming and outgoing transactions, newest first.
+
+        Passing ``cursor`` switches to keyset pagination: entries strictly
+        older than the cursor are returned and ``offset`` is ignored. Each
+        side of the history (sent and received) is read with an index range
+        scan bounded by ``limit``, so deep pages cost the same as the first.
+        The cursor for the next page is ``next_cursor`` of the last entry.
 
         Args:
             user_id: User ID to query
             limit: Maximum number of entries to return
-            offset: Number of entries to skip
+            offset: Number of entries to skip (OFFSET mode only)
             transaction_type: Optional filter by transaction type
+            cursor: Keyset cursor from a previous page ("" for the first page)
 
         Returns:
             List of transaction entries
 
         Raises:
-            HTTPException: If user not found
+            HTTPException: If user not found or cursor is invalid
         """
         # Verify user exists
         user = self.db.query(UserORM).filter(UserORM.id == user_id).first()
         if not user:
             raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
-        # Build query
-        query = self.db.query(ExtropyLedgerORM).filter(
-            (ExtropyLedgerORM.from_user_id == user_id) | (ExtropyLedgerORM.to_user_id == user_id)
-        )
+        if cursor is not None:
+            entries = self._ledger_page_after(user_id, limit, transaction_type, cursor)
+        else:
+            # Build query
+            query = self.db.query(ExtropyLedgerORM).filter(
+                (ExtropyLedgerORM.from_user_id == user_id)
+                | (ExtropyLedgerORM.to_user_id == user_id)
+            )
 
-        if transaction_type:
-            query = query.filter(ExtropyLedgerORM.transaction_type == transaction_type)
+            if transaction_type:
+                query = query.filter(ExtropyLedgerORM.transaction_type == transaction_type)
 
-        query = query.order_by(ExtropyLedgerORM.created_at.desc()).offset(offset).limit(limit)
+            query = query.order_by(ExtropyLedgerORM.created_at.desc()).offset(offset).limit(limit)
 
-        entries = query.all()
+            entries = query.all()
 
         return [
             {
@@ -270,12 +505,97 @@ class ExtropyTokenSystem:
                 "to_user_balance_after": (
                     str(entry.to_user_balance_after) if entry.to_user_balance_after else None
                 ),
-                "metadata": entry.metadata,
+                "metadata": entry.extra_metadata,
                 "created_at": entry.created_at.isoformat(),
+                "next_cursor": encode_ledger_cursor(entry.created_at, entry.id),
             }
             for entry in entries
         ]
 
+    def _ledger_page_after(
+        self,
+        user_id: UUID,
+        limit: int,
+        transaction_type: Optional[str],
+        cursor: str,
+    ) -> List[ExtropyLedgerORM]:
+        """Fetch one keyset page: the newest ``limit`` entries older than ``cursor``."""
+        position = None
+        if cursor:
+            try:
+                position = decode_ledger_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid ledger cursor")
+
+        order = (ExtropyLedgerORM.created_at.desc(), ExtropyLedgerORM.id.desc())
+        entries: Dict[UUID, ExtropyLedgerORM] = {}
+
+        # Sent and received are separate index ranges; read each, then merge
+        for column in (ExtropyLedgerORM.from_user_id, ExtropyLedgerORM.to_user_id):
+            query = select(ExtropyLedgerORM).where(column == user_id)
+            if transaction_type:
+                query = query.where(ExtropyLedgerORM.transaction_type == transaction_type)
+            if position:
+                query = query.where(
+                    tuple_(ExtropyLedgerORM.created_at, ExtropyLedgerORM.id) < tuple_(*position)
+                )
+            for entry in self.db.execute(query.order_by(*order).limit(limit)).scalars():
+                entries[entry.id] = entry
+
+        merged = sorted(entries.values(), key=lambda e: (e.created_at, str(e.id)), reverse=True)
+        return merged[:limit]
+
+    async def get_summary(self, user_id: UUID) -> Dict:
+        """
+        Get the materialized ledger summary for a user.
+
+        Falls back to a single aggregate query over the ledger if no summary
+        row exists yet.
+
+        Args:
+            user_id: User ID to query
+
+        Returns:
+            Dict with totals, per-type counts and last activity time
+        """
+        summary = self.db.get(UserTokenSummaryORM, user_id)
+        if summary is None:
+            return self._aggregate_ledger(user_id)
+
+        return {
+            "total_earned": _to_decimal(summary.total_earned),
+            "total_spent": _to_decimal(summary.total_spent),
+            "earn_count": summary.earn_count,
+            "transfer_count": summary.transfer_count,
+            "attribution_count": summary.attribution_count,
+            "tx_count": summary.tx_count,
+            "last_activity_at": summary.last_activity_at,
+        }
+
+    async def rebuild_summary(self, user_id: UUID) -> Dict:
+        """
+        Recompute a user's summary from the ledger and store it.
+
+        Intended for repairs and backfills; normal writes keep summaries
+        current incrementally. Does not commit.
+
+        Args:
+            user_id: User ID to rebuild
+
+        Returns:
+            The recomputed summary
+        """
+        summary = self._aggregate_ledger(user_id)
+        values = {"user_id": user_id, **summary}
+        statement = self._summary_insert().values(**values)
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[UserTokenSummaryORM.user_id],
+                set_={key: statement.excluded[key] for key in values if key != "user_id"},
+            )
+        )
+        return summary
+
     async def get_total_earned(self, user_id: UUID) -> Decimal:
         """
         Get total tokens earned by user (all incoming transactions).
@@ -286,14 +606,7 @@ class ExtropyTokenSystem:
         Returns:
             Total earned tokens
         """
-        result = (
-            self.db.query(ExtropyLedgerORM)
-            .filter(ExtropyLedgerORM.to_user_id == user_id)
-            .all()
-        )
-
-        total = sum((entry.amount for entry in result), Decimal("0.00000000"))
-        return total
+        return (await self.get_summary(user_id))["total_earned"]
 
     async def get_total_spent(self, user_id: UUID) -> Decimal:
         """
@@ -305,58 +618,50 @@ class ExtropyTokenSystem:
         Returns:
             Total spent tokens
         """
-        result = (
-            self.db.query(ExtropyLedgerORM)
-            .filter(ExtropyLedgerORM.from_user_id == user_id)
-            .all()
-        )
-
-        total = sum((entry.amount for entry in result), Decimal("0.00000000"))
-        return total
+        return (await self.get_summary(user_id))["total_spent"]
 
     async def get_token_stats(self, user_id: UUID) -> Dict:
         """
         Get comprehensive token statistics for user.
 
+        Reads the user's balance and materialized summary in one query.
+
         Args:
             user_id: User ID to query
 
         Returns:
             Dict with balance, earned, spent, and transaction counts
+
+        Raises:
+            HTTPException: If user not found
         """
-        balance = await self.get_balance(user_id)
-        total_earned = await self.get_total_earned(user_id)
-        total_spent = await self.get_total_spent(user_id)
-
-        # Get transaction counts by type
-        earn_count = (
-            self.db.query(ExtropyLedgerORM)
-            .filter(
-                ExtropyLedgerORM.to_user_id == user_id,
-                ExtropyLedgerORM.transaction_type == "earn",
-            )
-            .count()
-        )
+        row = self.db.execute(
+            select(UserORM.extropy_balance, UserTokenSummaryORM)
+            .outerjoin(UserTokenSummaryORM, UserTokenSummaryORM.user_id == UserORM.id)
+            .where(UserORM.id == user_id)
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
-        transfer_count = (
-            self.db.query(ExtropyLedgerORM)
-            .filter(
-                (ExtropyLedgerORM.from_user_id == user_id)
-                | (ExtropyLedgerORM.to_user_id == user_id),
-                ExtropyLedgerORM.transaction_type == "transfer",
-            )
-            .count()
-        )
+        balance, summary_row = row
+        if summary_row is None:
+            summary = self._aggregate_ledger(user_id)
+        else:
+            summary = {
+                "total_earned": _to_decimal(summary_row.total_earned),
+                "total_spent": _to_decimal(summary_row.total_spent),
+                "earn_count": summary_row.earn_count,
+                "transfer_count": summary_row.transfer_count,
+                "attribution_count": summary_row.attribution_count,
+                "last_activity_at": summary_row.last_activity_at,
+            }
 
-        attribution_count = (
-            self.db.query(ExtropyLedgerORM)
-            .filter(
-                (ExtropyLedgerORM.from_user_id == user_id)
-                | (ExtropyLedgerORM.to_user_id == user_id),
-                ExtropyLedgerORM.transaction_type == "attribution",
-            )
-            .count()
-        )
+        total_earned = summary["total_earned"]
+        total_spent = summary["total_spent"]
+        earn_count = summary["earn_count"]
+        transfer_count = summary["transfer_count"]
+        attribution_count = summary["attribution_count"]
+        last_activity_at = summary["last_activity_at"]
 
         return {
             "user_id": str(user_id),
@@ -370,4 +675,108 @@ class ExtropyTokenSystem:
                 "attribution": attribution_count,
                 "total": earn_count + transfer_count + attribution_count,
             },
+            "last_activity_at": last_activity_at.isoformat() if last_activity_at else None,
+        }
+
+    def _aggregate_ledger(self, user_id: UUID) -> Dict:
+        """Compute a user's summary with one conditional-aggregate query."""
+        ledger = ExtropyLedgerORM
+        received = ledger.to_user_id == user_id
+        sent = ledger.from_user_id == user_id
+
+        def total(condition):
+            return func.coalesce(func.sum(case((condition, ledger.amount), else_=0)), 0)
+
+        def count(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        row = self.db.execute(
+            select(
+                total(received),
+                total(sent),
+                count(and_(received, ledger.transaction_type == "earn")),
+                count(ledger.transaction_type == "transfer"),
+                count(ledger.transaction_type == "attribution"),
+                func.count(ledger.id),
+                func.max(ledger.created_at),
+            ).where(or_(received, sent))
+        ).one()
+
+        return {
+            "total_earned": _to_decimal(row[0]),
+            "total_spent": _to_decimal(row[1]),
+            "earn_count": int(row[2]),
+            "transfer_count": int(row[3]),
+            "attribution_count": int(row[4]),
+            "tx_count": int(row[5]),
+            "last_activity_at": row[6],
         }
+
+    def _record_summaries(
+        self,
+        entries: List[Tuple[Optional[UUID], Optional[UUID], Decimal, str]],
+        at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Fold ledger writes into the per-user summaries (does not commit).
+
+        Deltas are combined per user and applied with one upsert statement,
+        in the caller's transaction, so summaries change atomically with the
+        ledger rows they describe.
+
+        Args:
+            entries: (from_user_id, to_user_id, amount, transaction_type) per ledger row
+            at: Time of the ledger writes (defaults to now)
+        """
+        at = at or datetime.utcnow()
+        deltas: Dict[UUID, Dict[str, Any]] = {}
+
+        def delta(user_id: UUID) -> Dict[str, Any]:
+            if user_id not in deltas:
+                deltas[user_id] = {
+                    "user_id": user_id,
+                    **{key: 0 for key in SUMMARY_COUNTERS},
+                    "total_earned": ZERO,
+                    "total_spent": ZERO,
+                    "last_activity_at": at,
+                }
+            return deltas[user_id]
+
+        for from_user_id, to_user_id, amount, transaction_type in entries:
+            for user_id, role in ((from_user_id, "from"), (to_user_id, "to")):
+                if user_id is None:
+                    continue
+                row = delta(user_id)
+                row["tx_count"] += 1
+                if role == "to":
+                    row["total_earned"] += amount
+                else:
+                    row["total_spent"] += amount
+                if transaction_type == "earn" and role == "to":
+                    row["earn_count"] += 1
+                elif transaction_type in ("transfer", "attribution"):
+                    row[f"{transaction_type}_count"] += 1
+
+        if not deltas:
+            return
+
+        statement = self._summary_insert()
+        table = UserTokenSummaryORM.__table__
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={
+                    **{key: table.c[key] + statement.excluded[key] for key in SUMMARY_COUNTERS},
+                    "last_activity_at": statement.excluded.last_activity_at,
+                },
+            ),
+            # Sorted so concurrent writers take summary row locks in the same order
+            sorted(deltas.values(), key=lambda row: str(row["user_id"])),
+        )
+
+    def _summary_insert(self):
+        """INSERT for the summary table supporting ON CONFLICT on this dialect."""
+        bind = self.db.get_bind()
+        dialect = getattr(getattr(bind, "dialect", None), "name", "postgresql")
+        module = sqlite if dialect == "sqlite" else postgresql
+        return module.insert(UserTokenSummaryORM.__table__)
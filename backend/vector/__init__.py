@@ -1,6 +1,7 @@
 """Vector store for semantic search."""
 
 from backend.vector.chromadb_client import ChromaDBClient
+from backend.vector.embedding_cache import EmbeddingCache, get_embedding_cache
 from backend.vector.embeddings import EmbeddingGenerator
 
-__all__ = ["ChromaDBClient", "EmbeddingGenerator"]
+__all__ = ["ChromaDBClient", "EmbeddingCache", "EmbeddingGenerator", "get_embedding_cache"]
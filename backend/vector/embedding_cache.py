@@ -0,0 +1,254 @@
+"""Content-hash embedding cache shared by every embedding call site."""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import String, bindparam, text
+
+from backend.db.connection import get_engine
+from backend.scrapers.fingerprint import content_hash
+
+logger = logging.getLogger(__name__)
+
+EmbedFunc = Callable[[list[str]], list[list[float]]]
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class EmbeddingStore:
+    """Persistent tier: the ``embedding_cache`` table."""
+
+    _select = text(
+        "SELECT text_hash, embedding FROM embedding_cache "
+        "WHERE model = :model AND text_hash = ANY(:hashes)"
+    ).columns(text_hash=String(), embedding=Vector())
+
+    _insert = text(
+        "INSERT INTO embedding_cache (model, text_hash, dimensions, embedding) "
+        "VALUES (:model, :text_hash, :dimensions, :embedding) "
+        "ON CONFLICT (model, text_hash) DO NOTHING"
+    ).bindparams(bindparam("embedding", type_=Vector()))
+
+    def __init__(self, engine: Optional[Any] = None):
+        """
+        Initialize store.
+
+        Args:
+            engine: SQLAlchemy engine (defaults to ``get_engine()`` on first use)
+        """
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, list[float]]:
+        """
+        Look up cached embeddings in one query.
+
+        Args:
+            model: Embedding model name
+            hashes: Normalized text hashes
+
+        Returns:
+            Mapping of hash to embedding for the hashes that were found
+        """
+        with self.engine.connect() as conn:
+            rows = conn.execute(self._select, {"model": model, "hashes": hashes})
+            return {row.text_hash: [float(x) for x in row.embedding] for row in rows}
+
+    def put_many(self, model: str, embeddings: dict[str, list[float]]) -> None:
+        """
+        Store embeddings; existing keys are left untouched.
+
+        Args:
+            model: Embedding model name
+            embeddings: Mapping of normalized text hash to embedding
+        """
+        params = [
+            {"model": model, "text_hash": key, "dimensions": len(vector), "embedding": vector}
+            for key, vector in embeddings.items()
+        ]
+        with self.engine.begin() as conn:
+            conn.execute(self._insert, params)
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: in-process LRU over the ``embedding_cache`` table.
+
+    - Keys are (model, SHA-256 of the normalized text), so identical or
+      re-scraped text is embedded once however many content IDs it has
+    - Texts repeated within one request are embedded once
+    - Misses are embedded in a single call to the caller's ``embed`` function
+    - Store errors are logged and the cache runs L1-only for ``retry_after``
+      seconds
+    """
+
+    def __init__(
+        self,
+        store: Optional[EmbeddingStore] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        retry_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            store: Persistent tier (L1 only if None)
+            max_entries: Maximum embeddings kept in process
+            retry_after: Seconds to skip the store after an error
+            clock: Monotonic time source
+        """
+        self.store = store
+        self.max_entries = max_entries
+        self.retry_after = retry_after
+        self._clock = clock
+
+        self._entries: "OrderedDict[tuple[str, str], list[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._store_disabled_until = 0.0
+
+        self.requests = 0
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.duplicates = 0
+        self.misses = 0
+        self.store_errors = 0
+
+    def get_or_embed(self, model: str, texts: Sequence[str], embed: EmbedFunc) -> list[list[float]]:
+        """
+        Return embeddings for ``texts``, computing only uncached ones.
+
+        Args:
+            model: Embedding model name (part of the key)
+            texts: Input texts
+            embed: Computes embeddings for a list of texts, in order
+
+        Returns:
+            One embedding per input text, in order
+        """
+        keys = [content_hash(t) for t in texts]
+        unique = dict(zip(keys, texts))
+        found: dict[str, list[float]] = {}
+
+        with self._lock:
+            for key in unique:
+                vector = self._entries.get((model, key))
+                if vector is not None:
+                    self._entries.move_to_end((model, key))
+                    found[key] = vector
+            l1_hits = len(found)
+
+        missing = [key for key in unique if key not in found]
+        from_store = self._store_get(model, missing) if missing else {}
+        found.update(from_store)
+
+        missing = [key for key in missing if key not in found]
+        computed: dict[str, list[float]] = {}
+        if missing:
+            vectors = embed([unique[key] for key in missing])
+            computed = dict(zip(missing, vectors))
+            found.update(computed)
+            self._store_put(model, computed)
+
+        with self._lock:
+            for key, vector in {**from_store, **computed}.items():
+                self._entries[(model, key)] = vector
+                self._entries.move_to_end((model, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            self.requests += len(texts)
+            self.l1_hits += l1_hits
+            self.l2_hits += len(from_store)
+            self.duplicates += len(texts) - len(unique)
+            self.misses += len(computed)
+
+        return [found[key] for key in keys]
+
+    def clear(self) -> None:
+        """Drop all in-process entries (the store is untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit rates per tier."""
+        hits = self.requests - self.misses
+        if self.store is None:
+            store = "disabled"
+        elif self._clock() < self._store_disabled_until:
+            store = "backoff"
+        else:
+            store = "ok"
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "requests": self.requests,
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "duplicates": self.duplicates,
+            "misses": self.misses,
+            "hit_rate": round(hits / self.requests, 4) if self.requests else 0.0,
+            "store": store,
+            "store_errors": self.store_errors,
+        }
+
+    def _store_available(self) -> bool:
+        return self.store is not None and self._clock() >= self._store_disabled_until
+
+    def _store_failed(self, action: str, error: Exception) -> None:
+        self.store_errors += 1
+        self._store_disabled_until = self._clock() + self.retry_after
+        logger.warning(f"Embedding cache {action} failed, using L1 only: {error}")
+
+    def _store_get(self, model: str, keys: list[str]) -> dict[str, list[float]]:
+        if not self._store_available():
+            return {}
+        try:
+            return self.store.get_many(model, keys)
+        except Exception as e:
+            self._store_failed("lookup", e)
+            return {}
+
+    def _store_put(self, model: str, embeddings: dict[str, list[float]]) -> None:
+        if not self._store_available():
+            return
+        try:
+            self.store.put_many(model, embeddings)
+        except Exception as e:
+            self._store_failed("write", e)
+
+
+# Global cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Get or create the process-wide embedding cache.
+
+    ``EMBEDDING_CACHE_SIZE`` sets the LRU size and ``EMBEDDING_CACHE_PERSIST=0``
+    turns off the ``embedding_cache`` table tier.
+
+    Returns:
+        EmbeddingCache instance
+    """
+    global _embedding_cache
+
+    if _embedding_cache is None:
+        persist = os.getenv("EMBEDDING_CACHE_PERSIST", "1") != "0"
+        _embedding_cache = EmbeddingCache(
+            store=EmbeddingStore() if persist else None,
+            max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", DEFAULT_MAX_ENTRIES)),
+        )
+
+    return _embedding_cache
@@ -1,10 +1,12 @@
 """Embedding generation using OpenAI."""
 
 import os
-from typing import Any
+from typing import Any, Optional
 
 from openai import OpenAI
 
+from backend.vector.embedding_cache import EmbeddingCache, get_embedding_cache
+
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
 
@@ -16,12 +18,20 @@ class EmbeddingGenerator:
     - 1536 dimensional vectors
     - Batch processing
     - Retry logic
+    - Content-hash cache shared with the other embedding call sites
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[EmbeddingCache] = None):
+        """
+        Initialize embedding generator.
+
+        Args:
+            cache: Embedding cache (defaults to the shared ``get_embedding_cache()``)
+        """
         self.client = OpenAI(api_key=OPENAI_API_KEY)
         self.model = "text-embedding-ada-002"
         self.dimensions = 1536
+        self.cache = cache if cache is not None else get_embedding_cache()
 
     def generate(self, text: str) -> list[float]:
         """
@@ -33,8 +43,7 @@ class EmbeddingGenerator:
         Returns:
             Embedding vector (1536 dims)
         """
-        response = self.client.embeddings.create(input=text, model=self.model)
-        return response.data[0].embedding
+        return self.cache.get_or_embed(self.model, [text], self._embed)[0]
 
     def generate_batch(self, texts: list[str]) -> list[list[float]]:
         """
@@ -46,14 +55,18 @@ class EmbeddingGenerator:
         Returns:
             List of embedding vectors
         """
+        return self.cache.get_or_embed(self.model, texts, self._embed)
+
+    def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Call the API for texts the cache could not serve."""
         response = self.client.embeddings.create(input=texts, model=self.model)
         return [item.embedding for item in response.data]
 
     def health_check(self) -> dict[str, Any]:
         """Check OpenAI API access."""
         try:
-            # Test with minimal input
-            test_embedding = self.generate("test")
+            # Test with minimal input (bypassing the cache)
+            test_embedding = self._embed(["test"])[0]
             return {
                 "status": "ok",
                 "message": "OpenAI API connected",
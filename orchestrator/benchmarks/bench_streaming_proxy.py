@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark streaming vs buffered proxying through the orchestrator gateway.
+
+Starts a stub upstream that emits a large body in timed chunks, runs the
+gateway under uvicorn in a child process (once per mode), and measures
+time to first byte, total time and the gateway's peak RSS.
+
+Usage:
+    python orchestrator/benchmarks/bench_streaming_proxy.py
+    python orchestrator/benchmarks/bench_streaming_proxy.py --size-mb 64 --requests 10
+    python orchestrator/benchmarks/bench_streaming_proxy.py --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def run_upstream(
+    host: str, port: int, size: int, chunk_delay: float
+) -> asyncio.AbstractServer:
+    """Start a minimal HTTP/1.1 upstream that streams ``size`` bytes."""
+    chunk = b"x" * CHUNK_SIZE
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                # Read request head (bodies are not used by the benchmark)
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/octet-stream\r\n"
+                    + f"Content-Length: {size}\r\n\r\n".encode()
+                )
+                sent = 0
+                while sent < size:
+                    part = chunk[: min(CHUNK_SIZE, size - sent)]
+                    writer.write(part)
+                    await writer.drain()
+                    sent += len(part)
+                    if chunk_delay:
+                        await asyncio.sleep(chunk_delay)
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+def serve_gateway(mode: str, upstream_url: str, port: int) -> None:
+    """Run the gateway (child process entry point)."""
+    import uvicorn
+    from orchestrator import main
+
+    main.STREAMING_PROXY = mode == "stream"
+    main.SERVICES["research"] = upstream_url
+    main.upstream_pool.upstreams["research"] = upstream_url
+    uvicorn.run(main.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def peak_rss_mb(pid: int) -> Optional[float]:
+    """Read a process's peak resident set size (Linux only)."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+async def wait_for_gateway(url: str, timeout: float = 15.0) -> None:
+    """Poll the gateway root endpoint until it answers."""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.RequestError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"Gateway at {url} did not start")
+
+
+async def measure(url: str, requests: int, concurrency: int) -> Dict[str, List[float]]:
+    """Issue requests through the gateway and record TTFB and total time."""
+    ttfb: List[float] = []
+    total: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(timeout=None) as client:
+
+        async def one() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                first = None
+                async with client.stream("GET", url) as response:
+                    async for _ in response.aiter_raw():
+                        if first is None:
+                            first = time.perf_counter() - start
+                ttfb.append(first or 0.0)
+                total.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(one() for _ in range(requests)))
+
+    return {"ttfb": ttfb, "total": total}
+
+
+async def bench_mode(mode: str, args: argparse.Namespace, upstream_url: str, port: int) -> Dict:
+    """Benchmark one proxy mode in a fresh gateway process."""
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            __file__,
+            "--serve",
+            mode,
+            "--upstream",
+            upstream_url,
+            "--port",
+            str(port),
+        ],
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        await wait_for_gateway(f"http://127.0.0.1:{port}/")
+        baseline_rss = peak_rss_mb(proc.pid)
+        results = await measure(
+            f"http://127.0.0.1:{port}/api/enrich", args.requests, args.concurrency
+        )
+        return {
+            "mode": mode,
+            "ttfb_ms": statistics.median(results["ttfb"]) * 1000,
+            "total_ms": statistics.median(results["total"]) * 1000,
+            "baseline_rss_mb": baseline_rss,
+            "peak_rss_mb": peak_rss_mb(proc.pid),
+        }
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs buffered proxy")
+    parser.add_argument(
+        "--size-mb", type=float, default=32, help="Upstream body size (default: 32)"
+    )
+    parser.add_argument("--requests", type=int, default=5, help="Requests per mode (default: 5)")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Concurrent requests (default: 1)"
+    )
+    parser.add_argument(
+        "--chunk-delay",
+        type=float,
+        default=0.001,
+        help="Upstream delay per 64KB chunk in seconds, simulating generation (default: 0.001)",
+    )
+    parser.add_argument("--upstream-port", type=int, default=18801)
+    parser.add_argument("--gateway-port", type=int, default=18803)
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    upstream = await run_upstream("127.0.0.1", args.upstream_port, size, args.chunk_delay)
+    upstream_url = f"http://127.0.0.1:{args.upstream_port}"
+
+    print(f"Body: {args.size_mb} MB, requests: {args.requests}, concurrency: {args.concurrency}\n")
+    print(
+        f"{'mode':<10} {'TTFB (ms)':>12} {'total (ms)':>12} "
+        f"{'RSS idle (MB)':>14} {'RSS peak (MB)':>14}"
+    )
+
+    async with upstream:
+        for mode in ("buffered", "stream"):
+            result = await bench_mode(mode, args, upstream_url, args.gateway_port)
+            idle = result["baseline_rss_mb"]
+            peak = result["peak_rss_mb"]
+            print(
+                f"{mode:<10} {result['ttfb_ms']:>12.1f} {result['total_ms']:>12.1f} "
+                f"{idle if idle is not None else float('nan'):>14.1f} "
+                f"{peak if peak is not None else float('nan'):>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        serve_parser = argparse.ArgumentParser()
+        serve_parser.add_argument("--serve", choices=["buffered", "stream"], required=True)
+        serve_parser.add_argument("--upstream", required=True)
+        serve_parser.add_argument("--port", type=int, required=True)
+        serve_args = serve_parser.parse_args()
+        serve_gateway(serve_args.serve, serve_args.upstream, serve_args.port)
+    else:
+        asyncio.run(main())
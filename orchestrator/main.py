@@ -6,13 +6,28 @@ aggregates health checks, and implements timeout/retry logic.
 
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from orchestrator.monitoring import HealthChecker
+from orchestrator.monitoring import CircuitBreaker, HealthChecker
+from orchestrator.proxy import (
+    RETRYABLE_STATUS_CODES,
+    CachedResponse,
+    CacheRule,
+    ResponseCache,
+    RetryBudget,
+    UpstreamConfig,
+    UpstreamPool,
+    backoff_delay,
+    compute_etag,
+    etag_matches,
+    filter_headers,
+    is_idempotent,
+    stream_proxy,
+)
 
 
 @asynccontextmanager
@@ -23,6 +38,10 @@ async def lifespan(app: FastAPI):
     print(f"Configured services: {SERVICES}")
     print(f"Request timeout: {REQUEST_TIMEOUT}s")
     print(f"Max retries: {MAX_RETRIES}")
+    print(f"Streaming proxy: {STREAMING_PROXY}")
+
+    # Open long-lived upstream connection pools
+    await upstream_pool.start()
 
     # Start health monitoring
     await health_checker.start()
@@ -35,6 +54,9 @@ async def lifespan(app: FastAPI):
     # Stop health monitoring
     await health_checker.stop()
 
+    # Close upstream connection pools
+    await upstream_pool.close()
+
 
 # Service Configuration (must be defined before lifespan reference)
 SERVICES = {
@@ -46,15 +68,68 @@ SERVICES = {
 # Timeout and Retry Configuration
 REQUEST_TIMEOUT = 30.0  # 30 seconds
 MAX_RETRIES = 3
-RETRY_DELAY = 1.0  # 1 second between retries
+RETRY_DELAY = 1.0  # base backoff delay, doubled per retry with full jitter
+RETRY_MAX_DELAY = 10.0  # cap on a single backoff delay
+
+# Retry Budget (gateway-wide cap so retries cannot amplify an outage)
+RETRY_BUDGET_RATIO = 0.2  # at most 20% extra load from retries
+RETRY_BUDGET_MIN_PER_SECOND = 1.0  # retry floor at low traffic
+RETRY_BUDGET_WINDOW = 10  # seconds
+
+retry_budget = RetryBudget(
+    ratio=RETRY_BUDGET_RATIO,
+    min_retries_per_second=RETRY_BUDGET_MIN_PER_SECOND,
+    window=RETRY_BUDGET_WINDOW,
+)
+
+# Pass request/response bodies through chunk by chunk instead of buffering them
+STREAMING_PROXY = True
+
+# Upstream Connection Pools (one keep-alive client per service)
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE_CONNECTIONS = 20
+POOL_KEEPALIVE_EXPIRY = 30.0  # seconds an idle connection is kept open
+POOL_CONNECT_TIMEOUT = 5.0
+HTTP2_ENABLED = False  # requires the optional h2 package
+
+UPSTREAM_CONFIG = {
+    name: UpstreamConfig(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+        timeout=REQUEST_TIMEOUT,
+        connect_timeout=POOL_CONNECT_TIMEOUT,
+        http2=HTTP2_ENABLED,
+    )
+    for name in SERVICES
+}
+
+upstream_pool = UpstreamPool(SERVICES, UPSTREAM_CONFIG)
+
+# Response Cache (opt-in: only GETs matching a rule are cached)
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+RESPONSE_CACHE_RULES = [
+    CacheRule(service="backend", pattern=r"^/attributions/[^/]+/graph$", ttl=30.0),
+    CacheRule(service="backend", pattern=r"^/tokens/stats/[^/]+$", ttl=15.0),
+    CacheRule(service="backend", pattern=r"^/ultra-learning/subjects/stats$", ttl=60.0),
+    CacheRule(service="research", pattern=r"^/health$", ttl=10.0),
+]
+
+response_cache = ResponseCache(RESPONSE_CACHE_RULES, max_bytes=RESPONSE_CACHE_MAX_BYTES)
 
 # Health Monitoring
+HEALTH_PROBE_DEADLINE = 6.0  # bound on a full round of concurrent probes
+
 health_checker = HealthChecker(
     check_interval=30,  # Check every 30 seconds
     timeout=5.0,  # 5 second timeout for health checks
     max_history=100,  # Keep last 100 checks for uptime calculation
+    deadline=HEALTH_PROBE_DEADLINE,
 )
 
+# In-flight live probe shared by concurrent /health calls without a snapshot
+_live_health_probe: Optional["asyncio.Task[Dict[str, Any]]"] = None
+
 app = FastAPI(
     title="Extrophi Orchestrator",
     version="0.1.0",
@@ -72,11 +147,37 @@ app.add_middleware(
 )
 
 
+def get_circuit_breaker(service: str) -> Optional[CircuitBreaker]:
+    """Get the health monitor's circuit breaker for an upstream service.
+
+    Args:
+        service: Upstream service name
+
+    Returns:
+        The shared CircuitBreaker, or None for unmonitored upstreams
+    """
+    return health_checker.circuit_breakers.get(service)
+
+
+def circuit_open_error(service: str, breaker: CircuitBreaker) -> HTTPException:
+    """Build the fail-fast error returned while a circuit is open."""
+    return HTTPException(
+        status_code=503,
+        detail=f"{service.capitalize()} service unavailable: circuit breaker {breaker.state.value}",
+        headers={"Retry-After": str(breaker.timeout)},
+    )
+
+
 async def proxy_request_with_retry(
     url: str, method: str = "GET", **kwargs
 ) -> Dict[str, Any]:
     """Proxy a request to a service with timeout and retry logic.
 
+    Requests fail fast while the upstream's circuit breaker is open, and every
+    outcome is fed back into the breaker. Only idempotent methods are retried,
+    with jittered exponential backoff, and each retry must be granted by the
+    gateway-wide retry budget.
+
     Args:
         url: Target service URL
         method: HTTP method (GET, POST, etc.)
@@ -86,27 +187,54 @@ async def proxy_request_with_retry(
         Response data as dictionary
 
     Raises:
-        HTTPException: If all retries fail
+        HTTPException: If the circuit is open, the upstream rejects the
+            request, or all permitted attempts fail
     """
     last_error = None
+    upstream = upstream_pool.resolve(url)
+    breaker = get_circuit_breaker(upstream)
+    max_attempts = MAX_RETRIES if is_idempotent(method) else 1
+    attempts = 0
+
+    retry_budget.record_request()
 
-    for attempt in range(MAX_RETRIES):
+    for attempt in range(max_attempts):
+        if breaker is not None and not breaker.can_attempt():
+            if last_error is None:
+                raise circuit_open_error(upstream, breaker)
+            break
+
+        attempts += 1
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                response = await client.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response.json()
-        except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPStatusError) as e:
+            response = await upstream_pool.request(upstream, method, url, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if status_code not in RETRYABLE_STATUS_CODES:
+                # The upstream is up and rejected the request; do not retry
+                if breaker is not None:
+                    breaker.record_success()
+                raise HTTPException(status_code=status_code, detail=str(e))
             last_error = e
-            if attempt < MAX_RETRIES - 1:
-                await asyncio.sleep(RETRY_DELAY)
-                continue
-            break
+        except (httpx.TimeoutException, httpx.RequestError) as e:
+            last_error = e
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return response.json()
+
+        if breaker is not None:
+            breaker.record_failure()
+
+        if attempt < max_attempts - 1:
+            if not retry_budget.try_retry():
+                break
+            await asyncio.sleep(backoff_delay(attempt, RETRY_DELAY, RETRY_MAX_DELAY))
 
-    # All retries failed
+    # All permitted attempts failed
     raise HTTPException(
         status_code=503,
-        detail=f"Service unavailable after {MAX_RETRIES} retries: {str(last_error)}",
+        detail=f"Service unavailable after {attempts} attempts: {str(last_error)}",
     )
 
 
@@ -121,125 +249,263 @@ async def root():
     }
 
 
-@app.api_route("/api/enrich", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
-async def route_to_research(request: Request):
-    """Route requests to Research module (port 8001).
+async def forward_request(request: Request, service: str, prefix: str) -> Response:
+    """Forward a gateway request to an upstream service.
 
-    Handles all HTTP methods and forwards them to the Research service.
-    """
-    # Get request body if present
-    body = None
-    if request.method in ["POST", "PUT", "PATCH"]:
-        body = await request.body()
+    In streaming mode (``STREAMING_PROXY``) request and response bodies are
+    relayed chunk by chunk; otherwise the full bodies are buffered. Requests
+    fail fast while the upstream's circuit breaker is open, and each outcome
+    is recorded on the breaker.
+
+    Args:
+        request: Incoming gateway request
+        service: Upstream service name
+        prefix: Gateway path prefix to strip before forwarding
+
+    Returns:
+        Upstream response with status code and headers preserved
 
+    Raises:
+        HTTPException: 504 on upstream timeout, 503 if it is unreachable or
+            its circuit is open
+    """
     # Build target URL
-    path = request.url.path.replace("/api/enrich", "")
+    path = request.url.path.replace(prefix, "")
     query_string = str(request.url.query) if request.url.query else ""
-    target_url = f"{SERVICES['research']}{path}"
+    target_url = f"{SERVICES[service]}{path}"
     if query_string:
         target_url += f"?{query_string}"
 
     # Prepare headers (exclude host header)
-    headers = {k: v for k, v in request.headers.items() if k.lower() != "host"}
-
-    # Proxy request with retry
+    headers = [(k, v) for k, v in request.headers.items() if k.lower() != "host"]
+    has_body = request.method in ["POST", "PUT", "PATCH"]
+    label = service.capitalize()
+
+    # Serve fresh cached responses even while the upstream circuit is open
+    cache_rule = response_cache.match(service, path) if request.method == "GET" else None
+    cache_key = None
+    if cache_rule is not None:
+        cache_key = response_cache.make_key(service, path, query_string, headers)
+        cached = response_cache.get_fresh(cache_key)
+        if cached is not None:
+            return build_cached_response(request, cached, "hit")
+
+    breaker = get_circuit_breaker(service)
+    if breaker is not None and not breaker.can_attempt():
+        raise circuit_open_error(service, breaker)
+
+    contacted_upstream = True
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.request(
+        if cache_rule is not None:
+            cached, outcome = await response_cache.get_or_fetch(
+                cache_key,
+                service,
+                cache_rule.ttl,
+                lambda etag: fetch_for_cache(service, target_url, headers, etag),
+            )
+            contacted_upstream = outcome in ("miss", "revalidated")
+            response = build_cached_response(request, cached, outcome)
+        elif STREAMING_PROXY:
+            response = await stream_proxy(
+                upstream_pool,
+                service,
+                request.method,
+                target_url,
+                headers,
+                body=request.stream() if has_body else None,
+            )
+        else:
+            body = await request.body() if has_body else None
+            upstream_response = await upstream_pool.request(
+                service,
                 request.method,
                 target_url,
                 content=body,
                 headers=headers,
             )
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
+            response = Response(
+                content=upstream_response.content,
+                status_code=upstream_response.status_code,
+                headers=dict(upstream_response.headers),
             )
     except httpx.TimeoutException:
-        raise HTTPException(status_code=504, detail="Research service timeout")
+        if breaker is not None:
+            breaker.record_failure()
+        raise HTTPException(status_code=504, detail=f"{label} service timeout")
     except httpx.RequestError as e:
+        if breaker is not None:
+            breaker.record_failure()
         raise HTTPException(
-            status_code=503, detail=f"Research service unavailable: {str(e)}"
+            status_code=503, detail=f"{label} service unavailable: {str(e)}"
         )
 
+    if breaker is not None and contacted_upstream:
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
 
-@app.api_route("/api/publish", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
-async def route_to_backend(request: Request):
-    """Route requests to Backend module (port 8002).
+    # Writes may change what cached GETs for this service would return
+    if request.method != "GET" and response.status_code < 400:
+        response_cache.invalidate_service(service)
 
-    Handles all HTTP methods and forwards them to the Backend service.
+    return response
+
+
+async def fetch_for_cache(
+    service: str, target_url: str, headers: list, etag: Optional[str]
+) -> CachedResponse:
+    """Fetch and buffer an upstream GET for the response cache.
+
+    The client's own conditional headers are not forwarded, since the gateway
+    answers those from the cache; instead the stale entry's upstream ETag is
+    sent so an unchanged resource costs only a 304.
+
+    Args:
+        service: Upstream service name
+        target_url: Absolute upstream URL
+        headers: Request header pairs
+        etag: Upstream ETag of a stale cached copy, if any
+
+    Returns:
+        Buffered upstream response
     """
-    # Get request body if present
-    body = None
-    if request.method in ["POST", "PUT", "PATCH"]:
-        body = await request.body()
+    upstream_headers = [
+        (k, v) for k, v in headers if k.lower() not in ("if-none-match", "if-modified-since")
+    ]
+    if etag is not None:
+        upstream_headers.append(("If-None-Match", etag))
+
+    upstream_response = await upstream_pool.request(
+        service, "GET", target_url, headers=upstream_headers
+    )
+    body = upstream_response.content
+    upstream_etag = upstream_response.headers.get("etag")
+    return CachedResponse(
+        status_code=upstream_response.status_code,
+        # Body is already decoded, so length/encoding headers no longer apply
+        headers=filter_headers(
+            upstream_response.headers.multi_items(),
+            exclude=("content-length", "content-encoding", "etag"),
+        ),
+        body=body,
+        etag=upstream_etag or compute_etag(body),
+        upstream_etag=upstream_etag is not None,
+    )
 
-    # Build target URL
-    path = request.url.path.replace("/api/publish", "")
-    query_string = str(request.url.query) if request.url.query else ""
-    target_url = f"{SERVICES['backend']}{path}"
-    if query_string:
-        target_url += f"?{query_string}"
 
-    # Prepare headers (exclude host header)
-    headers = {k: v for k, v in request.headers.items() if k.lower() != "host"}
+def build_cached_response(request: Request, cached: CachedResponse, outcome: str) -> Response:
+    """Turn a cached upstream response into a gateway response.
 
-    # Proxy request with retry
-    try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.request(
-                request.method,
-                target_url,
-                content=body,
-                headers=headers,
-            )
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-            )
-    except httpx.TimeoutException:
-        raise HTTPException(status_code=504, detail="Backend service timeout")
-    except httpx.RequestError as e:
-        raise HTTPException(
-            status_code=503, detail=f"Backend service unavailable: {str(e)}"
+    Answers ``If-None-Match`` with 304 when the client's copy is current.
+
+    Args:
+        request: Incoming gateway request
+        cached: Buffered upstream response
+        outcome: Cache outcome, reported in the ``X-Cache`` header
+
+    Returns:
+        Full response, or an empty 304
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if cached.status_code == 200 and etag_matches(if_none_match, cached.etag):
+        response_cache.not_modified += 1
+        return Response(
+            status_code=304, headers={"ETag": cached.etag, "X-Cache": outcome.upper()}
         )
 
+    response = Response(content=cached.body, status_code=cached.status_code)
+    for name, value in cached.headers:
+        response.headers.append(name, value)
+    if cached.etag is not None:
+        response.headers["ETag"] = cached.etag
+    response.headers["X-Cache"] = outcome.upper()
+    return response
+
+
+@app.api_route("/api/enrich", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
+@app.api_route("/api/enrich/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
+async def route_to_research(request: Request):
+    """Route requests to Research module (port 8001).
+
+    Handles all HTTP methods and forwards them to the Research service.
+    """
+    return await forward_request(request, "research", "/api/enrich")
+
+
+@app.api_route("/api/publish", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
+@app.api_route("/api/publish/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
+async def route_to_backend(request: Request):
+    """Route requests to Backend module (port 8002).
+
+    Handles all HTTP methods and forwards them to the Backend service.
+    """
+    return await forward_request(request, "backend", "/api/publish")
+
 
 @app.get("/health")
 async def aggregate_health():
     """Aggregate health checks from all modules.
 
+    Served from the health monitor's cached snapshot, so load balancer
+    health scrapes cost nothing upstream. Only when no fresh snapshot exists
+    (e.g. before the first monitoring round) are services probed directly,
+    and concurrent callers share that single probe.
+
     Returns:
         Combined health status from Writer, Research, and Backend modules
     """
+    snapshot = health_checker.get_snapshot()
+    if snapshot is not None:
+        return snapshot
+
+    global _live_health_probe
+    if _live_health_probe is None or _live_health_probe.done():
+        _live_health_probe = asyncio.create_task(probe_all_services())
+
+    # Shield so one disconnecting caller does not cancel the shared probe
+    return await asyncio.shield(_live_health_probe)
+
+
+async def probe_all_services() -> Dict[str, Any]:
+    """Probe every service concurrently within ``HEALTH_PROBE_DEADLINE``.
+
+    Returns:
+        Combined health status; services that miss the deadline are unhealthy
+    """
     health_status = {
         "orchestrator": "healthy",
         "services": {},
         "overall": "healthy",
     }
 
-    # Check each service health
-    service_checks = []
-
-    for service_name, service_url in SERVICES.items():
-        service_checks.append(check_service_health(service_name, service_url))
-
     # Execute all health checks concurrently
-    results = await asyncio.gather(*service_checks, return_exceptions=True)
+    tasks = {
+        service_name: asyncio.create_task(check_service_health(service_name, service_url))
+        for service_name, service_url in SERVICES.items()
+    }
+    _, pending = await asyncio.wait(tasks.values(), timeout=HEALTH_PROBE_DEADLINE)
+    for task in pending:
+        task.cancel()
 
     # Process results
     all_healthy = True
-    for i, (service_name, _) in enumerate(SERVICES.items()):
-        result = results[i]
-        if isinstance(result, Exception):
+    for service_name, task in tasks.items():
+        if task in pending:
+            health_status["services"][service_name] = {
+                "status": "unhealthy",
+                "error": "Health check deadline exceeded",
+                "url": SERVICES[service_name],
+            }
+            all_healthy = False
+        elif task.exception() is not None:
             health_status["services"][service_name] = {
                 "status": "unhealthy",
-                "error": str(result),
+                "error": str(task.exception()),
             }
             all_healthy = False
         else:
+            result = task.result()
             health_status["services"][service_name] = result
             if result.get("status") != "healthy":
                 all_healthy = False
@@ -289,6 +555,41 @@ async def check_service_health(service_name: str, service_url: str) -> Dict[str,
         }
 
 
+@app.get("/status")
+async def get_gateway_status():
+    """Get gateway status: pools, circuit breakers, retry budget and cache.
+
+    Returns:
+        Gateway metrics grouped by subsystem
+    """
+    return {
+        "pool": upstream_pool.get_stats(),
+        "circuits": {
+            name: {
+                "state": breaker.state.value,
+                "failure_count": breaker.failure_count,
+            }
+            for name, breaker in health_checker.circuit_breakers.items()
+        },
+        "retry_budget": retry_budget.get_stats(),
+        "cache": response_cache.get_stats(),
+    }
+
+
+@app.get("/status/pool")
+async def get_pool_status():
+    """Get upstream connection pool utilisation.
+
+    Reports, per upstream service, the configured limits alongside in-flight
+    and peak request counts, saturation ratios (in-flight / max connections)
+    and open/idle connection counts, for sizing the pools.
+
+    Returns:
+        Pool metrics keyed by upstream service name
+    """
+    return upstream_pool.get_stats()
+
+
 @app.get("/health/status")
 async def get_health_status():
     """Get detailed health status from the monitoring system.
@@ -1,5 +1,5 @@
 """Health monitoring module for Extrophi Orchestrator."""
 
-from .health_checker import HealthChecker, CircuitBreaker, ServiceStatus
+from .health_checker import CircuitBreaker, HealthChecker, ServiceStatus, UptimeRing
 
-__all__ = ["HealthChecker", "CircuitBreaker", "ServiceStatus"]
+__all__ = ["HealthChecker", "CircuitBreaker", "ServiceStatus", "UptimeRing"]
@@ -5,6 +5,7 @@ This module implements:
 - Circuit breaker pattern for fault tolerance
 - Service status aggregation and storage
 - Health status endpoint data
+- Cached health snapshot so /health never probes upstreams itself
 """
 
 import asyncio
@@ -12,7 +13,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import httpx
 
@@ -122,6 +123,65 @@ class CircuitBreaker:
         return (time.time() - self.last_failure_time) >= self.timeout
 
 
+class UptimeRing:
+    """Fixed-size ring buffer of health check outcomes.
+
+    Keeps a running success count so recording a check and reading the
+    uptime percentage are both O(1), regardless of history length.
+    """
+
+    __slots__ = ("capacity", "_outcomes", "_index", "_size", "_successes")
+
+    def __init__(self, capacity: int):
+        """Initialize ring buffer.
+
+        Args:
+            capacity: Number of most recent checks to keep
+        """
+        self.capacity = capacity
+        self._outcomes = bytearray(capacity)
+        self._index = 0
+        self._size = 0
+        self._successes = 0
+
+    def record(self, success: bool) -> None:
+        """Record a check outcome, evicting the oldest once full."""
+        if self._size == self.capacity:
+            self._successes -= self._outcomes[self._index]
+        else:
+            self._size += 1
+
+        self._outcomes[self._index] = 1 if success else 0
+        self._successes += 1 if success else 0
+        self._index = (self._index + 1) % self.capacity
+
+    def uptime(self) -> float:
+        """Get uptime percentage (0-100) over the recorded checks."""
+        if self._size == 0:
+            return 100.0
+        return (self._successes / self._size) * 100.0
+
+    def resize(self, capacity: int) -> None:
+        """Change capacity, keeping the most recent outcomes."""
+        recent = list(self)[-capacity:]
+        self.capacity = capacity
+        self._outcomes = bytearray(capacity)
+        self._index = 0
+        self._size = 0
+        self._successes = 0
+        for success in recent:
+            self.record(success)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bool]:
+        """Iterate outcomes from oldest to newest."""
+        start = (self._index - self._size) % self.capacity
+        for i in range(self._size):
+            yield bool(self._outcomes[(start + i) % self.capacity])
+
+
 @dataclass
 class ServiceHealthStatus:
     """Health status for a single service.
@@ -177,6 +237,7 @@ class HealthChecker:
         check_interval: int = 30,
         timeout: float = 5.0,
         max_history: int = 100,
+        deadline: Optional[float] = None,
     ):
         """Initialize health checker.
 
@@ -184,10 +245,13 @@ class HealthChecker:
             check_interval: Seconds between health checks
             timeout: HTTP request timeout in seconds
             max_history: Maximum number of checks to store in history
+            deadline: Bound in seconds on a full round of concurrent probes
+                (defaults to ``timeout + 1``)
         """
         self.check_interval = check_interval
         self.timeout = timeout
         self.max_history = max_history
+        self.deadline = deadline if deadline is not None else timeout + 1.0
 
         # Service configuration
         self.services = {
@@ -208,10 +272,15 @@ class HealthChecker:
         }
 
         # Health check history for uptime calculation
-        self.health_history: Dict[str, List[bool]] = {
-            name: [] for name in self.services.keys()
+        self.health_history: Dict[str, UptimeRing] = {
+            name: UptimeRing(max_history) for name in self.services.keys()
         }
 
+        # Latest /health payload, replaced wholesale after each round of checks.
+        # Readers only ever see a complete snapshot, so no lock is needed.
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_time: Optional[float] = None
+
         # Background task
         self._task: Optional[asyncio.Task] = None
         self._running = False
@@ -251,17 +320,47 @@ class HealthChecker:
     async def check_all_services(self) -> Dict[str, ServiceHealthStatus]:
         """Check health of all services concurrently.
 
+        Probes run in parallel and the whole round is bounded by
+        ``self.deadline``; services that have not answered by then are marked
+        unhealthy. The cached health snapshot is refreshed afterwards.
+
         Returns:
             Dictionary mapping service names to health status
         """
-        tasks = []
-        for name, url in self.services.items():
-            tasks.append(self._check_service(name, url))
+        tasks = {
+            asyncio.create_task(self._check_service(name, url)): name
+            for name, url in self.services.items()
+        }
+
+        _, pending = await asyncio.wait(tasks.keys(), timeout=self.deadline)
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in pending:
+            self._record_deadline_exceeded(tasks[task])
+
+        self._publish_snapshot()
 
         return self.service_status
 
+    def _record_deadline_exceeded(self, name: str) -> None:
+        """Mark a service whose probe did not finish within the deadline."""
+        circuit_breaker = self.circuit_breakers[name]
+        status = self.service_status[name]
+
+        circuit_breaker.record_failure()
+        status.status = ServiceStatus.UNHEALTHY
+        status.error = "Health check deadline exceeded"
+        status.consecutive_failures += 1
+        self._update_history(name, False)
+
+        status.last_check = datetime.now()
+        status.circuit_state = circuit_breaker.state
+        status.uptime_percentage = self._calculate_uptime(name)
+
     async def _check_service(self, name: str, url: str) -> None:
         """Check health of a single service with circuit breaker.
 
@@ -344,11 +443,9 @@ class HealthChecker:
             success: Whether the health check succeeded
         """
         history = self.health_history[service_name]
-        history.append(success)
-
-        # Keep only max_history items
-        if len(history) > self.max_history:
-            history.pop(0)
+        if history.capacity != self.max_history:
+            history.resize(self.max_history)
+        history.record(success)
 
     def _calculate_uptime(self, service_name: str) -> float:
         """Calculate uptime percentage from history.
@@ -359,12 +456,7 @@ class HealthChecker:
         Returns:
             Uptime percentage (0-100)
         """
-        history = self.health_history[service_name]
-        if not history:
-            return 100.0
-
-        successes = sum(1 for check in history if check)
-        return (successes / len(history)) * 100.0
+        return self.health_history[service_name].uptime()
 
     def get_status(self) -> Dict[str, Any]:
         """Get current aggregated health status.
@@ -397,10 +489,67 @@ class HealthChecker:
             "services": service_statuses,
             "monitoring": {
                 "check_interval": self.check_interval,
+                "deadline": self.deadline,
                 "running": self._running,
             },
         }
 
+    def _publish_snapshot(self) -> None:
+        """Build the /health payload from current statuses and swap it in."""
+        services: Dict[str, Any] = {}
+        for name, status in self.service_status.items():
+            if status.status == ServiceStatus.HEALTHY:
+                services[name] = {
+                    "status": "healthy",
+                    "details": status.details,
+                    "url": status.url,
+                }
+            else:
+                services[name] = {
+                    "status": status.status.value,
+                    "error": status.error,
+                    "url": status.url,
+                }
+
+        all_healthy = all(s["status"] == "healthy" for s in services.values())
+        checked_at = datetime.now()
+
+        self._snapshot = {
+            "orchestrator": "healthy",
+            "services": services,
+            "overall": "healthy" if all_healthy else "degraded",
+            "checked_at": checked_at.isoformat(),
+        }
+        self._snapshot_time = time.monotonic()
+
+    def get_snapshot(self, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Get the cached health payload filled by the monitoring loop.
+
+        Args:
+            max_age: Maximum snapshot age in seconds (defaults to two check
+                intervals plus the probe deadline)
+
+        Returns:
+            Cached health payload, or None if no fresh snapshot exists
+        """
+        snapshot = self._snapshot
+        snapshot_time = self._snapshot_time
+        if snapshot is None or snapshot_time is None:
+            return None
+
+        if max_age is None:
+            max_age = self.check_interval * 2 + self.deadline
+        age = time.monotonic() - snapshot_time
+        if age > max_age:
+            return None
+
+        return {**snapshot, "cached": True, "age_seconds": round(age, 3)}
+
+    def clear_snapshot(self) -> None:
+        """Discard the cached health payload."""
+        self._snapshot = None
+        self._snapshot_time = None
+
     def get_service_status(self, service_name: str) -> Optional[Dict[str, Any]]:
         """Get status for a specific service.
 
@@ -0,0 +1,32 @@
+"""Upstream proxy module for Extrophi Orchestrator."""
+
+from .cache import CachedResponse, CacheRule, ResponseCache, compute_etag, etag_matches
+from .pool import PoolStats, UpstreamConfig, UpstreamPool, UpstreamStream
+from .retry import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    RetryBudget,
+    backoff_delay,
+    is_idempotent,
+)
+from .streaming import HOP_BY_HOP_HEADERS, filter_headers, stream_proxy
+
+__all__ = [
+    "HOP_BY_HOP_HEADERS",
+    "IDEMPOTENT_METHODS",
+    "RETRYABLE_STATUS_CODES",
+    "CachedResponse",
+    "CacheRule",
+    "PoolStats",
+    "ResponseCache",
+    "RetryBudget",
+    "UpstreamConfig",
+    "UpstreamPool",
+    "UpstreamStream",
+    "backoff_delay",
+    "compute_etag",
+    "etag_matches",
+    "filter_headers",
+    "is_idempotent",
+    "stream_proxy",
+]
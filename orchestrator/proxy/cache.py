@@ -0,0 +1,325 @@
+"""Response cache for idempotent GETs routed through the gateway.
+
+This module implements:
+- Opt-in caching per route with individual TTLs
+- ETag generation and If-None-Match revalidation (client and upstream side)
+- Request coalescing so concurrent identical misses share one upstream call
+- Byte-bounded LRU eviction with hit/miss/eviction counters
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Request headers that change the response and must be part of the cache key
+VARY_HEADERS = ("authorization", "x-api-key", "cookie", "accept")
+
+# Per-entry bookkeeping overhead added to the byte estimate
+ENTRY_OVERHEAD_BYTES = 256
+
+
+@dataclass
+class CacheRule:
+    """Caching policy for a set of upstream routes.
+
+    Attributes:
+        service: Upstream service name the rule applies to
+        pattern: Regular expression matched against the upstream path
+        ttl: Seconds a cached response stays fresh
+    """
+
+    service: str
+    pattern: str
+    ttl: float
+
+    def __post_init__(self) -> None:
+        self._regex = re.compile(self.pattern)
+
+    def matches(self, service: str, path: str) -> bool:
+        """Check whether the rule covers an upstream request path."""
+        return service == self.service and self._regex.search(path) is not None
+
+
+@dataclass
+class CachedResponse:
+    """A buffered upstream response.
+
+    Attributes:
+        status_code: HTTP status code
+        headers: End-to-end response header pairs
+        body: Response body
+        etag: Entity tag identifying this body
+        upstream_etag: True if the ETag came from the upstream (so it can be
+            revalidated with If-None-Match), False if generated by the gateway
+        expires_at: Monotonic time after which the entry is stale
+    """
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    etag: Optional[str] = None
+    upstream_etag: bool = False
+    expires_at: float = 0.0
+    size: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.size = (
+            len(self.body) + sum(len(k) + len(v) for k, v in self.headers) + ENTRY_OVERHEAD_BYTES
+        )
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry is still within its TTL."""
+        return (now if now is not None else time.monotonic()) < self.expires_at
+
+    def is_cacheable(self) -> bool:
+        """Check whether the upstream allows this response to be shared."""
+        if self.status_code != 200:
+            return False
+        for name, value in self.headers:
+            lower = name.lower()
+            if lower == "set-cookie":
+                return False
+            if lower == "cache-control" and re.search(r"no-store|private", value, re.I):
+                return False
+        return True
+
+
+def compute_etag(body: bytes) -> str:
+    """Generate a strong ETag from a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match request header value
+        etag: Current entity tag
+
+    Returns:
+        True if the client's copy is current and a 304 can be sent
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in if_none_match.split(",")}
+
+
+class ResponseCache:
+    """Byte-bounded LRU cache of upstream GET responses.
+
+    Only routes matching a ``CacheRule`` are cached. Entries are evicted in
+    least-recently-used order once ``max_bytes`` is exceeded. Stale entries
+    are kept (until evicted) so they can be revalidated cheaply with the
+    upstream's ETag.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[CacheRule],
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: Optional[int] = None,
+    ):
+        """Initialize response cache.
+
+        Args:
+            rules: Routes to cache and their TTLs
+            max_bytes: Total cache budget in bytes
+            max_entry_bytes: Largest single response to cache
+                (defaults to a tenth of ``max_bytes``)
+        """
+        self.rules = list(rules)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes or max_bytes // 10
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._by_service: Dict[str, Set[str]] = {}
+        self._inflight: Dict[str, "asyncio.Future[CachedResponse]"] = {}
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.revalidated = 0
+        self.not_modified = 0
+        self.stores = 0
+        self.evictions = 0
+        self.uncacheable = 0
+        self.invalidations = 0
+
+    def match(self, service: str, path: str) -> Optional[CacheRule]:
+        """Find the rule covering an upstream path, if any."""
+        for rule in self.rules:
+            if rule.matches(service, path):
+                return rule
+        return None
+
+    @staticmethod
+    def make_key(service: str, path: str, query: str, headers: Iterable[Tuple[str, str]]) -> str:
+        """Build a cache key from the request target and varying headers.
+
+        Credentials are hashed into the key so responses are never shared
+        between different callers.
+        """
+        vary = sorted((k.lower(), v) for k, v in headers if k.lower() in VARY_HEADERS)
+        digest = hashlib.blake2b(repr(vary).encode(), digest_size=8).hexdigest()
+        return f"{service}:GET:{path}?{query}#{digest}"
+
+    def get_fresh(self, key: str) -> Optional[CachedResponse]:
+        """Return a fresh cached response without contacting the upstream.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            The cached response if present and within its TTL, else None
+        """
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        service: str,
+        ttl: float,
+        fetch: Callable[[Optional[str]], Awaitable[CachedResponse]],
+    ) -> Tuple[CachedResponse, str]:
+        """Return a cached response, or fetch it once for all concurrent callers.
+
+        Args:
+            key: Cache key from ``make_key``
+            service: Upstream service name (for invalidation)
+            ttl: Freshness lifetime for a newly stored response
+            fetch: Upstream call; receives the stale entry's upstream ETag
+                (or None) to send as If-None-Match, and may return a 304
+
+        Returns:
+            Tuple of (response, outcome) where outcome is one of
+            "hit", "miss", "coalesced" or "revalidated"
+        """
+        fresh = self.get_fresh(key)
+        if fresh is not None:
+            return fresh, "hit"
+
+        entry = self._entries.get(key)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight), "coalesced"
+
+        self.misses += 1
+        future: "asyncio.Future[CachedResponse]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            stale_etag = entry.etag if entry is not None and entry.upstream_etag else None
+            response = await fetch(stale_etag)
+
+            outcome = "miss"
+            if response.status_code == 304 and entry is not None:
+                # Upstream confirmed our stale copy is still current
+                entry.expires_at = time.monotonic() + ttl
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                else:
+                    self._store(key, service, entry)
+                self.revalidated += 1
+                response, outcome = entry, "revalidated"
+            elif response.is_cacheable():
+                response.expires_at = time.monotonic() + ttl
+                self._store(key, service, response)
+            else:
+                self.uncacheable += 1
+
+            future.set_result(response)
+            return response, outcome
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so lone failures do not log "never retrieved"
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate_service(self, service: str) -> int:
+        """Drop every cached response for an upstream service.
+
+        Args:
+            service: Upstream service name
+
+        Returns:
+            Number of entries removed
+        """
+        keys = self._by_service.pop(service, set())
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry.size
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._by_service.clear()
+        self.current_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters for the status endpoint."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "revalidated": self.revalidated,
+            "not_modified": self.not_modified,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "uncacheable": self.uncacheable,
+            "invalidations": self.invalidations,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "rules": [
+                {"service": r.service, "pattern": r.pattern, "ttl": r.ttl} for r in self.rules
+            ],
+        }
+
+    def _store(self, key: str, service: str, response: CachedResponse) -> None:
+        """Insert a response and evict LRU entries until within budget."""
+        if response.size > self.max_entry_bytes:
+            self.uncacheable += 1
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous.size
+
+        self._entries[key] = response
+        self._by_service.setdefault(service, set()).add(key)
+        self.current_bytes += response.size
+        self.stores += 1
+
+        while self.current_bytes > self.max_bytes and self._entries:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self.current_bytes -= old_entry.size
+            self._by_service.get(old_key.split(":", 1)[0], set()).discard(old_key)
+            self.evictions += 1
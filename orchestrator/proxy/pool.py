@@ -0,0 +1,348 @@
+"""Pooled, keep-alive HTTP clients for upstream services.
+
+This module implements:
+- One long-lived httpx.AsyncClient per upstream service
+- Configurable connection pool sizes, keep-alive expiry and timeouts
+- Optional HTTP/2 (requires the ``h2`` package)
+- Pool saturation metrics for sizing
+"""
+
+import importlib.util
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` dependency is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class UpstreamConfig:
+    """Connection pool configuration for a single upstream service.
+
+    Attributes:
+        max_connections: Maximum concurrent connections to the upstream
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept alive
+        timeout: Default read/write/pool timeout in seconds
+        connect_timeout: TCP connect timeout in seconds
+        http2: Enable HTTP/2 (falls back to HTTP/1.1 if ``h2`` is missing)
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    http2: bool = False
+
+    def limits(self) -> httpx.Limits:
+        """Build httpx connection limits from this configuration."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self) -> httpx.Timeout:
+        """Build httpx timeouts from this configuration."""
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+
+@dataclass
+class PoolStats:
+    """Request accounting for a single upstream pool.
+
+    Attributes:
+        in_flight: Requests currently using the pool
+        peak_in_flight: Highest concurrent request count observed
+        total_requests: Requests sent through the pool
+        total_errors: Requests that raised a transport error
+        saturated_requests: Requests started while the pool was full
+        total_time: Cumulative request time in seconds
+    """
+
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_requests: int = 0
+    total_errors: int = 0
+    saturated_requests: int = 0
+    total_time: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+
+class UpstreamPool:
+    """Registry of long-lived HTTP clients, one per upstream service.
+
+    Clients are created eagerly by ``start()`` (called from the application
+    lifespan) or lazily on first use, and closed by ``close()``.
+    """
+
+    def __init__(
+        self,
+        upstreams: Dict[str, str],
+        configs: Optional[Dict[str, UpstreamConfig]] = None,
+        default_config: Optional[UpstreamConfig] = None,
+    ):
+        """Initialize upstream pool.
+
+        Args:
+            upstreams: Mapping of service name to base URL
+            configs: Per-service pool configuration overrides
+            default_config: Configuration for services without an override
+        """
+        self.upstreams = dict(upstreams)
+        self.default_config = default_config or UpstreamConfig()
+        self.configs: Dict[str, UpstreamConfig] = {
+            name: (configs or {}).get(name, self.default_config) for name in self.upstreams
+        }
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, PoolStats] = {}
+
+    async def start(self) -> None:
+        """Create clients for every configured upstream."""
+        for name in self.upstreams:
+            self.get_client(name)
+        print(f"Upstream connection pools ready: {list(self._clients.keys())}")
+
+    async def close(self) -> None:
+        """Close all clients and release their connections."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def resolve(self, url: str) -> str:
+        """Resolve a URL to the upstream that serves it.
+
+        URLs that do not match a configured upstream get their own pool keyed
+        by origin, using the default configuration.
+
+        Args:
+            url: Absolute request URL
+
+        Returns:
+            Upstream name
+        """
+        origin = self._origin(url)
+        for name, base_url in self.upstreams.items():
+            if self._origin(base_url) == origin:
+                return name
+
+        if origin not in self.upstreams:
+            self.upstreams[origin] = origin
+            self.configs[origin] = self.default_config
+        return origin
+
+    def get_client(self, name: str) -> httpx.AsyncClient:
+        """Get (or lazily create) the client for an upstream.
+
+        Args:
+            name: Upstream name
+
+        Returns:
+            Shared AsyncClient for the upstream
+
+        Raises:
+            KeyError: If the upstream is not configured
+        """
+        client = self._clients.get(name)
+        if client is None:
+            config = self.configs[name]
+            http2 = config.http2
+            if http2 and not _http2_available():
+                print(f"HTTP/2 requested for '{name}' but h2 is not installed; using HTTP/1.1")
+                http2 = False
+
+            client = httpx.AsyncClient(
+                timeout=config.timeouts(),
+                limits=config.limits(),
+                http2=http2,
+            )
+            self._clients[name] = client
+            self._stats.setdefault(name, PoolStats())
+        return client
+
+    @asynccontextmanager
+    async def track(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow an upstream client while accounting for pool usage.
+
+        Args:
+            name: Upstream name
+
+        Yields:
+            Shared AsyncClient for the upstream
+        """
+        client = self.get_client(name)
+        start_time = self._begin(name)
+        error = False
+
+        try:
+            yield client
+        except httpx.RequestError:
+            error = True
+            raise
+        finally:
+            self._end(name, start_time, error)
+
+    async def request(self, name: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through an upstream's shared client.
+
+        Args:
+            name: Upstream name
+            method: HTTP method
+            url: Absolute request URL
+            **kwargs: Additional arguments passed to ``AsyncClient.request``
+
+        Returns:
+            Upstream response
+        """
+        async with self.track(name) as client:
+            return await client.request(method, url, **kwargs)
+
+    async def stream(self, name: str, method: str, url: str, **kwargs) -> "UpstreamStream":
+        """Send a request and return the response without reading its body.
+
+        The request counts as in flight until the returned stream is closed,
+        so long-running pass-through bodies show up in pool saturation.
+
+        Args:
+            name: Upstream name
+            method: HTTP method
+            url: Absolute request URL
+            **kwargs: Additional arguments passed to ``AsyncClient.build_request``
+
+        Returns:
+            Open upstream stream; the caller must ``aclose()`` it
+        """
+        client = self.get_client(name)
+        start_time = self._begin(name)
+
+        try:
+            request = client.build_request(method, url, **kwargs)
+            response = await client.send(request, stream=True)
+        except httpx.RequestError:
+            self._end(name, start_time, error=True)
+            raise
+        except BaseException:
+            self._end(name, start_time)
+            raise
+
+        return UpstreamStream(self, name, response, start_time)
+
+    def _begin(self, name: str) -> float:
+        """Record the start of a request against an upstream pool."""
+        stats = self._stats[name]
+        if stats.in_flight >= self.configs[name].max_connections:
+            stats.saturated_requests += 1
+        stats.in_flight += 1
+        stats.total_requests += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        return time.perf_counter()
+
+    def _end(self, name: str, start_time: float, error: bool = False) -> None:
+        """Record the end of a request against an upstream pool."""
+        stats = self._stats[name]
+        stats.in_flight -= 1
+        stats.total_time += time.perf_counter() - start_time
+        if error:
+            stats.total_errors += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool utilisation metrics for every upstream.
+
+        Returns:
+            Dictionary mapping upstream names to pool metrics
+        """
+        stats: Dict[str, Any] = {}
+        for name, config in self.configs.items():
+            pool_stats = self._stats.get(name, PoolStats())
+            connections = self._connection_counts(self._clients.get(name))
+            avg_ms = (
+                pool_stats.total_time / pool_stats.total_requests * 1000
+                if pool_stats.total_requests
+                else 0.0
+            )
+            stats[name] = {
+                "url": self.upstreams[name],
+                "open": name in self._clients,
+                "http2": config.http2 and _http2_available(),
+                "max_connections": config.max_connections,
+                "max_keepalive_connections": config.max_keepalive_connections,
+                "keepalive_expiry": config.keepalive_expiry,
+                "in_flight": pool_stats.in_flight,
+                "peak_in_flight": pool_stats.peak_in_flight,
+                "saturation": round(pool_stats.in_flight / config.max_connections, 4),
+                "peak_saturation": round(pool_stats.peak_in_flight / config.max_connections, 4),
+                "saturated_requests": pool_stats.saturated_requests,
+                "total_requests": pool_stats.total_requests,
+                "total_errors": pool_stats.total_errors,
+                "avg_request_ms": round(avg_ms, 2),
+                **connections,
+            }
+        return stats
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """Normalize a URL to its scheme://host:port origin."""
+        parsed = httpx.URL(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        return f"{parsed.scheme}://{parsed.host}:{port}"
+
+    @staticmethod
+    def _connection_counts(client: Optional[httpx.AsyncClient]) -> Dict[str, int]:
+        """Inspect the underlying httpcore pool for open and idle connections.
+
+        httpx does not expose pool internals publicly, so this is best-effort
+        and reports zeros if the transport layout is not recognised.
+        """
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if not isinstance(connections, list):
+            return {"connections": 0, "idle_connections": 0}
+
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {"connections": len(connections), "idle_connections": idle}
+
+
+class UpstreamStream:
+    """An upstream response whose body is still being streamed.
+
+    Wraps the httpx response so the pool's in-flight accounting is released
+    exactly once, when the body has been relayed or the client disconnects.
+    """
+
+    def __init__(self, pool: UpstreamPool, name: str, response: httpx.Response, start_time: float):
+        self.pool = pool
+        self.name = name
+        self.response = response
+        self._start_time = start_time
+        self._closed = False
+
+    async def aiter_raw(self) -> AsyncIterator[bytes]:
+        """Yield the upstream body chunk by chunk, undecoded.
+
+        The stream is closed when iteration ends, including when the
+        downstream client disconnects mid-body.
+        """
+        try:
+            async for chunk in self.response.aiter_raw():
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the upstream response and release the pool slot."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self.response.aclose()
+        finally:
+            self.pool._end(self.name, self._start_time)
@@ -0,0 +1,155 @@
+"""Retry policy for proxied requests.
+
+This module implements:
+- Idempotency rules deciding which methods may be retried
+- Jittered exponential backoff
+- A gateway-wide retry budget so retries cannot amplify an outage
+"""
+
+import random
+import time
+from typing import Any, Dict, List
+
+# Methods that are safe to resend (RFC 9110 §9.2.2)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+# Upstream status codes worth retrying (transient gateway/server failures)
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+def is_idempotent(method: str) -> bool:
+    """Check whether a request method may be retried.
+
+    Args:
+        method: HTTP method
+
+    Returns:
+        True if resending the request cannot duplicate side effects
+    """
+    return method.upper() in IDEMPOTENT_METHODS
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Compute a "full jitter" exponential backoff delay.
+
+    The delay is drawn uniformly from ``[0, min(cap, base * 2**attempt)]`` so
+    concurrent clients retrying the same failure spread out instead of
+    retrying in lockstep.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+class RetryBudget:
+    """Gateway-wide limit on retries as a fraction of recent traffic.
+
+    Every request deposits into the budget and every retry withdraws from
+    it. Within the sliding window, retries are allowed while::
+
+        retries < min_retries_per_second * window + ratio * requests
+
+    so during an outage total upstream load is bounded at ``1 + ratio`` times
+    normal traffic, while a small floor keeps retries available at low volume.
+    Counts are kept in per-second buckets, so memory and per-call cost are
+    independent of traffic volume.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: int = 10,
+    ):
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per request in the window
+            min_retries_per_second: Retry floor regardless of traffic
+            window: Sliding window length in seconds
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+
+        self._seconds: List[int] = [0] * window
+        self._requests: List[int] = [0] * window
+        self._retries: List[int] = [0] * window
+
+        self.total_requests = 0
+        self.total_retries = 0
+        self.rejected_retries = 0
+
+    def record_request(self) -> None:
+        """Deposit a request into the budget."""
+        self._requests[self._bucket()] += 1
+        self.total_requests += 1
+
+    def try_retry(self) -> bool:
+        """Withdraw a retry from the budget if one is available.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        index = self._bucket()
+        if self._sum(self._retries) >= self._allowance():
+            self.rejected_retries += 1
+            return False
+
+        self._retries[index] += 1
+        self.total_retries += 1
+        return True
+
+    def reset(self) -> None:
+        """Clear all window counts."""
+        self._seconds = [0] * self.window
+        self._requests = [0] * self.window
+        self._retries = [0] * self.window
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get budget usage for the status endpoint.
+
+        Returns:
+            Window counts, remaining allowance and lifetime totals
+        """
+        self._bucket()
+        retries = self._sum(self._retries)
+        allowance = self._allowance()
+        return {
+            "ratio": self.ratio,
+            "min_retries_per_second": self.min_retries_per_second,
+            "window_seconds": self.window,
+            "window_requests": self._sum(self._requests),
+            "window_retries": retries,
+            "available": max(0, int(allowance - retries)),
+            "total_requests": self.total_requests,
+            "total_retries": self.total_retries,
+            "rejected_retries": self.rejected_retries,
+        }
+
+    def _allowance(self) -> float:
+        """Retries permitted in the current window."""
+        return self.min_retries_per_second * self.window + self.ratio * self._sum(self._requests)
+
+    def _sum(self, counts: List[int]) -> int:
+        """Sum bucket counts that still fall within the window."""
+        now = int(time.monotonic())
+        return sum(
+            count for second, count in zip(self._seconds, counts) if now - second < self.window
+        )
+
+    def _bucket(self) -> int:
+        """Get the bucket index for the current second, clearing stale data."""
+        now = int(time.monotonic())
+        index = now % self.window
+        if self._seconds[index] != now:
+            self._seconds[index] = now
+            self._requests[index] = 0
+            self._retries[index] = 0
+        return index
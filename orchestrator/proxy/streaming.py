@@ -0,0 +1,95 @@
+"""Streaming pass-through proxying.
+
+Request and response bodies are relayed chunk by chunk without buffering or
+JSON parsing, so arbitrary payloads pass through untouched and memory stays
+flat regardless of body size.
+"""
+
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+from .pool import UpstreamPool
+
+# Connection-scoped headers that must not be forwarded by a proxy (RFC 9110 §7.6.1)
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+
+def filter_headers(
+    headers: Iterable[Tuple[str, str]], exclude: Iterable[str] = ()
+) -> List[Tuple[str, str]]:
+    """Drop hop-by-hop (and any extra excluded) headers.
+
+    Pairs are kept as a list so repeated headers such as ``Set-Cookie``
+    survive the round trip.
+
+    Args:
+        headers: Header name/value pairs
+        exclude: Additional lower-case header names to drop
+
+    Returns:
+        Headers safe to forward
+    """
+    excluded = HOP_BY_HOP_HEADERS | set(exclude)
+    return [(k, v) for k, v in headers if k.lower() not in excluded]
+
+
+async def stream_proxy(
+    pool: UpstreamPool,
+    service: str,
+    method: str,
+    url: str,
+    headers: Iterable[Tuple[str, str]],
+    body: Optional[AsyncIterator[bytes]] = None,
+) -> StreamingResponse:
+    """Proxy a request to an upstream, streaming both bodies.
+
+    The upstream status code and end-to-end headers are preserved. The
+    response body is relayed undecoded (``aiter_raw``), so ``Content-Encoding``
+    and ``Content-Length`` remain valid.
+
+    Args:
+        pool: Upstream connection pool
+        service: Upstream name
+        method: HTTP method
+        url: Absolute upstream URL
+        headers: Request header pairs to forward (host already removed)
+        body: Request body chunks, or None for bodiless requests
+
+    Returns:
+        Streaming response relaying the upstream body
+
+    Raises:
+        httpx.TimeoutException: If the upstream does not respond in time
+        httpx.RequestError: If the upstream cannot be reached
+    """
+    upstream = await pool.stream(
+        service,
+        method,
+        url,
+        content=body,
+        headers=filter_headers(headers),
+    )
+
+    response = StreamingResponse(
+        upstream.aiter_raw(),
+        status_code=upstream.response.status_code,
+        background=BackgroundTask(upstream.aclose),
+    )
+    response.raw_headers = [
+        (k.encode("latin-1"), v.encode("latin-1"))
+        for k, v in filter_headers(upstream.response.headers.multi_items())
+    ]
+    return response
@@ -0,0 +1,26 @@
+"""Pytest fixtures for orchestrator tests."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.main import health_checker, response_cache, retry_budget, upstream_pool
+from orchestrator.monitoring.health_checker import CircuitBreaker
+
+
+@pytest.fixture(autouse=True)
+def reset_upstream_pool():
+    """Drop pooled clients so each test builds its own (mocked) client."""
+    yield
+    asyncio.run(upstream_pool.close())
+
+
+@pytest.fixture(autouse=True)
+def reset_resilience_state():
+    """Reset circuit breakers, retry budget, health snapshot and response cache."""
+    yield
+    health_checker.clear_snapshot()
+    response_cache.clear()
+    for name in health_checker.circuit_breakers:
+        health_checker.circuit_breakers[name] = CircuitBreaker()
+    retry_budget.reset()
@@ -0,0 +1,319 @@
+"""Tests for the gateway response cache."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator.main import app, health_checker
+from orchestrator.monitoring.health_checker import CircuitState
+from orchestrator.proxy.cache import (
+    CachedResponse,
+    CacheRule,
+    ResponseCache,
+    compute_etag,
+    etag_matches,
+)
+
+RealAsyncClient = httpx.AsyncClient
+
+
+def mock_upstream(handler):
+    """Patch pooled clients to use an in-memory transport."""
+    return patch(
+        "httpx.AsyncClient",
+        side_effect=lambda **kwargs: RealAsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def make_response(body: bytes = b'{"ok": true}', status_code: int = 200, headers=None):
+    """Build a buffered response."""
+    return CachedResponse(
+        status_code=status_code,
+        headers=headers or [("content-type", "application/json")],
+        body=body,
+        etag=compute_etag(body),
+    )
+
+
+@pytest.fixture
+def cache():
+    """Create a cache with one rule."""
+    return ResponseCache([CacheRule("backend", r"^/tokens/stats/", ttl=60.0)], max_bytes=10_000)
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(app)
+
+
+class TestEtags:
+    """Test ETag helpers."""
+
+    def test_compute_etag_stable(self):
+        """Test identical bodies produce identical strong ETags."""
+        assert compute_etag(b"abc") == compute_etag(b"abc")
+        assert compute_etag(b"abc") != compute_etag(b"abd")
+        assert compute_etag(b"abc").startswith('"')
+
+    def test_etag_matches(self):
+        """Test If-None-Match evaluation."""
+        assert etag_matches('"a"', '"a"') is True
+        assert etag_matches('"b", "a"', '"a"') is True
+        assert etag_matches('W/"a"', '"a"') is True
+        assert etag_matches("*", '"a"') is True
+        assert etag_matches('"b"', '"a"') is False
+        assert etag_matches(None, '"a"') is False
+
+
+class TestCacheRules:
+    """Test route matching and keys."""
+
+    def test_match(self, cache):
+        """Test only configured routes are cached."""
+        assert cache.match("backend", "/tokens/stats/u1") is not None
+        assert cache.match("backend", "/tokens/balance/u1") is None
+        assert cache.match("research", "/tokens/stats/u1") is None
+
+    def test_key_varies_by_credentials(self):
+        """Test different callers never share a cache entry."""
+        key_a = ResponseCache.make_key("backend", "/p", "", [("Authorization", "Bearer a")])
+        key_b = ResponseCache.make_key("backend", "/p", "", [("Authorization", "Bearer b")])
+        key_c = ResponseCache.make_key("backend", "/p", "", [("User-Agent", "x")])
+        assert key_a != key_b
+        assert key_c == ResponseCache.make_key("backend", "/p", "", [])
+
+
+class TestResponseCache:
+    """Test caching, coalescing and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, cache):
+        """Test responses are stored and served until they expire."""
+        calls = []
+
+        async def fetch(etag):
+            calls.append(etag)
+            return make_response()
+
+        _, outcome = await cache.get_or_fetch("k", "backend", 60.0, fetch)
+        assert outcome == "miss"
+        _, outcome = await cache.get_or_fetch("k", "backend", 60.0, fetch)
+        assert outcome == "hit"
+        assert len(calls) == 1
+        assert cache.get_stats()["hit_ratio"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesced(self, cache):
+        """Test concurrent identical requests share one upstream call."""
+        calls = []
+
+        async def fetch(etag):
+            calls.append(etag)
+            await asyncio.sleep(0.05)
+            return make_response()
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch("k", "backend", 60.0, fetch) for _ in range(10))
+        )
+
+        assert len(calls) == 1
+        assert sorted(outcome for _, outcome in results).count("coalesced") == 9
+        assert all(response.body == b'{"ok": true}' for response, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_see_errors(self, cache):
+        """Test a failing upstream call fails every waiter and caches nothing."""
+
+        async def fetch(etag):
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("refused")
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch("k", "backend", 60.0, fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_upstream_etag(self, cache):
+        """Test expired entries are revalidated with If-None-Match."""
+        seen = []
+
+        async def first(etag):
+            response = make_response()
+            response.etag, response.upstream_etag = '"v1"', True
+            return response
+
+        async def revalidate(etag):
+            seen.append(etag)
+            return CachedResponse(status_code=304, headers=[], body=b"")
+
+        await cache.get_or_fetch("k", "backend", 0.0, first)
+        response, outcome = await cache.get_or_fetch("k", "backend", 60.0, revalidate)
+
+        assert seen == ['"v1"']
+        assert outcome == "revalidated"
+        assert response.body == b'{"ok": true}'
+        _, outcome = await cache.get_or_fetch("k", "backend", 60.0, revalidate)
+        assert outcome == "hit"
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_responses_not_stored(self, cache):
+        """Test errors and private responses are not stored."""
+
+        async def error(etag):
+            return make_response(status_code=500)
+
+        async def private(etag):
+            return make_response(headers=[("cache-control", "private")])
+
+        await cache.get_or_fetch("a", "backend", 60.0, error)
+        await cache.get_or_fetch("b", "backend", 60.0, private)
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["uncacheable"] == 2
+
+    @pytest.mark.asyncio
+    async def test_byte_bounded_lru_eviction(self):
+        """Test least-recently-used entries are evicted to stay within budget."""
+        cache = ResponseCache([], max_bytes=2500, max_entry_bytes=2500)
+
+        def fetcher(body):
+            async def fetch(etag):
+                return make_response(body=body)
+
+            return fetch
+
+        await cache.get_or_fetch("a", "backend", 60.0, fetcher(b"a" * 700))
+        await cache.get_or_fetch("b", "backend", 60.0, fetcher(b"b" * 700))
+        await cache.get_or_fetch("a", "backend", 60.0, fetcher(b"a" * 700))  # touch a
+        await cache.get_or_fetch("c", "backend", 60.0, fetcher(b"c" * 700))
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= 2500
+        assert cache.get_fresh("a") is not None
+        assert cache.get_fresh("b") is None
+
+    @pytest.mark.asyncio
+    async def test_oversized_entry_skipped(self):
+        """Test responses larger than max_entry_bytes are not cached."""
+        cache = ResponseCache([], max_bytes=10_000, max_entry_bytes=100)
+
+        async def fetch(etag):
+            return make_response(body=b"x" * 500)
+
+        await cache.get_or_fetch("k", "backend", 60.0, fetch)
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_service(self, cache):
+        """Test invalidation drops only the given service's entries."""
+
+        async def fetch(etag):
+            return make_response()
+
+        await cache.get_or_fetch("backend:1", "backend", 60.0, fetch)
+        await cache.get_or_fetch("research:1", "research", 60.0, fetch)
+
+        assert cache.invalidate_service("backend") == 1
+        assert cache.get_fresh("backend:1") is None
+        assert cache.get_fresh("research:1") is not None
+
+
+class TestGatewayCaching:
+    """Test cached routing through the gateway."""
+
+    def test_cached_route_hits_upstream_once(self, client):
+        """Test repeated GETs to a cached route are served from cache."""
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, json={"total_earned": "10"})
+
+        with mock_upstream(handler):
+            first = client.get("/api/publish/tokens/stats/u1")
+            second = client.get("/api/publish/tokens/stats/u1")
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == {"total_earned": "10"}
+        assert calls == ["http://localhost:8002/tokens/stats/u1"]
+
+    def test_if_none_match_returns_304(self, client):
+        """Test clients with a current ETag get an empty 304."""
+
+        def handler(request):
+            return httpx.Response(200, json={"graph": []})
+
+        with mock_upstream(handler):
+            etag = client.get("/api/publish/attributions/c1/graph").headers["etag"]
+            response = client.get(
+                "/api/publish/attributions/c1/graph", headers={"If-None-Match": etag}
+            )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @patch("orchestrator.main.STREAMING_PROXY", False)
+    def test_uncached_route_not_cached(self, client):
+        """Test routes without a rule always reach the upstream."""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"balance": 1})
+
+        with mock_upstream(handler):
+            client.get("/api/publish/tokens/balance/u1")
+            client.get("/api/publish/tokens/balance/u1")
+
+        assert len(calls) == 2
+
+    def test_cache_served_while_circuit_open(self, client):
+        """Test fresh cached responses are served even if the upstream is down."""
+
+        def handler(request):
+            return httpx.Response(200, json={"subjects": []})
+
+        with mock_upstream(handler):
+            client.get("/api/publish/ultra-learning/subjects/stats")
+
+        health_checker.circuit_breakers["backend"].state = CircuitState.OPEN
+        health_checker.circuit_breakers["backend"].last_failure_time = 10**12
+
+        response = client.get("/api/publish/ultra-learning/subjects/stats")
+        assert response.status_code == 200
+        assert response.headers["x-cache"] == "HIT"
+
+    @patch("orchestrator.main.STREAMING_PROXY", False)
+    def test_write_invalidates_service_cache(self, client):
+        """Test successful writes drop cached GETs for that service."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(200, json={"ok": True})
+
+        with mock_upstream(handler):
+            client.get("/api/publish/tokens/stats/u1")
+            client.post("/api/publish/tokens/transfer", json={"amount": 1})
+            client.get("/api/publish/tokens/stats/u1")
+
+        assert calls == ["GET", "POST", "GET"]
+
+    def test_cache_stats_on_status_endpoint(self, client):
+        """Test cache counters are exposed on /status."""
+        response = client.get("/status")
+        assert response.status_code == 200
+        cache_stats = response.json()["cache"]
+        for key in ["hits", "misses", "evictions", "bytes", "hit_ratio"]:
+            assert key in cache_stats
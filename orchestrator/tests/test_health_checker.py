@@ -14,6 +14,7 @@ from orchestrator.monitoring.health_checker import (
     HealthChecker,
     ServiceHealthStatus,
     ServiceStatus,
+    UptimeRing,
 )
 
 
@@ -100,6 +101,41 @@ class TestCircuitBreaker:
         assert cb.state == CircuitState.OPEN
 
 
+class TestUptimeRing:
+    """Test ring-buffer uptime counter."""
+
+    def test_empty_ring_full_uptime(self):
+        """Test an empty history reports 100% uptime."""
+        ring = UptimeRing(5)
+        assert len(ring) == 0
+        assert ring.uptime() == 100.0
+
+    def test_uptime_percentage(self):
+        """Test uptime is the success ratio of recorded checks."""
+        ring = UptimeRing(10)
+        for success in [True, False, True, True]:
+            ring.record(success)
+        assert ring.uptime() == 75.0
+
+    def test_evicts_oldest(self):
+        """Test the oldest outcome is dropped once the ring is full."""
+        ring = UptimeRing(3)
+        for success in [False, True, True, True]:
+            ring.record(success)
+        assert len(ring) == 3
+        assert list(ring) == [True, True, True]
+        assert ring.uptime() == 100.0
+
+    def test_resize_keeps_recent(self):
+        """Test resizing keeps the most recent outcomes."""
+        ring = UptimeRing(5)
+        for success in [True, True, False, False, True]:
+            ring.record(success)
+        ring.resize(2)
+        assert list(ring) == [False, True]
+        assert ring.uptime() == 50.0
+
+
 class TestServiceHealthStatus:
     """Test service health status data structure."""
 
@@ -265,7 +301,8 @@ class TestHealthChecker:
     async def test_uptime_calculation(self, health_checker):
         """Test uptime percentage calculation."""
         # Simulate some successes and failures
-        health_checker.health_history["writer"] = [True, True, True, False, True]
+        for check in [True, True, True, False, True]:
+            health_checker._update_history("writer", check)
         uptime = health_checker._calculate_uptime("writer")
         assert uptime == 80.0  # 4 out of 5 successful
 
@@ -369,3 +406,55 @@ class TestHealthChecker:
                 status = health_checker.service_status[service_name]
                 assert status.last_check is not None
                 assert len(health_checker.health_history[service_name]) > 0
+
+    @pytest.mark.asyncio
+    async def test_check_all_services_deadline(self, health_checker):
+        """Test probes that miss the round deadline are marked unhealthy."""
+        health_checker.deadline = 0.05
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(side_effect=hang)
+
+            start = time.monotonic()
+            await health_checker.check_all_services()
+            assert time.monotonic() - start < 1.0
+
+        for status in health_checker.service_status.values():
+            assert status.status == ServiceStatus.UNHEALTHY
+            assert "deadline" in status.error.lower()
+            assert status.last_check is not None
+
+    @pytest.mark.asyncio
+    async def test_snapshot_published_after_checks(self, health_checker):
+        """Test each round of checks publishes a /health snapshot."""
+        assert health_checker.get_snapshot() is None
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "ok"}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                return_value=mock_response
+            )
+            await health_checker.check_all_services()
+
+        snapshot = health_checker.get_snapshot()
+        assert snapshot["overall"] == "healthy"
+        assert snapshot["cached"] is True
+        assert snapshot["services"]["writer"]["details"] == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_not_served(self, health_checker):
+        """Test snapshots older than max_age are ignored."""
+        health_checker._publish_snapshot()
+        assert health_checker.get_snapshot(max_age=60) is not None
+
+        health_checker._snapshot_time -= 120
+        assert health_checker.get_snapshot(max_age=60) is None
+
+        health_checker.clear_snapshot()
+        assert health_checker.get_snapshot() is None
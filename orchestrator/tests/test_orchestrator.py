@@ -1,6 +1,7 @@
 """Tests for Orchestrator API Gateway."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -11,11 +12,15 @@ from orchestrator.main import (
     MAX_RETRIES,
     REQUEST_TIMEOUT,
     SERVICES,
+    aggregate_health,
     app,
     check_service_health,
     health_checker,
+    probe_all_services,
     proxy_request_with_retry,
+    retry_budget,
 )
+from orchestrator.monitoring.health_checker import CircuitBreaker, CircuitState
 
 
 @pytest.fixture
@@ -38,8 +43,9 @@ class TestRootEndpoint:
         assert "docs" in data
 
 
+@patch("orchestrator.main.STREAMING_PROXY", False)
 class TestRoutingToResearch:
-    """Tests for routing requests to Research module."""
+    """Tests for routing requests to Research module (buffered mode)."""
 
     @patch("httpx.AsyncClient")
     def test_route_to_research_get(self, mock_client_class, client):
@@ -122,8 +128,9 @@ class TestRoutingToResearch:
         assert "unavailable" in response.json()["detail"].lower()
 
 
+@patch("orchestrator.main.STREAMING_PROXY", False)
 class TestRoutingToBackend:
-    """Tests for routing requests to Backend module."""
+    """Tests for routing requests to Backend module (buffered mode)."""
 
     @patch("httpx.AsyncClient")
     def test_route_to_backend_get(self, mock_client_class, client):
@@ -257,6 +264,55 @@ class TestHealthAggregation:
         assert "error" in data["services"]["research"]
 
 
+class TestCachedHealth:
+    """Tests for snapshot-backed /health."""
+
+    @patch("orchestrator.main.check_service_health")
+    def test_health_served_from_snapshot(self, mock_check, client):
+        """Test /health uses the monitor snapshot without probing."""
+        health_checker._publish_snapshot()
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cached"] is True
+        assert set(data["services"]) == {"writer", "research", "backend"}
+        assert mock_check.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_live_probes_coalesced(self):
+        """Test concurrent /health calls without a snapshot share one probe."""
+        calls = []
+
+        async def slow_check(name, url):
+            calls.append(name)
+            await asyncio.sleep(0.05)
+            return {"status": "healthy", "details": {}, "url": url}
+
+        with patch("orchestrator.main.check_service_health", side_effect=slow_check):
+            results = await asyncio.gather(*(aggregate_health() for _ in range(10)))
+
+        assert len(calls) == len(SERVICES)
+        assert all(r["overall"] == "healthy" for r in results)
+
+    @pytest.mark.asyncio
+    @patch("orchestrator.main.HEALTH_PROBE_DEADLINE", 0.05)
+    async def test_live_probe_deadline(self):
+        """Test services that miss the probe deadline are reported unhealthy."""
+        async def check(name, url):
+            if name == "research":
+                await asyncio.sleep(10)
+            return {"status": "healthy", "details": {}, "url": url}
+
+        with patch("orchestrator.main.check_service_health", side_effect=check):
+            result = await probe_all_services()
+
+        assert result["overall"] == "degraded"
+        assert "deadline" in result["services"]["research"]["error"].lower()
+        assert result["services"]["writer"]["status"] == "healthy"
+
+
 class TestCheckServiceHealth:
     """Tests for individual service health checks."""
 
@@ -394,6 +450,169 @@ class TestProxyRequestWithRetry:
         assert mock_sleep.call_count == MAX_RETRIES - 1
 
 
+@patch("orchestrator.main.STREAMING_PROXY", False)
+class TestUpstreamPoolIntegration:
+    """Tests for pooled upstream clients."""
+
+    @patch("httpx.AsyncClient")
+    def test_client_reused_across_requests(self, mock_client_class, client):
+        """Test that repeated requests share one client per upstream."""
+        mock_response = Mock()
+        mock_response.content = b'{"result": "success"}'
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+        mock_client_class.return_value = mock_client
+
+        for _ in range(3):
+            assert client.get("/api/enrich").status_code == 200
+
+        assert mock_client_class.call_count == 1
+        assert mock_client.request.call_count == 3
+
+    def test_pool_status_endpoint(self, client):
+        """Test that /status/pool reports every upstream."""
+        response = client.get("/status/pool")
+        assert response.status_code == 200
+        data = response.json()
+        for name in SERVICES:
+            assert name in data
+            assert "saturation" in data[name]
+            assert "in_flight" in data[name]
+
+
+class TestCircuitBreakerRouting:
+    """Tests for circuit-breaker-aware proxying and retry policy."""
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_open_circuit_fails_fast(self, mock_client_class):
+        """Test no upstream call is made while the circuit is open."""
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        breaker = health_checker.circuit_breakers["writer"]
+        breaker.state = CircuitState.OPEN
+        breaker.last_failure_time = time.time()
+
+        with pytest.raises(Exception) as exc_info:
+            await proxy_request_with_retry("http://localhost:8000/test")
+
+        assert exc_info.value.status_code == 503
+        assert "circuit breaker" in exc_info.value.detail
+        assert mock_client.request.call_count == 0
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_failures_open_circuit(self, mock_sleep, mock_client_class):
+        """Test proxy failures are fed into the breaker and stop retries."""
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        mock_client_class.return_value = mock_client
+        health_checker.circuit_breakers["writer"] = CircuitBreaker(failure_threshold=2)
+
+        with pytest.raises(Exception):
+            await proxy_request_with_retry("http://localhost:8000/test")
+
+        # Circuit opens after the second failure, so the third attempt is skipped
+        assert mock_client.request.call_count == 2
+        assert health_checker.circuit_breakers["writer"].state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_success_recorded(self, mock_client_class):
+        """Test successful requests reset the breaker's failure count."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"ok": True}
+        mock_response.raise_for_status = Mock()
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+        mock_client_class.return_value = mock_client
+        health_checker.circuit_breakers["writer"].failure_count = 2
+
+        await proxy_request_with_retry("http://localhost:8000/test")
+
+        assert health_checker.circuit_breakers["writer"].failure_count == 0
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_non_idempotent_not_retried(self, mock_sleep, mock_client_class):
+        """Test POST requests are attempted only once."""
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+        mock_client_class.return_value = mock_client
+
+        with pytest.raises(Exception):
+            await proxy_request_with_retry("http://localhost:8000/test", method="POST")
+
+        assert mock_client.request.call_count == 1
+        assert mock_sleep.call_count == 0
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_client_error_not_retried(self, mock_sleep, mock_client_class):
+        """Test 4xx responses pass through without retry or breaker failure."""
+        request = httpx.Request("GET", "http://localhost:8000/test")
+        error_response = httpx.Response(404, request=request)
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=error_response)
+        mock_client_class.return_value = mock_client
+
+        with pytest.raises(Exception) as exc_info:
+            await proxy_request_with_retry("http://localhost:8000/test")
+
+        assert exc_info.value.status_code == 404
+        assert mock_client.request.call_count == 1
+        assert health_checker.circuit_breakers["writer"].failure_count == 0
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_budget_limits_retries(self, mock_sleep, mock_client_class):
+        """Test retries stop once the gateway-wide budget is exhausted."""
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+        mock_client_class.return_value = mock_client
+        health_checker.circuit_breakers["writer"] = CircuitBreaker(failure_threshold=100)
+
+        with patch.object(retry_budget, "try_retry", return_value=False):
+            with pytest.raises(Exception):
+                await proxy_request_with_retry("http://localhost:8000/test")
+
+        assert mock_client.request.call_count == 1
+        assert mock_sleep.call_count == 0
+
+    @patch("orchestrator.main.STREAMING_PROXY", False)
+    @patch("httpx.AsyncClient")
+    def test_route_fails_fast_when_circuit_open(self, mock_client_class, client):
+        """Test gateway routes return 503 without calling an open upstream."""
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        breaker = health_checker.circuit_breakers["research"]
+        breaker.state = CircuitState.OPEN
+        breaker.last_failure_time = time.time()
+
+        response = client.get("/api/enrich")
+
+        assert response.status_code == 503
+        assert "circuit breaker" in response.json()["detail"]
+        assert "retry-after" in response.headers
+        assert mock_client.request.call_count == 0
+
+    def test_gateway_status_endpoint(self, client):
+        """Test /status reports pools, circuits and retry budget."""
+        response = client.get("/status")
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["circuits"]) == {"writer", "research", "backend"}
+        assert "available" in data["retry_budget"]
+        assert "research" in data["pool"]
+
+
 class TestConfiguration:
     """Tests for configuration values."""
 
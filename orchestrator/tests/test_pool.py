@@ -0,0 +1,157 @@
+"""Tests for pooled upstream HTTP clients."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from orchestrator.proxy.pool import UpstreamConfig, UpstreamPool
+
+SERVICES = {
+    "research": "http://localhost:8001",
+    "backend": "http://localhost:8002",
+}
+
+
+class TestUpstreamConfig:
+    """Test pool configuration helpers."""
+
+    def test_limits(self):
+        """Test limits are built from configuration."""
+        config = UpstreamConfig(
+            max_connections=50, max_keepalive_connections=10, keepalive_expiry=15.0
+        )
+        limits = config.limits()
+        assert limits.max_connections == 50
+        assert limits.max_keepalive_connections == 10
+        assert limits.keepalive_expiry == 15.0
+
+    def test_timeouts(self):
+        """Test timeouts are built from configuration."""
+        timeouts = UpstreamConfig(timeout=12.0, connect_timeout=2.0).timeouts()
+        assert timeouts.read == 12.0
+        assert timeouts.connect == 2.0
+
+
+class TestUpstreamPool:
+    """Test upstream client registry."""
+
+    @pytest.mark.asyncio
+    async def test_start_creates_one_client_per_upstream(self):
+        """Test start() opens a client for every upstream."""
+        pool = UpstreamPool(SERVICES)
+        await pool.start()
+        try:
+            assert pool.get_client("research") is pool.get_client("research")
+            assert pool.get_client("research") is not pool.get_client("backend")
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_per_upstream_config(self):
+        """Test per-upstream configuration overrides defaults."""
+        pool = UpstreamPool(SERVICES, {"research": UpstreamConfig(max_connections=7)})
+        assert pool.configs["research"].max_connections == 7
+        assert pool.configs["backend"].max_connections == UpstreamConfig().max_connections
+
+    @pytest.mark.asyncio
+    @patch("orchestrator.proxy.pool._http2_available", return_value=False)
+    async def test_http2_falls_back_without_h2(self, _mock_h2):
+        """Test HTTP/2 degrades to HTTP/1.1 when h2 is not installed."""
+        pool = UpstreamPool(SERVICES, default_config=UpstreamConfig(http2=True))
+        try:
+            assert isinstance(pool.get_client("research"), httpx.AsyncClient)
+            assert pool.get_stats()["research"]["http2"] is False
+        finally:
+            await pool.close()
+
+    def test_resolve_known_upstream(self):
+        """Test URLs resolve to the upstream serving their origin."""
+        pool = UpstreamPool(SERVICES)
+        assert pool.resolve("http://localhost:8001/api/enrich?q=1") == "research"
+        assert pool.resolve("http://localhost:8002/publish") == "backend"
+
+    def test_resolve_unknown_origin(self):
+        """Test unknown origins get their own pool entry."""
+        pool = UpstreamPool(SERVICES)
+        name = pool.resolve("http://example.com/test")
+        assert name == "http://example.com:80"
+        assert name in pool.configs
+
+    @pytest.mark.asyncio
+    async def test_close_releases_clients(self):
+        """Test close() closes and forgets clients."""
+        pool = UpstreamPool(SERVICES)
+        client = pool.get_client("research")
+        await pool.close()
+        assert client.is_closed
+        assert pool.get_client("research") is not client
+        await pool.close()
+
+
+class TestPoolStats:
+    """Test pool saturation metrics."""
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_request_accounting(self, mock_client_class):
+        """Test requests are counted and in-flight returns to zero."""
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=Mock(status_code=200))
+        mock_client_class.return_value = mock_client
+
+        pool = UpstreamPool(SERVICES)
+        await pool.request("research", "GET", "http://localhost:8001/")
+        await pool.request("research", "GET", "http://localhost:8001/")
+
+        stats = pool.get_stats()["research"]
+        assert stats["total_requests"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 1
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_saturation_tracking(self, mock_client_class):
+        """Test concurrent requests beyond max_connections are flagged."""
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return Mock(status_code=200)
+
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=slow_request)
+        mock_client_class.return_value = mock_client
+
+        pool = UpstreamPool(SERVICES, default_config=UpstreamConfig(max_connections=2))
+        tasks = [
+            asyncio.create_task(pool.request("research", "GET", "http://localhost:8001/"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        stats = pool.get_stats()["research"]
+        assert stats["in_flight"] == 3
+        assert stats["saturation"] == 1.5
+        assert stats["saturated_requests"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert pool.get_stats()["research"]["peak_saturation"] == 1.5
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_transport_errors_counted(self, mock_client_class):
+        """Test transport errors are recorded."""
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        mock_client_class.return_value = mock_client
+
+        pool = UpstreamPool(SERVICES)
+        with pytest.raises(httpx.ConnectError):
+            await pool.request("research", "GET", "http://localhost:8001/")
+
+        stats = pool.get_stats()["research"]
+        assert stats["total_errors"] == 1
+        assert stats["in_flight"] == 0
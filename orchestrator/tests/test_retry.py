@@ -0,0 +1,84 @@
+"""Tests for proxy retry policy."""
+
+from unittest.mock import patch
+
+from orchestrator.proxy.retry import RetryBudget, backoff_delay, is_idempotent
+
+
+class TestIdempotency:
+    """Test which methods may be retried."""
+
+    def test_idempotent_methods(self):
+        """Test safe and idempotent methods are retryable."""
+        for method in ["GET", "head", "OPTIONS", "PUT", "DELETE"]:
+            assert is_idempotent(method) is True
+
+    def test_non_idempotent_methods(self):
+        """Test POST and PATCH are not retryable."""
+        assert is_idempotent("POST") is False
+        assert is_idempotent("PATCH") is False
+
+
+class TestBackoffDelay:
+    """Test jittered exponential backoff."""
+
+    def test_delay_within_exponential_bound(self):
+        """Test delays never exceed base * 2**attempt."""
+        for attempt in range(5):
+            for _ in range(50):
+                assert 0 <= backoff_delay(attempt, 1.0, 100.0) <= 2**attempt
+
+    def test_delay_capped(self):
+        """Test delays never exceed the cap."""
+        for _ in range(50):
+            assert backoff_delay(20, 1.0, 5.0) <= 5.0
+
+    @patch("orchestrator.proxy.retry.random.uniform", side_effect=lambda a, b: b)
+    def test_delay_grows_exponentially(self, _mock_uniform):
+        """Test the upper bound doubles per attempt."""
+        assert [backoff_delay(i, 0.5, 100.0) for i in range(4)] == [0.5, 1.0, 2.0, 4.0]
+
+
+class TestRetryBudget:
+    """Test gateway-wide retry budget."""
+
+    def test_min_retries_floor(self):
+        """Test the floor allows retries without traffic."""
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.5, window=10)
+        assert sum(budget.try_retry() for _ in range(10)) == 5
+        assert budget.rejected_retries == 5
+
+    def test_ratio_of_requests(self):
+        """Test retries scale with request volume."""
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0.0, window=10)
+        for _ in range(100):
+            budget.record_request()
+        assert sum(budget.try_retry() for _ in range(20)) == 10
+
+    def test_window_expiry(self):
+        """Test counts expire once outside the window."""
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, window=10)
+        with patch("orchestrator.proxy.retry.time.monotonic", return_value=1000.0):
+            assert budget.try_retry() is True
+            assert budget.try_retry() is False
+        with patch("orchestrator.proxy.retry.time.monotonic", return_value=1011.0):
+            assert budget.try_retry() is True
+
+    def test_stats(self):
+        """Test stats report window and lifetime counts."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0.0, window=10)
+        budget.record_request()
+        budget.record_request()
+        budget.try_retry()
+        stats = budget.get_stats()
+        assert stats["window_requests"] == 2
+        assert stats["window_retries"] == 1
+        assert stats["available"] == 0
+        assert stats["total_retries"] == 1
+
+    def test_reset(self):
+        """Test reset clears window counts."""
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, window=10)
+        budget.try_retry()
+        budget.reset()
+        assert budget.try_retry() is True
@@ -0,0 +1,150 @@
+"""Tests for streaming pass-through proxy mode."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator.main import app, upstream_pool
+from orchestrator.proxy.streaming import filter_headers
+
+RealAsyncClient = httpx.AsyncClient
+
+
+async def chunked(data: bytes, size: int = 1024):
+    """Yield a payload in chunks, as a streaming upstream would."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def mock_upstream(handler):
+    """Patch pooled clients to use an in-memory transport."""
+    return patch(
+        "httpx.AsyncClient",
+        side_effect=lambda **kwargs: RealAsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(app)
+
+
+class TestFilterHeaders:
+    """Test hop-by-hop header filtering."""
+
+    def test_drops_hop_by_hop_headers(self):
+        """Test connection-scoped headers are removed."""
+        headers = [
+            ("Connection", "keep-alive"),
+            ("Transfer-Encoding", "chunked"),
+            ("Content-Type", "text/plain"),
+        ]
+        assert filter_headers(headers) == [("Content-Type", "text/plain")]
+
+    def test_keeps_repeated_headers(self):
+        """Test repeated headers are preserved."""
+        headers = [("set-cookie", "a=1"), ("set-cookie", "b=2")]
+        assert filter_headers(headers) == headers
+
+    def test_extra_exclusions(self):
+        """Test additional headers can be excluded."""
+        assert filter_headers([("X-Debug", "1")], exclude=["x-debug"]) == []
+
+
+class TestStreamingProxy:
+    """Test streaming pass-through via the gateway routes."""
+
+    def test_non_json_body_passes_through(self, client):
+        """Test binary upstream bodies are relayed byte for byte."""
+        payload = bytes(range(256)) * 64
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=chunked(payload),
+                headers={"content-type": "application/octet-stream"},
+            )
+
+        with mock_upstream(handler):
+            response = client.get("/api/enrich")
+
+        assert response.status_code == 200
+        assert response.content == payload
+        assert response.headers["content-type"] == "application/octet-stream"
+
+    def test_status_and_headers_preserved(self, client):
+        """Test upstream status codes and repeated headers are kept."""
+
+        def handler(request):
+            return httpx.Response(
+                207,
+                content=chunked(b"partial"),
+                headers=[("set-cookie", "a=1"), ("set-cookie", "b=2"), ("x-upstream", "backend")],
+            )
+
+        with mock_upstream(handler):
+            response = client.get("/api/publish")
+
+        assert response.status_code == 207
+        assert response.text == "partial"
+        assert response.headers["x-upstream"] == "backend"
+        assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+
+    def test_request_body_streamed_upstream(self, client):
+        """Test request bodies and query strings reach the upstream intact."""
+        seen = {}
+
+        def handler(request):
+            seen["body"] = request.content
+            seen["url"] = str(request.url)
+            seen["method"] = request.method
+            return httpx.Response(201, content=chunked(b'{"created": true}'))
+
+        with mock_upstream(handler):
+            response = client.post("/api/publish?draft=1", content=b"raw,csv,body")
+
+        assert response.status_code == 201
+        assert response.json() == {"created": True}
+        assert seen["body"] == b"raw,csv,body"
+        assert seen["method"] == "POST"
+        assert seen["url"] == "http://localhost:8002?draft=1"
+
+    def test_upstream_timeout(self, client):
+        """Test upstream timeouts map to 504."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("Timeout", request=request)
+
+        with mock_upstream(handler):
+            response = client.get("/api/enrich")
+
+        assert response.status_code == 504
+        assert "timeout" in response.json()["detail"].lower()
+
+    def test_upstream_unavailable(self, client):
+        """Test connection errors map to 503."""
+
+        def handler(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        with mock_upstream(handler):
+            response = client.get("/api/enrich")
+
+        assert response.status_code == 503
+        assert "unavailable" in response.json()["detail"].lower()
+
+    def test_pool_slot_released_after_stream(self, client):
+        """Test the pool in-flight count returns to zero after relaying."""
+
+        def handler(request):
+            return httpx.Response(200, content=chunked(b"x" * 10_000))
+
+        with mock_upstream(handler):
+            client.get("/api/enrich")
+
+        stats = upstream_pool.get_stats()["research"]
+        assert stats["in_flight"] == 0
+        assert stats["total_requests"] >= 1
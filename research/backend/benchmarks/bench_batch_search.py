@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark VectorSearch.batch_find_similar against one query at a time.
+
+Needs the research database (schema from ``db/schema.sql``, pgvector
+installed) configured through the usual ``DATABASE_URL`` / ``DB_*``
+variables. The first run seeds ``--rows`` random 1536-d contents under a
+dedicated benchmark source, generated server-side. Later runs reuse them
+when ``--keep`` was passed. Query vectors are stored rows, so every query
+has at least one match above the threshold.
+
+For each ``--queries`` count it reports the median wall time of:
+
+- sequential: awaiting ``find_similar`` once per query (the previous
+  ``batch_find_similar``)
+- batch: ``batch_find_similar`` (``unnest`` + ``LATERAL``, one statement
+  per ``QUERIES_PER_STATEMENT`` queries)
+
+Usage:
+    python research/backend/benchmarks/bench_batch_search.py
+    python research/backend/benchmarks/bench_batch_search.py --rows 100000 --queries 1 16 128 --keep
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+# Add research backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db.connection import DatabaseManager  # noqa: E402
+from db.search import VectorSearch  # noqa: E402
+
+BENCHMARK_URL = "benchmark://batch-search"
+DIMENSIONS = 1536
+SEED_BATCH = 10_000
+
+
+async def seed(db: DatabaseManager, rows: int, reindex: bool) -> None:
+    """Create the benchmark source and its contents unless already present"""
+    source_id = await db.fetchval(
+        "SELECT id FROM sources WHERE url = $1", BENCHMARK_URL
+    )
+    if source_id is not None:
+        existing = await db.fetchval(
+            "SELECT count(*) FROM contents WHERE source_id = $1", source_id
+        )
+        if existing == rows:
+            print(f"Reusing {existing:,} benchmark rows")
+            return
+        await db.execute("DELETE FROM sources WHERE id = $1", source_id)
+
+    source_id = await db.fetchval(
+        "INSERT INTO sources (platform, url, title) VALUES ('web', $1, 'Batch search benchmark') "
+        "RETURNING id",
+        BENCHMARK_URL,
+    )
+
+    start = time.perf_counter()
+    for first in range(1, rows + 1, SEED_BATCH):
+        last = min(first + SEED_BATCH - 1, rows)
+        # The correlated WHERE makes Postgres draw a fresh vector per row
+        await db.execute(
+            f"""
+            INSERT INTO contents (source_id, content_type, text_content, embedding)
+            SELECT $1, 'text', 'benchmark row ' || i,
+                   ARRAY(SELECT random() - 0.5 FROM generate_series(1, {DIMENSIONS})
+                         WHERE i > 0)::vector
+            FROM generate_series($2::int, $3::int) AS i
+            """,
+            source_id,
+            first,
+            last,
+        )
+        print(f"  seeded {last:,}/{rows:,} rows", end="\r", flush=True)
+
+    if reindex:
+        await db.execute("REINDEX INDEX idx_contents_embedding")
+    await db.execute("ANALYZE contents")
+    print(f"Seeded {rows:,} rows in {time.perf_counter() - start:.1f}s{' ' * 20}")
+
+
+async def load_queries(db: DatabaseManager, count: int) -> list:
+    """Use stored benchmark vectors as queries"""
+    rows = await db.fetch(
+        """
+        SELECT c.embedding::text AS embedding
+        FROM contents c JOIN sources s ON c.source_id = s.id
+        WHERE s.url = $1
+        ORDER BY random()
+        LIMIT $2
+        """,
+        BENCHMARK_URL,
+        count,
+    )
+    return [json.loads(row["embedding"]) for row in rows]
+
+
+async def sequential(
+    search: VectorSearch, embeddings: list, threshold: float, count: int
+):
+    return [
+        await search.find_similar(
+            embedding, match_threshold=threshold, match_count=count
+        )
+        for embedding in embeddings
+    ]
+
+
+async def timed(coro_factory, repeat: int) -> tuple:
+    """Median seconds over ``repeat`` runs, plus the last run's results"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = await coro_factory()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), results
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    db = DatabaseManager()
+    await db.connect(min_size=2, max_size=args.pool_size)
+    search = VectorSearch(db)
+    try:
+        await seed(db, args.rows, args.reindex)
+        queries = await load_queries(db, max(args.queries))
+
+        print(
+            f"\n{args.rows:,} rows, threshold {args.threshold}, top {args.count}, "
+            f"median of {args.repeat} runs, {VectorSearch.QUERIES_PER_STATEMENT} "
+            f"queries per statement\n"
+        )
+        print(
+            f"{'queries':>8} {'sequential s':>13} {'batch s':>9} "
+            f"{'batch q/s':>10} {'speedup':>8} {'same results':>13}"
+        )
+
+        for n in args.queries:
+            embeddings = queries[:n]
+            seq_time, seq_results = await timed(
+                partial(sequential, search, embeddings, args.threshold, args.count),
+                args.repeat,
+            )
+            batch_time, batch_results = await timed(
+                partial(
+                    search.batch_find_similar, embeddings, args.threshold, args.count
+                ),
+                args.repeat,
+            )
+            same = [[r["content_id"] for r in rs] for rs in seq_results] == [
+                [r["content_id"] for r in rs] for rs in batch_results
+            ]
+            print(
+                f"{n:>8} {seq_time:>13.3f} {batch_time:>9.3f} {n / batch_time:>10,.1f} "
+                f"{seq_time / batch_time:>7.1f}x {str(same):>13}"
+            )
+
+        if not args.keep:
+            await db.execute("DELETE FROM sources WHERE url = $1", BENCHMARK_URL)
+    finally:
+        await db.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched vector search")
+    parser.add_argument(
+        "--rows", type=int, default=100_000, help="Contents (default: 100000)"
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        nargs="+",
+        default=[1, 16, 128],
+        help="Query batch sizes (default: 1 16 128)",
+    )
+    parser.add_argument(
+        "--count", type=int, default=10, help="Results per query (default: 10)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.0,
+        help="Similarity threshold (default: 0.0)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (default: 3)"
+    )
+    parser.add_argument(
+        "--pool-size", type=int, default=8, help="Max pool size (default: 8)"
+    )
+    parser.add_argument(
+        "--reindex", action="store_true", help="Rebuild the IVFFlat index after seeding"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the benchmark rows for the next run"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
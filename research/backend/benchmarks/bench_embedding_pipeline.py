@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Benchmark embedding throughput of EmbeddingGenerator.generate_for_contents.
+
+Starts a local stub of the OpenAI embeddings endpoint that answers every
+request after ``--api-latency-ms`` and an in-memory stand-in for the
+database that charges ``--db-latency-ms`` per round trip. It then reports
+embeddings/sec, API requests and DB round trips for:
+
+- legacy: the previous per-content loop. For each ID it runs the cache
+  check, ``generate_for_content`` and a single-content write.
+- bulk: the pipelined ``generate_for_contents`` at each ``--concurrency``
+  level.
+
+Contents are synthetic text between ``--min-words`` and ``--max-words``
+words long, so some are split into several chunks. No network access is
+needed beyond loading the tiktoken encoding. Because the stubs isolate
+batching and scheduling from real API and database behaviour, absolute
+numbers are only indicative.
+
+Usage:
+    python research/backend/benchmarks/bench_embedding_pipeline.py
+    python research/backend/benchmarks/bench_embedding_pipeline.py --contents 1000 --concurrency 1 8 16
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import struct
+import sys
+import time
+from contextlib import asynccontextmanager, nullcontext
+from pathlib import Path
+from uuid import uuid4
+
+# Add research backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from embeddings.generator import EmbeddingGenerator  # noqa: E402
+
+
+class StubEmbeddingServer:
+    """Minimal HTTP/1.1 server speaking the OpenAI ``POST /embeddings`` API"""
+
+    def __init__(self, latency: float, dim: int):
+        self.latency = latency
+        self.requests = 0
+        vector = [random.Random(0).uniform(-1, 1) for _ in range(dim)]
+        self.vector_json = json.dumps(vector)
+        self.vector_base64 = json.dumps(
+            base64.b64encode(struct.pack(f"{dim}f", *vector)).decode()
+        )
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                request = json.loads(await reader.readexactly(length))
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+
+                inputs = request["input"]
+                count = 1 if isinstance(inputs, str) else len(inputs)
+                vector = (
+                    self.vector_base64
+                    if request.get("encoding_format") == "base64"
+                    else self.vector_json
+                )
+                data = ",".join(
+                    f'{{"object":"embedding","index":{i},"embedding":{vector}}}'
+                    for i in range(count)
+                )
+                body = (
+                    f'{{"object":"list","data":[{data}],"model":"{request["model"]}",'
+                    f'"usage":{{"prompt_tokens":0,"total_tokens":0}}}}'
+                ).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class InMemoryDatabase:
+    """
+    DatabaseManager stand-in holding contents and content_chunks in dicts
+
+    Answers only the queries the embedding generator issues. Every call,
+    including a whole ``executemany``, costs one simulated round trip.
+    """
+
+    def __init__(self, texts: list, latency: float):
+        self.latency = latency
+        self.round_trips = 0
+        self.rows = {
+            uuid4(): {"text_content": text, "embedding": None} for text in texts
+        }
+        self.chunks = {}
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    async def fetchval(self, query: str, content_id):
+        await self._round_trip()
+        row = self.rows.get(content_id)
+        if "IS NOT NULL" in query:
+            return row is not None and row["embedding"] is not None
+        return row["embedding"] if row else None
+
+    async def fetchrow(self, query: str, content_id):
+        await self._round_trip()
+        row = self.rows.get(content_id)
+        return {"id": content_id, **row} if row else None
+
+    async def fetch(self, query: str, content_ids, force):
+        await self._round_trip()
+        return [
+            {
+                "id": content_id,
+                "has_embedding": row["embedding"] is not None,
+                "text_content": (
+                    row["text_content"] if force or row["embedding"] is None else None
+                ),
+            }
+            for content_id in content_ids
+            if (row := self.rows.get(content_id)) is not None
+        ]
+
+    async def execute(self, query: str, *args) -> str:
+        await self._round_trip()
+        if "DELETE FROM content_chunks" in query:
+            content_ids = set(args[0])
+            self.chunks = {
+                key: row
+                for key, row in self.chunks.items()
+                if key[0] not in content_ids
+            }
+            return "DELETE"
+        embedding, content_id = args
+        self.rows[content_id]["embedding"] = embedding
+        return "UPDATE 1"
+
+    async def executemany(self, query: str, args: list) -> None:
+        await self._round_trip()
+        if "INSERT INTO content_chunks" in query:
+            for content_id, index, text, tokens, embedding in args:
+                self.chunks[(content_id, index)] = embedding
+        elif "UPDATE contents" in query:
+            for embedding, content_id in args:
+                self.rows[content_id]["embedding"] = embedding
+
+    def transaction(self):
+        return nullcontext()
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+
+def make_texts(count: int, min_words: int, max_words: int) -> list:
+    rng = random.Random(42)
+    vocabulary = [f"word{i}" for i in range(2000)]
+    return [
+        " ".join(rng.choices(vocabulary, k=rng.randint(min_words, max_words)))
+        for _ in range(count)
+    ]
+
+
+async def run_legacy(generator: EmbeddingGenerator, content_ids: list) -> int:
+    """The previous generate_for_contents loop: one content at a time."""
+    generated = 0
+    for content_id in content_ids:
+        if await generator.cache.has_embedding(content_id):
+            continue
+        if await generator.generate_for_content(content_id):
+            generated += 1
+    return generated
+
+
+async def run(
+    args: argparse.Namespace, texts: list, mode: str, concurrency: int = 1
+) -> dict:
+    server = StubEmbeddingServer(args.api_latency_ms / 1000, args.dim)
+    base_url = await server.start()
+    db = InMemoryDatabase(texts, args.db_latency_ms / 1000)
+    generator = EmbeddingGenerator(
+        api_key="stub", base_url=base_url, max_concurrency=concurrency
+    )
+    await generator.initialize(db)
+    content_ids = list(db.rows)
+
+    start = time.perf_counter()
+    if mode == "legacy":
+        generated = await run_legacy(generator, content_ids)
+    else:
+        generated = (await generator.generate_for_contents(content_ids))["generated"]
+    elapsed = time.perf_counter() - start
+
+    await generator.client.close()
+    await server.stop()
+    assert generated == len(texts), generated
+    return {
+        "generated": generated,
+        "seconds": elapsed,
+        "rate": generated / elapsed,
+        "requests": server.requests,
+        "round_trips": db.round_trips,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the embedding pipeline")
+    parser.add_argument(
+        "--contents", type=int, default=200, help="Contents (default: 200)"
+    )
+    parser.add_argument(
+        "--min-words", type=int, default=50, help="Min words (default: 50)"
+    )
+    parser.add_argument(
+        "--max-words", type=int, default=1500, help="Max words (default: 1500)"
+    )
+    parser.add_argument(
+        "--dim", type=int, default=1536, help="Embedding size (default: 1536)"
+    )
+    parser.add_argument(
+        "--api-latency-ms",
+        type=float,
+        default=100,
+        help="Stub API latency (default: 100)",
+    )
+    parser.add_argument(
+        "--db-latency-ms",
+        type=float,
+        default=2,
+        help="DB round-trip latency (default: 2)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 8],
+        help="Bulk-mode concurrency levels (default: 1 4 8)",
+    )
+    parser.add_argument("--skip-legacy", action="store_true", help="Only run bulk mode")
+    args = parser.parse_args()
+
+    texts = make_texts(args.contents, args.min_words, args.max_words)
+    print(
+        f"{args.contents} contents of {args.min_words}-{args.max_words} words, "
+        f"{args.api_latency_ms:.0f} ms API latency, {args.db_latency_ms:.0f} ms DB latency\n"
+    )
+    print(
+        f"{'mode':>10} {'embedded':>9} {'seconds':>8} {'emb/s':>8} "
+        f"{'requests':>9} {'db trips':>9} {'speedup':>8}"
+    )
+
+    runs = [] if args.skip_legacy else [("legacy", 1)]
+    runs += [("bulk", concurrency) for concurrency in args.concurrency]
+    baseline = None
+    for mode, concurrency in runs:
+        result = asyncio.run(run(args, texts, mode, concurrency))
+        baseline = baseline or result["rate"]
+        label = mode if mode == "legacy" else f"bulk x{concurrency}"
+        print(
+            f"{label:>10} {result['generated']:>9,} {result['seconds']:>8.2f} "
+            f"{result['rate']:>8,.1f} {result['requests']:>9,} {result['round_trips']:>9,} "
+            f"{result['rate'] / baseline:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ Provides Create, Read, Update, Delete operations for:
 
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4
 
 from .connection import DatabaseManager
@@ -264,6 +264,62 @@ class ContentCRUD:
 
         return success
 
+    async def update_embeddings(
+        self,
+        embeddings: List[Tuple[UUID, List[float]]],
+        chunks: Optional[List[Tuple[UUID, int, str, int, List[float]]]] = None
+    ) -> int:
+        """
+        Update many content embeddings in one round trip
+
+        Uses ``executemany`` on a single connection inside one transaction,
+        so the writes are pipelined rather than awaited one at a time.
+
+        Args:
+            embeddings: (content_id, embedding) pairs
+            chunks: (content_id, chunk_index, text, token_count, embedding)
+                rows; if given, replace these contents' rows in content_chunks
+
+        Returns:
+            Number of embeddings written
+        """
+        if not embeddings:
+            return 0
+
+        query = """
+            UPDATE contents
+            SET embedding = $1::vector
+            WHERE id = $2
+        """
+        args = [
+            (f"[{','.join(map(str, embedding))}]", content_id)
+            for content_id, embedding in embeddings
+        ]
+
+        async with self.db.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(query, args)
+
+                if chunks is not None:
+                    await conn.execute(
+                        "DELETE FROM content_chunks WHERE content_id = ANY($1::uuid[])",
+                        [content_id for content_id, _ in embeddings]
+                    )
+                    await conn.executemany(
+                        """
+                        INSERT INTO content_chunks
+                            (content_id, chunk_index, text_content, token_count, embedding)
+                        VALUES ($1, $2, $3, $4, $5::vector)
+                        """,
+                        [
+                            (content_id, index, text, tokens, f"[{','.join(map(str, embedding))}]")
+                            for content_id, index, text, tokens, embedding in chunks
+                        ]
+                    )
+
+        logger.info(f"Updated {len(args)} embeddings")
+        return len(args)
+
     async def delete(self, content_id: UUID) -> bool:
         """Delete content"""
         query = "DELETE FROM contents WHERE id = $1"
@@ -0,0 +1,19 @@
+-- Migration: Add per-chunk embeddings
+-- Date: 2026-10-16
+-- Description: content_chunks table for passage-level search, written by
+-- EmbeddingGenerator(store_chunks=True). Additive: safe on databases created
+-- from an older schema.sql, which cannot be re-run without dropping data.
+
+CREATE TABLE IF NOT EXISTS content_chunks (
+    content_id UUID NOT NULL REFERENCES contents(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,  -- Position within the content
+    text_content TEXT NOT NULL,
+    token_count INTEGER NOT NULL,
+    embedding vector(1536) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_id, chunk_index)
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_chunks_embedding ON content_chunks
+USING ivfflat (embedding vector_cosine_ops)
+WITH (lists = 100);
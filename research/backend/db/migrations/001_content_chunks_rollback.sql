@@ -0,0 +1,4 @@
+-- Rollback: Remove per-chunk embeddings
+
+DROP INDEX IF EXISTS idx_content_chunks_embedding;
+DROP TABLE IF EXISTS content_chunks;
@@ -0,0 +1,14 @@
+-- Migration: Add embedding cache
+-- Date: 2026-10-16
+-- Description: embedding_cache table, the persistent tier of TextEmbeddingCache
+-- once attached to a database. Additive: safe on databases created from an
+-- older schema.sql, which cannot be re-run without dropping data.
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model VARCHAR(100) NOT NULL,
+    text_hash CHAR(64) NOT NULL,  -- SHA-256 of NFKC-normalized, whitespace-collapsed text
+    dimensions INTEGER NOT NULL,
+    embedding vector NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (model, text_hash)
+);
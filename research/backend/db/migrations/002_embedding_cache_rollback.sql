@@ -0,0 +1,3 @@
+-- Rollback: Remove embedding cache
+
+DROP TABLE IF EXISTS embedding_cache;
@@ -11,6 +11,8 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Drop existing tables (for fresh setup)
 -- ============================================================================
 
+DROP TABLE IF EXISTS embedding_cache CASCADE;
+DROP TABLE IF EXISTS content_chunks CASCADE;
 DROP TABLE IF EXISTS scrape_jobs CASCADE;
 DROP TABLE IF EXISTS contents CASCADE;
 DROP TABLE IF EXISTS sources CASCADE;
@@ -47,6 +49,17 @@ CREATE TABLE contents (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Content chunks: per-chunk embeddings for passage-level retrieval
+CREATE TABLE content_chunks (
+    content_id UUID NOT NULL REFERENCES contents(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,  -- Position within the content
+    text_content TEXT NOT NULL,
+    token_count INTEGER NOT NULL,
+    embedding vector(1536) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_id, chunk_index)
+);
+
 -- Scrape Jobs: Async job tracking
 CREATE TABLE scrape_jobs (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -64,6 +77,16 @@ CREATE TABLE scrape_jobs (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Embedding cache: (model, normalized text hash) -> vector, so identical text is embedded once
+CREATE TABLE embedding_cache (
+    model VARCHAR(100) NOT NULL,
+    text_hash CHAR(64) NOT NULL,  -- SHA-256 of NFKC-normalized, whitespace-collapsed text
+    dimensions INTEGER NOT NULL,
+    embedding vector NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (model, text_hash)
+);
+
 -- ============================================================================
 -- Indexes for Performance
 -- ============================================================================
@@ -87,6 +110,10 @@ CREATE INDEX idx_contents_embedding ON contents
 USING ivfflat (embedding vector_cosine_ops)
 WITH (lists = 100);
 
+CREATE INDEX idx_content_chunks_embedding ON content_chunks
+USING ivfflat (embedding vector_cosine_ops)
+WITH (lists = 100);
+
 -- Job indexes
 CREATE INDEX idx_jobs_status ON scrape_jobs(status);
 CREATE INDEX idx_jobs_created_at ON scrape_jobs(created_at DESC);
@@ -5,6 +5,7 @@ Provides semantic search capabilities for content enrichment.
 Uses cosine similarity with OpenAI ada-002 embeddings (1536 dimensions).
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from uuid import UUID
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 class VectorSearch:
     """Vector similarity search operations"""
 
+    # Query vectors sent in one batch_find_similar statement
+    QUERIES_PER_STATEMENT = 64
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
 
@@ -181,6 +185,60 @@ class VectorSearch:
 
         return results
 
+    async def find_similar_passages(
+        self,
+        query_embedding: List[float],
+        match_threshold: float = 0.7,
+        match_count: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the chunks (passages) most similar to a query embedding
+
+        Searches the per-chunk embeddings in content_chunks rather than the
+        pooled content embeddings, so a matching paragraph inside a long
+        transcript or essay is found and returned on its own.
+
+        Args:
+            query_embedding: Query vector
+            match_threshold: Minimum similarity score
+            match_count: Maximum number of results
+
+        Returns:
+            List of matching passages with their content, position and source
+        """
+        embedding_str = f"[{','.join(map(str, query_embedding))}]"
+
+        query = """
+            SELECT
+                ch.content_id,
+                ch.chunk_index,
+                ch.text_content,
+                1 - (ch.embedding <=> $1::vector) AS similarity_score,
+                c.source_id,
+                s.platform,
+                s.url,
+                s.title,
+                s.author,
+                s.published_at
+            FROM content_chunks ch
+            JOIN contents c ON ch.content_id = c.id
+            JOIN sources s ON c.source_id = s.id
+            WHERE 1 - (ch.embedding <=> $1::vector) > $2
+            ORDER BY ch.embedding <=> $1::vector
+            LIMIT $3
+        """
+
+        rows = await self.db.fetch(query, embedding_str, match_threshold, match_count)
+
+        results = [dict(row) for row in rows]
+
+        logger.info(
+            f"Passage search: found {len(results)} matches "
+            f"(threshold={match_threshold}, limit={match_count})"
+        )
+
+        return results
+
     async def get_content_statistics(self) -> List[Dict[str, Any]]:
         """
         Get content statistics by platform
@@ -275,7 +333,12 @@ class VectorSearch:
         """
         Batch vector search for multiple queries
 
-        Efficiently searches for similar content for multiple embeddings.
+        Runs ``find_similar_content`` for every query vector inside one
+        statement (``unnest`` + ``LATERAL``), so N queries cost one round
+        trip instead of N. Large batches are split into statements of
+        QUERIES_PER_STATEMENT that run concurrently on the pool.
+
+        Threshold and count apply per query, exactly as in ``find_similar``.
 
         Args:
             query_embeddings: List of query vectors
@@ -283,18 +346,40 @@ class VectorSearch:
             match_count: Maximum results per query
 
         Returns:
-            List of result lists (one per query embedding)
+            List of result lists (one per query embedding, in input order)
         """
-        results = []
+        if not query_embeddings:
+            return []
 
-        for idx, embedding in enumerate(query_embeddings):
-            matches = await self.find_similar(
-                embedding,
-                match_threshold=match_threshold,
-                match_count=match_count
-            )
-            results.append(matches)
+        embedding_strs = [
+            f"[{','.join(map(str, embedding))}]" for embedding in query_embeddings
+        ]
 
-        logger.info(f"Batch search: processed {len(query_embeddings)} queries")
+        query = """
+            SELECT q.query_index, m.*
+            FROM unnest($1::text[]) WITH ORDINALITY AS q(embedding, query_index)
+            CROSS JOIN LATERAL find_similar_content(q.embedding::vector, $2, $3) m
+            ORDER BY q.query_index, m.similarity_score DESC
+        """
+
+        groups = [
+            embedding_strs[start:start + self.QUERIES_PER_STATEMENT]
+            for start in range(0, len(embedding_strs), self.QUERIES_PER_STATEMENT)
+        ]
+        group_rows = await asyncio.gather(*(
+            self.db.fetch(query, group, match_threshold, match_count) for group in groups
+        ))
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in query_embeddings]
+        for group_index, rows in enumerate(group_rows):
+            offset = group_index * self.QUERIES_PER_STATEMENT
+            for row in rows:
+                match = dict(row)
+                results[offset + match.pop('query_index') - 1].append(match)
+
+        logger.info(
+            f"Batch search: processed {len(query_embeddings)} queries "
+            f"in {len(groups)} statements"
+        )
 
         return results
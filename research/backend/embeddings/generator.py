@@ -2,9 +2,9 @@
 Embedding Generator for Research Backend
 
 Implements OpenAI ada-002 embedding generation with:
-- Text chunking (512 tokens per chunk)
+- Text chunking (512 tokens per chunk, sentence-aware, streamed)
 - Batch processing (up to 100 chunks per API call)
-- PostgreSQL pgvector storage
+- PostgreSQL pgvector storage (content and per-chunk passage vectors)
 - Cache layer to avoid re-embedding
 - Cost tracking for API usage
 
@@ -22,12 +22,19 @@ Usage:
     await generator.generate_for_contents(content_ids)
 """
 
+import asyncio
 import hashlib
+import json
 import logging
+import re
+import unicodedata
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from uuid import UUID
 
+import numpy as np
 import tiktoken
 from openai import AsyncOpenAI
 
@@ -120,6 +127,34 @@ class EmbeddingCache:
         result = await self.db.fetchval(query, content_id)
         return result if result is not None else False
 
+    async def get_texts_for_embedding(
+        self,
+        content_ids: List[UUID],
+        force: bool = False
+    ) -> List[Any]:
+        """
+        Look up cache state for many contents in one query
+
+        Text is only returned for contents that need embedding, so cached
+        rows cost an id and a flag rather than their full body.
+
+        Args:
+            content_ids: Content UUIDs
+            force: Return text for cached contents too
+
+        Returns:
+            Records with id, has_embedding and text_content (None when cached
+            and not forced). IDs that do not exist are absent.
+        """
+        query = """
+            SELECT id,
+                   embedding IS NOT NULL AS has_embedding,
+                   CASE WHEN $2 OR embedding IS NULL THEN text_content END AS text_content
+            FROM contents
+            WHERE id = ANY($1::uuid[])
+        """
+        return await self.db.fetch(query, content_ids, force)
+
     async def get_cached_embedding(self, content_id: UUID) -> Optional[List[float]]:
         """
         Get cached embedding for content
@@ -155,25 +190,194 @@ class EmbeddingCache:
         }
 
 
+class TextEmbeddingCache:
+    """
+    Embedding cache keyed by model and normalized text
+
+    An in-process LRU in front of the ``embedding_cache`` table, so identical
+    or re-scraped text is embedded once whatever its content ID, and
+    query-time embeddings are reused. Keys match the main backend's cache
+    (SHA-256 of NFKC-normalized, whitespace-collapsed text), so both share
+    the table when pointed at the same database.
+
+    Runs L1-only until a database is attached; database errors are logged
+    and treated as misses.
+    """
+
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(self, max_entries: int = 10_000):
+        """
+        Initialize text embedding cache
+
+        Args:
+            max_entries: Maximum embeddings kept in process
+        """
+        self.db: Optional[DatabaseManager] = None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+
+        self.lookups = 0
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.db_errors = 0
+
+    def attach(self, db_manager: DatabaseManager):
+        """Use the ``embedding_cache`` table as the persistent tier"""
+        self.db = db_manager
+
+    @classmethod
+    def compute_key(cls, text: str) -> str:
+        """SHA-256 of the normalized text (ignores Unicode form and whitespace)"""
+        normalized = cls._WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    async def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for many texts (one query for all L1 misses)
+
+        Args:
+            model: Embedding model name
+            texts: Input texts
+
+        Returns:
+            Embedding or None per text, in order
+        """
+        keys = [self.compute_key(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+
+        for key in keys:
+            embedding = self._entries.get((model, key))
+            if embedding is not None:
+                self._entries.move_to_end((model, key))
+                found[key] = embedding
+        l1_hits = sum(1 for key in keys if key in found)
+
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        from_db: Dict[str, List[float]] = {}
+        if missing and self.db is not None:
+            query = """
+                SELECT text_hash, embedding::text AS embedding
+                FROM embedding_cache
+                WHERE model = $1 AND text_hash = ANY($2::text[])
+            """
+            try:
+                rows = await self.db.fetch(query, model, missing)
+                from_db = {row['text_hash']: json.loads(row['embedding']) for row in rows}
+            except Exception as e:
+                self.db_errors += 1
+                logger.warning(f"Embedding cache lookup failed: {e}")
+        self._remember(model, from_db)
+        found.update(from_db)
+
+        self.lookups += len(texts)
+        self.l1_hits += l1_hits
+        self.l2_hits += sum(1 for key in keys if key in from_db)
+        return [found.get(key) for key in keys]
+
+    async def put_many(self, model: str, texts: List[str], embeddings: List[List[float]]):
+        """
+        Store embeddings for texts (existing keys are left untouched)
+
+        Args:
+            model: Embedding model name
+            texts: Input texts
+            embeddings: Embedding per text, in order
+        """
+        entries = {
+            self.compute_key(text): embedding
+            for text, embedding in zip(texts, embeddings)
+        }
+        self._remember(model, entries)
+
+        if self.db is None or not entries:
+            return
+
+        query = """
+            INSERT INTO embedding_cache (model, text_hash, dimensions, embedding)
+            VALUES ($1, $2, $3, $4::vector)
+            ON CONFLICT (model, text_hash) DO NOTHING
+        """
+        args = [
+            (model, key, len(embedding), f"[{','.join(map(str, embedding))}]")
+            for key, embedding in entries.items()
+        ]
+        try:
+            async with self.db.acquire() as conn:
+                await conn.executemany(query, args)
+        except Exception as e:
+            self.db_errors += 1
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit rates per tier"""
+        hits = self.l1_hits + self.l2_hits
+        return {
+            "entries": len(self._entries),
+            "lookups": self.lookups,
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.lookups - hits,
+            "hit_rate": round(hits / self.lookups * 100, 2) if self.lookups > 0 else 0,
+            "db_errors": self.db_errors,
+        }
+
+    def _remember(self, model: str, entries: Dict[str, List[float]]):
+        """Add entries to the LRU, evicting the least recently used"""
+        for key, embedding in entries.items():
+            self._entries[(model, key)] = embedding
+            self._entries.move_to_end((model, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> "tiktoken.Encoding":
+    """tiktoken encoding for a model, loaded once per process"""
+    return tiktoken.encoding_for_model(model)
+
+
 class TextChunker:
     """
     Split long text into chunks for embedding
 
     Uses tiktoken to count tokens accurately for OpenAI models.
     Default chunk size: 512 tokens with 50 token overlap.
+
+    Chunks are produced lazily, one sentence at a time, so long transcripts
+    and essays are never encoded or held as a whole. Chunks end on sentence
+    boundaries, preferring paragraph ends in the second half of a chunk, and
+    overlap by the trailing sentences of the previous chunk. Sentences longer
+    than a chunk are split on token boundaries.
     """
 
-    def __init__(self, model: str = "text-embedding-ada-002", chunk_size: int = 512):
+    # End of a sentence (punctuation plus closing quotes/brackets, then
+    # whitespace) or of a line
+    SENTENCE_BOUNDARY = re.compile(r"[.!?][\"')\]”’]*\s+|\n\s*")
+
+    def __init__(
+        self,
+        model: str = "text-embedding-ada-002",
+        chunk_size: int = 512,
+        overlap: int = 50
+    ):
         """
         Initialize text chunker
 
         Args:
             model: OpenAI model name for tokenization
             chunk_size: Maximum tokens per chunk
+            overlap: Maximum tokens shared between consecutive chunks
+                (capped at a quarter of chunk_size)
         """
-        self.encoding = tiktoken.encoding_for_model(model)
+        self.encoding = get_encoding(model)
         self.chunk_size = chunk_size
-        self.overlap = 50  # Overlap between chunks for context preservation
+        self.overlap = overlap  # Context kept between chunks
+
+    @property
+    def max_overlap(self) -> int:
+        """Overlap in tokens, capped so consecutive chunks always advance"""
+        return min(self.overlap, self.chunk_size // 4)
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text"""
@@ -189,35 +393,125 @@ class TextChunker:
         Returns:
             List of text chunks (each ≤ chunk_size tokens)
         """
-        # Encode text to tokens
-        tokens = self.encoding.encode(text)
+        return [chunk for chunk, _ in self.iter_chunks(text)]
+
+    def chunk_with_counts(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Split text into chunks, keeping each chunk's token count
 
-        # If text is small enough, return as-is
-        if len(tokens) <= self.chunk_size:
-            return [text]
+        Lets callers budget batches without re-encoding every chunk.
 
-        # Split into chunks with overlap
-        chunks = []
-        start = 0
+        Args:
+            text: Input text
 
-        while start < len(tokens):
-            # Get chunk of tokens
-            end = min(start + self.chunk_size, len(tokens))
-            chunk_tokens = tokens[start:end]
+        Returns:
+            List of (chunk text, token count) pairs
+        """
+        chunks = list(self.iter_chunks(text))
+        if len(chunks) > 1:
+            logger.info(
+                f"Split text into {len(chunks)} chunks "
+                f"({sum(tokens for _, tokens in chunks)} tokens)"
+            )
+        return chunks
 
-            # Decode back to text
-            chunk_text = self.encoding.decode(chunk_tokens)
-            chunks.append(chunk_text)
+    def iter_chunks(self, text: str) -> Iterator[Tuple[str, int]]:
+        """
+        Lazily split text into chunks
 
-            # Move to next chunk (with overlap)
-            start += self.chunk_size - self.overlap
+        Token counts are summed per sentence, so they can exceed the count
+        of the joined chunk by a token or so at sentence joins.
 
-            # Prevent infinite loop on last chunk
-            if end == len(tokens):
+        Args:
+            text: Input text
+
+        Yields:
+            (chunk text, token count) pairs
+        """
+        # A token is at least one UTF-8 byte (not character: CJK and emoji
+        # can take several tokens each), so short text is a single chunk
+        if len(text.encode("utf-8")) <= self.chunk_size:
+            yield text, self.count_tokens(text)
+            return
+
+        window: List[Tuple[str, int, bool]] = []  # (sentence, tokens, ends paragraph)
+        window_tokens = 0
+        carried = 0  # Leading sentences of the window already emitted (overlap)
+        emitted = False
+
+        for sentence, ends_paragraph in self._sentences(text):
+            tokens = self.encoding.encode(sentence)
+
+            if len(tokens) > self.chunk_size:
+                if len(window) > carried:
+                    yield self._join(window)
+                window, window_tokens, carried = [], 0, 0
+                yield from self._split_tokens(tokens)
+                emitted = True
+                continue
+
+            while window and window_tokens + len(tokens) > self.chunk_size:
+                if carried == len(window):
+                    window, window_tokens, carried = [], 0, 0  # Drop the overlap
+                    break
+                cut = self._cut_point(window, carried)
+                yield self._join(window[:cut])
+                emitted = True
+                overlap = self._overlap(window[:cut])
+                window = overlap + window[cut:]
+                window_tokens = sum(count for _, count, _ in window)
+                carried = len(overlap)
+
+            window.append((sentence, len(tokens), ends_paragraph))
+            window_tokens += len(tokens)
+
+        if len(window) > carried:
+            yield (text, window_tokens) if not emitted else self._join(window)
+
+    def _sentences(self, text: str) -> Iterator[Tuple[str, bool]]:
+        """Yield (sentence with trailing whitespace, ends a paragraph) pairs"""
+        start = 0
+        for match in self.SENTENCE_BOUNDARY.finditer(text):
+            yield text[start:match.end()], match.group().count("\n") >= 2
+            start = match.end()
+        if start < len(text):
+            yield text[start:], True
+
+    def _cut_point(self, window: List[Tuple[str, int, bool]], carried: int) -> int:
+        """Number of window sentences to emit: through the last paragraph end
+        in the second half of the chunk, else the whole window"""
+        tokens = 0
+        cut = len(window)
+        for index, (_, count, ends_paragraph) in enumerate(window):
+            tokens += count
+            if index >= carried and ends_paragraph and tokens >= self.chunk_size // 2:
+                cut = index + 1
+        return cut
+
+    def _overlap(self, sentences: List[Tuple[str, int, bool]]) -> List[Tuple[str, int, bool]]:
+        """Trailing sentences of an emitted chunk that fit in the overlap"""
+        tokens = 0
+        start = len(sentences)
+        while start > 1 and tokens + sentences[start - 1][1] <= self.max_overlap:
+            start -= 1
+            tokens += sentences[start][1]
+        return sentences[start:]
+
+    def _split_tokens(self, tokens: List[int]) -> Iterator[Tuple[str, int]]:
+        """Split one oversized sentence into overlapping token windows"""
+        step = self.chunk_size - self.max_overlap
+        for start in range(0, len(tokens), step):
+            window = tokens[start:start + self.chunk_size]
+            yield self.encoding.decode(window), len(window)
+            if start + self.chunk_size >= len(tokens):
                 break
 
-        logger.info(f"Split text into {len(chunks)} chunks ({len(tokens)} tokens total)")
-        return chunks
+    @staticmethod
+    def _join(sentences: List[Tuple[str, int, bool]]) -> Tuple[str, int]:
+        return (
+            "".join(sentence for sentence, _, _ in sentences).strip(),
+            sum(count for _, count, _ in sentences)
+        )
 
 
 class EmbeddingGenerator:
@@ -230,20 +524,55 @@ class EmbeddingGenerator:
     - Automatic caching (checks if content already embedded)
     - Cost tracking
     - Database integration (stores to pgvector)
+    - Bulk mode: token-budgeted batches, concurrent API calls, batched writes
+    - Chunk vectors optionally kept in content_chunks for passage-level search
     """
 
-    def __init__(self, api_key: str, model: str = "text-embedding-ada-002"):
+    # OpenAI limits: 2048 inputs and 300K tokens per request. Stay well below.
+    MAX_BATCH_INPUTS = 100
+    MAX_BATCH_TOKENS = 50_000
+
+    # How chunk embeddings combine into the content embedding
+    POOLING_MODES = ("mean", "weighted", "max")
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-ada-002",
+        base_url: Optional[str] = None,
+        max_concurrency: int = 4,
+        write_batch_size: int = 500,
+        text_cache: Optional[TextEmbeddingCache] = None,
+        pooling: str = "mean",
+        store_chunks: bool = False
+    ):
         """
         Initialize embedding generator
 
         Args:
             api_key: OpenAI API key
             model: OpenAI embedding model (default: text-embedding-ada-002)
+            base_url: Override the API endpoint (e.g. a local stub server)
+            max_concurrency: Embedding requests in flight in bulk mode
+            write_batch_size: Embeddings per batched database write in bulk mode
+            text_cache: Text-keyed embedding cache (a new one if None)
+            pooling: Chunk pooling mode: "mean", "weighted" (by chunk token
+                count) or "max" (element-wise)
+            store_chunks: Also store each chunk's embedding in content_chunks
+                (needs db/migrations/001_content_chunks.sql on existing databases)
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        if pooling not in self.POOLING_MODES:
+            raise ValueError(f"Unknown pooling mode: {pooling} (use one of {self.POOLING_MODES})")
+
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
         self.model = model
         self.chunker = TextChunker(model=model, chunk_size=512)
         self.cost_tracker = EmbeddingCostTracker()
+        self.max_concurrency = max_concurrency
+        self.write_batch_size = write_batch_size
+        self.text_cache = text_cache or TextEmbeddingCache()
+        self.pooling = pooling
+        self.store_chunks = store_chunks
 
         # Will be initialized with initialize()
         self.db: Optional[DatabaseManager] = None
@@ -262,6 +591,7 @@ class EmbeddingGenerator:
         self.db = db_manager
         self.cache = EmbeddingCache(db_manager)
         self.content_crud = ContentCRUD(db_manager)
+        self.text_cache.attach(db_manager)
         logger.info("EmbeddingGenerator initialized with database connection")
 
     async def generate(self, text: str) -> List[float]:
@@ -274,6 +604,11 @@ class EmbeddingGenerator:
         Returns:
             Embedding vector (1536 dimensions for ada-002)
         """
+        cached = (await self.text_cache.get_many(self.model, [text]))[0]
+        if cached is not None:
+            logger.debug("Embedding cache hit")
+            return cached
+
         # Count tokens for cost tracking
         token_count = self.chunker.count_tokens(text)
 
@@ -290,6 +625,8 @@ class EmbeddingGenerator:
 
         logger.debug(f"Generated embedding: {token_count} tokens")
 
+        await self.text_cache.put_many(self.model, [text], [embedding])
+
         return embedding
 
     async def generate_batch(self, texts: List[str]) -> List[List[float]]:
@@ -308,70 +645,154 @@ class EmbeddingGenerator:
         if not texts:
             return []
 
+        # Only texts the cache cannot serve go to the API, each one once
+        all_embeddings = await self.text_cache.get_many(self.model, texts)
+        misses = [i for i, embedding in enumerate(all_embeddings) if embedding is None]
+        miss_texts = list(dict.fromkeys(texts[i] for i in misses))
+        generated = []
+
         # OpenAI limit: max 100 inputs per request
         batch_size = 100
-        all_embeddings = []
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
+        for i in range(0, len(miss_texts), batch_size):
+            batch = miss_texts[i:i + batch_size]
 
             # Count tokens for cost tracking
             total_tokens = sum(self.chunker.count_tokens(text) for text in batch)
 
-            # Generate embeddings
-            response = await self.client.embeddings.create(
-                input=batch,
-                model=self.model
-            )
-
-            # Extract embeddings in order
-            embeddings = [item.embedding for item in response.data]
-            all_embeddings.extend(embeddings)
-
-            # Track cost
-            self.cost_tracker.add_request(total_tokens, len(batch))
+            embeddings = await self._embed_batch(batch, total_tokens)
+            generated.extend(embeddings)
 
             logger.info(
                 f"Generated batch: {len(batch)} embeddings, {total_tokens} tokens "
                 f"(${round(total_tokens * 0.0001 / 1000, 6)})"
             )
 
+        if generated:
+            await self.text_cache.put_many(self.model, miss_texts, generated)
+
+        by_text = dict(zip(miss_texts, generated))
+        for i in misses:
+            all_embeddings[i] = by_text[texts[i]]
+
         return all_embeddings
 
     async def generate_chunked(self, text: str) -> List[float]:
         """
-        Generate embedding for long text by chunking and averaging
+        Generate embedding for long text by chunking and pooling
 
         For texts longer than 512 tokens:
         1. Split into chunks
         2. Generate embedding for each chunk
-        3. Average embeddings (element-wise mean)
+        3. Pool embeddings (see ``pooling``)
 
         Args:
             text: Input text (can be arbitrarily long)
 
         Returns:
-            Averaged embedding vector
+            Pooled embedding vector
+        """
+        chunks, embeddings = await self._embed_chunks(text)
+        return self._pool(embeddings, [tokens for _, tokens in chunks])
+
+    async def _embed_chunks(
+        self,
+        text: str
+    ) -> Tuple[List[Tuple[str, int]], List[List[float]]]:
+        """
+        Chunk text and embed every chunk (batched)
+
+        Args:
+            text: Input text
+
+        Returns:
+            (chunk text, token count) pairs and their embeddings
         """
-        # Split into chunks
-        chunks = self.chunker.chunk_text(text)
+        chunks = self.chunker.chunk_with_counts(text)
+        embeddings = await self.generate_batch([chunk for chunk, _ in chunks])
+        return chunks, embeddings
 
-        # Generate embeddings for all chunks (batched)
-        embeddings = await self.generate_batch(chunks)
+    async def _embed_batch(self, texts: List[str], total_tokens: int) -> List[List[float]]:
+        """
+        Embed one request's worth of texts and record its cost
 
-        # Average embeddings (element-wise mean)
+        Args:
+            texts: Input texts (within the per-request limits)
+            total_tokens: Token count of all texts, for cost tracking
+
+        Returns:
+            Embedding vectors in input order
+        """
+        response = await self.client.embeddings.create(
+            input=texts,
+            model=self.model
+        )
+
+        # Extract embeddings in order
+        embeddings = [item.embedding for item in response.data]
+
+        # Track cost
+        self.cost_tracker.add_request(total_tokens, len(texts))
+
+        return embeddings
+
+    def _pool(self, embeddings: List[List[float]], token_counts: List[int]) -> List[float]:
+        """
+        Combine chunk embeddings into one content embedding
+
+        Args:
+            embeddings: Chunk embeddings in chunk order
+            token_counts: Token count of each chunk (weights for "weighted")
+
+        Returns:
+            Pooled embedding vector
+        """
         if len(embeddings) == 1:
             return embeddings[0]
 
-        # Compute mean across all chunks
-        avg_embedding = [
-            sum(emb[i] for emb in embeddings) / len(embeddings)
-            for i in range(len(embeddings[0]))
-        ]
+        matrix = np.asarray(embeddings, dtype=np.float64)
+        if self.pooling == "weighted":
+            pooled = np.average(matrix, axis=0, weights=np.asarray(token_counts, dtype=np.float64))
+        elif self.pooling == "max":
+            pooled = matrix.max(axis=0)
+        else:
+            pooled = matrix.mean(axis=0)
 
-        logger.info(f"Averaged {len(embeddings)} chunk embeddings")
+        logger.debug(f"Pooled {len(embeddings)} chunk embeddings ({self.pooling})")
+        return pooled.tolist()
 
-        return avg_embedding
+    def _pack_batches(
+        self,
+        chunks: List[Tuple[UUID, int, str, int]]
+    ) -> List[List[Tuple[UUID, int, str, int]]]:
+        """
+        Pack chunks into requests bounded by input count and token budget
+
+        Args:
+            chunks: (content_id, chunk index, text, token count) tuples
+
+        Returns:
+            Batches of chunks, each within MAX_BATCH_INPUTS and MAX_BATCH_TOKENS
+        """
+        batches: List[List[Tuple[UUID, int, str, int]]] = []
+        current: List[Tuple[UUID, int, str, int]] = []
+        current_tokens = 0
+
+        for chunk in chunks:
+            tokens = chunk[3]
+            if current and (
+                len(current) >= self.MAX_BATCH_INPUTS
+                or current_tokens + tokens > self.MAX_BATCH_TOKENS
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(chunk)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
 
     async def generate_for_content(
         self,
@@ -406,10 +827,19 @@ class EmbeddingGenerator:
         text = content['text_content']
 
         # Generate embedding (handles chunking automatically)
-        embedding = await self.generate_chunked(text)
-
-        # Store in database
-        success = await self.content_crud.update_embedding(content_id, embedding)
+        chunks, embeddings = await self._embed_chunks(text)
+        embedding = self._pool(embeddings, [tokens for _, tokens in chunks])
+
+        # Store in database, with the chunk vectors in the same transaction
+        chunk_rows = None
+        if self.store_chunks:
+            chunk_rows = [
+                (content_id, index, chunk, tokens, chunk_embedding)
+                for index, ((chunk, tokens), chunk_embedding) in enumerate(zip(chunks, embeddings))
+            ]
+        success = await self.content_crud.update_embeddings(
+            [(content_id, embedding)], chunks=chunk_rows
+        ) == 1
 
         if success:
             logger.info(f"Stored embedding for content: {content_id}")
@@ -426,6 +856,15 @@ class EmbeddingGenerator:
         """
         Generate embeddings for multiple contents
 
+        Runs as a pipeline rather than one content at a time:
+
+        1. One query finds which contents need embedding and loads their text
+        2. Texts are chunked; chunks already in the text cache are reused and
+           the rest are packed into token-budgeted requests
+        3. Up to ``max_concurrency`` requests run at once
+        4. Finished embeddings are written ``write_batch_size`` at a time
+           while later requests are still in flight
+
         Args:
             content_ids: List of content UUIDs
             force: Force regeneration even if cached
@@ -441,31 +880,130 @@ class EmbeddingGenerator:
             "generated": 0,
             "cached": 0,
             "failed": 0,
+            "chunks": 0,
+            "chunk_cache_hits": 0,
+            "batches": 0,
             "errors": []
         }
 
         start_time = datetime.now()
 
+        def fail(content_id: UUID, error: str) -> None:
+            stats["failed"] += 1
+            stats["errors"].append({"content_id": str(content_id), "error": error})
+
+        # 1. One set-based lookup instead of a cache query per content
+        rows = await self.cache.get_texts_for_embedding(content_ids, force=force)
+        found = {row['id'] for row in rows}
         for content_id in content_ids:
+            if content_id not in found:
+                logger.warning(f"Content not found: {content_id}")
+                stats["failed"] += 1
+
+        # 2. Chunk and pack into token-budgeted requests
+        chunks: List[Tuple[UUID, int, str, int]] = []
+        pending: Dict[UUID, List[Optional[List[float]]]] = {}
+        pieces_by_content: Dict[UUID, List[Tuple[str, int]]] = {}
+        for row in rows:
+            if row['text_content'] is None:
+                stats["cached"] += 1
+                continue
+            if not row['text_content'].strip():
+                fail(row['id'], "Empty text content")
+                continue
+
+            pieces = self.chunker.chunk_with_counts(row['text_content'])
+            pending[row['id']] = [None] * len(pieces)
+            pieces_by_content[row['id']] = pieces
+            chunks.extend(
+                (row['id'], index, text, tokens)
+                for index, (text, tokens) in enumerate(pieces)
+            )
+
+        ready: List[Tuple[UUID, List[float]]] = []
+        ready_chunks: List[Tuple[UUID, int, str, int, List[float]]] = []
+
+        def complete(content_id: UUID) -> None:
+            parts = pending.pop(content_id)
+            pieces = pieces_by_content.pop(content_id)
+            ready.append((content_id, self._pool(parts, [tokens for _, tokens in pieces])))
+            if self.store_chunks:
+                ready_chunks.extend(
+                    (content_id, index, text, tokens, embedding)
+                    for index, ((text, tokens), embedding) in enumerate(zip(pieces, parts))
+                )
+
+        # Reuse embeddings of identical text (re-scrapes, duplicates)
+        cached = await self.text_cache.get_many(self.model, [chunk[2] for chunk in chunks])
+        to_embed = []
+        for chunk, embedding in zip(chunks, cached):
+            if embedding is None:
+                to_embed.append(chunk)
+                continue
+            parts = pending[chunk[0]]
+            parts[chunk[1]] = embedding
+            if all(part is not None for part in parts):
+                complete(chunk[0])
+
+        batches = self._pack_batches(to_embed)
+        stats["chunks"] = len(chunks)
+        stats["chunk_cache_hits"] = len(chunks) - len(to_embed)
+        stats["batches"] = len(batches)
+
+        # 3. Bounded concurrent API calls; errors fail only that batch's contents
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed(batch):
+            async with semaphore:
+                try:
+                    texts = [chunk[2] for chunk in batch]
+                    tokens = sum(chunk[3] for chunk in batch)
+                    return batch, await self._embed_batch(texts, tokens), None
+                except Exception as e:
+                    return batch, None, e
+
+        # 4. Write completed contents (and their chunks) in batches while
+        #    requests are in flight
+        async def flush() -> None:
+            writes, chunk_writes = ready[:], ready_chunks[:]
+            ready.clear()
+            ready_chunks.clear()
             try:
-                # Check cache
-                if not force and await self.cache.has_embedding(content_id):
-                    stats["cached"] += 1
-                    logger.debug(f"Skipped cached content: {content_id}")
-                    continue
+                await self.content_crud.update_embeddings(
+                    writes, chunks=chunk_writes if self.store_chunks else None
+                )
+                stats["generated"] += len(writes)
+            except Exception as e:
+                logger.error(f"Error writing {len(writes)} embeddings: {e}")
+                for content_id, _ in writes:
+                    fail(content_id, str(e))
 
-                # Generate embedding
-                embedding = await self.generate_for_content(content_id, force=force)
+        for next_batch in asyncio.as_completed([embed(batch) for batch in batches]):
+            batch, embeddings, error = await next_batch
 
-                if embedding:
-                    stats["generated"] += 1
-                else:
-                    stats["failed"] += 1
+            if error is not None:
+                logger.error(f"Error generating embeddings for batch of {len(batch)}: {error}")
+                for content_id in dict.fromkeys(chunk[0] for chunk in batch):
+                    pieces_by_content.pop(content_id, None)
+                    if pending.pop(content_id, None) is not None:
+                        fail(content_id, str(error))
+                continue
 
-            except Exception as e:
-                logger.error(f"Error generating embedding for {content_id}: {e}")
-                stats["failed"] += 1
-                stats["errors"].append({"content_id": str(content_id), "error": str(e)})
+            await self.text_cache.put_many(self.model, [chunk[2] for chunk in batch], embeddings)
+
+            for (content_id, index, _, _), embedding in zip(batch, embeddings):
+                parts = pending.get(content_id)
+                if parts is None:
+                    continue  # Another batch for this content already failed
+                parts[index] = embedding
+                if all(part is not None for part in parts):
+                    complete(content_id)
+
+            if len(ready) >= self.write_batch_size:
+                await flush()
+
+        if ready:
+            await flush()
 
         # Calculate duration
         duration = (datetime.now() - start_time).total_seconds()
@@ -478,6 +1016,7 @@ class EmbeddingGenerator:
         logger.info(
             f"Batch complete: {stats['generated']} generated, "
             f"{stats['cached']} cached, {stats['failed']} failed "
+            f"in {stats['batches']} requests "
             f"({duration:.2f}s, ${stats['cost']['total_cost_usd']})"
         )
 
@@ -521,4 +1060,6 @@ class EmbeddingGenerator:
         if not self.cache:
             raise RuntimeError("EmbeddingGenerator not initialized - call initialize() first")
 
-        return await self.cache.count_cached()
+        stats = await self.cache.count_cached()
+        stats["text_cache"] = self.text_cache.get_stats()
+        return stats
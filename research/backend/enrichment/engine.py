@@ -412,8 +412,9 @@ class EnrichmentEngine:
             status['database'] = 'unhealthy'
 
         try:
-            # Check embeddings (simple test)
-            test_embedding = await self.embedding_generator.generate("test")
+            # Check embeddings (bypasses the text cache, which would answer locally)
+            embeddings = await self.embedding_generator._embed_batch(["test"], 1)
+            test_embedding = embeddings[0]
             status['embeddings'] = 'healthy' if len(test_embedding) == 1536 else 'unhealthy'
         except Exception as e:
             logger.error(f"Embedding health check failed: {e}")
@@ -2,7 +2,7 @@
 Tests for embedding generation module
 
 Tests cover:
-- Text chunking with tiktoken
+- Text chunking with tiktoken (sentence-aware, streamed)
 - Embedding generation (mocked OpenAI API)
 - Batch processing
 - Cache layer
@@ -10,10 +10,14 @@ Tests cover:
 - Database integration
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from db.crud import ContentCRUD
 from embeddings.generator import (
     EmbeddingGenerator,
     EmbeddingCache,
@@ -69,6 +73,79 @@ class TestTextChunker:
             # (This is a rough heuristic - overlap isn't guaranteed to be word-level)
             assert len(chunks) >= 2
 
+    @pytest.fixture
+    def word_chunker(self):
+        """Chunker counting one token per word"""
+        encoding = WordEncoding()
+        with patch('embeddings.generator.get_encoding', return_value=encoding):
+            chunker = TextChunker(chunk_size=12, overlap=0)
+        chunker.encoding = encoding
+        return chunker
+
+    def test_overlap_is_capped(self, word_chunker):
+        """Overlap never reaches the chunk size (which would never advance)"""
+        with patch('embeddings.generator.get_encoding', return_value=WordEncoding()):
+            assert TextChunker(chunk_size=50).max_overlap == 12
+            assert TextChunker(chunk_size=512).max_overlap == 50
+
+    def test_chunks_end_at_sentence_boundaries(self, word_chunker):
+        text = "One two three four five. Six seven eight nine ten. Eleven twelve thirteen."
+
+        chunks = word_chunker.chunk_with_counts(text)
+
+        assert chunks == [
+            ("One two three four five. Six seven eight nine ten.", 10),
+            ("Eleven twelve thirteen.", 3),
+        ]
+
+    def test_prefers_paragraph_breaks(self, word_chunker):
+        text = "Aa bb cc dd ee ff gg.\n\nHh ii jj. Kk ll mm."
+
+        chunks = word_chunker.chunk_text(text)
+
+        # "Hh ii jj." fits after the first paragraph, but the break is preferred
+        assert chunks == ["Aa bb cc dd ee ff gg.", "Hh ii jj. Kk ll mm."]
+
+    def test_overlap_repeats_trailing_sentences(self, word_chunker):
+        word_chunker.overlap = 3
+        text = " ".join(f"w{i} x{i}." for i in range(8))
+
+        chunks = word_chunker.chunk_text(text)
+
+        assert chunks == [
+            "w0 x0. w1 x1. w2 x2. w3 x3. w4 x4. w5 x5.",
+            "w5 x5. w6 x6. w7 x7.",
+        ]
+
+    def test_long_sentence_is_split_on_tokens(self, word_chunker):
+        text = "Short one. " + " ".join(["long"] * 30) + ". Short two."
+
+        chunks = word_chunker.chunk_with_counts(text)
+
+        assert chunks[0] == ("Short one.", 2)
+        assert [tokens for _, tokens in chunks[1:-1]] == [12, 12, 6]
+        assert chunks[-1] == ("Short two.", 2)
+
+    def test_multibyte_text_respects_chunk_size(self, word_chunker):
+        """CJK text can hold more tokens than characters"""
+        word_chunker.encoding = ByteEncoding()
+        text = "日本語" * 3 + "。"  # 10 characters, 30 tokens
+
+        chunks = word_chunker.chunk_with_counts(text)
+
+        assert len(chunks) > 1
+        assert all(tokens <= 12 for _, tokens in chunks)
+
+    def test_iter_chunks_is_lazy(self, word_chunker):
+        """The first chunk is ready before the rest of the text is encoded"""
+        word_chunker.encoding = MagicMock(wraps=WordEncoding())
+        text = " ".join(f"Sentence number {i}." for i in range(1000))
+
+        first = next(word_chunker.iter_chunks(text))
+
+        assert first == (" ".join(f"Sentence number {i}." for i in range(4)), 12)
+        assert word_chunker.encoding.encode.call_count == 5
+
 
 class TestEmbeddingCostTracker:
     """Test cost tracking functionality"""
@@ -347,6 +424,291 @@ class TestEmbeddingGenerator:
         assert "embeddings_generated" in stats
 
 
+class WordEncoding:
+    """Whitespace tokenizer standing in for tiktoken (one token per word)"""
+
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+class ByteEncoding:
+    """Tokenizer with one token per UTF-8 byte (tiktoken's worst case)"""
+
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens):
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+
+def embedding_response(texts):
+    """Fake API response: each text embeds to [word count] * 4"""
+    response = MagicMock()
+    response.data = [MagicMock(embedding=[float(len(t.split()))] * 4) for t in texts]
+    return response
+
+
+class TestBulkEmbedding:
+    """Test the pipelined generate_for_contents bulk mode"""
+
+    @pytest.fixture
+    def generator(self):
+        encoding = patch('embeddings.generator.get_encoding', return_value=WordEncoding())
+        with encoding, patch('embeddings.generator.AsyncOpenAI') as mock_openai:
+            in_flight = {"now": 0, "peak": 0}
+
+            async def create(input, model):
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+                await asyncio.sleep(0.01)
+                in_flight["now"] -= 1
+                return embedding_response(input)
+
+            mock_client = MagicMock()
+            mock_client.embeddings.create = AsyncMock(side_effect=create)
+            mock_openai.return_value = mock_client
+
+            generator = EmbeddingGenerator(api_key="test-key", max_concurrency=2)
+            generator.chunker.chunk_size = 10
+            generator.chunker.overlap = 0
+            generator.in_flight = in_flight
+            yield generator
+
+    async def initialize(self, generator, rows):
+        """Attach a fake database serving ``rows`` plus an embedding_cache table"""
+        cache_rows = {}
+
+        async def fetch(query, *args):
+            if "embedding_cache" in query:
+                model, hashes = args
+                return [
+                    {"text_hash": key, "embedding": cache_rows[(model, key)]}
+                    for key in hashes if (model, key) in cache_rows
+                ]
+            return rows
+
+        async def executemany(query, args):
+            for model, key, _, embedding in args:
+                cache_rows[(model, key)] = embedding
+
+        conn = MagicMock()
+        conn.executemany = AsyncMock(side_effect=executemany)
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        db_manager = MagicMock()
+        db_manager.fetch = AsyncMock(side_effect=fetch)
+        db_manager.acquire = acquire
+        db_manager.cache_rows = cache_rows
+        await generator.initialize(db_manager)
+        generator.content_crud.update_embeddings = AsyncMock(
+            side_effect=lambda pairs, chunks=None: len(pairs)
+        )
+        return db_manager
+
+    @pytest.mark.asyncio
+    async def test_one_lookup_batched_requests_and_writes(self, generator):
+        """Uncached contents are embedded in few requests and written in bulk"""
+        ids = [uuid4() for _ in range(6)]
+        rows = [
+            {"id": ids[0], "text_content": " ".join(["long"] * 25)},  # 3 chunks
+            {"id": ids[1], "text_content": None},  # Cached
+            *({"id": i, "text_content": "short text"} for i in ids[2:5]),
+        ]  # ids[5] does not exist
+        db_manager = await self.initialize(generator, rows)
+        generator.MAX_BATCH_INPUTS = 2
+        generator.write_batch_size = 2
+
+        stats = await generator.generate_for_contents(ids)
+
+        content_lookups = [
+            call for call in db_manager.fetch.call_args_list if "FROM contents" in call.args[0]
+        ]
+        assert len(content_lookups) == 1
+        assert content_lookups[0].args[1:] == (ids, False)
+        assert (stats["generated"], stats["cached"], stats["failed"]) == (4, 1, 1)
+        assert (stats["chunks"], stats["batches"]) == (6, 3)
+        assert generator.client.embeddings.create.call_count == 3
+        assert generator.in_flight["peak"] == 2
+
+        writes = [
+            pair
+            for call in generator.content_crud.update_embeddings.call_args_list
+            for pair in call.args[0]
+        ]
+        assert generator.content_crud.update_embeddings.call_count == 2
+        assert {content_id for content_id, _ in writes} == {ids[0], *ids[2:5]}
+        # Chunks of 10, 10 and 5 words are averaged
+        assert dict(writes)[ids[0]] == [25 / 3] * 4
+        assert stats["cost"]["embeddings_generated"] == 6
+
+    @pytest.mark.asyncio
+    async def test_chunk_vectors_written_with_content(self, generator):
+        """With store_chunks, each chunk's embedding is stored for passage search"""
+        content_id = uuid4()
+        await self.initialize(generator, [
+            {"id": content_id, "text_content": " ".join(["long"] * 25)},
+        ])
+
+        await generator.generate_for_contents([content_id])
+
+        assert generator.content_crud.update_embeddings.call_args.kwargs["chunks"] is None
+
+        generator.store_chunks = True
+        await generator.generate_for_contents([content_id], force=True)
+
+        chunks = generator.content_crud.update_embeddings.call_args.kwargs["chunks"]
+        assert [(row[0], row[1], row[3], row[4]) for row in chunks] == [
+            (content_id, 0, 10, [10.0] * 4),
+            (content_id, 1, 10, [10.0] * 4),
+            (content_id, 2, 5, [5.0] * 4),
+        ]
+
+    @pytest.mark.parametrize("pooling, expected", [
+        ("mean", [2.0, 2.0]),
+        ("weighted", [2.5, 1.0]),
+        ("max", [3.0, 4.0]),
+    ])
+    def test_pooling_modes(self, generator, pooling, expected):
+        generator.pooling = pooling
+
+        assert generator._pool([[1.0, 4.0], [3.0, 0.0]], [1, 3]) == expected
+
+    def test_unknown_pooling_mode(self, generator):
+        with pytest.raises(ValueError):
+            EmbeddingGenerator(api_key="test-key", pooling="median")
+
+    @pytest.mark.asyncio
+    async def test_failed_request_only_fails_its_contents(self, generator):
+        ids = [uuid4() for _ in range(3)]
+        rows = [{"id": i, "text_content": f"text {n}"} for n, i in enumerate(ids)]
+        await self.initialize(generator, rows)
+        generator.MAX_BATCH_INPUTS = 1
+
+        async def create(input, model):
+            if input == ["text 1"]:
+                raise RuntimeError("rate limited")
+            return embedding_response(input)
+
+        generator.client.embeddings.create.side_effect = create
+
+        stats = await generator.generate_for_contents(ids)
+
+        assert (stats["generated"], stats["failed"]) == (2, 1)
+        assert stats["errors"] == [{"content_id": str(ids[1]), "error": "rate limited"}]
+
+    @pytest.mark.asyncio
+    async def test_rescraped_text_reuses_cached_embeddings(self, generator):
+        """Identical text under a new content ID is not embedded again"""
+        first, second = uuid4(), uuid4()
+        rows = [{"id": first, "text_content": "Naval on leverage"}]
+        db_manager = await self.initialize(generator, rows)
+        await generator.generate_for_contents([first])
+
+        rows[:] = [{"id": second, "text_content": "Naval  on leverage\n"}]
+        stats = await generator.generate_for_contents([second])
+
+        assert (stats["generated"], stats["chunk_cache_hits"], stats["batches"]) == (1, 1, 0)
+        assert generator.client.embeddings.create.call_count == 1
+        assert len(db_manager.cache_rows) == 1
+        writes = generator.content_crud.update_embeddings.call_args_list
+        assert writes[1].args[0] == [(second, [3.0] * 4)]
+
+    @pytest.mark.asyncio
+    async def test_query_embeddings_are_shared_through_the_table(self, generator):
+        """A second generator on the same database reuses query-time embeddings"""
+        db_manager = await self.initialize(generator, [])
+        embedding = await generator.generate("What is leverage?")
+
+        other = EmbeddingGenerator(api_key="test-key")
+        await other.initialize(db_manager)
+
+        assert await other.generate("What is   leverage?") == embedding
+        assert await other.generate("What is leverage?") == embedding
+        assert generator.client.embeddings.create.call_count == 1
+        stats = other.text_cache.get_stats()
+        assert (stats["l2_hits"], stats["l1_hits"], stats["misses"]) == (1, 1, 0)
+
+    def test_pack_batches_respects_token_budget(self, generator):
+        generator.MAX_BATCH_TOKENS = 10
+        content_id = uuid4()
+        chunks = [(content_id, i, "x", tokens) for i, tokens in enumerate([4, 4, 4, 12, 1])]
+
+        batches = generator._pack_batches(chunks)
+
+        assert [[chunk[3] for chunk in batch] for batch in batches] == [[4, 4], [4], [12], [1]]
+
+    @pytest.mark.asyncio
+    async def test_update_embeddings_uses_executemany(self):
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+
+        @asynccontextmanager
+        async def transaction():
+            yield
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        conn.transaction = transaction
+        db_manager = MagicMock()
+        db_manager.acquire = acquire
+        first, second = uuid4(), uuid4()
+
+        written = await ContentCRUD(db_manager).update_embeddings(
+            [(first, [0.5, 1.0]), (second, [0.25, 0.0])]
+        )
+
+        assert written == 2
+        conn.executemany.assert_called_once()
+        assert conn.executemany.call_args.args[1] == [
+            ("[0.5,1.0]", first),
+            ("[0.25,0.0]", second),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update_embeddings_replaces_chunks(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.executemany = AsyncMock()
+
+        @asynccontextmanager
+        async def transaction():
+            yield
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        conn.transaction = transaction
+        db_manager = MagicMock()
+        db_manager.acquire = acquire
+        content_id = uuid4()
+
+        await ContentCRUD(db_manager).update_embeddings(
+            [(content_id, [0.5, 0.5])],
+            chunks=[
+                (content_id, 0, "first", 1, [1.0, 0.0]),
+                (content_id, 1, "second", 1, [0.0, 1.0]),
+            ]
+        )
+
+        assert "DELETE FROM content_chunks" in conn.execute.call_args.args[0]
+        assert conn.execute.call_args.args[1] == [content_id]
+        inserts = conn.executemany.call_args_list[1]
+        assert "INSERT INTO content_chunks" in inserts.args[0]
+        assert inserts.args[1] == [
+            (content_id, 0, "first", 1, "[1.0,0.0]"),
+            (content_id, 1, "second", 1, "[0.0,1.0]"),
+        ]
+
+
 class TestIntegration:
     """Integration tests (require database)"""
 
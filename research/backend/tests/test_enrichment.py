@@ -332,11 +332,16 @@ class TestEnrichmentEngine:
     @pytest.mark.asyncio
     async def test_health_check(self, enrichment_engine):
         """Test engine health check"""
-        # Mock embedding generation for health check
-        enrichment_engine.embedding_generator.generate = AsyncMock(return_value=[0.1] * 1536)
+        # Mock the embedding API call for health check
+        enrichment_engine.embedding_generator._embed_batch = AsyncMock(return_value=[[0.1] * 1536])
+        enrichment_engine.embedding_generator.generate = AsyncMock()
 
         health = await enrichment_engine.health_check()
 
+        # Probes the API, not the text cache
+        enrichment_engine.embedding_generator._embed_batch.assert_awaited_once_with(["test"], 1)
+        enrichment_engine.embedding_generator.generate.assert_not_called()
+        assert health["embeddings"] == "healthy"
         assert "engine" in health
         assert "database" in health
         assert "embeddings" in health
@@ -3,6 +3,7 @@ Tests for vector similarity search
 """
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 
 from db.search import VectorSearch
 from db.crud import ContentCRUD
@@ -186,6 +187,70 @@ async def test_batch_find_similar(vector_search: VectorSearch, content_crud: Con
         assert isinstance(query_results, list)
 
 
+@pytest.mark.asyncio
+async def test_batch_find_similar_matches_single_queries(vector_search: VectorSearch, content_crud: ContentCRUD, sample_source):
+    """Test batch search returns what find_similar returns for each query, in order"""
+    for i in range(4):
+        embedding = [0.0] * 1536
+        embedding[i] = 1.0
+        embedding[i + 1] = 0.5
+        await content_crud.create(
+            source_id=sample_source,
+            content_type="text",
+            text_content=f"Batch search content {i}.",
+            embedding=embedding
+        )
+
+    query_embeddings = []
+    for i in (3, 0, 2):
+        embedding = [0.0] * 1536
+        embedding[i] = 1.0
+        query_embeddings.append(embedding)
+
+    vector_search.QUERIES_PER_STATEMENT = 2  # Split across two statements
+
+    results = await vector_search.batch_find_similar(
+        query_embeddings=query_embeddings,
+        match_threshold=0.3,
+        match_count=2
+    )
+
+    for embedding, batch_results in zip(query_embeddings, results):
+        single_results = await vector_search.find_similar(
+            query_embedding=embedding,
+            match_threshold=0.3,
+            match_count=2
+        )
+        assert [r["content_id"] for r in batch_results] == [r["content_id"] for r in single_results]
+
+
+@pytest.mark.asyncio
+async def test_batch_find_similar_round_trips():
+    """Test batch search issues one statement per QUERIES_PER_STATEMENT queries"""
+    async def fetch(query, embeddings, match_threshold, match_count):
+        # Echo each query vector back as its only match
+        return [
+            {"query_index": index, "content_id": embedding}
+            for index, embedding in enumerate(embeddings, start=1)
+        ]
+
+    db_manager = MagicMock()
+    db_manager.fetch = AsyncMock(side_effect=fetch)
+    vector_search = VectorSearch(db_manager)
+    vector_search.QUERIES_PER_STATEMENT = 2
+
+    results = await vector_search.batch_find_similar(
+        query_embeddings=[[float(i)] for i in range(5)],
+        match_threshold=0.5,
+        match_count=3
+    )
+
+    assert db_manager.fetch.call_count == 3
+    assert db_manager.fetch.call_args.args[2:] == (0.5, 3)
+    assert results == [[{"content_id": f"[{float(i)}]"}] for i in range(5)]
+    assert await vector_search.batch_find_similar([]) == []
+
+
 @pytest.mark.asyncio
 async def test_similarity_threshold(vector_search: VectorSearch, content_crud: ContentCRUD, sample_source):
     """Test that similarity threshold filters results correctly"""
@@ -58,6 +58,7 @@ from valkey.exceptions import ConnectionError, TimeoutError, ValkeyError
 
 # Local application imports
 from src.core.config import settings
+from src.core.rate_limit import DistributedRateLimiter
 
 # Type variables
 T = TypeVar('T')
@@ -121,6 +122,7 @@ class CacheManager:
         self.pool: Optional[ConnectionPool] = None
         self._client: Optional[Valkey] = None
         self._connected = False
+        self._rate_limiter = DistributedRateLimiter(client=None, prefix="")
     
     async def connect(self) -> None:
         """
@@ -637,33 +639,41 @@ class CacheManager:
         identifier: str,
         limit: int,
         window: int,
-        tenant_id: Optional[str] = None
+        tenant_id: Optional[str] = None,
+        cost: int = 1
     ) -> bool:
         """
         Check if identifier is rate limited.
         
-        Uses sliding window rate limiting.
+        Uses a sliding-window counter evaluated atomically by one Lua script
+        (a single round-trip; the key always has a TTL). Falls back to
+        in-process limiting while Valkey is unreachable.
         
         Args:
             identifier: Unique identifier (e.g., user ID, IP)
             limit: Maximum requests allowed
             window: Time window in seconds
             tenant_id: Optional tenant identifier
+            cost: Weight of this request
             
         Returns:
             True if rate limited, False otherwise
         """
-        key = f"{CacheKeyPrefix.RATE_LIMIT}:{identifier}"
-        
-        current = await self.increment(key, tenant_id=tenant_id)
-        if current is None:
-            return False
+        # Own namespace: "rate_limit:<id>" may still hold a legacy INCR counter
+        key = self._make_key(f"{CacheKeyPrefix.RATE_LIMIT.value}:sw:{identifier}", tenant_id)
         
-        if current == 1:
-            # First request, set TTL
-            await self.expire(key, window, tenant_id)
+        if not self._connected and not self._rate_limiter.cooling_down:
+            try:
+                await self.connect()
+            except ConnectionError:
+                # Count locally until the retry interval has passed
+                self._rate_limiter.mark_unavailable()
+        self._rate_limiter.client = self._client
         
-        return current > limit
+        result = await self._rate_limiter.hit(
+            key, cost=cost, limit=limit, window_seconds=window
+        )
+        return not result.allowed
     
     # Health check
     
@@ -0,0 +1,307 @@
+"""
+Distributed sliding-window rate limiting on Valkey/Redis
+
+Each check is one atomic Lua script call (a single round-trip): a
+sliding-window counter with cost-weighted requests and optional blocking,
+stored in a small hash that always carries a TTL. All workers sharing the
+server therefore share one limit per client, and blocks survive restarts.
+
+If the server is unreachable the limiter falls back to an equivalent
+in-process limiter and retries the server after a cool-down.
+
+Works with any redis-py compatible asyncio client (``redis.asyncio``,
+``valkey.asyncio`` or ``fakeredis``). The module depends only on the
+standard library.
+
+This is a copy of backend/security/distributed_rate_limit.py: the writer
+runs from its own import root (``src.``) and is deployed without the
+backend package, so it cannot import the original. Apply fixes to both.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: limiter key
+# ARGV: limit, window_ms, cost, block_ms, now_ms
+# Returns: {allowed (0/1), remaining, retry_after_ms}
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local block = tonumber(ARGV[4])
+local now = tonumber(ARGV[5])
+
+local state = redis.call('HMGET', key, 'start', 'cur', 'prev', 'blocked')
+local blocked = tonumber(state[4]) or 0
+if blocked > now then
+    return {0, 0, blocked - now}
+end
+
+local start = now - (now % window)
+local last = tonumber(state[1])
+local cur = tonumber(state[2]) or 0
+local prev = tonumber(state[3]) or 0
+if blocked > 0 or last == nil then
+    -- New client, or a served block: start with a clean slate
+    last, cur, prev = start, 0, 0
+end
+if last ~= start then
+    if start - last == window then prev = cur else prev = 0 end
+    cur = 0
+end
+
+local estimate = prev * (1 - (now - start) / window) + cur
+if estimate + cost > limit then
+    if block > 0 then
+        redis.call('HSET', key, 'start', start, 'cur', cur, 'prev', prev, 'blocked', now + block)
+        redis.call('PEXPIRE', key, block)
+        return {0, 0, block}
+    end
+    return {0, 0, start + window - now}
+end
+
+cur = cur + cost
+redis.call('HSET', key, 'start', start, 'cur', cur, 'prev', prev, 'blocked', 0)
+redis.call('PEXPIRE', key, 2 * window)
+return {1, math.floor(limit - estimate - cost), 0}
+"""
+
+
+class RateLimitResult(NamedTuple):
+    """Outcome of one rate-limit check"""
+
+    allowed: bool
+    remaining: int
+    retry_after: float  # Seconds until a request may succeed (0 if allowed)
+    source: str  # "server" or "local"
+
+
+class LocalRateLimiter:
+    """
+    In-process limiter with the same semantics as ``SLIDING_WINDOW_LUA``.
+
+    Used when the server is unreachable. Idle keys expire like the server's
+    TTLs and are swept periodically.
+    """
+
+    def __init__(self, sweep_interval_ms: int = 60_000):
+        # key -> [window_start, current, previous, blocked_until, expires_at] (ms)
+        self._state: Dict[str, List[float]] = {}
+        self._sweep_interval_ms = sweep_interval_ms
+        self._next_sweep = 0.0
+
+    def hit(
+        self,
+        key: str,
+        limit: int,
+        window_ms: int,
+        cost: int,
+        block_ms: int,
+        now_ms: int,
+    ) -> RateLimitResult:
+        """
+        Count a request for ``key``.
+
+        Args:
+            key: Limiter key
+            limit: Requests allowed per window
+            window_ms: Window length in milliseconds
+            cost: Weight of this request
+            block_ms: Block duration once the limit is exceeded (0 = no block)
+            now_ms: Current time in milliseconds
+
+        Returns:
+            RateLimitResult
+        """
+        if now_ms >= self._next_sweep:
+            self.sweep(now_ms)
+
+        state = self._state.get(key)
+        if state is not None and state[4] <= now_ms:
+            state = None
+
+        if state is not None and state[3] > now_ms:
+            return RateLimitResult(False, 0, (state[3] - now_ms) / 1000, "local")
+
+        start = now_ms - now_ms % window_ms
+        if state is None or state[3]:
+            state = [start, 0, 0, 0, 0]
+            self._state[key] = state
+        if state[0] != start:
+            state[2] = state[1] if start - state[0] == window_ms else 0
+            state[1] = 0
+            state[0] = start
+
+        estimate = state[2] * (1 - (now_ms - start) / window_ms) + state[1]
+        if estimate + cost > limit:
+            if block_ms > 0:
+                state[3] = now_ms + block_ms
+                state[4] = now_ms + block_ms
+                return RateLimitResult(False, 0, block_ms / 1000, "local")
+            return RateLimitResult(
+                False, 0, (start + window_ms - now_ms) / 1000, "local"
+            )
+
+        state[1] += cost
+        state[4] = now_ms + 2 * window_ms
+        return RateLimitResult(True, math.floor(limit - estimate - cost), 0.0, "local")
+
+    def sweep(self, now_ms: float) -> int:
+        """Drop expired keys; returns the number removed."""
+        expired = [key for key, state in self._state.items() if state[4] <= now_ms]
+        for key in expired:
+            del self._state[key]
+        self._next_sweep = now_ms + self._sweep_interval_ms
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+
+class DistributedRateLimiter:
+    """
+    Shared sliding-window rate limiter backed by Valkey/Redis.
+
+    Also exposes ``check_rate_limit(client_ip, endpoint, cost)`` and
+    ``max_requests`` so it can replace ``AdaptiveRateLimiter`` directly.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any],
+        limit: int = 100,
+        window_seconds: float = 60,
+        block_duration_seconds: float = 0,
+        prefix: str = "rate_limit",
+        retry_interval_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            client: Async Valkey/Redis client (None = local limiting only)
+            limit: Default requests allowed per window
+            window_seconds: Default window length
+            block_duration_seconds: Block duration once the limit is exceeded (0 = no block)
+            prefix: Key prefix ("" to use identifiers as keys)
+            retry_interval_seconds: Cool-down before retrying an unreachable server
+            clock: Wall-clock time source in seconds (shared by all workers)
+        """
+        self.client = client
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.block_duration_seconds = block_duration_seconds
+        self.prefix = prefix
+        self.retry_interval_seconds = retry_interval_seconds
+        self._clock = clock
+
+        self.local = LocalRateLimiter()
+        self._script = None
+        self._script_client = None
+        self._down_until = 0.0
+
+        self.server_checks = 0
+        self.local_checks = 0
+        self.server_errors = 0
+
+    @property
+    def max_requests(self) -> int:
+        """Default limit (``AdaptiveRateLimiter`` compatibility)."""
+        return self.limit
+
+    @property
+    def cooling_down(self) -> bool:
+        """True while waiting to retry the server after an error."""
+        return self._clock() < self._down_until
+
+    @property
+    def server_available(self) -> bool:
+        """True if checks currently go to the server."""
+        return self.client is not None and not self.cooling_down
+
+    def mark_unavailable(self) -> None:
+        """Limit locally for ``retry_interval_seconds`` (e.g. after a failed connect)."""
+        self._down_until = self._clock() + self.retry_interval_seconds
+
+    async def hit(
+        self,
+        identifier: str,
+        cost: int = 1,
+        limit: Optional[int] = None,
+        window_seconds: Optional[float] = None,
+    ) -> RateLimitResult:
+        """
+        Count a request and decide whether it is allowed.
+
+        Args:
+            identifier: Client identifier (IP, user ID, ...)
+            cost: Weight of this request
+            limit: Override the default limit
+            window_seconds: Override the default window
+
+        Returns:
+            RateLimitResult
+        """
+        key = f"{self.prefix}:{identifier}" if self.prefix else identifier
+        limit = self.limit if limit is None else limit
+        window_ms = int((window_seconds or self.window_seconds) * 1000)
+        block_ms = int(self.block_duration_seconds * 1000)
+        now = self._clock()
+        now_ms = int(now * 1000)
+
+        if self.server_available:
+            try:
+                allowed, remaining, retry_ms = await self._get_script()(
+                    keys=[key], args=[limit, window_ms, cost, block_ms, now_ms]
+                )
+                self.server_checks += 1
+                return RateLimitResult(
+                    bool(allowed), int(remaining), int(retry_ms) / 1000, "server"
+                )
+            except Exception as e:
+                self.server_errors += 1
+                self.mark_unavailable()
+                logger.warning(f"Rate limit server unavailable, limiting locally: {e}")
+
+        self.local_checks += 1
+        return self.local.hit(key, limit, window_ms, cost, block_ms, now_ms)
+
+    async def check_rate_limit(
+        self, client_ip: str, endpoint: str = None, cost: int = 1
+    ) -> bool:
+        """
+        Check if a request should be allowed.
+
+        Args:
+            client_ip: Client IP address
+            endpoint: API endpoint (optional, for per-endpoint limits)
+            cost: Request cost
+
+        Returns:
+            bool: True if request allowed, False if rate limited
+        """
+        identifier = f"{client_ip}:{endpoint}" if endpoint else client_ip
+        return (await self.hit(identifier, cost)).allowed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter counters."""
+        return {
+            "server_checks": self.server_checks,
+            "local_checks": self.local_checks,
+            "server_errors": self.server_errors,
+            "server_available": self.server_available,
+            "local_keys": len(self.local),
+        }
+
+    def _get_script(self):
+        """Register the Lua script on the current client (EVALSHA with EVAL fallback)."""
+        if self._script is None or self._script_client is not self.client:
+            self._script = self.client.register_script(SLIDING_WINDOW_LUA)
+            self._script_client = self.client
+        return self._script
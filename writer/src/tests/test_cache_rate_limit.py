@@ -0,0 +1,85 @@
+"""
+Tests for CacheManager.is_rate_limited
+
+Runs the limiter's Lua script against fakeredis (requires ``fakeredis[lua]``).
+Run from writer/: ``python -m pytest src/tests/test_cache_rate_limit.py``
+"""
+
+import pytest
+
+pytest.importorskip("valkey")
+fakeredis = pytest.importorskip("fakeredis")
+
+from valkey.exceptions import ConnectionError  # noqa: E402
+
+from src.core.cache import CacheManager  # noqa: E402
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def client():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def manager(client):
+    manager = CacheManager()
+    manager._client = client
+    manager._connected = True
+    return manager
+
+
+async def test_counts_under_sliding_window_key(manager, client):
+    limited = [
+        await manager.is_rate_limited("user-1", limit=2, window=60) for _ in range(3)
+    ]
+
+    assert limited == [False, False, True]
+    assert await client.type("rate_limit:sw:user-1") == "hash"
+    assert await client.ttl("rate_limit:sw:user-1") > 0
+    assert manager._rate_limiter.server_checks == 3
+
+
+async def test_ignores_legacy_counter_key(manager, client):
+    """An old INCR counter under "rate_limit:<id>" is neither read nor replaced."""
+    await client.set("rate_limit:user-1", 57)
+
+    assert not await manager.is_rate_limited("user-1", limit=2, window=60)
+    assert await client.get("rate_limit:user-1") == "57"
+    assert manager._rate_limiter.server_errors == 0
+
+
+async def test_limits_locally_after_mark_unavailable(manager, client):
+    manager._rate_limiter.mark_unavailable()
+
+    limited = [
+        await manager.is_rate_limited("user-1", limit=2, window=60) for _ in range(3)
+    ]
+
+    assert limited == [False, False, True]
+    assert manager._rate_limiter.local_checks == 3
+    assert manager._rate_limiter.server_checks == 0
+    assert not await client.exists("rate_limit:sw:user-1")
+
+
+async def test_failed_connect_is_not_retried_while_cooling_down(manager):
+    attempts = 0
+
+    async def refuse():
+        nonlocal attempts
+        attempts += 1
+        raise ConnectionError("Cache connection failed")
+
+    manager._client = None
+    manager._connected = False
+    manager.connect = refuse
+
+    limited = [
+        await manager.is_rate_limited("user-1", limit=2, window=60) for _ in range(3)
+    ]
+
+    assert limited == [False, False, True]
+    assert attempts == 1
+    assert manager._rate_limiter.cooling_down
+    assert manager._rate_limiter.local_checks == 3